@@ -0,0 +1,111 @@
+from .component import Component
+
+
+class ChangeJournal:
+    """Records the changes made to a core model through its methods.
+
+    Components are tracked by uid. A component that is added and removed again is forgotten,
+    a component that is removed and added again counts as modified.
+    Changes made directly on the graph, e.g. `core_model.graph.add_node`, are not recorded.
+
+    Every change gets a sequence number. Exporters store the `sequence` of the journal at the
+    time of an export and get the changes since with `since`, so several exports of the same
+    model can be patched independently.
+    """
+
+    def __init__(self) -> None:
+        self.added: dict[int, Component] = {}
+        """Components added since the journal was started or cleared."""
+        self.removed: dict[int, Component] = {}
+        """Components removed since the journal was started or cleared, in their earlier state."""
+        self.modified: dict[int, tuple[Component, Component]] = {}
+        """Modified components as pairs of their earlier state and their current state."""
+        self.edges: set[frozenset[int]] = set()
+        """Uid pairs of the edges that were added, removed or changed."""
+        self._entries: list[tuple[str, Component, Component]] = []
+        """The recorded changes in order, as the kind of the change with the components."""
+        self._start = 0
+        """The sequence number of the first entry in `_entries`."""
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.modified) + len(self.edges)
+
+    @property
+    def num_structural(self) -> int:
+        """The number of structural changes, i.e. added or removed components and changed edges."""
+        return len(self.added) + len(self.removed) + len(self.edges)
+
+    @property
+    def sequence(self) -> int:
+        """The sequence number of the next change, i.e. the number of changes recorded so far."""
+        return self._start + len(self._entries)
+
+    def record_added(self, component: Component) -> None:
+        self._entries.append(("added", component, component))
+        self._apply_added(component)
+
+    def record_removed(self, component: Component) -> None:
+        self._entries.append(("removed", component, component))
+        self._apply_removed(component)
+
+    def record_modified(self, before: Component, after: Component) -> None:
+        self._entries.append(("modified", before, after))
+        self._apply_modified(before, after)
+
+    def record_edge(self, component1: Component, component2: Component) -> None:
+        self._entries.append(("edge", component1, component2))
+        self.edges.add(frozenset((component1.uid, component2.uid)))
+
+    def since(self, sequence: int) -> "ChangeJournal | None":
+        """Summarize the changes recorded from the sequence number [sequence] on.
+
+        :param sequence: The `sequence` of the journal at the time of an export.
+        :type sequence: int
+        :return: A journal with the changes since then, or None if they were cleared.
+        :rtype: ChangeJournal | None
+        """
+        if sequence < self._start or sequence > self.sequence:
+            return None
+        journal = ChangeJournal()
+        for kind, component1, component2 in self._entries[sequence - self._start :]:
+            if kind == "added":
+                journal._apply_added(component1)
+            elif kind == "removed":
+                journal._apply_removed(component1)
+            elif kind == "modified":
+                journal._apply_modified(component1, component2)
+            else:
+                journal.edges.add(frozenset((component1.uid, component2.uid)))
+        return journal
+
+    def touched_uids(self) -> set[int]:
+        """The uids of all components that were changed or whose connections changed."""
+        uids = set(self.added) | set(self.removed) | set(self.modified)
+        for edge in self.edges:
+            uids |= edge
+        return uids
+
+    def clear(self) -> None:
+        """Forget all recorded changes. Exports made before cannot be patched anymore."""
+        self._start = self.sequence
+        self._entries = []
+        self.added, self.removed, self.modified, self.edges = {}, {}, {}, set()
+
+    def _apply_added(self, component: Component) -> None:
+        removed = self.removed.pop(component.uid, None)
+        if removed is not None:
+            self.modified[component.uid] = (removed, component)
+        else:
+            self.added[component.uid] = component
+
+    def _apply_removed(self, component: Component) -> None:
+        if self.added.pop(component.uid, None) is not None:
+            return
+        before, _ = self.modified.pop(component.uid, (component, component))
+        self.removed[component.uid] = before
+
+    def _apply_modified(self, before: Component, after: Component) -> None:
+        if after.uid in self.added:
+            self.added[after.uid] = after
+        else:
+            self.modified[after.uid] = (self.modified.get(after.uid, (before,))[0], after)
@@ -1,7 +1,9 @@
+import copy
 import importlib
 from ast import literal_eval as make_tuple
-from dataclasses import asdict, dataclass, field
-from typing import TypeVar
+from collections.abc import Iterable
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import networkx as nx
 
@@ -10,9 +12,14 @@ from epowcore.generic.configuration import Configuration
 from epowcore.generic.constants import GDF_VERSION, Platform
 from epowcore.generic.logger import Logger
 
+from .change_journal import ChangeJournal
 from .component import Component
 
+if TYPE_CHECKING:
+    from epowcore.generic.spatial_index import SpatialIndex
+
 T = TypeVar("T")
+C = TypeVar("C", bound=Component)
 
 
 @dataclass(kw_only=True)
@@ -27,6 +34,38 @@ class CoreModel:
     """Graph of connection between elements."""
     version: int = GDF_VERSION
     """Version of the generic data format."""
+    journal: ChangeJournal | None = field(default=None, init=False, repr=False, compare=False)
+    """Changes of the model, only recorded after calling `track_changes`."""
+    spatial_index: "SpatialIndex | None" = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Index of the component coordinates, only updated after calling `get_spatial_index`."""
+
+    def track_changes(self) -> ChangeJournal:
+        """Start recording the changes made through the methods of the model.
+        The journal allows exporters to patch their previous output with
+        `ConverterBase.reexport`.
+
+        :return: The journal of the model.
+        :rtype: ChangeJournal
+        """
+        if self.journal is None:
+            self.journal = ChangeJournal()
+        return self.journal
+
+    def get_spatial_index(self) -> "SpatialIndex":
+        """Get the spatial index over the coordinates of all components, including those in
+        subsystems. The index is built on the first query and kept up to date with the changes
+        made through the methods of the model.
+
+        :return: The spatial index of the model.
+        :rtype: SpatialIndex
+        """
+        from epowcore.generic.spatial_index import SpatialIndex
+
+        if self.spatial_index is None:
+            self.spatial_index = SpatialIndex(self)
+        return self.spatial_index
 
     def base_mva_fb(self, platform: Platform | None = None) -> float:
         """Base rating for pu calculations in the project with fallback."""
@@ -45,6 +84,25 @@ class CoreModel:
         :type component: Component
         """
         self.graph.add_node(component)
+        if self.journal is not None:
+            self.journal.record_added(component)
+        if self.spatial_index is not None:
+            self.spatial_index.insert(component)
+
+    def add_components(self, components: Iterable[Component]) -> None:
+        """Add multiple components to the graph at once.
+
+        :param components: The components to be added.
+        :type components: Iterable[Component]
+        """
+        components = list(components)
+        self.graph.add_nodes_from(components)
+        if self.journal is not None:
+            for component in components:
+                self.journal.record_added(component)
+        if self.spatial_index is not None:
+            for component in components:
+                self.spatial_index.insert(component)
 
     def remove_component(self, component: Component, keep_connections: bool = False) -> None:
         """Remove a component from the graph.
@@ -71,8 +129,49 @@ class CoreModel:
                         edge1[1],
                         edge2[1],
                     )
+        if self.journal is not None:
+            for neighbor in self.graph.neighbors(component):
+                self.journal.record_edge(component, neighbor)
+            self.journal.record_removed(component)
+        if self.spatial_index is not None:
+            self.spatial_index.remove(component)
         self.graph.remove_node(component)
 
+    def update_component(self, component: C, **changes: Any) -> C:
+        """Change attributes of a component in the model.
+        Components are hashed by their attributes, so they must not be modified in place while
+        they are part of the graph. The component is replaced by an updated copy instead,
+        which keeps all connections.
+
+        :param component: The component to be updated, found by its uid.
+        :type component: Component
+        :param changes: The new values of the attributes, e.g. `active_power=10.0`.
+        :raises ValueError: If the component is not part of the model or an attribute is unknown.
+        :return: The updated component of the same type, which replaces [component] in the graph.
+        :rtype: Component
+        """
+        names = {f.name for f in fields(component)} - {"uid"}
+        unknown = set(changes) - names
+        if unknown:
+            raise ValueError(f"Cannot update {', '.join(sorted(unknown))} of {component.name}")
+        graph = self.graph
+        if not graph.has_node(component):
+            # also accept outdated versions of the component and components in subsystems
+            current, current_graph = self.get_component_by_id(component.uid)
+            if not isinstance(current, type(component)) or current_graph is None:
+                raise ValueError(f"{component.name} ({component.uid}) is not part of the model")
+            component, graph = current, current_graph
+
+        updated = copy.copy(component)
+        for name, value in changes.items():
+            setattr(updated, name, value)
+        graph.relabel_nodes({component: updated})
+        if self.journal is not None:
+            self.journal.record_modified(component, updated)
+        if self.spatial_index is not None:
+            self.spatial_index.insert(updated)
+        return updated
+
     def get_component_by_id(self, uid: int) -> tuple[Component | None, ComponentGraph | None]:
         """Get a component by its uid.
 
@@ -123,6 +222,12 @@ class CoreModel:
             connector_name1 = [connector_name1]
         if isinstance(connector_name2, str):
             connector_name2 = [connector_name2]
+        for component in (component1, component2):
+            if not self.graph.has_node(component):
+                if self.journal is not None:
+                    self.journal.record_added(component)
+                if self.spatial_index is not None:
+                    self.spatial_index.insert(component)
         attrs = {}
         if self.graph.has_edge(component1, component2):
             attrs = self.graph.edges[component1, component2]
@@ -141,6 +246,8 @@ class CoreModel:
             }
             self.graph.add_edge(component1, component2)
         self.graph.edges.update(component1, component2, attrs)
+        if self.journal is not None:
+            self.journal.record_edge(component1, component2)
 
     # TODO This is kept for legacy reasons. Has only been used without following subsystems and ports.
     def get_attached_to(
@@ -334,6 +441,19 @@ class CoreModel:
                 max_id = s_max
         return max_id + 1
 
+    def get_valid_ids(self, count: int) -> range:
+        """Generate a contiguous block of valid new component IDs.
+        Only scans the model once, so prefer it over repeated calls of `get_valid_id`
+        when creating many components.
+
+        :param count: The number of IDs to allocate.
+        :type count: int
+        :return: A range of [count] valid IDs for new components.
+        :rtype: range
+        """
+        start = self.get_valid_id()
+        return range(start, start + count)
+
     def sanity_check(self) -> bool:
         """Checks the validity of the model, including subsystem graphs."""
 
@@ -381,8 +501,7 @@ class CoreModel:
         :return: The dictionary containing the model settings, graph, and components.
         :rtype: dict
         """
-        data = asdict(self)
-        del data["graph"]
+        data = {f.name: getattr(self, f.name) for f in fields(self) if f.init and f.name != "graph"}
         return data | self.graph.to_primitive_dict()
 
     @classmethod
@@ -5,6 +5,7 @@ from epowcore.gdf.impedance import Impedance
 
 from epowcore.gdf.shunt import Shunt
 from epowcore.gdf.voltage_source import VoltageSource
+from epowcore.generic.manipulation.batch_rewrite import BatchRewrite
 
 from .bus import Bus, LFBusType
 from .load import Load
@@ -27,17 +28,23 @@ class ExtendedWard(Ward):
         self,
         core_model: CoreModel,
         base_mva: float = 100.0,
+        rewrite: BatchRewrite | None = None,
     ) -> None:
         """Replaces the Ward equivalent with a Load, a Shunt component, and a VoltageSource in the graph.
 
         :param core_model: The core model to replace the ward in.
         :type core_model: CoreModel
+        :param base_mva: The base power of the internal impedance in MVA.
+        :type base_mva: float
+        :param rewrite: The batch to collect the graph edits in, applied immediately if None.
+        :type rewrite: BatchRewrite | None
         """
         bus: Component = next(core_model.graph.neighbors(self))
         if not isinstance(bus, Bus):
             raise TypeError(f"Expected {self} to be connected to a Bus, but got {bus}.")
 
-        new_id = core_model.get_valid_id()
+        batch = rewrite if rewrite is not None else BatchRewrite(core_model)
+        new_id = batch.new_ids(5)[0]
         load = Load(
             new_id,
             f"{self.name}-Load",
@@ -78,9 +85,13 @@ class ExtendedWard(Ward):
             x_pu=1e-8,
         )
 
-        core_model.graph.remove_node(self)
-        core_model.graph.add_edge(bus, load)
-        core_model.graph.add_edge(bus, shunt)
-        core_model.graph.add_edge(bus, int_impedance)
-        core_model.graph.add_edge(int_impedance, int_bus)
-        core_model.graph.add_edge(int_bus, int_vsource)
+        batch.remove_component(self)
+        for component in (load, shunt, int_bus, int_impedance, int_vsource):
+            batch.add_component(component)
+        batch.add_edge(bus, load)
+        batch.add_edge(bus, shunt)
+        batch.add_edge(bus, int_impedance)
+        batch.add_edge(int_impedance, int_bus)
+        batch.add_edge(int_bus, int_vsource)
+        if rewrite is None:
+            batch.apply()
@@ -5,6 +5,7 @@ from epowcore.gdf.core_model import CoreModel
 from epowcore.gdf.tline import TLine
 from epowcore.gdf.utils import get_connected_bus
 from epowcore.generic.constants import Platform
+from epowcore.generic.manipulation.batch_rewrite import BatchRewrite
 
 from .component import Component
 
@@ -27,12 +28,17 @@ class Impedance(Component):
     """Imaginary part of positive sequence impedance from B to A in pu."""
 
     def replace_with_line(
-        self, core_model: CoreModel, platform: Platform | None = None
+        self,
+        core_model: CoreModel,
+        platform: Platform | None = None,
+        rewrite: BatchRewrite | None = None,
     ) -> None:
         """Replaces the Impedance with a TLine component in the graph.
 
         :param core_model: The CoreModel to replace this component in.
         :type core_model: CoreModel
+        :param rewrite: The batch to collect the graph edits in, applied immediately if None.
+        :type rewrite: BatchRewrite | None
         """
         connected_bus: Bus | None = get_connected_bus(core_model.graph, self)
         if connected_bus is None:
@@ -47,8 +53,9 @@ class Impedance(Component):
         if b1 is None or b0 is None:
             raise ValueError("No default values found for Impedance to TLine conversion!")
 
+        batch = rewrite if rewrite is not None else BatchRewrite(core_model)
         line = TLine(
-            core_model.get_valid_id(),
+            batch.new_id(),
             f"{self.name}-Line",
             bus.coords,
             length=1.0,
@@ -62,7 +69,9 @@ class Impedance(Component):
         )
         buses = list(core_model.graph.neighbors(self))
 
-        core_model.add_component(line)
-        core_model.add_connection(buses[0], line)
-        core_model.add_connection(buses[1], line)
-        core_model.remove_component(self)
+        batch.add_component(line)
+        batch.add_connection(buses[0], line)
+        batch.add_connection(buses[1], line)
+        batch.remove_component(self)
+        if rewrite is None:
+            batch.apply()
@@ -1,5 +1,6 @@
 from ast import literal_eval as make_tuple
-from dataclasses import dataclass, field
+import copy
+from dataclasses import dataclass, field, fields
 import networkx as nx
 
 from epowcore.gdf.core_model import CoreModel, _get_class
@@ -82,8 +83,10 @@ class Subsystem(Component):
         :return: A dictionary describing the instance with primitive data types only.
         :rtype: dict
         """
-        normal_dict = super().to_primitive_dict()
-        del normal_dict["graph"]
+        # asdict would copy the whole subgraph just to drop it
+        normal_dict = {
+            f.name: copy.deepcopy(getattr(self, f.name)) for f in fields(self) if f.name != "graph"
+        }
         return normal_dict | self.graph.to_primitive_dict()
 
     @classmethod
@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from epowcore.gdf.core_model import CoreModel
 from epowcore.gdf.tline import TLine
 from epowcore.generic.constants import Platform
+from epowcore.generic.manipulation.batch_rewrite import BatchRewrite
 
 from .component import Component
 
@@ -22,13 +23,27 @@ class Switch(Component):
     rate_c: float | None = None
     """Emergency rating [MVA]."""
 
-    def replace_with_line_if_closed(self, core_model: CoreModel, platform: Platform) -> None:
+    def replace_with_line_if_closed(
+        self, core_model: CoreModel, platform: Platform, rewrite: BatchRewrite | None = None
+    ) -> None:
+        """Replaces a closed switch with a low impedance TLine and removes an open switch.
+
+        :param core_model: The CoreModel to replace this component in.
+        :type core_model: CoreModel
+        :param platform: The platform to get the configured line parameters for.
+        :type platform: Platform
+        :param rewrite: The batch to collect the graph edits in, applied immediately if None.
+        :type rewrite: BatchRewrite | None
+        """
+        batch = rewrite if rewrite is not None else BatchRewrite(core_model)
+        batch.remove_component(self)
         if not self.closed:
-            core_model.remove_component(self)
+            if rewrite is None:
+                batch.apply()
             return None
 
         line = TLine(
-            uid=core_model.get_valid_id(),
+            uid=batch.new_id(),
             name=self.name + "_tline",
             length=None,
             r1=self.get_default(attr="tline_r1", platform=platform),
@@ -45,6 +60,8 @@ class Switch(Component):
 
         buses = list(core_model.graph.neighbors(self))
 
-        core_model.add_component(line)
-        core_model.add_connection(buses[0], line, None, "A")
-        core_model.add_connection(buses[1], line, None, "B")
+        batch.add_component(line)
+        batch.add_connection(buses[0], line, None, "A")
+        batch.add_connection(buses[1], line, None, "B")
+        if rewrite is None:
+            batch.apply()
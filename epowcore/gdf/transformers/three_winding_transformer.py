@@ -3,6 +3,7 @@ from dataclasses import dataclass, field
 from epowcore.gdf.bus import Bus, LFBusType
 from epowcore.gdf.core_model import CoreModel
 from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.generic.manipulation.batch_rewrite import BatchRewrite
 
 from .transformer import Transformer, WindingConfig
 
@@ -68,14 +69,18 @@ class ThreeWindingTransformer(Transformer):
         """No load losses (iron losses) of the transformer [p.u.]"""
         return self.pfe_kw / self.rating_hv / 1000
 
-    def replace_with_two_winding_transformers(self, core_model: CoreModel) -> None:
+    def replace_with_two_winding_transformers(
+        self, core_model: CoreModel, rewrite: BatchRewrite | None = None
+    ) -> None:
         """Creates three two winding transformers and their auxiliary bus from a three winding transformer.
 
         The new auxiliary bus is connected to the LV side of each of the three new transformers.
 
         :param core_model: The core model that contains this three winding transformer.
+        :param rewrite: The batch to collect the graph edits in, applied immediately if None.
         :return: None
         """
+        batch = rewrite if rewrite is not None else BatchRewrite(core_model)
         # Create auxilary bus
         auxilary_bus = Bus(
             self.uid,  # Id
@@ -86,7 +91,7 @@ class ThreeWindingTransformer(Transformer):
         )
         # Create three two winding transformers
         two_winding_transformers = []
-        new_id = core_model.get_valid_id()
+        new_id = batch.new_ids(3)[0]
 
         x1_h, x1_m, x1_l = _calculate_impedances(
             (self.x1_hm, self.x1_ml, self.x1_lh),
@@ -154,15 +159,20 @@ class ThreeWindingTransformer(Transformer):
 
         # Add elements to core model
         neighbors = list(core_model.graph.neighbors(self))
-        core_model.graph.remove_node(self)
+        batch.remove_component(self)
+        batch.add_component(auxilary_bus)
+        for trafo in two_winding_transformers:
+            batch.add_component(trafo)
 
         # Add connections to graph
-        core_model.add_connection(auxilary_bus, two_winding_transformers[0], "", "LV")
-        core_model.add_connection(auxilary_bus, two_winding_transformers[1], "", "LV")
-        core_model.add_connection(auxilary_bus, two_winding_transformers[2], "", "LV")
+        batch.add_connection(auxilary_bus, two_winding_transformers[0], "", "LV")
+        batch.add_connection(auxilary_bus, two_winding_transformers[1], "", "LV")
+        batch.add_connection(auxilary_bus, two_winding_transformers[2], "", "LV")
 
         for i in range(min(len(neighbors), 3)):
-            core_model.add_connection(two_winding_transformers[i], neighbors[i], "HV", "")
+            batch.add_connection(two_winding_transformers[i], neighbors[i], "HV", "")
+        if rewrite is None:
+            batch.apply()
 
 
 def _calculate_impedances(
@@ -162,8 +162,8 @@ class TwoWindingTransformer(Transformer):
         :return: The given or calculated value.
         :rtype: float
         """
-        if self.rating_short_term is not None:
-            return self.rating_short_term
+        if self.rating_emergency is not None:
+            return self.rating_emergency
         factor = self.get_default("rating_emergency_factor", platform)
         if factor is None:
             raise ValueError("No default value found for `rating_emergency` calculation!")
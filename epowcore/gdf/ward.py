@@ -2,6 +2,7 @@ from dataclasses import dataclass, field
 from epowcore.gdf.core_model import CoreModel
 
 from epowcore.gdf.shunt import Shunt
+from epowcore.generic.manipulation.batch_rewrite import BatchRewrite
 
 from .component import Component
 from .load import Load
@@ -25,13 +26,18 @@ class Ward(Component):
     q_zload: float = field(default_factory=float)
     """The reactive power of the constant impedance load. The unit is Mvar."""
 
-    def replace_with_load_and_shunt(self, core_model: CoreModel) -> None:
+    def replace_with_load_and_shunt(
+        self, core_model: CoreModel, rewrite: BatchRewrite | None = None
+    ) -> None:
         """Replaces the Ward equivalent with a Load and a Shunt component in the graph.
 
         :param core_model: The core model to replace the ward in.
         :type core_model: CoreModel
+        :param rewrite: The batch to collect the graph edits in, applied immediately if None.
+        :type rewrite: BatchRewrite | None
         """
-        new_id = core_model.get_valid_id()
+        batch = rewrite if rewrite is not None else BatchRewrite(core_model)
+        new_id = batch.new_ids(2)[0]
         load = Load(
             new_id,
             f"{self.name}-Load",
@@ -48,9 +54,11 @@ class Ward(Component):
         )
         bus = list(core_model.graph.neighbors(self))[0]
 
-        core_model.add_component(load)
-        core_model.add_component(shunt)
-        core_model.add_connection(bus, load)
-        core_model.add_connection(bus, shunt)
+        batch.add_component(load)
+        batch.add_component(shunt)
+        batch.add_connection(bus, load)
+        batch.add_connection(bus, shunt)
 
-        core_model.remove_component(self)
+        batch.remove_component(self)
+        if rewrite is None:
+            batch.apply()
@@ -0,0 +1,132 @@
+from dataclasses import dataclass, field
+from enum import Enum
+
+import networkx as nx
+import numpy as np
+import numpy.typing as npt
+import scipy.sparse as sp
+from scipy.sparse.csgraph import reverse_cuthill_mckee
+from scipy.sparse.linalg import splu
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+
+
+class BusOrdering(Enum):
+    """Orderings that can be used to number the buses of an exported model."""
+
+    UID = "uid"
+    """Ascending uid, i.e. the order of the GDF model."""
+    RCM = "rcm"
+    """Reverse Cuthill-McKee, minimizes the bandwidth of the admittance matrix."""
+    AMD = "amd"
+    """Minimum degree on the symmetric pattern of the admittance matrix, minimizes the fill-in
+    of the LU factorization.
+    """
+
+
+@dataclass
+class BusNumbering:
+    """Bidirectional mapping between GDF bus uids and dense bus indices of an exported model."""
+
+    uids: list[int]
+    """The bus uids in index order."""
+    start: int = 0
+    """The index of the first bus, e.g. 1 for Matpower."""
+    indices: dict[int, int] = field(init=False, repr=False)
+    """Mapping of bus uids to their index."""
+
+    def __post_init__(self) -> None:
+        self.indices = {uid: i for i, uid in enumerate(self.uids, self.start)}
+
+    def __len__(self) -> int:
+        return len(self.uids)
+
+    def index(self, uid: int) -> int:
+        """Get the index of the bus with the given uid."""
+        return self.indices[uid]
+
+    def uid(self, index: int) -> int:
+        """Get the uid of the bus with the given index."""
+        return self.uids[index - self.start]
+
+    @classmethod
+    def from_core_model(
+        cls, core_model: CoreModel, ordering: BusOrdering = BusOrdering.UID, start: int = 0
+    ) -> "BusNumbering":
+        """Number the buses of a flattened core model according to the given ordering.
+
+        :param core_model: The flattened core model.
+        :type core_model: CoreModel
+        :param ordering: The ordering of the buses, defaults to BusOrdering.UID
+        :type ordering: BusOrdering, optional
+        :param start: The index of the first bus, defaults to 0
+        :type start: int, optional
+        :return: The numbering of the buses.
+        :rtype: BusNumbering
+        """
+        buses = sorted(core_model.type_list(Bus), key=lambda b: b.uid)
+        uids = [b.uid for b in buses]
+        if ordering == BusOrdering.UID or len(buses) < 2:
+            return cls(uids, start)
+
+        adjacency = bus_adjacency(core_model, buses)
+        match ordering:
+            case BusOrdering.RCM:
+                permutation = reverse_cuthill_mckee(adjacency, symmetric_mode=True)
+            case BusOrdering.AMD:
+                permutation = _minimum_degree(adjacency)
+            case _:
+                raise ValueError(f"Unsupported bus ordering: {ordering}")
+        return cls([uids[i] for i in permutation], start)
+
+
+def bus_adjacency(core_model: CoreModel, buses: list[Bus]) -> sp.csr_matrix:
+    """Get the symmetric adjacency pattern of the buses of a flattened core model,
+    i.e. the off-diagonal pattern of its admittance matrix.
+    Buses are adjacent if they are connected directly or through branch components
+    like lines, transformers, switches or chains of them.
+
+    :param core_model: The flattened core model.
+    :type core_model: CoreModel
+    :param buses: The buses in the order of the matrix rows.
+    :type buses: list[Bus]
+    :return: The adjacency matrix with ones for adjacent buses.
+    :rtype: sp.csr_matrix
+    """
+    graph = core_model.graph.get_internal_graph(copy=False)
+    rows = {bus: i for i, bus in enumerate(buses)}
+
+    cliques: list[list[int]] = [
+        [rows[u], rows[v]] for u, v in graph.edges if u in rows and v in rows
+    ]
+    branch_components = graph.subgraph(n for n in graph.nodes if n not in rows)
+    for cluster in nx.connected_components(branch_components):
+        connected = {rows[n] for c in cluster for n in graph.neighbors(c) if n in rows}
+        if len(connected) > 1:
+            cliques.append(sorted(connected))
+
+    row_list: list[int] = []
+    col_list: list[int] = []
+    for clique in cliques:
+        for i in clique:
+            for j in clique:
+                if i != j:
+                    row_list.append(i)
+                    col_list.append(j)
+    adjacency = sp.coo_matrix(
+        (np.ones(len(row_list)), (row_list, col_list)), shape=(len(buses), len(buses))
+    ).tocsr()
+    adjacency.data[:] = 1.0
+    return adjacency
+
+
+def _minimum_degree(adjacency: sp.csr_matrix) -> npt.NDArray[np.int32]:
+    # SuperLU computes the minimum degree column ordering of A^T + A before factorizing.
+    # Factorizing a strictly diagonally dominant matrix with the adjacency pattern is cheap
+    # and never pivots.
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    matrix = (sp.diags(degree + 1.0) - adjacency).tocsc()
+    lu = splu(matrix, permc_spec="MMD_AT_PLUS_A", diag_pivot_thresh=0.0)
+    # perm_c maps the original column to its position in the factorization
+    return np.argsort(lu.perm_c).astype(np.int32)
@@ -71,10 +71,11 @@ class ComponentGraph:
         assert isinstance(node, Component)
         self._graph.add_node(node)
 
-    def add_nodes_from(self, nodes: Iterator[Component]) -> None:
+    def add_nodes_from(self, nodes: Iterable[Component]) -> None:
         # No **attr support: Can not set node attributes while creating.
-        for node in nodes:
-            self.add_node(node)
+        nodes = list(nodes)
+        assert all(isinstance(node, Component) for node in nodes)
+        self._graph.add_nodes_from(nodes)
 
     def add_edge(self, u_of_edge: Component, v_of_edge: Component) -> None:
         # No **attr support: Can not set edge attributes while creating.
@@ -82,10 +83,17 @@ class ComponentGraph:
         assert isinstance(v_of_edge, Component)
         self._graph.add_edge(u_of_edge, v_of_edge)
 
-    def add_edges_from(self, edges: Iterable[tuple[Component, Component]]) -> None:
-        # No **attr support: Can not set edge attributes while creating.
-        for edge in edges:
-            self.add_edge(edge[0], edge[1])
+    def add_edges_from(
+        self,
+        edges: Iterable[
+            tuple[Component, Component] | tuple[Component, Component, dict[int, list[str]]]
+        ],
+    ) -> None:
+        # No **attr support: Edge data can only be passed per edge as third tuple element.
+        # Data of existing edges is updated, connector lists are not concatenated.
+        edges = list(edges)
+        assert all(isinstance(u, Component) and isinstance(v, Component) for u, v, *_ in edges)
+        self._graph.add_edges_from(edges)
 
     def remove_node(self, node: Component) -> None:
         self._graph.remove_node(node)
@@ -113,10 +121,24 @@ class ComponentGraph:
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, ComponentGraph):
             return NotImplemented
-        return list(self.nodes) == list(other.nodes) and list(self.edges) == list(other.edges)
+        # independent of the insertion order and the direction of the edges
+        graph, other_graph = self._graph, other._graph
+        if (
+            graph.number_of_nodes() != other_graph.number_of_nodes()
+            or graph.number_of_edges() != other_graph.number_of_edges()
+        ):
+            return False
+        if any(node not in other_graph for node in graph):
+            return False
+        return all(
+            other_graph.has_edge(u, v) and other_graph.edges[u, v] == data
+            for u, v, data in graph.edges(data=True)
+        )
 
     def __hash__(self) -> int:
-        return hash(self._graph)
+        # Equal graphs need equal hashes, and the hash of a graph must not change when it is
+        # edited as part of a subsystem in another graph. Subsystems are told apart by their uid.
+        return hash(ComponentGraph)
 
     def to_primitive_dict(self) -> dict:
         """Return the dataclass as a dict containing only primitive data types.
@@ -124,14 +146,15 @@ class ComponentGraph:
         :return: A dictionary describing the instance with primitive data types only.
         :rtype: dict
         """
-        internal_graph = self.get_internal_graph()
+        # relabeling copies the graph, only the connector lists of the edges are shared
+        internal_graph = self.get_internal_graph(copy=False)
         comp_label_dict = {k: k.to_export_str() for k in internal_graph.nodes}
         label_comp_dict = {k.to_export_str(): k.to_primitive_dict() for k in internal_graph.nodes}
 
         export_graph = nx.relabel_nodes(internal_graph, comp_label_dict)
 
         return {
-            "graph": nx.to_dict_of_dicts(export_graph),
+            "graph": cp.deepcopy(nx.to_dict_of_dicts(export_graph)),
             "components": label_comp_dict,
         }
 
@@ -1,5 +1,9 @@
 import logging
 import re
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Any
 import yaml
 
@@ -8,23 +12,89 @@ from epowcore.generic.singleton import Singleton
 
 _REGEX_FILE_TAG = re.compile(r"<file:(.*)>")
 
+_context_platform: ContextVar[Platform | None] = ContextVar("default_platform", default=None)
+"""The default platform of the current context, overrides the global default platform."""
+_context_overrides: ContextVar[tuple[dict, ...]] = ContextVar("overrides", default=())
+"""Configuration overlays of the current context, innermost first."""
+
 
 class Configuration(metaclass=Singleton):
     """A singleton class that holds the configuration of the application, parsed from a yaml file."""
 
     def __init__(self) -> None:
-        self.default_platform: Platform | None = None
-        """The currently selected platform to get default values for."""
+        self.__default_platform: Platform | None = None
+        """The globally selected platform to get default values for."""
         self.__configs: list[tuple[int, dict]] = []
-        """A list of configuration dictionaries and their priorities, always sorted by descending priority."""
+        """A list of configuration dictionaries and their priorities, always sorted by descending priority.
+        The list is replaced instead of modified, so readers in other threads see a consistent
+        state."""
+        self.__lock = threading.Lock()
 
         self.load_config("config.yml")
 
+    @property
+    def default_platform(self) -> Platform | None:
+        """The currently selected platform to get default values for.
+        The platform of the current context (see [scoped]) takes precedence over the global one.
+        """
+        platform = _context_platform.get()
+        return platform if platform is not None else self.__default_platform
+
+    @default_platform.setter
+    def default_platform(self, platform: Platform | None) -> None:
+        self.__default_platform = platform
+
+    @contextmanager
+    def scoped(
+        self, platform: Platform | None = None, overrides: dict | None = None
+    ) -> Iterator["Configuration"]:
+        """Select a default platform and configuration overlay for the current context only.
+
+        Other threads and asyncio tasks are not affected, so converters for different platforms
+        can run concurrently. The previous state is restored when the block is left.
+
+        :param platform: The default platform of the context, defaults to the current one.
+        :type platform: Platform | None, optional
+        :param overrides: Configuration values that take precedence over all loaded configurations.
+        :type overrides: dict | None, optional
+        """
+        platform_token = _context_platform.set(
+            platform if platform is not None else _context_platform.get()
+        )
+        overrides_token = _context_overrides.set(
+            (overrides,) + _context_overrides.get()
+            if overrides is not None
+            else _context_overrides.get()
+        )
+        try:
+            yield self
+        finally:
+            _context_overrides.reset(overrides_token)
+            _context_platform.reset(platform_token)
+
+    def state(self) -> dict:
+        """The configuration in effect for the current context, e.g. to detect changes.
+
+        :return: The default platform, the overlays of the context and the loaded configurations
+                 with their priorities, in the order they are searched.
+        :rtype: dict
+        """
+        platform = self.default_platform
+        return {
+            "platform": platform.value if platform is not None else None,
+            "overrides": list(_context_overrides.get()),
+            "configs": [[priority, conf] for priority, conf in self.__configs],
+        }
+
     def get(self, key: str) -> Any:
         """Static access method.
 
         :param key: The key of the configuration value.
         """
+        for conf in _context_overrides.get():
+            value = self.__get_from_config(key, conf)
+            if value is not None:
+                return value
         for _, conf in self.__configs:
             value = self.__get_from_config(key, conf)
             if value is not None:
@@ -64,11 +134,12 @@ class Configuration(metaclass=Singleton):
         :param priority: The priority of the configuration to delete.
         :return: True if the configuration was deleted, False if no configuration with the given priority was found.
         """
-        for i, (pri, _) in enumerate(self.__configs):
-            if pri == priority:
-                del self.__configs[i]
-                return True
-        return False
+        with self.__lock:
+            configs = [(pri, conf) for pri, conf in self.__configs if pri != priority]
+            if len(configs) == len(self.__configs):
+                return False
+            self.__configs = configs
+        return True
 
     def load_config(self, config_file: str, priority: int = 0) -> bool:
         """Loads the configuration from a yaml file.
@@ -105,16 +176,20 @@ class Configuration(metaclass=Singleton):
         """Inserts the configuration into the list of configurations at the correct position,
         according to descending priority.
         """
-        for i, (pri, _) in enumerate(self.__configs):
-            if pri == priority:
-                # Overwrite existing configuration
-                self.__configs[i] = (priority, config)
-                return
-            if pri < priority:
-                # Insert new configuration
-                self.__configs.insert(i, (priority, config))
-                return
-        self.__configs.append((priority, config))
+        with self.__lock:
+            configs = list(self.__configs)
+            for i, (pri, _) in enumerate(configs):
+                if pri == priority:
+                    # Overwrite existing configuration
+                    configs[i] = (priority, config)
+                    break
+                if pri < priority:
+                    # Insert new configuration
+                    configs.insert(i, (priority, config))
+                    break
+            else:
+                configs.append((priority, config))
+            self.__configs = configs
 
     def _crawl_and_replace(
         self,
@@ -0,0 +1,199 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Callable
+from enum import Enum
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.generic.configuration import Configuration
+from epowcore.generic.logger import Logger
+
+if TYPE_CHECKING:
+    from epowcore.generic.converter_base import ConverterBase
+
+Model = TypeVar("Model")
+
+_SUFFIX = ".bin"
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+def _package_version() -> str:
+    try:
+        return version("epowcore")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+class ConversionCache:
+    """A content-addressed cache for the results of `ConverterBase.from_gdf` on disk.
+
+    The key is a hash of the canonical GDF content, the configuration in effect, the converter
+    class with its settings, the model name and the epowcore version. The exported models are
+    stored in the serialized form of the converter, e.g. pandapower JSON or a Matpower .mat file.
+    Converters without serialization are not cached.
+
+    Entries are written atomically and carry a checksum, so concurrent processes can share a
+    directory and corrupted entries are discarded. If the cache grows beyond [max_size] bytes,
+    the least recently used entries are evicted.
+
+    Example:
+        converter = PandapowerConverter()
+        converter.cache = ConversionCache(".epowcore_cache")
+        model = converter.from_gdf(core_model, "IEEE39")
+    """
+
+    def __init__(self, directory: str | Path, max_size: int = 1 << 30) -> None:
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, converter: "ConverterBase", core_model: CoreModel, name: str) -> str:
+        """Calculate the cache key of an export.
+
+        :param converter: The converter exporting the model.
+        :type converter: ConverterBase
+        :param core_model: The exported core model.
+        :type core_model: CoreModel
+        :param name: The name of the exported model.
+        :type name: str
+        :return: The hexadecimal SHA-256 digest identifying the export.
+        :rtype: str
+        """
+        klass = type(converter)
+        # only plain settings, not results of previous runs like plausibility results
+        settings = {
+            key: value.name if isinstance(value, Enum) else value
+            for key, value in vars(converter).items()
+            if key != "cache"
+            and (value is None or isinstance(value, (bool, int, float, str, Enum)))
+        }
+        content = {
+            "converter": f"{klass.__module__}.{klass.__qualname__}",
+            "settings": settings,
+            "name": name,
+            "version": _package_version(),
+            "configuration": Configuration().state(),
+            "model": core_model.export_dict(),
+        }
+        encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Read an entry and mark it as recently used.
+        Corrupted entries are deleted.
+
+        :param key: The key of the entry.
+        :type key: str
+        :return: The stored data or None if there is no valid entry.
+        :rtype: bytes | None
+        """
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        digest, payload = data[:_DIGEST_SIZE], data[_DIGEST_SIZE:]
+        if hashlib.sha256(payload).digest() != digest:
+            Logger.log_to_selected(f"Discarding corrupted cache entry {key}")
+            self.delete(key)
+            return None
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return payload
+
+    def put(self, key: str, payload: bytes) -> None:
+        """Store an entry atomically and evict old entries if the cache is too large.
+
+        :param key: The key of the entry.
+        :type key: str
+        :param payload: The data to store.
+        :type payload: bytes
+        """
+        file_descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(hashlib.sha256(payload).digest())
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            Path(temp_path).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def delete(self, key: str) -> None:
+        """Delete an entry if it exists."""
+        self._path(key).unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        """Delete the least recently used entries until the cache fits into [max_size]."""
+        entries = []
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+        size = sum(entry_size for _, entry_size, _ in entries)
+        for _, entry_size, path in sorted(entries):
+            if size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            size -= entry_size
+
+    def size(self) -> int:
+        """The total size of all entries in bytes."""
+        return sum(path.stat().st_size for path in self.directory.glob(f"*{_SUFFIX}"))
+
+    def clear(self) -> None:
+        """Delete all entries."""
+        for path in self.directory.glob(f"*{_SUFFIX}"):
+            path.unlink(missing_ok=True)
+
+    def from_gdf(
+        self,
+        converter: "ConverterBase[Model]",
+        core_model: CoreModel,
+        name: str,
+        export: Callable[[], Model],
+    ) -> Model:
+        """Return the cached result of an export or run [export] and cache its result.
+
+        :param converter: The converter, which serializes and deserializes the results.
+        :type converter: ConverterBase[Model]
+        :param core_model: The exported core model.
+        :type core_model: CoreModel
+        :param name: The name of the exported model.
+        :type name: str
+        :param export: Runs the export on a cache miss.
+        :type export: Callable[[], Model]
+        :return: The exported model.
+        :rtype: Model
+        """
+        key = self.key(converter, core_model, name)
+        payload = self.get(key)
+        if payload is not None:
+            try:
+                return converter.deserialize(payload)
+            except Exception as e:  # pylint: disable=broad-except
+                Logger.log_to_selected(f"Discarding unreadable cache entry {key}: {e}")
+                self.delete(key)
+
+        model = export()
+        try:
+            payload = converter.serialize(model)
+        except NotImplementedError:
+            Logger.log_to_selected(f"{type(converter).__name__} results cannot be cached")
+            return model
+        self.put(key, payload)
+        return model
+
+    def _path(self, key: str) -> Path:
+        return self.directory / f"{key}{_SUFFIX}"
@@ -2,7 +2,9 @@ from abc import abstractmethod
 import copy
 from typing import Generic, TypeVar
 
+from epowcore.gdf.change_journal import ChangeJournal
 from epowcore.gdf.core_model import CoreModel
+from epowcore.generic.conversion_cache import ConversionCache
 from epowcore.generic.logger import Logger
 from epowcore.generic.tools.visualization import visualize_graph
 
@@ -13,13 +15,39 @@ Model = TypeVar("Model")
 class ConverterBase(Generic[Model]):
     """Base class for all converters with import to and export from the GDF."""
 
+    structural_change_limit: float = 0.0
+    """Share of the components of a model up to which structural changes are patched by
+    `reexport`. With more added or removed components and changed edges, the model is exported
+    again."""
+
+    SEQUENCE_ATTRIBUTE = "journal_sequence"
+    """Attribute of the exported models of converters that patch their exports, set to the
+    sequence number of the journal of the core model at the time of the export."""
+
     def __init__(self, debug: bool = False) -> None:
         self.debug = debug
+        self.cache: ConversionCache | None = None
+        """Cache for the results of `from_gdf`; disabled by default."""
 
     def from_gdf(
         self, core_model: CoreModel, name: str, log_path: str | None = None
     ) -> Model:
-        """Export a core model to the format."""
+        """Export a core model to the format.
+        The selected logger of the calling context is restored afterwards.
+        If a cache is set, the result is read from or stored in the cache.
+        """
+        sequence = core_model.journal.sequence if core_model.journal is not None else None
+        with Logger.scope():
+            if self.cache is None:
+                model = self.__from_gdf(core_model, name, log_path)
+            else:
+                model = self.cache.from_gdf(
+                    self, core_model, name, lambda: self.__from_gdf(core_model, name, log_path)
+                )
+        self.__set_sequence(model, sequence)
+        return model
+
+    def __from_gdf(self, core_model: CoreModel, name: str, log_path: str | None) -> Model:
         logger = None
         if log_path is not None or self.debug:
             logger = Logger.new(f"{type(self).__name__} Export", True)
@@ -27,6 +55,7 @@ class ConverterBase(Generic[Model]):
             Logger.disable()
 
         core_model = copy.deepcopy(core_model)
+        core_model.journal = None
         if self.debug:
             print("Before export:")
             visualize_graph(core_model.graph.get_internal_graph(copy=False), show_labels=True)
@@ -41,8 +70,79 @@ class ConverterBase(Generic[Model]):
             logger.close()
         return model
 
+    def reexport(
+        self, core_model: CoreModel, model: Model, name: str, log_path: str | None = None
+    ) -> Model:
+        """Update a model that was exported from [core_model] with the changes recorded since.
+        Converters that support it patch [model] in place with the changes recorded in the
+        journal after the sequence number stored on [model], so several exports of the same core
+        model can be updated independently. The core model is exported again if it does not
+        track its changes, if there are too many structural changes or if the converter cannot
+        patch them.
+
+        :param core_model: The core model, tracking its changes since the export of [model].
+        :type core_model: CoreModel
+        :param model: The result of the last export of [core_model].
+        :type model: Model
+        :param name: The name of the model.
+        :type name: str
+        :param log_path: Path to save the log to; defaults to None
+        :type log_path: str | None, optional
+        :return: The patched [model] or a new export.
+        :rtype: Model
+        """
+        sequence = getattr(model, self.SEQUENCE_ATTRIBUTE, None)
+        if core_model.journal is None or sequence is None:
+            return self.from_gdf(core_model, name, log_path)
+        journal = core_model.journal.since(sequence)
+        if journal is None or journal.num_structural > self.structural_change_limit * len(
+            core_model.graph.nodes
+        ):
+            return self.from_gdf(core_model, name, log_path)
+        sequence = core_model.journal.sequence
+        with Logger.scope():
+            patched = self.__reexport(core_model, model, journal, name, log_path)
+        if patched is None:
+            return self.from_gdf(core_model, name, log_path)
+        self.__set_sequence(patched, sequence)
+        return patched
+
+    def __set_sequence(self, model: Model, sequence: int | None) -> None:
+        if hasattr(model, self.SEQUENCE_ATTRIBUTE):
+            setattr(model, self.SEQUENCE_ATTRIBUTE, sequence)
+
+    def __reexport(
+        self,
+        core_model: CoreModel,
+        model: Model,
+        journal: ChangeJournal,
+        name: str,
+        log_path: str | None,
+    ) -> Model | None:
+        logger = None
+        if log_path is not None or self.debug:
+            logger = Logger.new(f"{type(self).__name__} Re-Export", True)
+        else:
+            Logger.disable()
+
+        patched: Model | None = None
+        if self._patch_export(core_model, model, journal):
+            patched = self._post_export(model, name)
+        else:
+            Logger.log_to_selected("Changes cannot be patched, exporting the whole model")
+        if log_path is not None and logger is not None:
+            logger.save_to_file(log_path)
+            logger.close()
+        return patched
+
     def to_gdf(self, model: Model, log_path: str | None = None) -> CoreModel:
-        """Import a core model from the format."""
+        """Import a core model from the format.
+        The selected logger of the calling context is restored afterwards.
+        """
+        with Logger.scope():
+            return self.__to_gdf(model, log_path)
+
+    def __to_gdf(self, model: Model, log_path: str | None) -> CoreModel:
         logger = None
         if log_path is not None:
             logger = Logger.new(f"{type(self).__name__} Import", True)
@@ -74,6 +174,24 @@ class ConverterBase(Generic[Model]):
         """Called after the export of a core model."""
         return model
 
+    def _patch_export(self, core_model: CoreModel, model: Model, journal: ChangeJournal) -> bool:
+        """Called by `reexport` to apply the changes in [journal] to [model] in place.
+        Must return False without modifying [model] if the changes cannot be patched.
+        Models of converters that implement this need an attribute `journal_sequence`.
+        """
+        return False
+
+    def serialize(self, model: Model) -> bytes:
+        """Serialize an exported model for the cache.
+
+        :raises NotImplementedError: If the results of the converter cannot be cached.
+        """
+        raise NotImplementedError()
+
+    def deserialize(self, data: bytes) -> Model:
+        """Restore a model serialized by `serialize`."""
+        raise NotImplementedError()
+
     def _pre_import(self, model: Model) -> Model:
         """Called before the import of a model."""
         return model
@@ -0,0 +1,161 @@
+import hashlib
+from dataclasses import fields
+
+from epowcore.gdf.component import Component
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.generic.component_graph import ComponentGraph
+
+_MODULUS = 1 << 128
+_FIELD_NAMES: dict[type, tuple[str, ...]] = {}
+
+
+def _digest(data: str) -> int:
+    return int.from_bytes(hashlib.blake2b(data.encode("utf-8"), digest_size=16).digest(), "big")
+
+
+def _field_names(component_type: type) -> tuple[str, ...]:
+    names = _FIELD_NAMES.get(component_type)
+    if names is None:
+        names = tuple(
+            f.name
+            for f in fields(component_type)
+            if not (issubclass(component_type, Subsystem) and f.name == "graph")
+        )
+        _FIELD_NAMES[component_type] = names
+    return names
+
+
+def edge_fingerprint(uid1: int, uid2: int, data: dict[int, list[str]]) -> int:
+    """The fingerprint of a connection between two components, including the connector names.
+
+    :param uid1: The uid of the first component.
+    :type uid1: int
+    :param uid2: The uid of the second component.
+    :type uid2: int
+    :param data: The connector names of the connection by uid.
+    :type data: dict[int, list[str]]
+    :return: A 128 bit fingerprint that does not depend on the order of the components.
+    :rtype: int
+    """
+    return _digest(repr(("E", sorted((uid1, uid2)), sorted(data.items()))))
+
+
+class Fingerprinter:
+    """Calculates fingerprints of components, graphs and models that are stable across processes.
+
+    The fingerprint of a graph is the sum of the fingerprints of its components and connections,
+    so it does not depend on the insertion order and can be updated incrementally. Subsystems
+    include the fingerprint of their graph, like the inner nodes of a Merkle tree.
+
+    The fingerprints of components other than subsystems and of connections are cached by
+    identity. Keep a fingerprinter to fingerprint a model repeatedly, e.g. after replacing a few
+    components with `CoreModel.update_component`, which only requires hashing the new components
+    and their connections.
+    Components must not be changed in place while they are cached.
+    """
+
+    def __init__(self) -> None:
+        self._cache: dict[int, tuple[Component, int]] = {}
+        self._edge_cache: dict[
+            tuple[int, int], tuple[Component, Component, dict[int, list[str]], int]
+        ] = {}
+
+    def component(self, component: Component) -> int:
+        """The fingerprint of a component, based on its type and attributes.
+        The fingerprint of a subsystem includes the fingerprint of its graph.
+
+        :param component: The component.
+        :type component: Component
+        :return: A 128 bit fingerprint.
+        :rtype: int
+        """
+        if isinstance(component, Subsystem):
+            return (self.attributes(component) + self.graph(component.graph)) % _MODULUS
+        cached = self._cache.get(id(component))
+        if cached is not None and cached[0] is component:
+            return cached[1]
+        fingerprint = self.attributes(component)
+        self._cache[id(component)] = (component, fingerprint)
+        return fingerprint
+
+    def graph(self, graph: ComponentGraph) -> int:
+        """The fingerprint of a graph, independent of the order of its nodes and edges.
+
+        :param graph: The graph.
+        :type graph: ComponentGraph
+        :return: A 128 bit fingerprint.
+        :rtype: int
+        """
+        total = sum(self.component(component) for component in graph.nodes)
+        total += sum(
+            self._edge(component1, component2, data)
+            for component1, component2, data in graph.edges.data()
+        )
+        return total % _MODULUS
+
+    def model(self, core_model: CoreModel) -> int:
+        """The fingerprint of a core model, its attributes and its graph.
+
+        :param core_model: The core model.
+        :type core_model: CoreModel
+        :return: A 128 bit fingerprint.
+        :rtype: int
+        """
+        attributes = {
+            f.name: getattr(core_model, f.name)
+            for f in fields(core_model)
+            if f.init and f.name != "graph"
+        }
+        total = _digest(repr(("M", sorted(attributes.items())))) + self.graph(core_model.graph)
+        return total % _MODULUS
+
+    def attributes(self, component: Component) -> int:
+        """The fingerprint of the type and attributes of a component,
+        without the graph of subsystems."""
+        component_type = type(component)
+        values = tuple(getattr(component, name) for name in _field_names(component_type))
+        return _digest(
+            repr(("C", f"{component_type.__module__}.{component_type.__qualname__}", values))
+        )
+
+    def clear(self) -> None:
+        """Forget all cached fingerprints."""
+        self._cache = {}
+        self._edge_cache = {}
+
+    def _edge(self, component1: Component, component2: Component, data: dict) -> int:
+        # the connector lists can change in place, so a copy is kept to validate the cache
+        key = (id(component1), id(component2))
+        cached = self._edge_cache.get(key)
+        if (
+            cached is not None
+            and cached[0] is component1
+            and cached[1] is component2
+            and cached[2] == data
+        ):
+            return cached[3]
+        fingerprint = edge_fingerprint(component1.uid, component2.uid, data)
+        snapshot = {uid: list(names) for uid, names in data.items()}
+        self._edge_cache[key] = (component1, component2, snapshot, fingerprint)
+        return fingerprint
+
+
+def fingerprint(item: CoreModel | ComponentGraph | Component) -> str:
+    """The fingerprint of a core model, graph or component as hexadecimal string.
+    Equal fingerprints mean equal content with a very high probability, also if the components
+    and connections were added in a different order.
+
+    :param item: The core model, graph or component.
+    :type item: CoreModel | ComponentGraph | Component
+    :return: The 128 bit fingerprint as 32 hexadecimal digits.
+    :rtype: str
+    """
+    fingerprinter = Fingerprinter()
+    if isinstance(item, CoreModel):
+        value = fingerprinter.model(item)
+    elif isinstance(item, ComponentGraph):
+        value = fingerprinter.graph(item)
+    else:
+        value = fingerprinter.component(item)
+    return f"{value:032x}"
@@ -0,0 +1,370 @@
+import json
+import math
+from collections import OrderedDict
+from collections.abc import Hashable
+from pathlib import Path
+
+import networkx as nx
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import shortest_path
+
+from epowcore.gdf.component import Component
+from epowcore.generic.fingerprint import Fingerprinter
+from epowcore.generic.logger import Logger
+
+Position = tuple[float, float]
+
+
+def sparse_stress_layout(
+    graph: nx.Graph,
+    initial: dict[Hashable, Position] | None = None,
+    num_pivots: int = 50,
+    max_iterations: int = 100,
+    tolerance: float = 1e-2,
+) -> dict[Hashable, Position]:
+    """Calculate a layout with the sparse stress model, in which the distance of two nodes
+    approximates the number of edges between them.
+
+    Instead of the distances between all pairs of nodes, only the distances of adjacent nodes and
+    the distances to a few pivot nodes are approximated, which represent the other nodes around
+    them. The layout starts from the given [initial] positions or a pivot MDS layout and is
+    refined by stress majorization. Time and memory are linear in the number of nodes for a fixed
+    number of pivots.
+    Connected components are laid out separately and placed next to each other, the largest first.
+    The result only depends on the order of the nodes and edges of the graph.
+
+    :param graph: The graph.
+    :type graph: nx.Graph
+    :param initial: Initial positions of all or some of the nodes, e.g. geographic coordinates.
+        Nodes without a position start at the center of their placed neighbors.
+    :type initial: dict[Hashable, Position] | None, optional
+    :param num_pivots: The number of pivots per connected component, defaults to 50.
+    :type num_pivots: int, optional
+    :param max_iterations: Maximum number of majorization steps, defaults to 100.
+    :type max_iterations: int, optional
+    :param tolerance: Stop when the nodes move less than this share of the edge length on
+        average, defaults to 1e-2.
+    :type tolerance: float, optional
+    :return: The positions of the nodes in units of edge lengths.
+    :rtype: dict[Hashable, Position]
+    """
+    components = sorted(
+        (list(nodes) for nodes in nx.connected_components(graph)), key=len, reverse=True
+    )
+    index = {node: i for i, node in enumerate(graph.nodes)}
+    layouts = []
+    for nodes in components:
+        nodes.sort(key=index.__getitem__)
+        layouts.append(
+            (nodes, _layout_component(graph, nodes, initial, num_pivots, max_iterations, tolerance))
+        )
+    return _pack(layouts)
+
+
+def _layout_component(
+    graph: nx.Graph,
+    nodes: list[Hashable],
+    initial: dict[Hashable, Position] | None,
+    num_pivots: int,
+    max_iterations: int,
+    tolerance: float,
+) -> np.ndarray:
+    size = len(nodes)
+    if size == 1:
+        return np.zeros((1, 2))
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array(
+        [(index[u], index[v]) for u, v in graph.subgraph(nodes).edges() if u != v], dtype=np.int64
+    ).reshape(-1, 2)
+    adjacency = csr_matrix(
+        (
+            np.ones(2 * len(edges)),
+            (np.r_[edges[:, 0], edges[:, 1]], np.r_[edges[:, 1], edges[:, 0]]),
+        ),
+        shape=(size, size),
+    )
+    pivots, distances = _select_pivots(adjacency, min(num_pivots, size))
+
+    positions = _seed_positions(nodes, index, adjacency, initial)
+    if positions is None:
+        positions = _pivot_mds(distances)
+
+    # stress terms: adjacent nodes with length 1, and each node to the pivots, which stand for
+    # the nodes closer to them than half the distance to the node
+    nearest = np.argmin(distances, axis=0)
+    pivot_weights = np.zeros_like(distances)
+    for k, row in enumerate(distances):
+        region = np.sort(row[nearest == k])
+        others = row > 1
+        represented = np.searchsorted(region, row[others] / 2, side="right")
+        pivot_weights[k, others] = np.maximum(represented, 1) / row[others] ** 2
+    source = np.r_[edges[:, 0], edges[:, 1]]
+    target = np.r_[edges[:, 1], edges[:, 0]]
+    # nodes at the same position are pushed apart in opposite directions
+    apart = np.where(source < target, 1.0, -1.0)
+    weight_sum = pivot_weights.sum(axis=0) + np.bincount(source, minlength=size)
+
+    # positions as complex numbers; start from the right scale to converge faster
+    points = positions[:, 0] + 1j * positions[:, 1]
+    current = np.abs(points[edges[:, 0]] - points[edges[:, 1]]).mean()
+    if current > 0:
+        points = points / current
+    for _ in range(max_iterations):
+        delta = points[None, :] - points[pivots, None]
+        norm = np.abs(delta)
+        norm[norm == 0] = 1.0
+        goal = (pivot_weights * (points[pivots, None] + delta * (distances / norm))).sum(axis=0)
+        delta = points[source] - points[target]
+        norm = np.abs(delta)
+        delta[norm == 0] = apart[norm == 0]
+        norm[norm == 0] = 1.0
+        neighbor_goal = points[target] + delta / norm
+        goal += np.bincount(source, weights=neighbor_goal.real, minlength=size)
+        goal += 1j * np.bincount(source, weights=neighbor_goal.imag, minlength=size)
+        updated = goal / weight_sum
+        moved = np.abs(updated - points).mean()
+        points = updated
+        if moved < tolerance:
+            break
+    return np.column_stack([points.real, points.imag])
+
+
+def _select_pivots(adjacency: csr_matrix, num_pivots: int) -> tuple[list[int], np.ndarray]:
+    """Select pivots that are far apart, starting with the node of the highest degree.
+
+    :return: The pivots and their distances to all nodes.
+    """
+    degrees = np.diff(adjacency.indptr)
+    pivots = [int(np.argmax(degrees))]
+    rows = [shortest_path(adjacency, unweighted=True, indices=pivots[0])]
+    closest = rows[0].copy()
+    while len(pivots) < num_pivots:
+        pivot = int(np.argmax(closest))
+        if closest[pivot] == 0:
+            break
+        pivots.append(pivot)
+        rows.append(shortest_path(adjacency, unweighted=True, indices=pivot))
+        closest = np.minimum(closest, rows[-1])
+    return pivots, np.vstack(rows)
+
+
+def _pivot_mds(distances: np.ndarray) -> np.ndarray:
+    """Classical multidimensional scaling approximated by the distances to the pivots."""
+    if distances.shape[0] < 2:
+        return np.column_stack([distances[0], np.zeros(distances.shape[1])])
+    squared = distances.T**2
+    centered = (
+        squared - squared.mean(axis=0) - squared.mean(axis=1)[:, None] + squared.mean()
+    ) * -0.5
+    _, vectors = np.linalg.eigh(centered.T @ centered)
+    positions = centered @ vectors[:, ::-1][:, :2]
+    # the sign of eigenvectors is arbitrary
+    signs = np.sign(positions[np.abs(positions).argmax(axis=0), [0, 1]])
+    signs[signs == 0] = 1.0
+    return positions * signs
+
+
+def _seed_positions(
+    nodes: list[Hashable],
+    index: dict[Hashable, int],
+    adjacency: csr_matrix,
+    initial: dict[Hashable, Position] | None,
+) -> np.ndarray | None:
+    """Start from the given positions and place the other nodes at the center of their placed
+    neighbors, in the order of their distance to the placed nodes."""
+    if not initial:
+        return None
+    positions = np.zeros((len(nodes), 2))
+    placed = np.zeros(len(nodes), dtype=bool)
+    for node in nodes:
+        if node in initial:
+            positions[index[node]] = initial[node]
+            placed[index[node]] = True
+    if len({tuple(p) for p in positions[placed]}) < 2:
+        return None
+    frontier = np.flatnonzero(placed)
+    while not placed.all():
+        neighbors = np.unique(
+            np.concatenate(
+                [adjacency.indices[adjacency.indptr[i] : adjacency.indptr[i + 1]] for i in frontier]
+            )
+        )
+        frontier = neighbors[~placed[neighbors]]
+        if len(frontier) == 0:
+            return None
+        for i in frontier:
+            around = adjacency.indices[adjacency.indptr[i] : adjacency.indptr[i + 1]]
+            positions[i] = positions[around[placed[around]]].mean(axis=0)
+        placed[frontier] = True
+    return positions
+
+
+def _pack(layouts: list[tuple[list[Hashable], np.ndarray]]) -> dict[Hashable, Position]:
+    """Place the layouts of the connected components in rows, the largest first."""
+    result: dict[Hashable, Position] = {}
+    if not layouts:
+        return result
+    spans = [positions.max(axis=0) - positions.min(axis=0) for _, positions in layouts]
+    row_width = max(
+        max(span[0] for span in spans), math.sqrt(sum((s[0] + 1) * (s[1] + 1) for s in spans))
+    )
+    x_offset = y_offset = row_height = 0.0
+    for (nodes, positions), span in zip(layouts, spans):
+        if x_offset > 0 and x_offset + span[0] > row_width:
+            x_offset = 0.0
+            y_offset += row_height + 1.0
+            row_height = 0.0
+        shifted = positions - positions.min(axis=0) + (x_offset, y_offset)
+        for node, (x, y) in zip(nodes, shifted):
+            result[node] = (float(x), float(y))
+        x_offset += span[0] + 1.0
+        row_height = max(row_height, span[1])
+    return result
+
+
+def geo_positions(graph: nx.Graph) -> dict[Hashable, Position]:
+    """The positions of the components with geographic coordinates, projected onto a plane.
+    Components with a list of coordinates, like lines, are placed at their center.
+
+    :param graph: The graph of components.
+    :type graph: nx.Graph
+    :return: The x (east) and y (north) positions of the components with coordinates.
+    :rtype: dict[Hashable, Position]
+    """
+    coords: dict[Hashable, Position] = {}
+    for component in graph.nodes:
+        value = getattr(component, "coords", None)
+        if not value:
+            continue
+        if isinstance(value, list):
+            value = tuple(np.mean(value, axis=0))
+        coords[component] = (float(value[0]), float(value[1]))
+    if not coords:
+        return {}
+    # equirectangular projection around the mean latitude
+    scale = math.cos(math.radians(float(np.mean([lat for lat, _ in coords.values()]))))
+    return {component: (lon * scale, lat) for component, (lat, lon) in coords.items()}
+
+
+def grid_order(positions: dict[Hashable, Position], columns: int) -> list[Hashable]:
+    """Order the nodes of a layout row by row for placing them on a grid with [columns] columns,
+    so that nodes that are close in the layout are close on the grid.
+
+    :param positions: The layout.
+    :type positions: dict[Hashable, Position]
+    :param columns: The number of nodes per row.
+    :type columns: int
+    :return: The nodes in the order of the grid cells, row by row.
+    :rtype: list[Hashable]
+    """
+    by_y = sorted(positions, key=lambda node: (positions[node][1], positions[node][0]))
+    result = []
+    for start in range(0, len(by_y), columns):
+        result.extend(sorted(by_y[start : start + columns], key=lambda node: positions[node][0]))
+    return result
+
+
+class LayoutCache:
+    """Keeps the layouts of component graphs by the fingerprint of the graph, so the same model
+    is laid out only once, e.g. for the Simscape export and its visualization.
+
+    The layouts are stored by the uids of the components and also apply to copies of the graph.
+    If a [directory] is given, the layouts are also written there as JSON files and shared between
+    processes.
+    """
+
+    def __init__(self, directory: str | Path | None = None, max_entries: int = 16) -> None:
+        self.directory = Path(directory) if directory is not None else None
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, dict[int, Position]] = OrderedDict()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+
+    def key(self, graph: nx.Graph, use_coords: bool) -> str:
+        """The cache key of the layout of a graph. The graph is fingerprinted by a new
+        `Fingerprinter`, which would otherwise keep all components ever laid out alive."""
+        return f"{Fingerprinter().graph(graph):032x}{'g' if use_coords else 't'}"
+
+    def get(self, key: str) -> dict[int, Position] | None:
+        """Returns the layout by component uid, or None if it is not cached."""
+        layout = self._entries.get(key)
+        if layout is not None:
+            self._entries.move_to_end(key)
+            return layout
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.json"
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                layout = {int(uid): (x, y) for uid, (x, y) in json.load(file).items()}
+        except (OSError, ValueError, TypeError) as error:
+            if path.exists():
+                Logger.log_to_selected(f"Ignoring invalid layout cache entry {path}: {error}")
+            return None
+        self._remember(key, layout)
+        return layout
+
+    def put(self, key: str, layout: dict[int, Position]) -> None:
+        """Store the layout by component uid."""
+        self._remember(key, layout)
+        if self.directory is not None:
+            path = self.directory / f"{key}.json"
+            temp_path = path.with_suffix(".tmp")
+            with open(temp_path, "w", encoding="utf-8") as file:
+                json.dump({str(uid): position for uid, position in layout.items()}, file)
+            temp_path.replace(path)
+
+    def clear(self) -> None:
+        """Forget all layouts kept in memory."""
+        self._entries.clear()
+
+    def _remember(self, key: str, layout: dict[int, Position]) -> None:
+        self._entries[key] = layout
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+SHARED_LAYOUT_CACHE = LayoutCache()
+"""The cache used by default, shared by all exporters and the visualization."""
+
+
+def layout_graph(
+    graph: nx.Graph, cache: LayoutCache | None = SHARED_LAYOUT_CACHE, use_coords: bool = True
+) -> dict[Component, Position]:
+    """Calculate a deterministic layout of a graph of components with the sparse stress model.
+
+    Components with geographic coordinates start at their projected location, so the layout
+    resembles the map of the grid. The result does not depend on the order in which components
+    and connections were added, and is cached by the fingerprint of the graph.
+
+    :param graph: The graph of components.
+    :type graph: nx.Graph
+    :param cache: The cache for the layout, defaults to the shared cache; None disables caching.
+    :type cache: LayoutCache | None, optional
+    :param use_coords: Start from the geographic coordinates of the components, defaults to True.
+    :type use_coords: bool, optional
+    :return: The positions of the components in units of connection lengths, y pointing up.
+    :rtype: dict[Component, Position]
+    """
+    key = cache.key(graph, use_coords) if cache is not None else None
+    if cache is not None and key is not None:
+        cached = cache.get(key)
+        if cached is not None and all(component.uid in cached for component in graph.nodes):
+            return {component: cached[component.uid] for component in graph.nodes}
+
+    # sort nodes and edges for a result independent of the insertion order
+    ordered = nx.Graph()
+    ordered.add_nodes_from(sorted(graph.nodes, key=lambda component: component.uid))
+    ordered.add_edges_from(
+        sorted(
+            (tuple(sorted((u, v), key=lambda c: c.uid)) for u, v in graph.edges()),
+            key=lambda edge: (edge[0].uid, edge[1].uid),
+        )
+    )
+    initial = geo_positions(graph) if use_coords else None
+    layout = sparse_stress_layout(ordered, initial)
+    if cache is not None and key is not None:
+        cache.put(key, {component.uid: layout[component] for component in graph.nodes})
+    return {component: layout[component] for component in graph.nodes}
@@ -1,9 +1,22 @@
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_selected: ContextVar[int] = ContextVar("selected_logger", default=-1)
+"""Handle of the logger selected in the current thread or asyncio task."""
+
+
 class Logger:
-    """Global logger for the conversion changes."""
+    """Global logger for the conversion changes.
+
+    The loggers are shared, but the selection is local to the current context,
+    so concurrent conversions in threads or asyncio tasks log to their own logger.
+    """
 
     __current_handle = -1
-    __selected = -1
     __loggers: dict[int, "Logger"] = {}
+    __lock = threading.Lock()
 
     def __init__(self, handle: int, origin: str, print_to_console: bool = True) -> None:
         self.handle = handle
@@ -35,9 +48,10 @@ class Logger:
 
     def close(self) -> None:
         """Closes the current conversion changes log."""
-        if self.__class__.__selected == self.handle:
-            self.__class__.__selected = -1
-        del Logger.__loggers[self.handle]
+        if _selected.get() == self.handle:
+            _selected.set(-1)
+        with Logger.__lock:
+            del Logger.__loggers[self.handle]
 
     @property
     def entries(self) -> list[str]:
@@ -51,7 +65,7 @@ class Logger:
         :return: The logger with the given handle.
         """
         if handle is None:
-            return cls.__loggers[cls.__selected]
+            return cls.__loggers[_selected.get()]
         if handle not in cls.__loggers:
             raise ValueError(f"Logger with handle {handle} does not exist")
         return cls.__loggers[handle]
@@ -64,7 +78,7 @@ class Logger:
         """
         if not handle in cls.__loggers and handle != -1:
             raise ValueError(f"Logger with handle {handle} does not exist")
-        cls.__selected = handle
+        _selected.set(handle)
 
     @classmethod
     def log_to_selected(cls, message: str) -> bool:
@@ -73,9 +87,10 @@ class Logger:
         :param message: The message to log.
         :return: True if a log was selected, else False.
         """
-        if cls.__selected == -1:
+        logger = cls.__loggers.get(_selected.get())
+        if logger is None:
             return False
-        cls.get(cls.__selected).log(message)
+        logger.log(message)
         return True
 
     @classmethod
@@ -87,21 +102,32 @@ class Logger:
         :param print_to_console: Whether to print the log to the console.
         :return: The handle of the new log.
         """
-        cls.__current_handle += 1
-        cls.__loggers[cls.__current_handle] = Logger(
-            cls.__current_handle, origin, print_to_console
-        )
-        if cls.__selected == -1 or select:
-            cls.__selected = cls.__current_handle
-        return cls.__loggers[cls.__current_handle]
+        with cls.__lock:
+            cls.__current_handle += 1
+            logger = Logger(cls.__current_handle, origin, print_to_console)
+            cls.__loggers[logger.handle] = logger
+        if _selected.get() == -1 or select:
+            _selected.set(logger.handle)
+        return logger
 
     @classmethod
     def disable(cls) -> None:
         """Disable logging by unselecting the current logger."""
-        cls.__selected = -1
+        _selected.set(-1)
+
+    @classmethod
+    @contextmanager
+    def scope(cls) -> Iterator[None]:
+        """Restore the selected logger of the current context when the block is left."""
+        token = _selected.set(_selected.get())
+        try:
+            yield
+        finally:
+            _selected.reset(token)
 
     @classmethod
     def close_all(cls) -> None:
         """Close all previously created loggers."""
-        cls.__selected = -1
-        cls.__loggers = {}
+        _selected.set(-1)
+        with cls.__lock:
+            cls.__loggers = {}
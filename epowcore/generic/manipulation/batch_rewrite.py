@@ -0,0 +1,151 @@
+from types import TracebackType
+
+from epowcore.gdf.component import Component
+from epowcore.gdf.core_model import CoreModel
+
+
+class BatchRewrite:
+    """Collects the graph edits of a rewrite pass and applies them to the model in one sweep.
+
+    Replacement methods like `Ward.replace_with_load_and_shunt` accept a BatchRewrite.
+    They read the unchanged graph of the model and register their edits, which are applied
+    together when the batch is applied or its context is left without an error.
+    New uids are allocated from a counter that is initialized with a single scan of the model.
+
+    Example:
+        with BatchRewrite(core_model) as rewrite:
+            for ward in core_model.type_list(Ward):
+                ward.replace_with_load_and_shunt(core_model, rewrite)
+    """
+
+    def __init__(self, core_model: CoreModel) -> None:
+        self.core_model = core_model
+        self._next_id: int | None = None
+        self._removed: list[Component] = []
+        self._added: list[Component] = []
+        self._edges: dict[frozenset[Component], tuple[Component, Component, dict]] = {}
+
+    def __enter__(self) -> "BatchRewrite":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            self.apply()
+
+    def new_ids(self, count: int) -> range:
+        """Allocate a contiguous block of uids that are not used in the model or in this batch.
+
+        :param count: The number of uids to allocate.
+        :type count: int
+        :return: A range of [count] new uids.
+        :rtype: range
+        """
+        if self._next_id is None:
+            self._next_id = self.core_model.get_valid_id()
+        ids = range(self._next_id, self._next_id + count)
+        self._next_id += count
+        return ids
+
+    def new_id(self) -> int:
+        """Allocate a single new uid."""
+        return self.new_ids(1)[0]
+
+    def add_component(self, component: Component) -> None:
+        """Add a component to the model when the batch is applied."""
+        self._added.append(component)
+
+    def remove_component(self, component: Component) -> None:
+        """Remove a component and its connections from the model when the batch is applied."""
+        self._removed.append(component)
+
+    def add_edge(self, component1: Component, component2: Component) -> None:
+        """Add an edge without connector data when the batch is applied."""
+        self._edge(component1, component2)
+
+    def add_connection(
+        self,
+        component1: Component,
+        component2: Component,
+        connector_name1: str | list[str] | None = "",
+        connector_name2: str | list[str] | None = "",
+    ) -> None:
+        """Add an edge between two components when the batch is applied.
+        The connector names are merged like in `CoreModel.add_connection`.
+
+        :param component1: The first component.
+        :type component1: Component
+        :param component2: The second component.
+        :type component2: Component
+        :param connector_name1: The name of the connector on the first component.
+        :type connector_name1: str | list[str] | None
+        :param connector_name2: The name of the connector on the second component.
+        :type connector_name2: str | list[str] | None
+        """
+        attrs = self._edge(component1, component2)
+        for component, connector_name in (
+            (component1, connector_name1),
+            (component2, connector_name2),
+        ):
+            if connector_name is None:
+                connector_name = []
+            elif isinstance(connector_name, str):
+                connector_name = [connector_name]
+            attrs[component.uid] = attrs.get(component.uid, []) + connector_name
+
+    def _edge(self, component1: Component, component2: Component) -> dict[int, list[str]]:
+        """The data of a planned edge, which is created if necessary."""
+        key = frozenset((component1, component2))
+        if key not in self._edges:
+            self._edges[key] = (component1, component2, {})
+        return self._edges[key][2]
+
+    def apply(self) -> None:
+        """Apply all collected edits: removals first, then the new components and edges.
+        Connector names of edges that already exist in the graph are concatenated.
+
+        :raises ValueError: If an edge references a component that is not part of the model.
+        """
+        graph = self.core_model.graph
+        journal = self.core_model.journal
+        if journal is not None:
+            for component in filter(graph.has_node, self._removed):
+                for neighbor in graph.neighbors(component):
+                    journal.record_edge(component, neighbor)
+                journal.record_removed(component)
+            for component in self._added:
+                journal.record_added(component)
+        spatial_index = self.core_model.spatial_index
+        if spatial_index is not None:
+            for component in filter(graph.has_node, self._removed):
+                spatial_index.remove(component)
+            for component in self._added:
+                spatial_index.insert(component)
+        graph.remove_nodes_from(self._removed)
+        graph.add_nodes_from(self._added)
+
+        new_edges = []
+        for component1, component2, attrs in self._edges.values():
+            for component in (component1, component2):
+                if not graph.has_node(component):
+                    raise ValueError(
+                        f"Cannot connect {component.name} ({component.uid}), "
+                        "it is not part of the model"
+                    )
+            if graph.has_edge(component1, component2):
+                existing = graph.edges[component1, component2]
+                for uid, connectors in attrs.items():
+                    existing[uid] = existing.get(uid, []) + connectors
+                graph.edges.update(component1, component2, existing)
+            else:
+                new_edges.append((component1, component2, attrs))
+        graph.add_edges_from(new_edges)
+        if journal is not None:
+            for component1, component2, _ in self._edges.values():
+                journal.record_edge(component1, component2)
+
+        self._removed, self._added, self._edges = [], [], {}
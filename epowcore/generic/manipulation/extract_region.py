@@ -0,0 +1,131 @@
+import copy
+
+import networkx as nx
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.component import Component
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.port import Port
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.generic.component_graph import ComponentGraph
+from epowcore.generic.logger import Logger
+from epowcore.generic.spatial_index import BBox
+
+
+def extract_region(
+    core_model: CoreModel,
+    bbox: BBox | None = None,
+    polygon: list[tuple[float, float]] | None = None,
+    keep_boundary: bool = False,
+) -> CoreModel:
+    """Extract the part of a model inside a region into a new model, e.g. a regional model
+    from a national one. The region is found with the spatial index of the model.
+
+    The components whose coordinates intersect the region are kept, together with the components
+    without coordinates connected to them, like generators and their controllers.
+    Branches leading out of the region are removed, unless [keep_boundary] is set, which keeps
+    the buses at their far end with the components without coordinates attached to them.
+    Subsystems are kept with the part of their content in the region.
+    The components are shared with [core_model], the graphs and connections are copied.
+
+    :param core_model: The model to extract the region from.
+    :type core_model: CoreModel
+    :param bbox: The region as bounding box (min_lat, min_lon, max_lat, max_lon).
+    :type bbox: BBox | None, optional
+    :param polygon: The region as polygon of (lat, lon) corners, instead of [bbox].
+    :type polygon: list[tuple[float, float]] | None, optional
+    :param keep_boundary: Keep branches leaving the region and the buses at their far end,
+        defaults to False.
+    :type keep_boundary: bool, optional
+    :raises ValueError: If not exactly one of [bbox] and [polygon] is given.
+    :return: The model of the region.
+    :rtype: CoreModel
+    """
+    index = core_model.get_spatial_index()
+    if bbox is not None and polygon is None:
+        found = index.intersecting(bbox)
+    elif polygon is not None and bbox is None:
+        found = index.intersecting_polygon(polygon)
+    else:
+        raise ValueError("Either a bounding box or a polygon must be given to extract a region")
+    selected = {component.uid for component in found}
+    graph = _extract_graph(core_model.graph, selected, keep_boundary, None)
+    region = CoreModel(
+        base_frequency=core_model.base_frequency, base_mva=core_model.base_mva, graph=graph
+    )
+    Logger.log_to_selected(
+        f"Extracted {len(graph.nodes)} of {len(core_model.graph.nodes)} components in the region"
+    )
+    return region
+
+
+def _extract_graph(
+    graph: ComponentGraph, selected: set[int], keep_boundary: bool, outer: set[int] | None
+) -> ComponentGraph:
+    """Copy the part of a graph in the region; [outer] are the uids kept in the parent graph."""
+    internal = graph.get_internal_graph(copy=False)
+    kept: set[Component] = set()
+    for node in internal:
+        if isinstance(node, Port):
+            if outer is not None and node.connection_component in outer:
+                kept.add(node)
+        elif isinstance(node, Subsystem):
+            if _contains(node, selected):
+                kept.add(node)
+        elif node.uid in selected:
+            kept.add(node)
+            if keep_boundary and not isinstance(node, Bus):
+                kept.update(n for n in internal[node] if isinstance(n, Bus))
+
+    # components without coordinates hang from the kept components
+    stack = list(kept)
+    while stack:
+        for neighbor in internal[stack.pop()]:
+            if neighbor not in kept and _unlocated(neighbor):
+                kept.add(neighbor)
+                stack.append(neighbor)
+
+    # remove branches leading out of the region, repeated for components attached to them
+    while True:
+        cut = [
+            node
+            for node in kept
+            if not isinstance(node, (Bus, Port, Subsystem))
+            and any(neighbor not in kept for neighbor in internal[node])
+        ]
+        if not cut:
+            break
+        kept.difference_update(cut)
+
+    uids = {node.uid for node in kept}
+    mapping: dict[Component, Component] = {}
+    for node in kept:
+        if isinstance(node, Subsystem):
+            subsystem = copy.copy(node)
+            subsystem.graph = _extract_graph(node.graph, selected, keep_boundary, uids)
+            mapping[node] = subsystem
+        else:
+            mapping[node] = node
+    result = nx.Graph()
+    result.add_nodes_from(mapping[node] for node in internal if node in kept)
+    result.add_edges_from(
+        (mapping[u], mapping[v], copy.deepcopy(data))
+        for u, v, data in internal.subgraph(kept).edges(data=True)
+    )
+    return ComponentGraph(result)
+
+
+def _contains(subsystem: Subsystem, selected: set[int]) -> bool:
+    return any(
+        node.uid in selected or (isinstance(node, Subsystem) and _contains(node, selected))
+        for node in subsystem.graph.nodes
+    )
+
+
+def _unlocated(component: Component) -> bool:
+    """Whether a component has no coordinates, for subsystems none of their content."""
+    if isinstance(component, Port):
+        return False
+    if isinstance(component, Subsystem):
+        return all(isinstance(node, Port) or _unlocated(node) for node in component.graph.nodes)
+    return not component.coords
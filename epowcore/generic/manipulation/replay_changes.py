@@ -0,0 +1,53 @@
+from epowcore.gdf.change_journal import ChangeJournal
+from epowcore.gdf.component import Component
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.subsystem import Subsystem
+
+
+def replay_changes(core_model: CoreModel, mirror: CoreModel, journal: ChangeJournal) -> bool:
+    """Apply the changes recorded in the journal of [core_model] to [mirror],
+    a flattened copy of [core_model] from the time of the last export, e.g. the model that an
+    exporter created its output from. Components are matched by uid.
+
+    Modified components are replaced, also if they are part of a subsystem in [core_model].
+    Structural changes can only be replayed if [core_model] has no subsystems.
+
+    :param core_model: The changed core model.
+    :type core_model: CoreModel
+    :param mirror: The flattened copy, changed in place.
+    :type mirror: CoreModel
+    :param journal: The changes of [core_model] since the copy was made.
+    :type journal: ChangeJournal
+    :return: False, without changing [mirror], if the changes cannot be replayed, e.g. because
+             a modified component is not part of [mirror].
+    :rtype: bool
+    """
+    nodes = {component.uid: component for component in mirror.graph.nodes}
+    if any(uid not in nodes for uid in journal.modified):
+        return False
+    current: dict[int, Component] = {}
+    if journal.num_structural > 0:
+        if core_model.type_list(Subsystem):
+            return False
+        current = {component.uid: component for component in core_model.graph.nodes}
+
+    mirror.graph.relabel_nodes({nodes[uid]: after for uid, (_, after) in journal.modified.items()})
+    mirror.graph.remove_nodes_from([nodes[uid] for uid in journal.removed if uid in nodes])
+    mirror.graph.add_nodes_from(journal.added.values())
+    for edge in journal.edges:
+        if len(edge) != 2:
+            continue
+        component1, component2 = (current.get(uid) for uid in edge)
+        if component1 is None or component2 is None:
+            continue
+        # unchanged components of the mirror are equal to the ones of the core model
+        if core_model.graph.has_edge(component1, component2):
+            data = core_model.graph.edges[component1, component2]
+            if not mirror.graph.has_edge(component1, component2):
+                mirror.graph.add_edge(component1, component2)
+            mirror.graph.edges.update(
+                component1, component2, {uid: list(names) for uid, names in data.items()}
+            )
+        elif mirror.graph.has_edge(component1, component2):
+            mirror.graph.remove_edge(component1, component2)
+    return True
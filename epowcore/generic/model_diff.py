@@ -0,0 +1,143 @@
+from dataclasses import dataclass, field, fields
+from typing import Any
+
+from epowcore.gdf.component import Component
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.generic.component_graph import ComponentGraph
+from epowcore.generic.fingerprint import Fingerprinter
+
+
+@dataclass
+class ModelDiff:
+    """The differences between two versions of a model. Components are matched by uid,
+    connections by the uids of their components."""
+
+    added: list[Component] = field(default_factory=list)
+    """Components that only exist in the new model. Added subsystems are not split up."""
+    removed: list[Component] = field(default_factory=list)
+    """Components that only exist in the old model."""
+    changed: list[tuple[Component, Component]] = field(default_factory=list)
+    """Pairs of the old and new version of components with changed attributes or type.
+    Subsystems are only listed if their own attributes changed, changes of their content are
+    listed individually."""
+    added_connections: list[tuple[int, int]] = field(default_factory=list)
+    """Uid pairs of connections that only exist in the new model."""
+    removed_connections: list[tuple[int, int]] = field(default_factory=list)
+    """Uid pairs of connections that only exist in the old model."""
+    changed_connections: list[tuple[int, int]] = field(default_factory=list)
+    """Uid pairs of connections with changed connector names."""
+    attributes: dict[str, tuple[Any, Any]] = field(default_factory=dict)
+    """Changed attributes of the core model as pairs of the old and new value."""
+
+    def __len__(self) -> int:
+        return (
+            len(self.added)
+            + len(self.removed)
+            + len(self.changed)
+            + len(self.added_connections)
+            + len(self.removed_connections)
+            + len(self.changed_connections)
+            + len(self.attributes)
+        )
+
+    def summary(self) -> str:
+        """A short human readable description of the differences."""
+        if len(self) == 0:
+            return "The models are equal."
+        lines = [
+            f"{len(self.added)} added, {len(self.removed)} removed and "
+            f"{len(self.changed)} changed components",
+            f"{len(self.added_connections)} added, {len(self.removed_connections)} removed and "
+            f"{len(self.changed_connections)} changed connections",
+        ]
+        for name, (old, new) in self.attributes.items():
+            lines.append(f"{name}: {old} -> {new}")
+        return "\n".join(lines)
+
+
+def diff_models(
+    old: CoreModel, new: CoreModel, fingerprinter: Fingerprinter | None = None
+) -> ModelDiff:
+    """Compare two versions of a core model, e.g. two extractions of the same grid.
+
+    Components are compared by their fingerprints. Unchanged subsystems are skipped as a whole,
+    changed subsystems are compared recursively. Passing the same fingerprinter to repeated
+    comparisons, e.g. against a fixed baseline, avoids hashing unchanged components again.
+
+    :param old: The old version of the model.
+    :type old: CoreModel
+    :param new: The new version of the model.
+    :type new: CoreModel
+    :param fingerprinter: Fingerprinter with cached fingerprints; defaults to a new one.
+    :type fingerprinter: Fingerprinter | None, optional
+    :return: The differences between the models.
+    :rtype: ModelDiff
+    """
+    diff = diff_graphs(old.graph, new.graph, fingerprinter)
+    for f in fields(CoreModel):
+        if not f.init or f.name == "graph":
+            continue
+        old_value, new_value = getattr(old, f.name), getattr(new, f.name)
+        if old_value != new_value:
+            diff.attributes[f.name] = (old_value, new_value)
+    return diff
+
+
+def diff_graphs(
+    old: ComponentGraph, new: ComponentGraph, fingerprinter: Fingerprinter | None = None
+) -> ModelDiff:
+    """Compare two versions of a component graph, see `diff_models`.
+
+    :param old: The old version of the graph.
+    :type old: ComponentGraph
+    :param new: The new version of the graph.
+    :type new: ComponentGraph
+    :param fingerprinter: Fingerprinter with cached fingerprints; defaults to a new one.
+    :type fingerprinter: Fingerprinter | None, optional
+    :return: The differences between the graphs.
+    :rtype: ModelDiff
+    """
+    diff = ModelDiff()
+    _diff_graphs(old, new, fingerprinter or Fingerprinter(), diff)
+    return diff
+
+
+def _diff_graphs(
+    old: ComponentGraph, new: ComponentGraph, fingerprinter: Fingerprinter, diff: ModelDiff
+) -> None:
+    old_nodes = {component.uid: component for component in old.nodes}
+    new_nodes = {component.uid: component for component in new.nodes}
+
+    for uid, after in new_nodes.items():
+        before = old_nodes.get(uid)
+        if before is None:
+            diff.added.append(after)
+        elif before is after or fingerprinter.component(before) == fingerprinter.component(after):
+            continue
+        elif isinstance(before, Subsystem) and type(before) is type(after):
+            assert isinstance(after, Subsystem)
+            if fingerprinter.attributes(before) != fingerprinter.attributes(after):
+                diff.changed.append((before, after))
+            _diff_graphs(before.graph, after.graph, fingerprinter, diff)
+        else:
+            diff.changed.append((before, after))
+    diff.removed.extend(component for uid, component in old_nodes.items() if uid not in new_nodes)
+
+    # the connector lists are small, comparing them is cheaper than hashing
+    old_edges = _edges(old)
+    for key, data in _edges(new).items():
+        old_data = old_edges.pop(key, None)
+        if old_data is None:
+            diff.added_connections.append(key)
+        elif old_data != data:
+            diff.changed_connections.append(key)
+    diff.removed_connections.extend(old_edges)
+
+
+def _edges(graph: ComponentGraph) -> dict[tuple[int, int], dict[int, list[str]]]:
+    edges = {}
+    for component1, component2, data in graph.edges.data():
+        uid1, uid2 = component1.uid, component2.uid
+        edges[(uid1, uid2) if uid1 <= uid2 else (uid2, uid1)] = data
+    return edges
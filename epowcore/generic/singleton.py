@@ -1,7 +1,13 @@
+import threading
+
+
 class Singleton(type):
     _instances = {}  # type: ignore
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs):  # type: ignore
         if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+            with cls._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
         return cls._instances[cls]
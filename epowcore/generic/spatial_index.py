@@ -0,0 +1,387 @@
+import heapq
+import itertools
+import math
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from epowcore.gdf.component import Component
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.generic.component_graph import ComponentGraph
+
+if TYPE_CHECKING:
+    from epowcore.gdf.core_model import CoreModel
+
+BBox = tuple[float, float, float, float]
+"""A bounding box as (min_lat, min_lon, max_lat, max_lon)."""
+ComponentType = type[Component] | tuple[type[Component], ...]
+
+
+class SpatialIndex:
+    """An R-tree over the coordinates of the components of a core model, including the
+    components in subsystems. Like the coordinates of the components, all points are (lat, lon).
+
+    The tree is packed with the sort-tile-recursive (STR) algorithm when the index is first
+    queried. Afterwards, the changes made through the methods of the core model are kept in a
+    small buffer next to the tree, which is searched linearly. When the buffer exceeds
+    [rebuild_ratio] of the size of the tree, the tree is packed again.
+    Adding, removing or updating a subsystem drops the whole index, which is built again from the
+    model on the next query. Like with the `ChangeJournal`, changes made directly on the graph,
+    e.g. `core_model.graph.add_node`, are not seen; call `invalidate` after such changes.
+
+    Example:
+        index = core_model.get_spatial_index()
+        region = index.intersecting((48.9, 8.3, 49.1, 8.5))
+        bus = index.nearest((49.0, 8.4), component_type=Bus)[0]
+    """
+
+    def __init__(
+        self, core_model: "CoreModel", node_capacity: int = 16, rebuild_ratio: float = 0.1
+    ) -> None:
+        self.core_model = core_model
+        self.node_capacity = node_capacity
+        self.rebuild_ratio = rebuild_ratio
+        self.builds = 0
+        """The number of times the tree was packed, e.g. for benchmarks."""
+        self._components: dict[int, Component] | None = None
+        self._uids = np.empty(0, dtype=np.int64)
+        self._boxes = np.empty((0, 4))
+        # per level above the leaves: the boxes of the nodes and the range of their children
+        self._levels: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        self._pending: dict[int, np.ndarray] = {}
+        self._stale: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._ensure())
+
+    def invalidate(self) -> None:
+        """Drop the index, so that it is built again from the model on the next query."""
+        self._components = None
+        self._pending.clear()
+        self._stale.clear()
+
+    def insert(self, component: Component) -> None:
+        """Add a component to the index or replace the component with the same uid."""
+        if self._components is None:
+            return
+        if isinstance(component, Subsystem):
+            self.invalidate()
+            return
+        self._discard(component.uid)
+        if component.coords:
+            self._components[component.uid] = component
+            self._pending[component.uid] = _bounding_boxes([component])[0]
+
+    def remove(self, component: Component) -> None:
+        """Remove a component from the index."""
+        if self._components is None:
+            return
+        if isinstance(component, Subsystem):
+            self.invalidate()
+            return
+        self._discard(component.uid)
+
+    def intersecting(
+        self, bbox: BBox, component_type: ComponentType | None = None
+    ) -> list[Component]:
+        """Find the components whose point or line intersects a bounding box.
+
+        :param bbox: The bounding box as (min_lat, min_lon, max_lat, max_lon).
+        :type bbox: BBox
+        :param component_type: Only return components of this type, defaults to all types.
+        :type component_type: ComponentType | None, optional
+        :return: The components, sorted by uid.
+        :rtype: list[Component]
+        """
+        candidates = self._candidates(bbox, component_type)
+        lines = [(c.uid, c.coords) for c in candidates if isinstance(c.coords, list)]
+        hits = _lines_intersect_bbox([coords for _, coords in lines], bbox)
+        crossing = {uid for (uid, _), hit in zip(lines, hits) if hit}
+        return [c for c in candidates if isinstance(c.coords, tuple) or c.uid in crossing]
+
+    def intersecting_polygon(
+        self, polygon: list[tuple[float, float]], component_type: ComponentType | None = None
+    ) -> list[Component]:
+        """Find the components whose point or line intersects a polygon.
+
+        :param polygon: The corners of the polygon as (lat, lon), without repeating the first.
+        :type polygon: list[tuple[float, float]]
+        :param component_type: Only return components of this type, defaults to all types.
+        :type component_type: ComponentType | None, optional
+        :return: The components, sorted by uid.
+        :rtype: list[Component]
+        """
+        corners = np.asarray(polygon, dtype=float).reshape(-1, 2)
+        if len(corners) < 3:
+            raise ValueError(f"A polygon needs at least three corners, got {len(corners)}")
+        bbox = (*corners.min(axis=0), *corners.max(axis=0))
+        edges = (corners, np.roll(corners, -1, axis=0))
+        result = []
+        for component in self._candidates(bbox, component_type):
+            points = np.asarray(component.coords, dtype=float).reshape(-1, 2)
+            if _line_intersects_polygon(points, edges):
+                result.append(component)
+        return result
+
+    def nearest(
+        self,
+        point: tuple[float, float],
+        k: int = 1,
+        component_type: ComponentType | None = None,
+    ) -> list[Component]:
+        """Find the components closest to a point, measuring the distance to the nearest point of
+        a line. Distances are approximated with an equirectangular projection around [point].
+
+        :param point: The point as (lat, lon).
+        :type point: tuple[float, float]
+        :param k: The number of components to find, defaults to 1.
+        :type k: int, optional
+        :param component_type: Only return components of this type, defaults to all types.
+        :type component_type: ComponentType | None, optional
+        :return: Up to [k] components, the closest first.
+        :rtype: list[Component]
+        """
+        components = self._ensure()
+        lat, lon = point
+        scale = math.cos(math.radians(lat))
+
+        def box_distances(boxes: np.ndarray) -> np.ndarray:
+            dy = np.maximum(np.maximum(boxes[:, 0] - lat, lat - boxes[:, 2]), 0.0)
+            dx = np.maximum(np.maximum(boxes[:, 1] - lon, lon - boxes[:, 3]), 0.0) * scale
+            return np.hypot(dx, dy)
+
+        # entries are (distance, tie breaker, kind, index): kind > 0 is a node of that level,
+        # 0 a leaf of the tree, -1 a pending component and -2 a component with its exact distance
+        counter = itertools.count()
+        heap: list[tuple[float, int, int, int]] = []
+        if self._levels:
+            top = self._levels[-1][0]
+            for index, distance in enumerate(box_distances(top).tolist()):
+                heap.append((distance, next(counter), len(self._levels), index))
+        else:
+            for uid, distance in zip(self._uids.tolist(), box_distances(self._boxes).tolist()):
+                heap.append((distance, next(counter), 0, uid))
+        for uid, box in self._pending.items():
+            heap.append((float(box_distances(box.reshape(1, 4))[0]), next(counter), -1, uid))
+        heapq.heapify(heap)
+
+        result: list[Component] = []
+        while heap and len(result) < k:
+            distance, _, kind, index = heapq.heappop(heap)
+            if kind > 0:
+                _, starts, ends = self._levels[kind - 1]
+                children = np.arange(starts[index], ends[index])
+                if kind == 1:
+                    boxes, indices = self._boxes[children], self._uids[children].tolist()
+                else:
+                    boxes, indices = self._levels[kind - 2][0][children], children.tolist()
+                for child, child_distance in zip(indices, box_distances(boxes).tolist()):
+                    heapq.heappush(heap, (child_distance, next(counter), kind - 1, child))
+            elif kind == -2:
+                result.append(components[index])
+            elif kind == -1 or index not in self._stale:
+                component = components[index]
+                if component_type is not None and not isinstance(component, component_type):
+                    continue
+                if isinstance(component.coords, list):
+                    distance = _line_distance(component.coords, lat, lon, scale)
+                heapq.heappush(heap, (distance, next(counter), -2, index))
+        return result
+
+    def _ensure(self) -> dict[int, Component]:
+        if self._components is None:
+            components: list[Component] = []
+            _collect(self.core_model.graph, components)
+            self._components = {component.uid: component for component in components}
+            uids = np.fromiter(self._components, dtype=np.int64, count=len(self._components))
+            self._pack(uids, _bounding_boxes(list(self._components.values())))
+        elif len(self._pending) + len(self._stale) > max(
+            self.node_capacity, self.rebuild_ratio * len(self._uids)
+        ):
+            keep = ~np.isin(self._uids, np.fromiter(self._stale, dtype=np.int64))
+            uids = np.concatenate([self._uids[keep], np.fromiter(self._pending, dtype=np.int64)])
+            boxes = np.vstack([self._boxes[keep], *self._pending.values()])
+            self._pack(uids, boxes)
+        return self._components
+
+    def _pack(self, uids: np.ndarray, boxes: np.ndarray) -> None:
+        capacity = self.node_capacity
+        order = _str_order(boxes, capacity)
+        self._uids, self._boxes = uids[order], boxes[order]
+        self._levels = []
+        children = self._boxes
+        while len(children) > capacity:
+            starts = np.arange(0, len(children), capacity)
+            ends = np.minimum(starts + capacity, len(children))
+            nodes = np.hstack(
+                [
+                    np.minimum.reduceat(children[:, :2], starts),
+                    np.maximum.reduceat(children[:, 2:], starts),
+                ]
+            )
+            # the nodes are ordered again, so that they are grouped well on the next level
+            order = _str_order(nodes, capacity)
+            self._levels.append((nodes[order], starts[order], ends[order]))
+            children = nodes[order]
+        self._pending.clear()
+        self._stale.clear()
+        self.builds += 1
+
+    def _discard(self, uid: int) -> None:
+        assert self._components is not None
+        if self._components.pop(uid, None) is not None and self._pending.pop(uid, None) is None:
+            self._stale.add(uid)
+
+    def _candidates(self, bbox: BBox, component_type: ComponentType | None) -> list[Component]:
+        """The components whose bounding box intersects [bbox]."""
+        components = self._ensure()
+        if self._levels:
+            nodes = np.arange(len(self._levels[-1][0]))
+            for boxes, starts, ends in reversed(self._levels):
+                hits = nodes[_intersects(boxes[nodes], bbox)]
+                nodes = _ranges(starts[hits], ends[hits])
+        else:
+            nodes = np.arange(len(self._uids))
+        uids = self._uids[nodes[_intersects(self._boxes[nodes], bbox)]].tolist()
+        if self._stale:
+            uids = [uid for uid in uids if uid not in self._stale]
+        if self._pending:
+            pending = np.fromiter(self._pending, dtype=np.int64)
+            boxes = np.vstack(list(self._pending.values()))
+            uids.extend(pending[_intersects(boxes, bbox)].tolist())
+        result = [components[uid] for uid in sorted(uids)]
+        if component_type is not None:
+            result = [component for component in result if isinstance(component, component_type)]
+        return result
+
+
+def _collect(graph: ComponentGraph, components: list[Component]) -> None:
+    for node in graph.nodes:
+        if isinstance(node, Subsystem):
+            _collect(node.graph, components)
+        elif node.coords:
+            components.append(node)
+
+
+def _bounding_boxes(components: list[Component]) -> np.ndarray:
+    """The bounding boxes of the coordinates of components as array of shape (n, 4)."""
+    if not components:
+        return np.empty((0, 4))
+    coordinates: list[tuple[float, float]] = []
+    lengths = []
+    for component in components:
+        if isinstance(component.coords, tuple):
+            coordinates.append(component.coords)
+            lengths.append(1)
+        elif component.coords:
+            coordinates.extend(component.coords)
+            lengths.append(len(component.coords))
+    points = np.asarray(coordinates, dtype=float).reshape(-1, 2)
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    return np.hstack(
+        [np.minimum.reduceat(points, starts, axis=0), np.maximum.reduceat(points, starts, axis=0)]
+    )
+
+
+def _str_order(boxes: np.ndarray, capacity: int) -> np.ndarray:
+    """The sort-tile-recursive order of boxes: sorted by longitude into vertical slices
+    of whole nodes, each slice sorted by latitude."""
+    num_boxes = len(boxes)
+    centers = (boxes[:, :2] + boxes[:, 2:]) / 2.0
+    num_nodes = -(-num_boxes // capacity)
+    slice_size = capacity * max(1, math.ceil(math.sqrt(num_nodes)))
+    slices = np.empty(num_boxes, dtype=np.int64)
+    slices[np.argsort(centers[:, 1], kind="stable")] = np.arange(num_boxes) // slice_size
+    return np.lexsort((centers[:, 0], slices))
+
+
+def _intersects(boxes: np.ndarray, bbox: BBox) -> np.ndarray:
+    min_lat, min_lon, max_lat, max_lon = bbox
+    return (
+        (boxes[:, 0] <= max_lat)
+        & (boxes[:, 2] >= min_lat)
+        & (boxes[:, 1] <= max_lon)
+        & (boxes[:, 3] >= min_lon)
+    )
+
+
+def _ranges(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """The concatenated ranges [start, end) as one array."""
+    lengths = ends - starts
+    offsets = np.repeat(starts - np.cumsum(lengths) + lengths, lengths)
+    return offsets + np.arange(offsets.size)
+
+
+def _lines_intersect_bbox(lines: list[list[tuple[float, float]]], bbox: BBox) -> np.ndarray:
+    """Whether the coordinates of lines intersect a bounding box, tested for all lines at once.
+    A segment intersects the box if their bounding boxes overlap and the corners of the box are
+    not all on the same side of the segment."""
+    if not lines:
+        return np.zeros(0, dtype=bool)
+    lengths = np.array([len(line) for line in lines])
+    starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    points = np.asarray([point for line in lines for point in line], dtype=np.float64)
+    low, high = np.array(bbox[:2]), np.array(bbox[2:])
+
+    hits = np.logical_or.reduceat(((points >= low) & (points <= high)).all(axis=1), starts)
+    p1, p2 = points[:-1], points[1:]
+    segments = np.ones(len(p1), dtype=bool)
+    segments[(starts + lengths - 1)[:-1]] = False  # from the end of a line to the next line
+    segments &= (np.minimum(p1, p2) <= high).all(axis=1) & (np.maximum(p1, p2) >= low).all(axis=1)
+    corners = np.array([low, [low[0], high[1]], high, [high[0], low[1]]])
+    direction = p2 - p1
+    sides = direction[:, None, 0] * (corners[None, :, 1] - p1[:, None, 1]) - direction[
+        :, None, 1
+    ] * (corners[None, :, 0] - p1[:, None, 0])
+    segments &= ~((sides > 0).all(axis=1) | (sides < 0).all(axis=1))
+    hits[np.repeat(np.arange(len(lines)), lengths)[:-1][segments]] = True
+    return hits
+
+
+def _points_in_polygon(points: np.ndarray, edges: tuple[np.ndarray, np.ndarray]) -> np.ndarray:
+    """Whether points are inside a polygon given by the start and end of its edges,
+    with the even-odd rule."""
+    y, x = points[:, :1], points[:, 1:]
+    (y1, x1), (y2, x2) = edges[0].T, edges[1].T
+    crosses = (y1 > y) != (y2 > y)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x1 + (y - y1) * (x2 - x1) / (y2 - y1)
+    return np.count_nonzero(crosses & (x < x_cross), axis=1) % 2 == 1
+
+
+def _line_intersects_polygon(line: np.ndarray, edges: tuple[np.ndarray, np.ndarray]) -> bool:
+    """Whether a point or line has a point inside a polygon or crosses one of its edges."""
+    if _points_in_polygon(line, edges).any():
+        return True
+    if len(line) < 2:
+        return False
+    p1, p2 = line[:-1, None, :], line[1:, None, :]
+    q1, q2 = edges[0][None, :, :], edges[1][None, :, :]
+
+    def cross(o: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        return (a[..., 0] - o[..., 0]) * (b[..., 1] - o[..., 1]) - (a[..., 1] - o[..., 1]) * (
+            b[..., 0] - o[..., 0]
+        )
+
+    # the bounding boxes of the segments must overlap as well for collinear segments
+    overlap = (np.minimum(p1, p2) <= np.maximum(q1, q2)).all(axis=-1) & (
+        np.maximum(p1, p2) >= np.minimum(q1, q2)
+    ).all(axis=-1)
+    straddles = (cross(q1, q2, p1) * cross(q1, q2, p2) <= 0) & (
+        cross(p1, p2, q1) * cross(p1, p2, q2) <= 0
+    )
+    return bool((straddles & overlap).any())
+
+
+def _line_distance(
+    coords: list[tuple[float, float]], lat: float, lon: float, scale: float
+) -> float:
+    """The distance of a point to a line, with longitudes multiplied by [scale]."""
+    points = np.asarray(coords, dtype=float)
+    y, x = points[:, 0] - lat, (points[:, 1] - lon) * scale
+    if len(points) == 1:
+        return float(np.hypot(x[0], y[0]))
+    dy, dx = np.diff(y), np.diff(x)
+    length = dx * dx + dy * dy
+    t = np.clip(-(x[:-1] * dx + y[:-1] * dy) / np.where(length == 0.0, 1.0, length), 0.0, 1.0)
+    return float(np.min(np.hypot(x[:-1] + t * dx, y[:-1] + t * dy)))
@@ -0,0 +1,58 @@
+"""Helpers shared by the importers of table based formats, e.g. Matpower, pandapower and PyPSA."""
+
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+
+from epowcore.gdf.component import Component
+from epowcore.generic.configuration import Configuration
+from epowcore.generic.constants import Platform
+
+Connection = tuple[Component, Component, dict[int, list[str]]]
+"""An edge between two components with its connector data."""
+
+MACHINE_DEFAULT_ATTRIBUTES = [
+    "inertia_constant",
+    "zero_sequence_resistance",
+    "zero_sequence_reactance",
+    "stator_leakage_reactance",
+    "stator_resistance",
+    "synchronous_reactance_x",
+    "transient_reactance_x",
+    "subtransient_reactance_x",
+    "synchronous_reactance_q",
+    "transient_reactance_q",
+    "subtransient_reactance_q",
+]
+"""SynchronousMachine attributes that are not part of the tables, read from the configuration."""
+
+
+def machine_defaults(platform: Platform, attributes: list[str] | None = None) -> dict[str, Any]:
+    """Read the default values of SynchronousMachine attributes from the configuration.
+
+    :param platform: The platform the machines are imported from.
+    :type platform: Platform
+    :param attributes: The attributes, defaults to `MACHINE_DEFAULT_ATTRIBUTES`.
+    :type attributes: list[str] | None, optional
+    :raises ValueError: If no default value is configured for an attribute.
+    :return: The default values by attribute.
+    :rtype: dict[str, Any]
+    """
+    defaults = {}
+    for attr in MACHINE_DEFAULT_ATTRIBUTES if attributes is None else attributes:
+        value = Configuration().get_default("SynchronousMachine", attr, platform)
+        if value is None:
+            raise ValueError(f"No default value found for SynchronousMachine.{attr}")
+        defaults[attr] = value
+    return defaults
+
+
+def float_column(table: pd.DataFrame, column: str, default: float | npt.NDArray) -> npt.NDArray:
+    """Float values of an optional column. Missing columns and NaN values are replaced by
+    [default]."""
+    if column not in table.columns:
+        return np.broadcast_to(np.asarray(default, dtype=float), (len(table),)).copy()
+    values = table[column].to_numpy(dtype=float, na_value=np.nan)
+    return np.where(np.isnan(values), default, values)
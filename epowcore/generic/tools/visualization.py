@@ -2,6 +2,9 @@ from typing import Mapping
 import matplotlib.pyplot as plt
 import networkx as nx
 
+from epowcore.gdf.component import Component
+from epowcore.generic.layout import layout_graph, sparse_stress_layout
+
 
 def visualize_graph(
     graph: nx.Graph,
@@ -12,13 +15,16 @@ def visualize_graph(
     height: int = 10,
     seed: int | None = None,
 ) -> Mapping:
-    """Visualize network graph."""
+    """Visualize network graph.
+    Without a [layout], graphs of components use the cached layout of `layout_graph`,
+    otherwise the missing positions are added by a spring layout."""
 
-    pos = (
-        nx.spring_layout(graph, seed=seed)
-        if layout is None
-        else nx.spring_layout(graph, pos=layout, fixed=list(layout.keys()), seed=seed)
-    )
+    if layout is not None:
+        pos = nx.spring_layout(graph, pos=layout, fixed=list(layout.keys()), seed=seed)
+    elif all(isinstance(node, Component) for node in graph):
+        pos = layout_graph(graph)
+    else:
+        pos = sparse_stress_layout(graph)
 
     plt.figure(figsize=(width, height))
     nx.draw_networkx_nodes(
@@ -1,37 +1,221 @@
-from geojson import Feature, FeatureCollection, LineString, Point, utils
+import json
+import os
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, TextIO
+
+import numpy as np
+from geojson import Feature, FeatureCollection, LineString, Point
 
 from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.generic.component_graph import ComponentGraph
 from epowcore.generic.logger import Logger
+from epowcore.geo_json.from_gdf.geometry import (
+    line_tiles,
+    simplify_line,
+    to_lon_lat,
+    zoom_tolerance,
+)
+
+PRECISION = 6
+"""Decimal places of the exported coordinates, as used by the geojson package."""
+CHUNK_SIZE = 2_000
+"""Number of components per chunk of a parallel export."""
+
+# uid, name, type, subsystem and coordinates of a component, which can be sent to a worker;
+# the coordinates of a point are kept as (lat, lon), those of a line are converted to an array
+# of (lon, lat) once, which is also much faster to send to a worker than a list of tuples
+_Record = tuple[int, str, str, str | None, tuple[float, float] | np.ndarray]
+
+
+def export_geo_json(
+    core_model: CoreModel, tolerance: float | None = None, max_workers: int = 1
+) -> FeatureCollection:
+    """Export the components with coordinates, including those in subsystems.
+
+    :param core_model: The core model.
+    :type core_model: CoreModel
+    :param tolerance: Simplify lines with the Douglas-Peucker algorithm, so that removed points
+        are at most [tolerance] degrees away from the line, defaults to no simplification.
+    :type tolerance: float | None, optional
+    :param max_workers: The number of processes creating the features, defaults to 1.
+    :type max_workers: int, optional
+    :return: Points for components with one coordinate pair, line strings for the others.
+    :rtype: FeatureCollection
+    """
+    features = []
+    for feature in iter_features(core_model, tolerance, max_workers):
+        geometry = feature["geometry"]
+        if geometry["type"] == "Point":
+            shape = Point(geometry["coordinates"])
+        else:
+            shape = LineString(geometry["coordinates"])
+        features.append(Feature(id=feature["id"], geometry=shape, properties=feature["properties"]))
+    return FeatureCollection(features)
+
+
+def iter_features(
+    core_model: CoreModel, tolerance: float | None = None, max_workers: int = 1
+) -> Iterator[dict]:
+    """Create the GeoJSON features of the components chunk by chunk,
+    see `export_geo_json` for the parameters.
+
+    :return: The features as dictionaries, in the order of the components.
+    :rtype: Iterator[dict]
+    """
+    for features in _map_chunks(_records(core_model), tolerance, None, max_workers):
+        yield from features
+
+
+def write_geo_json(
+    core_model: CoreModel,
+    file: str | TextIO,
+    tolerance: float | None = None,
+    max_workers: int = 1,
+) -> int:
+    """Write the components as GeoJSON feature collection, one feature at a time,
+    so that large models are not held as one document in memory.
 
+    :param core_model: The core model.
+    :type core_model: CoreModel
+    :param file: The path or the opened file to write to.
+    :type file: str | TextIO
+    :param tolerance: The simplification tolerance in degrees, see `export_geo_json`.
+    :type tolerance: float | None, optional
+    :param max_workers: The number of processes creating the features, defaults to 1.
+    :type max_workers: int, optional
+    :return: The number of written features.
+    :rtype: int
+    """
+    if isinstance(file, str):
+        with open(file, "w", encoding="utf-8") as opened:
+            return write_geo_json(core_model, opened, tolerance, max_workers)
+    file.write('{"type": "FeatureCollection", "features": [\n')
+    count = 0
+    for feature in iter_features(core_model, tolerance, max_workers):
+        if count > 0:
+            file.write(",\n")
+        file.write(json.dumps(feature, separators=(",", ":")))
+        count += 1
+    file.write("\n]}\n")
+    return count
 
-def export_geo_json(core_model: CoreModel) -> FeatureCollection:
-    geo_json_objects = []
 
-    for node in core_model.graph.nodes:
-        if node.coords is not None and node.coords:
-            properties = {
-                "uid": node.uid,
-                "name": node.name,
-                "type": node.__class__.__name__,
-            }
+def write_tiles(
+    core_model: CoreModel,
+    directory: str,
+    min_zoom: int = 0,
+    max_zoom: int = 10,
+    pixels: float = 1.0,
+    max_workers: int = 1,
+) -> int:
+    """Write the components as web map tiles, a GeoJSON feature collection per tile at
+    `{directory}/{z}/{x}/{y}.geojson`.
+
+    At each zoom level, lines are simplified so that removed points are less than [pixels]
+    away from the line on the map. A feature is written to every tile touched by
+    the bounding box of one of its segments; features are not clipped at the tile borders.
+
+    :param core_model: The core model.
+    :type core_model: CoreModel
+    :param directory: The directory to write the tiles to.
+    :type directory: str
+    :param min_zoom: The lowest zoom level, defaults to 0.
+    :type min_zoom: int, optional
+    :param max_zoom: The highest zoom level, defaults to 10.
+    :type max_zoom: int, optional
+    :param pixels: The simplification tolerance in pixels, defaults to 1.0.
+    :type pixels: float, optional
+    :param max_workers: The number of processes creating the features, defaults to 1.
+    :type max_workers: int, optional
+    :return: The number of written tiles.
+    :rtype: int
+    """
+    records = _records(core_model)
+    count = 0
+    for zoom in range(min_zoom, max_zoom + 1):
+        tiles: dict[tuple[int, int], list[str]] = {}
+        for features in _map_chunks(records, zoom_tolerance(zoom, pixels), zoom, max_workers):
+            for feature, feature_tiles in features:
+                text = json.dumps(feature, separators=(",", ":"))
+                for tile in feature_tiles:
+                    tiles.setdefault(tile, []).append(text)
+        for (x, y), texts in tiles.items():
+            tile_directory = os.path.join(directory, str(zoom), str(x))
+            os.makedirs(tile_directory, exist_ok=True)
+            with open(os.path.join(tile_directory, f"{y}.geojson"), "w", encoding="utf-8") as file:
+                file.write('{"type":"FeatureCollection","features":[')
+                file.write(",".join(texts))
+                file.write("]}\n")
+        count += len(tiles)
+    return count
+
+
+def _records(core_model: CoreModel) -> list[_Record]:
+    records: list[_Record] = []
+    _collect(core_model.graph, None, records)
+    return records
+
+
+def _collect(graph: ComponentGraph, subsystem: str | None, records: list[_Record]) -> None:
+    for node in graph.nodes:
+        if isinstance(node, Subsystem):
+            name = node.name if subsystem is None else f"{subsystem}/{node.name}"
+            _collect(node.graph, name, records)
+        elif node.coords is not None and node.coords:
+            coords: tuple[float, float] | np.ndarray
             if isinstance(node.coords, tuple):
-                geo_json_objects.append(
-                    Feature(
-                        id=node.uid,
-                        geometry=Point((node.coords[1], node.coords[0])),
-                        properties=properties,
-                    )
-                )
+                coords = node.coords
             else:
-                line = utils.map_tuples(lambda c: (c[1], c[0]), LineString(node.coords))
-                geo_json_objects.append(
-                    Feature(
-                        id=node.uid,
-                        geometry=line,
-                        properties=properties,
-                    )
-                )
+                coords = np.ascontiguousarray(to_lon_lat(node.coords))
+            records.append((node.uid, node.name, node.__class__.__name__, subsystem, coords))
         else:
             Logger.log_to_selected(f"No coordinates for {node.name} ({node.uid}). Not exported!")
 
-    return FeatureCollection(geo_json_objects)
+
+def _map_chunks(
+    records: list[_Record], tolerance: float | None, zoom: int | None, max_workers: int
+) -> Iterator[list]:
+    chunks = [records[start : start + CHUNK_SIZE] for start in range(0, len(records), CHUNK_SIZE)]
+    create = partial(_create_features, tolerance=tolerance, zoom=zoom)
+    if max_workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+            yield from executor.map(create, chunks)
+    else:
+        yield from map(create, chunks)
+
+
+def _create_features(chunk: list[_Record], tolerance: float | None, zoom: int | None) -> list:
+    """Create the features of a chunk; with a zoom level, each with the tiles it touches."""
+    # the points of a chunk are converted at once
+    points = np.asarray([r[4] for r in chunk if isinstance(r[4], tuple)], dtype=float).reshape(
+        -1, 2
+    )
+    point_coordinates = iter(np.round(points[:, ::-1], PRECISION))
+
+    features: list = []
+    for record in chunk:
+        uid, name, type_name, subsystem, coords = record
+        point = isinstance(coords, tuple)
+        if not isinstance(coords, np.ndarray):
+            coordinates = next(point_coordinates).reshape(1, 2)
+        else:
+            if tolerance is not None:
+                coords = simplify_line(coords, tolerance)
+            coordinates = np.round(coords, PRECISION)
+        properties: dict[str, Any] = {"uid": uid, "name": name, "type": type_name}
+        if subsystem is not None:
+            properties["subsystem"] = subsystem
+        feature = {
+            "type": "Feature",
+            "id": uid,
+            "geometry": {
+                "type": "Point" if point else "LineString",
+                "coordinates": coordinates[0].tolist() if point else coordinates.tolist(),
+            },
+            "properties": properties,
+        }
+        features.append(feature if zoom is None else (feature, line_tiles(coordinates, zoom)))
+    return features
@@ -0,0 +1,99 @@
+"""Vectorised geometry helpers for the GeoJSON export: coordinate conversion,
+Douglas-Peucker simplification and web map tiles."""
+
+import numpy as np
+
+MAX_LATITUDE = 85.0511287798
+"""The latitude limit of the web mercator projection."""
+TILE_SIZE = 256
+"""The size of a map tile in pixels."""
+
+
+def to_lon_lat(coords: tuple[float, float] | list[tuple[float, float]]) -> np.ndarray:
+    """Convert coordinates of the core model, which are (lat, lon), to GeoJSON order.
+
+    :param coords: A coordinate pair or a list of pairs.
+    :type coords: tuple[float, float] | list[tuple[float, float]]
+    :return: An array of shape (n, 2) with longitude and latitude.
+    :rtype: np.ndarray
+    """
+    points = np.asarray(coords, dtype=float).reshape(-1, 2)
+    return points[:, ::-1]
+
+
+def simplify_line(points: np.ndarray, tolerance: float) -> np.ndarray:
+    """Simplify a line with the Douglas-Peucker algorithm.
+
+    :param points: The points of the line, an array of shape (n, 2).
+    :type points: np.ndarray
+    :param tolerance: The maximum distance of a removed point to the simplified line,
+        in the unit of the coordinates.
+    :type tolerance: float
+    :return: The remaining points, always including the first and the last point.
+    :rtype: np.ndarray
+    """
+    num_points = len(points)
+    if num_points < 3 or tolerance <= 0:
+        return points
+    keep = np.zeros(num_points, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, num_points - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        direction = points[end] - points[start]
+        offsets = points[start + 1 : end] - points[start]
+        length = np.hypot(direction[0], direction[1])
+        if length == 0.0:
+            distances = np.hypot(offsets[:, 0], offsets[:, 1])
+        else:
+            distances = np.abs(direction[0] * offsets[:, 1] - direction[1] * offsets[:, 0]) / length
+        farthest = int(np.argmax(distances))
+        if distances[farthest] > tolerance:
+            index = start + 1 + farthest
+            keep[index] = True
+            stack.append((start, index))
+            stack.append((index, end))
+    return points[keep]
+
+
+def zoom_tolerance(zoom: int, pixels: float = 1.0) -> float:
+    """The simplification tolerance in degrees for a zoom level of a web map,
+    so that removed points are less than [pixels] away from the simplified line."""
+    return pixels * 360.0 / (TILE_SIZE * 2**zoom)
+
+
+def tile_coordinates(points: np.ndarray, zoom: int) -> np.ndarray:
+    """The web map tiles (x, y) of points at a zoom level.
+
+    :param points: An array of shape (n, 2) with longitude and latitude.
+    :type points: np.ndarray
+    :param zoom: The zoom level.
+    :type zoom: int
+    :return: An integer array of shape (n, 2) with the x and y index of the tile of each point.
+    :rtype: np.ndarray
+    """
+    num_tiles = 2**zoom
+    latitude = np.radians(np.clip(points[:, 1], -MAX_LATITUDE, MAX_LATITUDE))
+    x = (points[:, 0] + 180.0) / 360.0 * num_tiles
+    y = (1.0 - np.log(np.tan(latitude) + 1.0 / np.cos(latitude)) / np.pi) / 2.0 * num_tiles
+    tiles = np.floor(np.column_stack([x, y])).astype(int)
+    return np.clip(tiles, 0, num_tiles - 1)
+
+
+def line_tiles(points: np.ndarray, zoom: int) -> set[tuple[int, int]]:
+    """The web map tiles touched by a point or line at a zoom level.
+    Each segment is assigned to all tiles of its bounding box."""
+    tiles = tile_coordinates(points, zoom)
+    if len(tiles) == 1:
+        return {(int(tiles[0, 0]), int(tiles[0, 1]))}
+    low = np.minimum(tiles[:-1], tiles[1:])
+    high = np.maximum(tiles[:-1], tiles[1:])
+    result: set[tuple[int, int]] = set()
+    for (x_min, y_min), (x_max, y_max) in zip(low.tolist(), high.tolist()):
+        if x_min == x_max and y_min == y_max:
+            result.add((x_min, y_min))
+        else:
+            result.update((x, y) for x in range(x_min, x_max + 1) for y in range(y_min, y_max + 1))
+    return result
@@ -1,3 +1,4 @@
+import geojson
 from geojson import FeatureCollection
 
 from epowcore.gdf.core_model import CoreModel
@@ -11,6 +12,12 @@ class GeoJSONConverter(ConverterBase[FeatureCollection]):
     ) -> FeatureCollection:
         return super().from_gdf(core_model, name, log_path)
 
+    def serialize(self, model: FeatureCollection) -> bytes:
+        return geojson.dumps(model).encode("utf-8")
+
+    def deserialize(self, data: bytes) -> FeatureCollection:
+        return geojson.loads(data)
+
     def _export(self, core_model: CoreModel, name: str) -> FeatureCollection:
         return export_geo_json(core_model)
 
@@ -20,12 +20,18 @@ class JmdlConverter(ConverterBase[JmdlModel]):
         return self.to_gdf(jmdl)
 
     def from_gdf(self, core_model: CoreModel, name: str, log_path: str | None = None) -> JmdlModel:
-        Configuration().default_platform = Platform.JMDL
-        return super().from_gdf(core_model, name, log_path)
+        with Configuration().scoped(Platform.JMDL):
+            return super().from_gdf(core_model, name, log_path)
 
     def to_gdf(self, model: JmdlModel, log_path: str | None = None) -> CoreModel:
         return super().to_gdf(model, log_path)
 
+    def serialize(self, model: JmdlModel) -> bytes:
+        return model.to_json(minified=True).encode("utf-8")
+
+    def deserialize(self, data: bytes) -> JmdlModel:
+        return JmdlModel.from_dict(json.loads(data))
+
     def _pre_export(self, core_model: CoreModel, name: str) -> CoreModel:
         return transform(core_model)
 
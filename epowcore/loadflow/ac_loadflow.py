@@ -0,0 +1,447 @@
+from copy import deepcopy
+from dataclasses import dataclass
+from enum import Enum
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+import scipy.sparse as sp
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu, spsolve
+
+from epowcore.gdf.bus import Bus, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.external_grid import ExternalGrid, ExternalGridType
+from epowcore.gdf.generators.static_generator import StaticGenerator
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.load import Load
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.gdf.utils import get_connected_bus
+from epowcore.generic.logger import Logger
+from epowcore.generic.manipulation.flatten import flatten
+from epowcore.loadflow.admittance import (
+    AdmittanceMatrices,
+    assemble_admittance,
+    build_admittance,
+)
+
+
+class LoadFlowAlgorithm(Enum):
+    """Algorithms to solve the AC load flow."""
+
+    NEWTON_RAPHSON = "nr"
+    """Newton-Raphson with a sparse Jacobian."""
+    FAST_DECOUPLED = "fdxb"
+    """Fast-decoupled load flow, XB version."""
+
+
+@dataclass
+class BusData:
+    """Load flow specification of the buses in the order of the admittance matrix."""
+
+    bus_type: npt.NDArray[np.int64]
+    """Load flow bus type, see the constants PQ, PV, SL and ISO."""
+    s_injection: npt.NDArray[np.complex128]
+    """Specified complex power injection (generation - demand) [p.u.]"""
+    v_setpoint: npt.NDArray[np.float64]
+    """Voltage set point of PV and slack buses [p.u.]"""
+
+
+# bus type codes of BusData
+PQ, PV, SL, ISO = 1, 2, 3, 4
+_BUS_TYPE_CODES = {LFBusType.PQ: PQ, LFBusType.PV: PV, LFBusType.SL: SL, LFBusType.ISO: ISO}
+
+
+@dataclass
+class LoadFlowResult:
+    """Columnar results of an AC load flow. Values of unsupplied buses and branches are NaN."""
+
+    converged: bool
+    """Whether the load flow converged."""
+    iterations: int
+    """Number of iterations."""
+    bus_uids: npt.NDArray[np.int64]
+    """Uid of each bus."""
+    vm_pu: npt.NDArray[np.float64]
+    """Voltage magnitude of each bus [p.u.]"""
+    va_degree: npt.NDArray[np.float64]
+    """Voltage angle of each bus [deg]"""
+    p_mw: npt.NDArray[np.float64]
+    """Active power injection (generation - demand) of each bus [MW]"""
+    q_mvar: npt.NDArray[np.float64]
+    """Reactive power injection (generation - demand) of each bus [Mvar]"""
+    branch_uids: npt.NDArray[np.int64]
+    """Uid of the component of each branch."""
+    p_from_mw: npt.NDArray[np.float64]
+    """Active power flow into each branch at the from end [MW]"""
+    q_from_mvar: npt.NDArray[np.float64]
+    """Reactive power flow into each branch at the from end [Mvar]"""
+    p_to_mw: npt.NDArray[np.float64]
+    """Active power flow into each branch at the to end [MW]"""
+    q_to_mvar: npt.NDArray[np.float64]
+    """Reactive power flow into each branch at the to end [Mvar]"""
+
+    def bus_results(self) -> pd.DataFrame:
+        """Bus results as table indexed by the bus uids."""
+        return pd.DataFrame(
+            {
+                "vm_pu": self.vm_pu,
+                "va_degree": self.va_degree,
+                "p_mw": self.p_mw,
+                "q_mvar": self.q_mvar,
+            },
+            index=pd.Index(self.bus_uids, name="uid"),
+        )
+
+    def branch_results(self) -> pd.DataFrame:
+        """Branch results as table indexed by the uids of the branch components."""
+        return pd.DataFrame(
+            {
+                "p_from_mw": self.p_from_mw,
+                "q_from_mvar": self.q_from_mvar,
+                "p_to_mw": self.p_to_mw,
+                "q_to_mvar": self.q_to_mvar,
+            },
+            index=pd.Index(self.branch_uids, name="uid"),
+        )
+
+
+def run_loadflow(
+    core_model: CoreModel,
+    algorithm: LoadFlowAlgorithm = LoadFlowAlgorithm.NEWTON_RAPHSON,
+    tolerance_mva: float = 1e-8,
+    max_iterations: int | None = None,
+) -> LoadFlowResult:
+    """Run an AC load flow on a core model.
+
+    The bus types are taken from the `lf_bus_type` of the buses. Buses with an external grid
+    of type SL become slack buses. If there is no slack bus at all, the buses with external
+    grids are used. Voltage set points are taken from external grids, synchronous machines
+    and static generators. Loads and generators are modelled with constant power,
+    reactive power limits are not considered.
+
+    :param core_model: The core model, subsystems are flattened on a copy.
+    :type core_model: CoreModel
+    :param algorithm: The algorithm to solve the load flow, defaults to Newton-Raphson
+    :type algorithm: LoadFlowAlgorithm, optional
+    :param tolerance_mva: Maximum power mismatch [MVA], defaults to 1e-8
+    :type tolerance_mva: float, optional
+    :param max_iterations: Maximum number of iterations, defaults to 10 for Newton-Raphson
+                           and 30 for fast-decoupled
+    :type max_iterations: int | None, optional
+    :raises ValueError: Raised if there is no slack bus.
+    :return: The load flow results.
+    :rtype: LoadFlowResult
+    """
+    if core_model.type_list(Subsystem):
+        core_model = deepcopy(core_model)
+        flatten(core_model)
+
+    admittance = build_admittance(core_model)
+    bus_data = build_bus_data(core_model, admittance)
+    base_mva = core_model.base_mva_fb()
+
+    # only solve the buses connected to a slack bus
+    active = _supplied_buses(admittance, bus_data)
+    active_branches = active[admittance.from_bus] & active[admittance.to_bus]
+    ybus = admittance.ybus[active][:, active].tocsr()
+    bus_type = bus_data.bus_type[active]
+    ref = np.flatnonzero(bus_type == SL)
+    pv = np.flatnonzero(bus_type == PV)
+    pq = np.flatnonzero(bus_type == PQ)
+
+    v0 = _initial_voltage(admittance, bus_data, active)
+    s_bus = bus_data.s_injection[active]
+    tolerance = tolerance_mva / base_mva
+
+    match algorithm:
+        case LoadFlowAlgorithm.NEWTON_RAPHSON:
+            v, converged, iterations = _newton_raphson(
+                ybus, s_bus, v0, ref, pv, pq, tolerance, max_iterations or 10
+            )
+        case LoadFlowAlgorithm.FAST_DECOUPLED:
+            b_p, b_pp = _decoupled_matrices(admittance, active)
+            v, converged, iterations = _fast_decoupled(
+                ybus, b_p, b_pp, s_bus, v0, ref, pv, pq, tolerance, max_iterations or 30
+            )
+        case _:
+            raise ValueError(f"Unsupported load flow algorithm: {algorithm}")
+    if not converged:
+        Logger.log_to_selected(f"Load flow did not converge after {iterations} iterations")
+
+    voltage = np.full(len(active), np.nan, dtype=complex)
+    voltage[active] = v
+    s_result = np.full(len(active), np.nan, dtype=complex)
+    s_result[active] = v * np.conj(ybus @ v) * base_mva
+
+    s_from = np.full(len(active_branches), np.nan, dtype=complex)
+    s_to = np.full(len(active_branches), np.nan, dtype=complex)
+    v_all = np.where(active, voltage, 0)
+    s_from[active_branches] = (
+        v_all[admittance.from_bus] * np.conj(admittance.yf @ v_all) * base_mva
+    )[active_branches]
+    s_to[active_branches] = (v_all[admittance.to_bus] * np.conj(admittance.yt @ v_all) * base_mva)[
+        active_branches
+    ]
+
+    return LoadFlowResult(
+        converged=converged,
+        iterations=iterations,
+        bus_uids=np.array(admittance.bus_numbering.uids, dtype=np.int64),
+        vm_pu=np.abs(voltage),
+        va_degree=np.rad2deg(np.angle(voltage)),
+        p_mw=s_result.real,
+        q_mvar=s_result.imag,
+        branch_uids=admittance.branch_uids,
+        p_from_mw=s_from.real,
+        q_from_mvar=s_from.imag,
+        p_to_mw=s_to.real,
+        q_to_mvar=s_to.imag,
+    )
+
+
+def build_bus_data(core_model: CoreModel, admittance: AdmittanceMatrices) -> BusData:
+    """Collect bus types, power injections and voltage set points of a flattened core model.
+
+    :param core_model: The flattened core model.
+    :type core_model: CoreModel
+    :param admittance: The admittance matrices of the core model.
+    :type admittance: AdmittanceMatrices
+    :raises ValueError: Raised if there is no slack bus.
+    :return: The load flow specification of the buses.
+    :rtype: BusData
+    """
+    numbering = admittance.bus_numbering
+    num_buses = len(numbering)
+    base_mva = core_model.base_mva_fb()
+
+    def index(bus: Bus) -> int:
+        return numbering.index(bus.uid) - numbering.start
+
+    bus_type = np.full(num_buses, PQ, dtype=np.int64)
+    for node in core_model.type_list(Bus):
+        bus_type[index(node)] = _BUS_TYPE_CODES[node.lf_bus_type]
+
+    s_injection = np.zeros(num_buses, dtype=complex)
+    v_setpoint = np.full(num_buses, np.nan)
+    # set points of voltage controlling units, lower priority first
+    setpoints: list[tuple[int, float]] = []
+
+    for load in core_model.type_list(Load):
+        bus = get_connected_bus(core_model.graph, load, max_depth=1)
+        if bus is None:
+            Logger.log_to_selected(f"No connected bus found for load {load.name}")
+            continue
+        s_injection[index(bus)] -= complex(load.active_power, load.reactive_power)
+
+    generators: list[StaticGenerator | SynchronousMachine] = [
+        *core_model.type_list(StaticGenerator),
+        *core_model.type_list(SynchronousMachine),
+    ]
+    for generator in generators:
+        bus = get_connected_bus(core_model.graph, generator, max_depth=1)
+        if bus is None:
+            Logger.log_to_selected(f"No connected bus found for generator {generator.name}")
+            continue
+        s_injection[index(bus)] += complex(generator.active_power, generator.reactive_power)
+        setpoints.append((index(bus), generator.voltage_set_point))
+
+    external_grid_buses: list[int] = []
+    for external_grid in core_model.type_list(ExternalGrid):
+        bus = get_connected_bus(core_model.graph, external_grid, max_depth=3)
+        if bus is None:
+            Logger.log_to_selected(f"No connected bus found for external grid {external_grid.name}")
+            continue
+        s_injection[index(bus)] += complex(external_grid.p, external_grid.q)
+        setpoints.append((index(bus), external_grid.u_setp))
+        external_grid_buses.append(index(bus))
+        if external_grid.bus_type == ExternalGridType.SL:
+            bus_type[index(bus)] = SL
+
+    for i, setpoint in setpoints:
+        v_setpoint[i] = setpoint
+
+    if not np.any(bus_type == SL):
+        if not external_grid_buses:
+            raise ValueError("The load flow requires a slack bus or an external grid.")
+        Logger.log_to_selected("No slack bus defined, using the buses of the external grids")
+        bus_type[external_grid_buses] = SL
+
+    missing = np.flatnonzero(((bus_type == PV) | (bus_type == SL)) & np.isnan(v_setpoint))
+    if len(missing) > 0:
+        Logger.log_to_selected(
+            f"No voltage set point for {len(missing)} PV or slack buses, using 1.0 p.u."
+        )
+    v_setpoint[np.isnan(v_setpoint)] = 1.0
+
+    s_injection /= base_mva
+    return BusData(bus_type=bus_type, s_injection=s_injection, v_setpoint=v_setpoint)
+
+
+def _supplied_buses(admittance: AdmittanceMatrices, bus_data: BusData) -> npt.NDArray[np.bool_]:
+    """Mask of the buses that are not isolated and connected to a slack bus."""
+    connected = bus_data.bus_type != ISO
+    graph = admittance.ybus[connected][:, connected] != 0
+    _, labels = connected_components(graph, directed=False)
+    supplied_labels = np.unique(labels[bus_data.bus_type[connected] == SL])
+    active = np.zeros(len(connected), dtype=bool)
+    active[np.flatnonzero(connected)[np.isin(labels, supplied_labels)]] = True
+    if not np.all(active):
+        Logger.log_to_selected(f"{np.count_nonzero(~active)} buses are not supplied")
+    return active
+
+
+def _initial_voltage(
+    admittance: AdmittanceMatrices, bus_data: BusData, active: npt.NDArray[np.bool_]
+) -> npt.NDArray[np.complex128]:
+    """Voltage magnitudes from the set points and angles from a DC load flow."""
+    bus_type = bus_data.bus_type[active]
+    vm = np.where((bus_type == PV) | (bus_type == SL), bus_data.v_setpoint[active], 1.0)
+
+    bbus, _, pbusinj, _ = admittance.dc_matrices()
+    bbus = bbus[active][:, active].tocsc()
+    p = bus_data.s_injection[active].real - pbusinj[active] - admittance.ysh[active].real
+    non_ref = np.flatnonzero(bus_type != SL)
+    va = np.zeros(len(bus_type))
+    if len(non_ref) > 0:
+        va[non_ref] = spsolve(bbus[non_ref][:, non_ref].tocsc(), p[non_ref])
+    return vm * np.exp(1j * va)
+
+
+def _newton_raphson(
+    ybus: sp.csr_matrix,
+    s_bus: npt.NDArray[np.complex128],
+    v0: npt.NDArray[np.complex128],
+    ref: npt.NDArray[np.int64],
+    pv: npt.NDArray[np.int64],
+    pq: npt.NDArray[np.int64],
+    tolerance: float,
+    max_iterations: int,
+) -> tuple[npt.NDArray[np.complex128], bool, int]:
+    """Solve the load flow with the Newton-Raphson method like MATPOWER's `newtonpf`."""
+    v = v0.copy()
+    va = np.angle(v)
+    vm = np.abs(v)
+    pvpq = np.concatenate([pv, pq])
+    num_pvpq = len(pvpq)
+
+    mismatch = v * np.conj(ybus @ v) - s_bus
+    f = np.concatenate([mismatch[pvpq].real, mismatch[pq].imag])
+    iterations = 0
+    converged = np.max(np.abs(f), initial=0.0) < tolerance
+    while not converged and iterations < max_iterations:
+        iterations += 1
+        ds_dvm, ds_dva = _dsbus_dv(ybus, v)
+        jacobian = sp.bmat(
+            [
+                [ds_dva[pvpq][:, pvpq].real, ds_dvm[pvpq][:, pq].real],
+                [ds_dva[pq][:, pvpq].imag, ds_dvm[pq][:, pq].imag],
+            ],
+            format="csc",
+        )
+        dx = spsolve(jacobian, -f)
+        va[pvpq] += dx[:num_pvpq]
+        vm[pq] += dx[num_pvpq:]
+        v = vm * np.exp(1j * va)
+
+        mismatch = v * np.conj(ybus @ v) - s_bus
+        f = np.concatenate([mismatch[pvpq].real, mismatch[pq].imag])
+        converged = np.max(np.abs(f), initial=0.0) < tolerance
+    return v, bool(converged), iterations
+
+
+def _dsbus_dv(
+    ybus: sp.csr_matrix, v: npt.NDArray[np.complex128]
+) -> tuple[sp.csr_matrix, sp.csr_matrix]:
+    """Partial derivatives of the bus power injections w.r.t. voltage magnitude and angle."""
+    i_bus = ybus @ v
+    diag_v = sp.diags(v)
+    diag_i = sp.diags(i_bus)
+    diag_vnorm = sp.diags(v / np.abs(v))
+    ds_dvm = diag_v @ np.conj(ybus @ diag_vnorm) + np.conj(diag_i) @ diag_vnorm
+    ds_dva = 1j * diag_v @ np.conj(diag_i - ybus @ diag_v)
+    return ds_dvm.tocsr(), ds_dva.tocsr()
+
+
+def _decoupled_matrices(
+    admittance: AdmittanceMatrices, active: npt.NDArray[np.bool_]
+) -> tuple[sp.csr_matrix, sp.csr_matrix]:
+    """The matrices B' and B'' of the XB fast-decoupled load flow like MATPOWER's `makeB`."""
+    num_buses = len(admittance.ysh)
+    no_shunt = np.zeros(len(admittance.ys), dtype=complex)
+
+    # B': no shunts, no resistance, no taps
+    ys_p = 1 / (1j * np.imag(1 / admittance.ys))
+    y_p, *_ = assemble_admittance(
+        num_buses,
+        admittance.from_bus,
+        admittance.to_bus,
+        ys_p,
+        ys_p,
+        no_shunt,
+        np.ones(len(ys_p), dtype=complex),
+        np.zeros(num_buses, dtype=complex),
+    )
+    # B'': no phase shifts
+    y_pp, *_ = assemble_admittance(
+        num_buses,
+        admittance.from_bus,
+        admittance.to_bus,
+        admittance.ys,
+        admittance.ys,
+        admittance.yc,
+        np.abs(admittance.tap).astype(complex),
+        admittance.ysh,
+    )
+    b_p = -y_p.imag[active][:, active]
+    b_pp = -y_pp.imag[active][:, active]
+    return b_p.tocsr(), b_pp.tocsr()
+
+
+def _fast_decoupled(
+    ybus: sp.csr_matrix,
+    b_p: sp.csr_matrix,
+    b_pp: sp.csr_matrix,
+    s_bus: npt.NDArray[np.complex128],
+    v0: npt.NDArray[np.complex128],
+    ref: npt.NDArray[np.int64],
+    pv: npt.NDArray[np.int64],
+    pq: npt.NDArray[np.int64],
+    tolerance: float,
+    max_iterations: int,
+) -> tuple[npt.NDArray[np.complex128], bool, int]:
+    """Solve the load flow with the fast-decoupled method like MATPOWER's `fdpf`."""
+    v = v0.copy()
+    va = np.angle(v)
+    vm = np.abs(v)
+    pvpq = np.concatenate([pv, pq])
+
+    def mismatches() -> tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        mismatch = (v * np.conj(ybus @ v) - s_bus) / vm
+        return mismatch[pvpq].real, mismatch[pq].imag
+
+    p, q = mismatches()
+    converged = max(np.max(np.abs(p), initial=0.0), np.max(np.abs(q), initial=0.0)) < tolerance
+    if converged:
+        return v, True, 0
+
+    # the matrices are factorized once
+    lu_p = splu(b_p[pvpq][:, pvpq].tocsc())
+    lu_pp = splu(b_pp[pq][:, pq].tocsc()) if len(pq) > 0 else None
+
+    iterations = 0
+    while iterations < max_iterations:
+        iterations += 1
+        va[pvpq] -= lu_p.solve(p)
+        v = vm * np.exp(1j * va)
+        p, q = mismatches()
+        if max(np.max(np.abs(p), initial=0.0), np.max(np.abs(q), initial=0.0)) < tolerance:
+            return v, True, iterations
+
+        if lu_pp is not None:
+            vm[pq] -= lu_pp.solve(q)
+            v = vm * np.exp(1j * va)
+        p, q = mismatches()
+        if max(np.max(np.abs(p), initial=0.0), np.max(np.abs(q), initial=0.0)) < tolerance:
+            return v, True, iterations
+    return v, False, iterations
@@ -0,0 +1,302 @@
+from dataclasses import dataclass
+
+import networkx as nx
+import numpy as np
+import numpy.typing as npt
+import scipy.sparse as sp
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.component import Component
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.impedance import Impedance
+from epowcore.gdf.shunt import Shunt
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.gdf.switch import Switch
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.gdf.utils import get_connected_bus
+from epowcore.generic.bus_numbering import BusNumbering
+from epowcore.generic.logger import Logger
+
+
+@dataclass
+class AdmittanceMatrices:
+    """Sparse admittance matrices of a power system in p.u. on the system base.
+
+    Rows of the branch matrices follow [branch_uids], bus rows and columns follow [bus_numbering].
+    """
+
+    bus_numbering: BusNumbering
+    """Mapping between bus uids and matrix indices."""
+    branch_uids: npt.NDArray[np.int64]
+    """The uid of the component of each branch row."""
+    ybus: sp.csr_matrix
+    """Bus admittance matrix (buses x buses)."""
+    yf: sp.csr_matrix
+    """Branch admittance matrix of the from end (branches x buses)."""
+    yt: sp.csr_matrix
+    """Branch admittance matrix of the to end (branches x buses)."""
+    cf: sp.csr_matrix
+    """Incidence matrix of the branch from ends (branches x buses)."""
+    ct: sp.csr_matrix
+    """Incidence matrix of the branch to ends (branches x buses)."""
+    from_bus: npt.NDArray[np.int64]
+    """Index of the from bus of each branch."""
+    to_bus: npt.NDArray[np.int64]
+    """Index of the to bus of each branch."""
+    ys: npt.NDArray[np.complex128]
+    """Series admittance of each branch seen from the from end."""
+    yc: npt.NDArray[np.complex128]
+    """Total shunt admittance of each branch."""
+    tap: npt.NDArray[np.complex128]
+    """Complex ratio of the ideal transformer at the from end of each branch."""
+    ysh: npt.NDArray[np.complex128]
+    """Shunt admittance of each bus."""
+
+    @property
+    def incidence(self) -> sp.csr_matrix:
+        """Bus/branch incidence matrix with +1 at the from end and -1 at the to end."""
+        return (self.cf - self.ct).tocsr()
+
+    def dc_matrices(
+        self,
+    ) -> tuple[sp.csr_matrix, sp.csr_matrix, npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+        """Build the matrices of the DC approximation like MATPOWER's `makeBdc`.
+        Branch flows are `Pf = Bf * Va + Pfinj`, bus injections are `P = Bbus * Va + Pbusinj`.
+
+        :return: The matrices Bbus and Bf and the injections Pbusinj and Pfinj of phase shifters.
+        :rtype: tuple[sp.csr_matrix, sp.csr_matrix, npt.NDArray[np.float64], npt.NDArray[np.float64]]
+        """
+        b = 1 / np.imag(1 / self.ys) / np.abs(self.tap)
+        num_branches = len(b)
+        rows = np.concatenate([np.arange(num_branches), np.arange(num_branches)])
+        bf = sp.csr_matrix(
+            (np.concatenate([b, -b]), (rows, np.concatenate([self.from_bus, self.to_bus]))),
+            shape=self.cf.shape,
+        )
+        bbus = ((self.cf - self.ct).T @ bf).tocsr()
+        pfinj = -b * np.angle(self.tap)
+        pbusinj = (self.cf - self.ct).T @ pfinj
+        return bbus, bf, pbusinj, pfinj
+
+
+def build_admittance(
+    core_model: CoreModel, bus_numbering: BusNumbering | None = None
+) -> AdmittanceMatrices:
+    """Build the sparse admittance matrices of a flattened core model.
+
+    Transmission lines and impedances are modelled as pi-equivalents, transformers as
+    pi-equivalents with an ideal transformer at the HV side. Shunts are added to the diagonal.
+    Closed switches between two buses are modelled as lines with the configured switch impedance.
+    Values are converted to p.u. on the nominal voltages of the buses and the base rating
+    of the core model.
+
+    :param core_model: The flattened core model.
+    :type core_model: CoreModel
+    :param bus_numbering: The numbering of the buses, defaults to the numbering by uid
+    :type bus_numbering: BusNumbering | None, optional
+    :raises ValueError: Raised if the core model contains subsystems or a branch without impedance.
+    :return: The admittance matrices.
+    :rtype: AdmittanceMatrices
+    """
+    if core_model.type_list(Subsystem):
+        raise ValueError("The core model has to be flattened to build the admittance matrices.")
+    if bus_numbering is None:
+        bus_numbering = BusNumbering.from_core_model(core_model)
+
+    base_mva = core_model.base_mva_fb()
+    graph = core_model.graph.get_internal_graph(copy=False)
+    v_nom = np.zeros(len(bus_numbering))
+    for bus in core_model.type_list(Bus):
+        v_nom[bus_numbering.index(bus.uid) - bus_numbering.start] = bus.nominal_voltage
+
+    # uid, from, to, ys from -> to, ys to -> from, shunt admittance, complex tap ratio
+    rows: list[tuple[int, int, int, complex, complex, complex, complex]] = []
+
+    def index(bus: Bus) -> int:
+        return bus_numbering.index(bus.uid) - bus_numbering.start
+
+    for line in core_model.type_list(TLine):
+        buses = _terminal_buses(graph, line, "A", "B")
+        if buses is None:
+            continue
+        f, t = index(buses[0]), index(buses[1])
+        length = line.length if line.length is not None else 1.0
+        z_base = v_nom[f] ** 2 / base_mva
+        ys = (
+            line.parallel_lines
+            * z_base
+            * _series_admittance(line, complex(line.r1, line.x1) * length)
+        )
+        yc = 1j * line.parallel_lines * line.b1 * length * 1e-6 * z_base
+        rows.append((line.uid, f, t, ys, ys, yc, 1.0))
+
+    for impedance in core_model.type_list(Impedance):
+        buses = _terminal_buses(graph, impedance, "A", "B")
+        if buses is None:
+            continue
+        z_ft = complex(impedance.r_pu, impedance.x_pu)
+        z_tf = complex(
+            impedance.r_pu if impedance.r_pu_ba is None else impedance.r_pu_ba,
+            impedance.x_pu if impedance.x_pu_ba is None else impedance.x_pu_ba,
+        )
+        scale = impedance.sn_mva / base_mva
+        rows.append(
+            (
+                impedance.uid,
+                index(buses[0]),
+                index(buses[1]),
+                scale * _series_admittance(impedance, z_ft),
+                scale * _series_admittance(impedance, z_tf),
+                0,
+                1.0,
+            )
+        )
+
+    for trafo in core_model.type_list(TwoWindingTransformer):
+        buses = _terminal_buses(graph, trafo, "HV", "LV")
+        if buses is None:
+            continue
+        f, t = index(buses[0]), index(buses[1])
+        # refer the impedances to the nominal voltage of the LV bus and the base rating
+        scale = trafo.rating / base_mva * (v_nom[t] / trafo.voltage_lv) ** 2
+        ys = scale * _series_admittance(trafo, complex(trafo.r1pu, trafo.x1pu))
+        ym = scale * complex(trafo.gm_pu, trafo.bm_pu)
+        ratio = trafo.tap_ratio_fb() * (trafo.voltage_hv / v_nom[f]) / (trafo.voltage_lv / v_nom[t])
+        tap = ratio * np.exp(1j * np.deg2rad(trafo.phase_shift))
+        rows.append((trafo.uid, f, t, ys, ys, ym, tap))
+
+    for switch in core_model.type_list(Switch):
+        switch_buses = [n for n in graph.neighbors(switch) if isinstance(n, Bus)]
+        if not switch.closed or len(switch_buses) != 2:
+            continue
+        f, t = index(switch_buses[0]), index(switch_buses[1])
+        z_base = v_nom[f] ** 2 / base_mva
+        # closed switches are modelled as the lines they are replaced with by the exporters
+        r1, x1 = switch.get_default("tline_r1"), switch.get_default("tline_x1")
+        if r1 is None or x1 is None:
+            Logger.log_to_selected(f"No line parameters found for switch {switch.name}")
+            continue
+        ys = z_base * _series_admittance(switch, complex(r1, x1))
+        rows.append((switch.uid, f, t, ys, ys, 0, 1.0))
+
+    ysh = np.zeros(len(bus_numbering), dtype=complex)
+    for shunt in core_model.type_list(Shunt):
+        shunt_bus = get_connected_bus(core_model.graph, shunt, max_depth=1)
+        if shunt_bus is None:
+            Logger.log_to_selected(f"No connected bus found for shunt {shunt.name}")
+            continue
+        # the shunt powers are demands, i.e. y = (p - jq) / |V|^2
+        ysh[index(shunt_bus)] += complex(shunt.p, -shunt.q) / base_mva
+
+    if rows:
+        uids, f_col, t_col, ys_ft, ys_tf, yc, tap = (np.array(c) for c in zip(*rows))
+    else:
+        uids, f_col, t_col = (np.zeros(0, dtype=np.int64) for _ in range(3))
+        ys_ft, ys_tf, yc, tap = (np.zeros(0, dtype=complex) for _ in range(4))
+    from_bus = f_col.real.astype(np.int64)
+    to_bus = t_col.real.astype(np.int64)
+    yc = yc.astype(complex)
+    tap = tap.astype(complex)
+
+    ybus, yf, yt, cf, ct = assemble_admittance(
+        len(bus_numbering), from_bus, to_bus, ys_ft, ys_tf, yc, tap, ysh
+    )
+    return AdmittanceMatrices(
+        bus_numbering=bus_numbering,
+        branch_uids=uids.real.astype(np.int64),
+        ybus=ybus,
+        yf=yf,
+        yt=yt,
+        cf=cf,
+        ct=ct,
+        from_bus=from_bus,
+        to_bus=to_bus,
+        ys=ys_ft.astype(complex),
+        yc=yc,
+        tap=tap,
+        ysh=ysh,
+    )
+
+
+def assemble_admittance(
+    num_buses: int,
+    from_bus: npt.NDArray[np.int64],
+    to_bus: npt.NDArray[np.int64],
+    ys_ft: npt.NDArray[np.complex128],
+    ys_tf: npt.NDArray[np.complex128],
+    yc: npt.NDArray[np.complex128],
+    tap: npt.NDArray[np.complex128],
+    ysh: npt.NDArray[np.complex128],
+) -> tuple[sp.csr_matrix, sp.csr_matrix, sp.csr_matrix, sp.csr_matrix, sp.csr_matrix]:
+    """Assemble the admittance matrices from branch data, like MATPOWER's `makeYbus`.
+    All values are in p.u., the shunt admittance [yc] of a branch is split between both ends.
+
+    :param num_buses: Number of buses.
+    :type num_buses: int
+    :param from_bus: Index of the from bus of each branch.
+    :type from_bus: npt.NDArray[np.int64]
+    :param to_bus: Index of the to bus of each branch.
+    :type to_bus: npt.NDArray[np.int64]
+    :param ys_ft: Series admittance of each branch seen from the from end.
+    :type ys_ft: npt.NDArray[np.complex128]
+    :param ys_tf: Series admittance of each branch seen from the to end.
+    :type ys_tf: npt.NDArray[np.complex128]
+    :param yc: Total shunt admittance of each branch.
+    :type yc: npt.NDArray[np.complex128]
+    :param tap: Complex ratio of the ideal transformer at the from end of each branch.
+    :type tap: npt.NDArray[np.complex128]
+    :param ysh: Shunt admittance of each bus.
+    :type ysh: npt.NDArray[np.complex128]
+    :return: The matrices Ybus, Yf, Yt, Cf and Ct.
+    :rtype: tuple[sp.csr_matrix, sp.csr_matrix, sp.csr_matrix, sp.csr_matrix, sp.csr_matrix]
+    """
+    num_branches = len(from_bus)
+    ytt = ys_tf + yc / 2
+    yff = (ys_ft + yc / 2) / (tap * np.conj(tap))
+    yft = -ys_ft / np.conj(tap)
+    ytf = -ys_tf / tap
+
+    branches = np.arange(num_branches)
+    shape = (num_branches, num_buses)
+    rows = np.concatenate([branches, branches])
+    yf = sp.csr_matrix(
+        (np.concatenate([yff, yft]), (rows, np.concatenate([from_bus, to_bus]))), shape=shape
+    )
+    yt = sp.csr_matrix(
+        (np.concatenate([ytf, ytt]), (rows, np.concatenate([from_bus, to_bus]))), shape=shape
+    )
+    ones = np.ones(num_branches)
+    cf = sp.csr_matrix((ones, (branches, from_bus)), shape=shape)
+    ct = sp.csr_matrix((ones, (branches, to_bus)), shape=shape)
+
+    ybus = (cf.T @ yf + ct.T @ yt + sp.diags(ysh)).tocsr()
+    return ybus, yf, yt, cf, ct
+
+
+def _series_admittance(component: Component, impedance: complex) -> complex:
+    """Invert the series impedance of a branch component.
+
+    :raises ValueError: Raised if the impedance is zero.
+    """
+    if impedance == 0:
+        message = f"The series impedance of {component.name} ({component.uid}) is zero."
+        Logger.log_to_selected(message)
+        raise ValueError(message)
+    return 1 / impedance
+
+
+def _terminal_buses(
+    graph: nx.Graph, component: Component, connector_from: str, connector_to: str
+) -> tuple[Bus, Bus] | None:
+    """Get the buses directly connected to the two connectors of a branch component."""
+    buses: dict[str, Bus] = {}
+    for neighbor, data in graph.adj[component].items():
+        if not isinstance(neighbor, Bus):
+            continue
+        for connector in data.get(component.uid, []):
+            buses[connector] = neighbor
+    if connector_from not in buses or connector_to not in buses:
+        Logger.log_to_selected(f"No connected buses found for {component.name}")
+        return None
+    return buses[connector_from], buses[connector_to]
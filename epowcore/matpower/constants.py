@@ -0,0 +1,57 @@
+"""Column indices of the Matpower case matrices (0-based, see `idx_bus`, `idx_brch`, `idx_gen`)."""
+
+# bus matrix
+BUS_I = 0
+BUS_TYPE = 1
+PD = 2
+QD = 3
+GS = 4
+BS = 5
+BUS_AREA = 6
+VM = 7
+VA = 8
+BASE_KV = 9
+ZONE = 10
+VMAX = 11
+VMIN = 12
+BUS_COLUMNS = 13
+
+# branch matrix
+F_BUS = 0
+T_BUS = 1
+BR_R = 2
+BR_X = 3
+BR_B = 4
+RATE_A = 5
+RATE_B = 6
+RATE_C = 7
+TAP = 8
+SHIFT = 9
+BR_STATUS = 10
+ANGMIN = 11
+ANGMAX = 12
+BRANCH_COLUMNS = 13
+
+# gen matrix
+GEN_BUS = 0
+PG = 1
+QG = 2
+QMAX = 3
+QMIN = 4
+VG = 5
+MBASE = 6
+GEN_STATUS = 7
+PMAX = 8
+PMIN = 9
+PC1 = 10
+PC2 = 11
+QC1MIN = 12
+QC1MAX = 13
+QC2MIN = 14
+QC2MAX = 15
+RAMP_AGC = 16
+RAMP_10 = 17
+RAMP_30 = 18
+RAMP_Q = 19
+APF = 20
+GEN_COLUMNS = 21
@@ -1,5 +1,9 @@
 from copy import deepcopy
+
+import numpy as np
+
 from epowcore.gdf.bus import Bus
+from epowcore.gdf.change_journal import ChangeJournal
 from epowcore.gdf.core_model import CoreModel
 from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
 from epowcore.gdf.load import Load
@@ -7,8 +11,11 @@ from epowcore.gdf.shunt import Shunt
 from epowcore.gdf.tline import TLine
 from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
 from epowcore.gdf.utils import get_connected_bus, get_z_base
+from epowcore.generic.bus_numbering import BusNumbering, BusOrdering
 from epowcore.generic.logger import Logger
 from epowcore.generic.manipulation.flatten import flatten
+from epowcore.generic.manipulation.replay_changes import replay_changes
+from epowcore.loadflow.admittance import assemble_admittance
 from epowcore.matpower.matpower_model import (
     BranchDataEntry,
     BusDataEntry,
@@ -16,8 +23,22 @@ from epowcore.matpower.matpower_model import (
     MatpowerModel,
 )
 
+PATCHED_TYPES = (Bus, Load, Shunt, TLine, TwoWindingTransformer, SynchronousMachine)
+"""GDF types whose parameter changes are patched by `patch_matpower`."""
+
+
+def export_matpower(
+    core_model: CoreModel, bus_ordering: BusOrdering = BusOrdering.UID
+) -> MatpowerModel:
+    """Export the core model to a Matpower case.
 
-def export_matpower(core_model: CoreModel) -> MatpowerModel:
+    :param core_model: The core model to export.
+    :type core_model: CoreModel
+    :param bus_ordering: The ordering of the Matpower bus numbers, defaults to BusOrdering.UID
+    :type bus_ordering: BusOrdering, optional
+    :return: The Matpower case.
+    :rtype: MatpowerModel
+    """
 
     # Matpower does not support subsystems, thus it is easier to work with a flattened model.
     flat_ds = deepcopy(core_model)
@@ -27,13 +48,12 @@ def export_matpower(core_model: CoreModel) -> MatpowerModel:
 
     buses: dict[int, BusDataEntry] = {}
 
-    bus_list = flat_ds.type_list(Bus)
-    bus_list.sort(key=lambda x: x.uid)
-    mpc_bus_id = 1
+    # Matpower bus numbers are dense and start at 1
+    bus_numbering = BusNumbering.from_core_model(flat_ds, bus_ordering, start=1)
+    bus_dict = {b.uid: b for b in flat_ds.type_list(Bus)}
 
-    for b in bus_list:
-        buses[b.uid] = BusDataEntry.from_gdf_bus(b, mpc_bus_id)
-        mpc_bus_id += 1
+    for uid in bus_numbering.uids:
+        buses[uid] = BusDataEntry.from_gdf_bus(bus_dict[uid], bus_numbering.index(uid))
 
     for load in flat_ds.type_list(Load):
         bus: Bus | None = get_connected_bus(flat_ds.graph, load)
@@ -48,57 +68,30 @@ def export_matpower(core_model: CoreModel) -> MatpowerModel:
         if bus is None:
             Logger.log_to_selected(f"No connected bus found for shunt {shunt.name}")
             continue
+        # Matpower shunts are given as injection at V = 1 p.u., GDF shunts as demand
         buses[bus.uid].shunt_g += shunt.p
-        buses[bus.uid].shunt_b += shunt.q
+        buses[bus.uid].shunt_b -= shunt.q
 
     branches: list[BranchDataEntry] = []
+    component_rows: dict[int, int] = {}
 
     for line in flat_ds.type_list(TLine):
         bus_from = core_model.get_neighbors(line, connector="A")[0]
         bus_to = core_model.get_neighbors(line, connector="B")[0]
-
-        length = line.length if line.length is not None else 1.0
-        r1 = line.r1 * length
-        x1 = line.x1 * length
-        b1 = line.b1 * length * 1e-6
-
+        component_rows[line.uid] = len(branches)
         branches.append(
-            BranchDataEntry(
-                from_bus=buses[bus_from.uid].bus_number,
-                to_bus=buses[bus_to.uid].bus_number,
-                r=r1 / get_z_base(line, core_model),
-                x=x1 / get_z_base(line, core_model),
-                b=b1 * get_z_base(line, core_model),
-                rate_a=line.rating,
-                rate_b=line.rating_short_term_fb(),
-                rate_c=line.rating_emergency_fb(),
-                tap_ratio=0.0,
-                ph_shift=0.0,
-                angle_min=line.get_fb("angle_min"),
-                angle_max=line.get_fb("angle_max"),
-                status=1,
+            _line_entry(
+                line, core_model, buses[bus_from.uid].bus_number, buses[bus_to.uid].bus_number
             )
         )
 
     for trafo in flat_ds.type_list(TwoWindingTransformer):
         bus_from = core_model.get_neighbors(trafo, connector="HV")[0]
         bus_to = core_model.get_neighbors(trafo, connector="LV")[0]
-
+        component_rows[trafo.uid] = len(branches)
         branches.append(
-            BranchDataEntry(
-                from_bus=buses[bus_from.uid].bus_number,
-                to_bus=buses[bus_to.uid].bus_number,
-                r=trafo.r1pu / trafo.rating * base_mva,
-                x=trafo.x1pu / trafo.rating * base_mva,
-                b=trafo.bm_pu * trafo.rating / base_mva,
-                rate_a=trafo.rating,
-                rate_b=trafo.rating_short_term_fb(),
-                rate_c=trafo.rating_emergency_fb(),
-                tap_ratio=trafo.tap_ratio_fb(),
-                ph_shift=trafo.phase_shift,
-                angle_min=trafo.get_fb("angle_min"),
-                angle_max=trafo.get_fb("angle_max"),
-                status=1,
+            _transformer_entry(
+                trafo, base_mva, buses[bus_from.uid].bus_number, buses[bus_to.uid].bus_number
             )
         )
 
@@ -111,33 +104,188 @@ def export_matpower(core_model: CoreModel) -> MatpowerModel:
             continue
 
         buses[bus.uid].voltage_mag = gen.voltage_set_point
+        component_rows[gen.uid] = len(generators)
+        generators.append(_generator_entry(gen, buses[bus.uid].bus_number))
 
-        generators.append(
-            GeneratorDataEntry(
-                bus_number=buses[bus.uid].bus_number,
-                pg=gen.active_power,
-                qg=gen.reactive_power,
-                q_max=gen.q_max,
-                q_min=gen.q_min,
-                voltage_setpoint=gen.voltage_set_point,
-                base_mva=gen.rated_apparent_power,
-                status=1,
-                p_max=gen.p_max,
-                p_min=gen.p_min,
-                pc_1=gen.pc1,
-                pc_2=gen.pc2,
-                qc_min_1=gen.qc1_min,
-                qc_max_1=gen.qc1_max,
-                qc_min_2=gen.qc2_min,
-                qc_max_2=gen.qc2_max,
-                ramp_agc=1.0,
-                ramp_10=1.0,
-                ramp_30=1.0,
-                ramp_q=1.0,
-                apf=1.0,
+    model = MatpowerModel(
+        base_mva=base_mva,
+        bus=list(buses.values()),
+        gen=generators,
+        branch=branches,
+        bus_numbering=bus_numbering,
+        component_rows=component_rows,
+        source=flat_ds,
+    )
+    fill_internal(model)
+    return model
+
+
+def patch_matpower(core_model: CoreModel, model: MatpowerModel, journal: ChangeJournal) -> bool:
+    """Apply the changes recorded in [journal] to a previous export of [core_model].
+    Only parameter changes of buses, loads, shunts, lines, two-winding transformers and
+    synchronous machines are patched, the topology of the case is kept.
+
+    :param core_model: The changed core model.
+    :type core_model: CoreModel
+    :param model: The previous export of [core_model], patched in place.
+    :type model: MatpowerModel
+    :param journal: The changes since the previous export.
+    :type journal: ChangeJournal
+    :return: False, without modifying [model], if the changes cannot be patched, e.g. structural
+             changes or changes of components that are replaced by the transformation.
+    :rtype: bool
+    """
+    numbering = model.bus_numbering
+    source = model.source
+    if journal.num_structural > 0 or numbering is None or source is None:
+        return False
+    for before, after in journal.modified.values():
+        if not isinstance(after, PATCHED_TYPES):
+            return False
+        # the bus type is kept by the transformation, the voltage changes the per unit values
+        if isinstance(after, Bus) and (
+            after.lf_bus_type is None
+            or not isinstance(before, Bus)
+            or after.nominal_voltage != before.nominal_voltage
+        ):
+            return False
+    if not replay_changes(core_model, source, journal):
+        return False
+
+    generator_buses: set[int] = set()
+    for before, after in journal.modified.values():
+        if isinstance(after, Bus):
+            entry = model.bus[numbering.index(after.uid) - numbering.start]
+            entry.bus_type = after.lf_bus_type
+        elif isinstance(after, (Load, Shunt)):
+            bus = get_connected_bus(source.graph, after)
+            if bus is None:
+                continue
+            entry = model.bus[numbering.index(bus.uid) - numbering.start]
+            # loads and shunts are summed up per bus
+            if isinstance(after, Load):
+                assert isinstance(before, Load)
+                entry.demand_p += after.active_power - before.active_power
+                entry.demand_q += after.reactive_power - before.reactive_power
+            else:
+                assert isinstance(before, Shunt)
+                entry.shunt_g += after.p - before.p
+                entry.shunt_b -= after.q - before.q
+        elif after.uid not in model.component_rows:
+            # generators without a bus are not exported
+            continue
+        elif isinstance(after, TLine):
+            row = model.component_rows[after.uid]
+            branch = model.branch[row]
+            model.branch[row] = _line_entry(after, source, branch.from_bus, branch.to_bus)
+        elif isinstance(after, TwoWindingTransformer):
+            row = model.component_rows[after.uid]
+            branch = model.branch[row]
+            model.branch[row] = _transformer_entry(
+                after, model.base_mva, branch.from_bus, branch.to_bus
             )
-        )
+        elif isinstance(after, SynchronousMachine):
+            row = model.component_rows[after.uid]
+            model.gen[row] = _generator_entry(after, model.gen[row].bus_number)
+            generator_buses.add(model.gen[row].bus_number)
 
-    return MatpowerModel(
-        base_mva=base_mva, bus=list(buses.values()), gen=generators, branch=branches
+    # the voltage of a bus is set by its last generator
+    for gen in model.gen:
+        if gen.bus_number in generator_buses:
+            model.bus[gen.bus_number - numbering.start].voltage_mag = gen.voltage_setpoint
+    fill_internal(model)
+    return True
+
+
+def _line_entry(line: TLine, core_model: CoreModel, from_bus: int, to_bus: int) -> BranchDataEntry:
+    length = line.length if line.length is not None else 1.0
+    r1 = line.r1 * length
+    x1 = line.x1 * length
+    b1 = line.b1 * length * 1e-6
+    z_base = get_z_base(line, core_model)
+
+    return BranchDataEntry(
+        from_bus=from_bus,
+        to_bus=to_bus,
+        r=r1 / z_base,
+        x=x1 / z_base,
+        b=b1 * z_base,
+        rate_a=line.rating,
+        rate_b=line.rating_short_term_fb(),
+        rate_c=line.rating_emergency_fb(),
+        tap_ratio=0.0,
+        ph_shift=0.0,
+        angle_min=line.get_fb("angle_min"),
+        angle_max=line.get_fb("angle_max"),
+        status=1,
     )
+
+
+def _transformer_entry(
+    trafo: TwoWindingTransformer, base_mva: float, from_bus: int, to_bus: int
+) -> BranchDataEntry:
+    return BranchDataEntry(
+        from_bus=from_bus,
+        to_bus=to_bus,
+        r=trafo.r1pu / trafo.rating * base_mva,
+        x=trafo.x1pu / trafo.rating * base_mva,
+        b=trafo.bm_pu * trafo.rating / base_mva,
+        rate_a=trafo.rating,
+        rate_b=trafo.rating_short_term_fb(),
+        rate_c=trafo.rating_emergency_fb(),
+        tap_ratio=trafo.tap_ratio_fb(),
+        ph_shift=trafo.phase_shift,
+        angle_min=trafo.get_fb("angle_min"),
+        angle_max=trafo.get_fb("angle_max"),
+        status=1,
+    )
+
+
+def _generator_entry(gen: SynchronousMachine, bus_number: int) -> GeneratorDataEntry:
+    return GeneratorDataEntry(
+        bus_number=bus_number,
+        pg=gen.active_power,
+        qg=gen.reactive_power,
+        q_max=gen.q_max,
+        q_min=gen.q_min,
+        voltage_setpoint=gen.voltage_set_point,
+        base_mva=gen.rated_apparent_power,
+        status=1,
+        p_max=gen.p_max,
+        p_min=gen.p_min,
+        pc_1=gen.pc1,
+        pc_2=gen.pc2,
+        qc_min_1=gen.qc1_min,
+        qc_max_1=gen.qc1_max,
+        qc_min_2=gen.qc2_min,
+        qc_max_2=gen.qc2_max,
+        ramp_agc=1.0,
+        ramp_10=1.0,
+        ramp_30=1.0,
+        ramp_q=1.0,
+        apf=1.0,
+    )
+
+
+def fill_internal(model: MatpowerModel) -> None:
+    """Fill the admittance matrices of the internal data like MATPOWER's `makeYbus`."""
+    num_buses = len(model.bus)
+    # bus numbers are dense and the buses are sorted by bus number
+    from_bus = np.array([b.from_bus for b in model.branch], dtype=np.int64) - 1
+    to_bus = np.array([b.to_bus for b in model.branch], dtype=np.int64) - 1
+    ys = np.reciprocal(np.array([complex(b.r, b.x) for b in model.branch], dtype=complex))
+    yc = 1j * np.array([b.b for b in model.branch], dtype=float)
+    ratio = np.array([b.tap_ratio for b in model.branch], dtype=float)
+    ratio[ratio == 0] = 1.0
+    shift = np.array([b.ph_shift for b in model.branch], dtype=float)
+    tap = ratio * np.exp(1j * np.deg2rad(shift))
+    ysh = np.array(
+        [complex(b.shunt_g, b.shunt_b) / model.base_mva for b in model.bus], dtype=complex
+    )
+
+    ybus, yf, yt, _, _ = assemble_admittance(num_buses, from_bus, to_bus, ys, ys, yc, tap, ysh)
+    model.internal["Ybus"] = ybus
+    model.internal["Yf"] = yf
+    model.internal["Yt"] = yt
+    model.internal["branch_is"] = np.ones(len(model.branch), dtype=bool)
+    model.internal["gen_is"] = np.ones(len(model.gen), dtype=bool)
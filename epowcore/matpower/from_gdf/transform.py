@@ -20,6 +20,7 @@ from epowcore.gdf.ward import Ward
 from epowcore.generic.component_graph import ComponentGraph
 from epowcore.generic.constants import Platform
 from epowcore.generic.logger import Logger
+from epowcore.generic.manipulation.batch_rewrite import BatchRewrite
 from epowcore.generic.manipulation.merge_components import merge_components
 
 WHITE_LIST = (
@@ -56,29 +57,29 @@ def transform(core_model: CoreModel) -> CoreModel:
             Logger.log_to_selected(f"Removing outlier node: {n.name}")
             core_model_tr.graph.remove_node(n)
 
+    # Each pass collects its replacements and applies them in one sweep
     # Replace extended Ward equivalents with loads, shunts, impedances and voltage sources
-    ext_wards = [n for n in core_model_tr.graph.nodes if isinstance(n, ExtendedWard)]
-    for ext_ward in ext_wards:
-        ext_ward.replace_with_load_shunt_vsource(core_model_tr)
+    with BatchRewrite(core_model_tr) as rewrite:
+        for ext_ward in core_model_tr.type_list(ExtendedWard):
+            ext_ward.replace_with_load_shunt_vsource(core_model_tr, rewrite=rewrite)
 
     # Replace Ward equivalents with loads and shunts
     # Order is important because ExtendedWard is also a Ward!
-    wards = [n for n in core_model_tr.graph.nodes if isinstance(n, Ward)]
-    for ward in wards:
-        ward.replace_with_load_and_shunt(core_model_tr)
+    with BatchRewrite(core_model_tr) as rewrite:
+        for ward in core_model_tr.type_list(Ward):
+            ward.replace_with_load_and_shunt(core_model_tr, rewrite)
 
     # Replace impedances with lines
-    impedances = [n for n in core_model_tr.graph.nodes if isinstance(n, Impedance)]
-    for impedance in impedances:
-        impedance.replace_with_line(core_model_tr, Platform.MATPOWER)
-
-    three_winding_transformers = core_model_tr.type_list(ThreeWindingTransformer)
-
-    for three_winding_transformer in three_winding_transformers:
-        Logger.log_to_selected(
-            f"Replacing three-winding transformer: {three_winding_transformer.name}"
-        )
-        three_winding_transformer.replace_with_two_winding_transformers(core_model_tr)
+    with BatchRewrite(core_model_tr) as rewrite:
+        for impedance in core_model_tr.type_list(Impedance):
+            impedance.replace_with_line(core_model_tr, Platform.MATPOWER, rewrite)
+
+    with BatchRewrite(core_model_tr) as rewrite:
+        for three_winding_transformer in core_model_tr.type_list(ThreeWindingTransformer):
+            Logger.log_to_selected(
+                f"Replacing three-winding transformer: {three_winding_transformer.name}"
+            )
+            three_winding_transformer.replace_with_two_winding_transformers(core_model_tr, rewrite)
 
     # Merge neighbouring buses
     for bus in core_model_tr.type_list(Bus):
@@ -1,31 +1,90 @@
-from scipy.io import savemat
+import io
+from pathlib import Path
 
+import numpy as np
+from scipy.io import loadmat, savemat
+
+from epowcore.generic.bus_numbering import BusNumbering, BusOrdering
 from epowcore.generic.configuration import Configuration
 from epowcore.generic.constants import Platform
-from epowcore.matpower.from_gdf.matpower_export import export_matpower
+from epowcore.matpower.from_gdf.matpower_export import (
+    export_matpower,
+    fill_internal,
+    patch_matpower,
+)
 from epowcore.matpower.from_gdf.transform import transform
 from epowcore.matpower.matpower_model import MatpowerModel
+from epowcore.matpower.to_gdf.case_reader import read_case_file, read_mat_file
+from epowcore.matpower.to_gdf.matpower_import import import_matpower
 
+from epowcore.gdf.change_journal import ChangeJournal
 from epowcore.gdf.core_model import CoreModel
 from epowcore.generic.converter_base import ConverterBase
 
 
 class MatpowerConverter(ConverterBase[MatpowerModel]):
+    def __init__(self, debug: bool = False, bus_ordering: BusOrdering = BusOrdering.UID) -> None:
+        super().__init__(debug=debug)
+        self.bus_ordering = bus_ordering
+
     def from_gdf(self, core_model: CoreModel, name: str, log_path: str | None = None) -> MatpowerModel:
-        Configuration().default_platform = Platform.MATPOWER
-        return super().from_gdf(core_model, name, log_path)
+        with Configuration().scoped(Platform.MATPOWER):
+            return super().from_gdf(core_model, name, log_path)
+
+    def reexport(
+        self, core_model: CoreModel, model: MatpowerModel, name: str, log_path: str | None = None
+    ) -> MatpowerModel:
+        with Configuration().scoped(Platform.MATPOWER):
+            return super().reexport(core_model, model, name, log_path)
 
     def write_to_matfile(self, model: MatpowerModel, file_path: str) -> None:
         savemat(file_path, model.as_dict())
 
+    def read_from_file(self, file_path: str | Path) -> MatpowerModel:
+        """Read a Matpower case from a .mat or .m case file."""
+        return read_case_file(file_path)
+
+    def file_to_gdf(self, file_path: str | Path, log_path: str | None = None) -> CoreModel:
+        """Read a Matpower case file and convert it to a GDF core model."""
+        return self.to_gdf(self.read_from_file(file_path), log_path)
+
     def to_gdf(self, model: MatpowerModel, log_path: str | None = None) -> CoreModel:
-        raise NotImplementedError()
+        with Configuration().scoped(Platform.MATPOWER):
+            return super().to_gdf(model, log_path)
+
+    def serialize(self, model: MatpowerModel) -> bytes:
+        """Serialize the case as .mat file with the bus numbering. The source model is lost."""
+        variables = model.as_dict()
+        if model.bus_numbering is not None:
+            variables["bus_uids"] = np.array(model.bus_numbering.uids, dtype=np.int64)
+            variables["bus_start"] = model.bus_numbering.start
+        buffer = io.BytesIO()
+        savemat(buffer, variables)
+        return buffer.getvalue()
+
+    def deserialize(self, data: bytes) -> MatpowerModel:
+        model = MatpowerModel.from_dict({"mpc": read_mat_file(io.BytesIO(data))})
+        variables = loadmat(io.BytesIO(data), variable_names=["bus_uids", "bus_start"])
+        if "bus_uids" in variables:
+            model.bus_numbering = BusNumbering(
+                variables["bus_uids"].ravel().tolist(), int(variables["bus_start"].item())
+            )
+        fill_internal(model)
+        return model
 
     def _pre_export(self, core_model: CoreModel, name: str) -> CoreModel:
         return transform(core_model)
 
     def _export(self, core_model: CoreModel, name: str) -> MatpowerModel:
-        return export_matpower(core_model)
+        return export_matpower(core_model, self.bus_ordering)
+
+    def _patch_export(
+        self, core_model: CoreModel, model: MatpowerModel, journal: ChangeJournal
+    ) -> bool:
+        return patch_matpower(core_model, model, journal)
 
     def _post_export(self, model: MatpowerModel, name: str) -> MatpowerModel:
         return model
+
+    def _import(self, model: MatpowerModel) -> CoreModel:
+        return import_matpower(model)
@@ -1,8 +1,11 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 import numpy as np
 import numpy.typing as npt
+import scipy.sparse as sp
 
 from epowcore.gdf.bus import Bus, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.generic.bus_numbering import BusNumbering
 
 
 BUS_TYPE_MAPPING: dict[LFBusType, int] = {
@@ -12,6 +15,8 @@ BUS_TYPE_MAPPING: dict[LFBusType, int] = {
     LFBusType.ISO: 4,
 }
 
+MATPOWER_BUS_TYPE_MAPPING: dict[int, LFBusType] = {v: k for k, v in BUS_TYPE_MAPPING.items()}
+
 
 @dataclass(kw_only=True)
 class BusDataEntry:
@@ -53,6 +58,15 @@ class BusDataEntry:
             voltage_angle=0.0,
         )
 
+    @classmethod
+    def from_nparray(cls, row: npt.NDArray) -> "BusDataEntry":
+        values = row.tolist()
+        values[1] = MATPOWER_BUS_TYPE_MAPPING[int(values[1])]
+        values[0] = int(values[0])
+        values[6] = int(values[6])
+        values[10] = int(values[10])
+        return cls(**dict(zip(_field_names(cls), values)))
+
     def to_nparray(self) -> npt.ArrayLike:
         return np.array(
             [
@@ -119,6 +133,14 @@ class GeneratorDataEntry:
     apf: float
     """Area participation factor"""
 
+    @classmethod
+    def from_nparray(cls, row: npt.NDArray) -> "GeneratorDataEntry":
+        names = _field_names(cls)
+        # Matpower version 1 cases only contain the first 10 columns
+        values = row.tolist() + [0.0] * (len(names) - len(row))
+        values[0] = int(values[0])
+        return cls(**dict(zip(names, values)))
+
     def to_nparray(self) -> npt.ArrayLike:
         return np.array(
             [
@@ -177,6 +199,14 @@ class BranchDataEntry:
     angle_max: float
     """Maximum angle difference between buses [degrees]"""
 
+    @classmethod
+    def from_nparray(cls, row: npt.NDArray) -> "BranchDataEntry":
+        values = row.tolist()
+        values[0] = int(values[0])
+        values[1] = int(values[1])
+        values[10] = int(values[10])
+        return cls(**dict(zip(_field_names(cls), values)))
+
     def to_nparray(self) -> npt.ArrayLike:
         return np.array(
             [
@@ -206,7 +236,7 @@ class MatpowerModel:
     branch: list[BranchDataEntry]  #  = np.array([], dtype=np.complex128),
     gen: list[GeneratorDataEntry]
     gencost: npt.ArrayLike | None = None
-    internal: dict[str, npt.ArrayLike] = field(
+    internal: dict[str, npt.ArrayLike | sp.csr_matrix] = field(
         default_factory=lambda: {
             "Ybus": np.array([], dtype=np.complex128),
             "Yf": np.array([], dtype=np.complex128),
@@ -215,6 +245,34 @@ class MatpowerModel:
             "gen_is": np.array([], dtype=bool),
         }
     )
+    bus_numbering: BusNumbering | None = None
+    """Mapping between GDF bus uids and Matpower bus numbers, set by the export."""
+    component_rows: dict[int, int] = field(default_factory=dict)
+    """Rows of the exported GDF branches in `branch` and generators in `gen` by uid,
+    set by the export."""
+    source: CoreModel | None = None
+    """The flattened core model the case was exported from, kept to patch the export."""
+    journal_sequence: int | None = None
+    """Sequence number of the journal of the core model at the export, set by the converter."""
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "MatpowerModel":
+        """Create a MatpowerModel from a dictionary in the format of `as_dict`,
+        e.g. read from a .mat file.
+
+        :param data: Dictionary with an "mpc" entry containing baseMVA, bus, branch and gen.
+        :type data: dict
+        :return: The MatpowerModel containing the case data.
+        :rtype: MatpowerModel
+        """
+        mpc = data["mpc"]
+        return cls(
+            base_mva=float(mpc["baseMVA"]),
+            version=int(mpc.get("version", 2)),
+            bus=[BusDataEntry.from_nparray(row) for row in _as_matrix(mpc["bus"])],
+            branch=[BranchDataEntry.from_nparray(row) for row in _as_matrix(mpc["branch"])],
+            gen=[GeneratorDataEntry.from_nparray(row) for row in _as_matrix(mpc["gen"])],
+        )
 
     def as_dict(self) -> dict:
         return {
@@ -234,3 +292,15 @@ class MatpowerModel:
                 # },
             },
         }
+
+
+def _field_names(cls: type) -> list[str]:
+    return [f.name for f in fields(cls)]
+
+
+def _as_matrix(data: npt.ArrayLike) -> npt.NDArray:
+    """Return the data as two-dimensional float array. Single rows are read as 1D arrays."""
+    matrix = np.asarray(data, dtype=float)
+    if matrix.size == 0:
+        return matrix.reshape(0, 0)
+    return np.atleast_2d(matrix)
@@ -0,0 +1,90 @@
+import io
+import re
+from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
+from scipy.io import loadmat
+
+from epowcore.matpower.matpower_model import MatpowerModel
+
+_REGEX_COMMENT = re.compile(r"%[^\n]*")
+_REGEX_MATRIX = re.compile(r"mpc\.(bus|branch|gen)\s*=\s*\[(.*?)\]\s*;", re.DOTALL)
+_REGEX_BASE_MVA = re.compile(r"mpc\.baseMVA\s*=\s*([^;]+);")
+_REGEX_VERSION = re.compile(r"mpc\.version\s*=\s*'(\d+)'\s*;")
+
+
+def read_case_file(file_path: str | Path) -> MatpowerModel:
+    """Read a Matpower case from a .mat or a .m case file.
+
+    :param file_path: Path to the case file.
+    :type file_path: str | Path
+    :raises ValueError: Raised if the file type is not supported.
+    :return: The MatpowerModel containing the case data.
+    :rtype: MatpowerModel
+    """
+    path = Path(file_path)
+    match path.suffix.lower():
+        case ".mat":
+            mpc = read_mat_file(path)
+        case ".m":
+            mpc = read_m_file(path)
+        case _:
+            raise ValueError(f"Unsupported Matpower case file type: {path.suffix}")
+    return MatpowerModel.from_dict({"mpc": mpc})
+
+
+def read_mat_file(file_path: str | Path | BinaryIO) -> dict:
+    """Read the case struct of a .mat file, e.g. written by `MatpowerConverter.write_to_matfile`
+    or by MATPOWER's `savecase`.
+
+    :param file_path: Path to the .mat file or a binary file object with its content.
+    :type file_path: str | Path | BinaryIO
+    :return: Dictionary with the baseMVA, version, bus, branch and gen entries.
+    :rtype: dict
+    """
+    source_file = file_path if hasattr(file_path, "read") else str(file_path)
+    data = loadmat(source_file, squeeze_me=True, struct_as_record=False)
+    # version 2 cases are stored as struct, version 1 cases as top level variables
+    source = data["mpc"] if "mpc" in data else None
+    mpc = {}
+    for key in ("baseMVA", "version", "bus", "branch", "gen"):
+        value = getattr(source, key, None) if source is not None else data.get(key, None)
+        if value is not None:
+            mpc[key] = value
+    if "version" in mpc:
+        mpc["version"] = int(str(mpc["version"]))
+    return mpc
+
+
+def read_m_file(file_path: str | Path) -> dict:
+    """Parse the case matrices of a MATPOWER .m case file, e.g. `case2869pegase.m`.
+    Only the baseMVA, version, bus, branch and gen entries are read.
+
+    :param file_path: Path to the .m case file.
+    :type file_path: str | Path
+    :raises ValueError: Raised if required entries are missing.
+    :return: Dictionary with the baseMVA, version, bus, branch and gen entries.
+    :rtype: dict
+    """
+    with open(file_path, "r", encoding="utf8") as file:
+        content = _REGEX_COMMENT.sub("", file.read())
+
+    base_mva = _REGEX_BASE_MVA.search(content)
+    if base_mva is None:
+        raise ValueError(f"No baseMVA found in case file {file_path}")
+    mpc: dict = {"baseMVA": float(base_mva.group(1))}
+
+    version = _REGEX_VERSION.search(content)
+    if version is not None:
+        mpc["version"] = int(version.group(1))
+
+    for match in _REGEX_MATRIX.finditer(content):
+        # rows are separated by semicolons and/or line breaks
+        rows = match.group(2).replace(";", "\n")
+        mpc[match.group(1)] = np.loadtxt(io.StringIO(rows), dtype=float, ndmin=2)
+
+    missing = [key for key in ("bus", "branch", "gen") if key not in mpc]
+    if missing:
+        raise ValueError(f"Missing matrices in case file {file_path}: {missing}")
+    return mpc
@@ -0,0 +1,342 @@
+from collections import Counter
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.load import Load
+from epowcore.gdf.shunt import Shunt
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.generic.configuration import Configuration
+from epowcore.generic.constants import Platform
+from epowcore.generic.logger import Logger
+from epowcore.generic.tools.table_import import Connection, machine_defaults
+from epowcore.matpower.constants import (
+    ANGMAX,
+    ANGMIN,
+    BASE_KV,
+    BR_B,
+    BR_R,
+    BR_STATUS,
+    BR_X,
+    BRANCH_COLUMNS,
+    BS,
+    BUS_COLUMNS,
+    BUS_I,
+    BUS_TYPE,
+    F_BUS,
+    GEN_BUS,
+    GEN_COLUMNS,
+    GEN_STATUS,
+    GS,
+    MBASE,
+    PC1,
+    PC2,
+    PD,
+    PG,
+    PMAX,
+    PMIN,
+    QC1MAX,
+    QC1MIN,
+    QC2MAX,
+    QC2MIN,
+    QD,
+    QG,
+    QMAX,
+    QMIN,
+    RATE_A,
+    RATE_B,
+    RATE_C,
+    SHIFT,
+    T_BUS,
+    TAP,
+    VG,
+)
+from epowcore.matpower.matpower_model import MATPOWER_BUS_TYPE_MAPPING, MatpowerModel
+
+
+def import_matpower(model: MatpowerModel) -> CoreModel:
+    """Import a Matpower case and convert it to a GDF CoreModel.
+
+    The case matrices are processed column-wise: bus numbers are mapped to component uids
+    with a sorted lookup, per-unit values are converted for all branches at once,
+    uids are allocated in blocks and all connections are inserted into the graph in one call.
+
+    Buses get their uids in ascending order of the Matpower bus numbers,
+    so exporting the imported model with `export_matpower` preserves the bus order.
+
+    :param model: The Matpower case to import.
+    :type model: MatpowerModel
+    :return: The imported CoreModel.
+    :rtype: CoreModel
+    """
+    mpc = model.as_dict()["mpc"]
+    base_frequency = Configuration().get_default(
+        "MatpowerModel", "base_frequency", Platform.MATPOWER
+    )
+    if base_frequency is None:
+        raise ValueError("No default value found for MatpowerModel.base_frequency")
+    core_model = CoreModel(base_frequency=base_frequency, base_mva=model.base_mva)
+
+    bus = _as_matrix(mpc["bus"], BUS_COLUMNS)
+    branch = _as_matrix(mpc["branch"], BRANCH_COLUMNS)
+    gen = _as_matrix(mpc["gen"], GEN_COLUMNS)
+
+    # bus numbers are not necessarily contiguous -> map them to rows of the bus matrix
+    order = np.argsort(bus[:, BUS_I], kind="stable")
+    sorted_numbers = bus[order, BUS_I]
+
+    def bus_index(numbers: npt.NDArray) -> npt.NDArray:
+        if len(numbers) == 0:
+            return np.zeros(0, dtype=int)
+        pos = np.clip(np.searchsorted(sorted_numbers, numbers), 0, len(order) - 1)
+        unknown = sorted_numbers[pos] != numbers
+        if np.any(unknown):
+            raise ValueError(
+                f"Matpower case references unknown buses: {np.unique(numbers[unknown]).tolist()}"
+            )
+        return order[pos]
+
+    buses = _create_buses(core_model, bus, order)
+    connections = _create_loads_and_shunts(core_model, bus, buses)
+    connections += _create_branches(core_model, branch, bus, buses, bus_index)
+    connections += _create_generators(core_model, gen, bus, buses, bus_index)
+
+    core_model.graph.add_edges_from(connections)
+    return core_model
+
+
+def _create_buses(core_model: CoreModel, bus: npt.NDArray, order: npt.NDArray) -> list[Bus]:
+    """Create the buses, indexed like the rows of the bus matrix. uids follow [order]."""
+    rows = bus.tolist()
+    created: dict[int, Bus] = {}
+    for uid, i in zip(core_model.get_valid_ids(len(rows)), order.tolist()):
+        row = rows[i]
+        created[i] = Bus(
+            uid,
+            f"Bus {int(row[BUS_I])}",
+            lf_bus_type=MATPOWER_BUS_TYPE_MAPPING[int(row[BUS_TYPE])],
+            nominal_voltage=row[BASE_KV],
+        )
+    core_model.add_components(created.values())
+    return [created[i] for i in range(len(rows))]
+
+
+def _create_loads_and_shunts(
+    core_model: CoreModel, bus: npt.NDArray, buses: list[Bus]
+) -> list[Connection]:
+    """Create one Load per bus with demand and one Shunt per bus with shunt admittance."""
+    numbers = bus[:, BUS_I].astype(int).tolist()
+    rows = bus.tolist()
+
+    load_rows = np.flatnonzero((bus[:, PD] != 0) | (bus[:, QD] != 0)).tolist()
+    loads = [
+        Load(uid, f"Load {numbers[i]}", active_power=rows[i][PD], reactive_power=rows[i][QD])
+        for uid, i in zip(core_model.get_valid_ids(len(load_rows)), load_rows)
+    ]
+    core_model.add_components(loads)
+
+    shunt_rows = np.flatnonzero((bus[:, GS] != 0) | (bus[:, BS] != 0)).tolist()
+    shunts = [
+        Shunt(uid, f"Shunt {numbers[i]}", p=rows[i][GS], q=-rows[i][BS])
+        for uid, i in zip(core_model.get_valid_ids(len(shunt_rows)), shunt_rows)
+    ]
+    core_model.add_components(shunts)
+
+    connections: list[Connection] = [(buses[i], load, {}) for i, load in zip(load_rows, loads)]
+    connections += [(buses[i], shunt, {}) for i, shunt in zip(shunt_rows, shunts)]
+    return connections
+
+
+def _create_branches(
+    core_model: CoreModel,
+    branch: npt.NDArray,
+    bus: npt.NDArray,
+    buses: list[Bus],
+    bus_index: Callable[[npt.NDArray], npt.NDArray],
+) -> list[Connection]:
+    """Create TLines and TwoWindingTransformers from the in-service branches.
+    Branches with a tap ratio, a phase shift or different voltage levels are transformers.
+    """
+    base_mva = core_model.base_mva_fb()
+
+    in_service = branch[:, BR_STATUS] > 0
+    if not np.all(in_service):
+        Logger.log_to_selected(f"Skipping {np.count_nonzero(~in_service)} out of service branches")
+        branch = branch[in_service]
+
+    f_idx = bus_index(branch[:, F_BUS])
+    t_idx = bus_index(branch[:, T_BUS])
+    kv_f = bus[f_idx, BASE_KV]
+    kv_t = bus[t_idx, BASE_KV]
+    is_trafo = (branch[:, TAP] != 0) | (branch[:, SHIFT] != 0) | (kv_f != kv_t)
+    names = _branch_names(bus[:, BUS_I].astype(int), f_idx, t_idx, is_trafo)
+    connections: list[Connection] = []
+
+    # Lines: absolute values (length = None) based on the voltage at the 'from' bus
+    rows = np.flatnonzero(~is_trafo)
+    z_base = kv_f[rows] ** 2 / base_mva
+    values = np.column_stack(
+        [
+            branch[rows, BR_R] * z_base,
+            branch[rows, BR_X] * z_base,
+            branch[rows, BR_B] / z_base * 1e6,
+            branch[rows][:, [RATE_A, RATE_B, RATE_C, ANGMIN, ANGMAX]],
+        ]
+    ).tolist()
+    lines = [
+        TLine(
+            uid,
+            names[i],
+            length=None,
+            r1=r1,
+            x1=x1,
+            b1=b1,
+            rating=rate_a,
+            rating_short_term=rate_b,
+            rating_emergency=rate_c,
+            angle_min=angle_min,
+            angle_max=angle_max,
+        )
+        for uid, i, (r1, x1, b1, rate_a, rate_b, rate_c, angle_min, angle_max) in zip(
+            core_model.get_valid_ids(len(rows)), rows.tolist(), values
+        )
+    ]
+    core_model.add_components(lines)
+    for i, line in zip(rows.tolist(), lines):
+        connections.append((buses[f_idx[i]], line, {line.uid: ["A"]}))
+        connections.append((buses[t_idx[i]], line, {line.uid: ["B"]}))
+
+    # Transformers: p.u. values based on the rating; the 'from' bus is the tap side
+    rows = np.flatnonzero(is_trafo)
+    rating = branch[rows, RATE_A]
+    rating = np.where(rating > 0, rating, base_mva)
+    shift_30 = np.rint(branch[rows, SHIFT] / 30)
+    rounded = np.count_nonzero(shift_30 * 30 != branch[rows, SHIFT])
+    if rounded > 0:
+        Logger.log_to_selected(
+            f"Rounding the phase shift of {rounded} transformers to multiples of 30 degrees"
+        )
+    values = np.column_stack(
+        [
+            rating,
+            kv_f[rows],
+            kv_t[rows],
+            branch[rows, BR_R] * rating / base_mva,
+            branch[rows, BR_X] * rating / base_mva,
+            # GDF only describes the magnetizing susceptance by the no load current (bm_pu <= 0)
+            np.abs(branch[rows, BR_B]) * base_mva / rating * 100,
+            shift_30,
+            np.where(branch[rows, TAP] != 0, branch[rows, TAP], 1.0),
+            branch[rows][:, [RATE_B, RATE_C, ANGMIN, ANGMAX]],
+        ]
+    ).tolist()
+    trafos = [
+        TwoWindingTransformer(
+            uid,
+            names[i],
+            rating=v[0],
+            voltage_hv=v[1],
+            voltage_lv=v[2],
+            r1pu=v[3],
+            x1pu=v[4],
+            pfe_kw=0.0,
+            no_load_current=v[5],
+            phase_shift_30=int(v[6]),
+            tap_ratio=v[7],
+            rating_short_term=v[8],
+            rating_emergency=v[9],
+            angle_min=v[10],
+            angle_max=v[11],
+        )
+        for uid, i, v in zip(core_model.get_valid_ids(len(rows)), rows.tolist(), values)
+    ]
+    core_model.add_components(trafos)
+    for i, trafo in zip(rows.tolist(), trafos):
+        connections.append((buses[f_idx[i]], trafo, {trafo.uid: ["HV"]}))
+        connections.append((buses[t_idx[i]], trafo, {trafo.uid: ["LV"]}))
+
+    return connections
+
+
+def _branch_names(
+    numbers: npt.NDArray, f_idx: npt.NDArray, t_idx: npt.NDArray, is_trafo: npt.NDArray
+) -> list[str]:
+    """Create names like 'Line 1 - 2' or 'Trf 1 - 2'. Parallel branches get a numbered suffix."""
+    names = [
+        f"{'Trf' if trafo else 'Line'} {f} - {t}"
+        for f, t, trafo in zip(numbers[f_idx].tolist(), numbers[t_idx].tolist(), is_trafo.tolist())
+    ]
+    counts = Counter(names)
+    seen: Counter = Counter()
+    for i, name in enumerate(names):
+        if counts[name] > 1:
+            seen[name] += 1
+            names[i] = f"{name} ({seen[name]})"
+    return names
+
+
+def _create_generators(
+    core_model: CoreModel,
+    gen: npt.NDArray,
+    bus: npt.NDArray,
+    buses: list[Bus],
+    bus_index: Callable[[npt.NDArray], npt.NDArray],
+) -> list[Connection]:
+    """Create SynchronousMachines from the in-service generators.
+    Dynamic parameters are not part of Matpower cases and are taken from the configuration.
+    """
+    in_service = gen[:, GEN_STATUS] > 0
+    if not np.all(in_service):
+        Logger.log_to_selected(
+            f"Skipping {np.count_nonzero(~in_service)} out of service generators"
+        )
+        gen = gen[in_service]
+
+    defaults = machine_defaults(Platform.MATPOWER)
+    if len(gen) > 0:
+        Logger.log_to_selected(f"Using defaults for imported synchronous machines: {defaults}")
+
+    g_idx = bus_index(gen[:, GEN_BUS])
+    rated_voltage = bus[g_idx, BASE_KV].tolist()
+    machines = [
+        SynchronousMachine(
+            uid,
+            f"Gen {n + 1}",
+            rated_apparent_power=row[MBASE],
+            rated_active_power=row[PMAX],
+            rated_voltage=rated_voltage[n],
+            active_power=row[PG],
+            reactive_power=row[QG],
+            voltage_set_point=row[VG],
+            p_min=row[PMIN],
+            p_max=row[PMAX],
+            q_min=row[QMIN],
+            q_max=row[QMAX],
+            pc1=row[PC1],
+            pc2=row[PC2],
+            qc1_min=row[QC1MIN],
+            qc1_max=row[QC1MAX],
+            qc2_min=row[QC2MIN],
+            qc2_max=row[QC2MAX],
+            **defaults,
+        )
+        for n, (uid, row) in enumerate(zip(core_model.get_valid_ids(len(gen)), gen.tolist()))
+    ]
+    core_model.add_components(machines)
+    return [(buses[i], machine, {}) for i, machine in zip(g_idx.tolist(), machines)]
+
+
+def _as_matrix(data: npt.ArrayLike, columns: int) -> npt.NDArray:
+    """Return the case data as 2D array with at least [columns] columns."""
+    matrix = np.asarray(data, dtype=float)
+    if matrix.size == 0:
+        return np.zeros((0, columns))
+    matrix = np.atleast_2d(matrix)
+    if matrix.shape[1] < columns:
+        matrix = np.hstack([matrix, np.zeros((matrix.shape[0], columns - matrix.shape[1]))])
+    return matrix
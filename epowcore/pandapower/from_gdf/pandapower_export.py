@@ -1,25 +1,57 @@
+from collections.abc import Callable
+from typing import Any
+
 import pandapower
 
 from epowcore.gdf.bus import Bus
+from epowcore.gdf.change_journal import ChangeJournal
+from epowcore.gdf.component import Component
 from epowcore.gdf.core_model import CoreModel
 from epowcore.gdf.external_grid import ExternalGrid
 from epowcore.gdf.switch import Switch
 from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
 from epowcore.gdf.generators.static_generator import StaticGenerator
 from epowcore.gdf.load import Load
+from epowcore.gdf.shunt import Shunt
 from epowcore.gdf.tline import TLine
 from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.generic.bus_numbering import BusNumbering, BusOrdering
 from epowcore.generic.logger import Logger
 from epowcore.generic.manipulation.flatten import flatten
+from epowcore.generic.manipulation.replay_changes import replay_changes
 from epowcore.pandapower.pandapower_model import PandapowerModel
 
+ELEMENT_TABLES: list[
+    tuple[type[Component], str, Callable[[PandapowerModel, CoreModel, Any], bool]]
+] = [
+    (Load, "load", PandapowerModel.create_load_from_gdf),
+    (TwoWindingTransformer, "trafo", PandapowerModel.create_two_winding_transformer_from_gdf),
+    (
+        StaticGenerator,
+        "sgen",
+        PandapowerModel.create_static_generator_from_gdf_static_generator,
+    ),
+    (SynchronousMachine, "gen", PandapowerModel.create_generator_from_gdf_synchronous_machine),
+    (TLine, "line", PandapowerModel.create_line_from_gdf_tline),
+    (Switch, "switch", PandapowerModel.create_switch_from_gdf_switch),
+    (Shunt, "shunt", PandapowerModel.create_shunt_from_gdf_shunt),
+    (ExternalGrid, "ext_grid", PandapowerModel.create_external_grid_from_gdf),
+]
+"""GDF types exported by `export_pandapower` except buses, their pandapower tables and the
+functions creating them. The elements are indexed by their uid."""
+
 
-def export_pandapower(core_model: CoreModel) -> PandapowerModel:
+def export_pandapower(
+    core_model: CoreModel, bus_ordering: BusOrdering | None = None
+) -> PandapowerModel:
     """Pandapower export function, taking in the gdf CoreModel and 
     returning a PandapowerModel object.
 
     :param core_model: GDF core model to be converted to a PandapowerModel.
     :type core_model: CoreModel
+    :param bus_ordering: If set, the pandapower bus indices are renumbered densely in this
+                         ordering. Otherwise, the bus uids are used; defaults to None
+    :type bus_ordering: BusOrdering | None, optional
     :return: PandapowerModel conversion result.
     :rtype: PandapowerModel
     """
@@ -33,12 +65,20 @@ def export_pandapower(core_model: CoreModel) -> PandapowerModel:
     pandapower_network = PandapowerModel(
         network=pandapower.create_empty_network(
             f_hz=core_model.base_frequency, sn_mva=core_model.base_mva_fb(), add_stdtypes=False
-        )
+        ),
+        bus_numbering=(
+            BusNumbering.from_core_model(core_model, bus_ordering)
+            if bus_ordering is not None
+            else None
+        ),
+        source=core_model,
     )
 
     Logger.log_to_selected("Creating buses in the Pandapower network")
     counter = 0
     gdf_bus_list = core_model.type_list(Bus)
+    if pandapower_network.bus_numbering is not None:
+        gdf_bus_list.sort(key=lambda b: pandapower_network.bus_index(b))
     number_of_buses = len(gdf_bus_list)
     for gdf_bus in gdf_bus_list:
         pandapower_network.create_bus_from_gdf(bus=gdf_bus)
@@ -109,6 +149,15 @@ def export_pandapower(core_model: CoreModel) -> PandapowerModel:
             counter += 1
     Logger.log_to_selected(f"Created {counter} out of {number_of_switches}")
 
+    Logger.log_to_selected("Creating shunts in the pandapower network")
+    counter = 0
+    gdf_shunt_list = core_model.type_list(Shunt)
+    number_of_shunts = len(gdf_shunt_list)
+    for gdf_shunt in gdf_shunt_list:
+        if pandapower_network.create_shunt_from_gdf_shunt(core_model=core_model, shunt=gdf_shunt):
+            counter += 1
+    Logger.log_to_selected(f"Created {counter} out of {number_of_shunts}")
+
     Logger.log_to_selected("Create external grids in the pandapower network")
     counter = 0
     gdf_external_grid_list = core_model.type_list(ExternalGrid)
@@ -121,3 +170,57 @@ def export_pandapower(core_model: CoreModel) -> PandapowerModel:
     Logger.log_to_selected(f"Created {counter} out of {number_of_external_grids}")
 
     return pandapower_network
+
+
+def patch_pandapower(
+    core_model: CoreModel, pandapower_model: PandapowerModel, journal: ChangeJournal
+) -> bool:
+    """Apply the changes recorded in [journal] to a previous export of [core_model].
+    The changes are replayed on the flattened model kept by the export. The elements of all
+    changed components and of the components whose connections changed are deleted and created
+    again, so the result matches a new export up to the order of the rows.
+
+    :param core_model: The changed core model.
+    :type core_model: CoreModel
+    :param pandapower_model: The previous export of [core_model], patched in place.
+    :type pandapower_model: PandapowerModel
+    :param journal: The changes since the previous export.
+    :type journal: ChangeJournal
+    :return: False, without modifying [pandapower_model], if the changes cannot be patched, e.g.
+             because added buses would change the bus numbering.
+    :rtype: bool
+    """
+    source = pandapower_model.source
+    if source is None:
+        return False
+    # added or removed buses change the dense bus numbering
+    structural = [*journal.added.values(), *journal.removed.values()]
+    if pandapower_model.bus_numbering is not None and any(isinstance(c, Bus) for c in structural):
+        return False
+    if not replay_changes(core_model, source, journal):
+        return False
+
+    network = pandapower_model.network
+    touched = journal.touched_uids()
+    components = {uid: c for c in source.graph.nodes if (uid := c.uid) in touched}
+
+    for bus in journal.removed.values():
+        if isinstance(bus, Bus):
+            network.bus.drop(index=bus.uid, inplace=True, errors="ignore")
+    for bus in list(components.values()):
+        if isinstance(bus, Bus) and (bus.uid in journal.added or bus.uid in journal.modified):
+            network.bus.drop(index=pandapower_model.bus_index(bus), inplace=True, errors="ignore")
+            pandapower_model.create_bus_from_gdf(bus)
+            # lines are rated with the voltage of their buses
+            lines = [c for c in source.graph.neighbors(bus) if isinstance(c, TLine)]
+            touched.update(line.uid for line in lines)
+            components.update((line.uid, line) for line in lines)
+
+    for _, table, _ in ELEMENT_TABLES:
+        network[table].drop(index=network[table].index.intersection(touched), inplace=True)
+    changed = [components[uid] for uid in sorted(components)]
+    for component_type, _, create in ELEMENT_TABLES:
+        for component in changed:
+            if isinstance(component, component_type):
+                create(pandapower_model, source, component)
+    return True
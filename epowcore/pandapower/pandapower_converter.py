@@ -1,14 +1,20 @@
+import json
+
 import pandapower
 
+from epowcore.gdf.change_journal import ChangeJournal
 from epowcore.gdf.core_model import CoreModel
+from epowcore.generic.bus_numbering import BusNumbering, BusOrdering
 from epowcore.generic.configuration import Configuration
 from epowcore.generic.constants import Platform
 from epowcore.generic.converter_base import ConverterBase
 from epowcore.generic.logger import Logger
 from epowcore.pandapower.from_gdf.pandapower_export import (
     export_pandapower,
+    patch_pandapower,
 )
 from epowcore.pandapower.pandapower_model import PandapowerModel
+from epowcore.pandapower.to_gdf.pandapower_import import import_pandapower
 from epowcore.plausibility.pandapower_checker import (
     PandapowerPlausibilityChecker,
 )
@@ -16,13 +22,17 @@ from epowcore.plausibility.plausibility_result import PlausibilityResult
 
 
 class PandapowerConverter(ConverterBase[PandapowerModel]):
+    structural_change_limit = 0.05
+
     def __init__(
         self,
         debug: bool = False,
         run_plausibility_check: bool = False,
         plausibility_output_path: str | None = None,
+        bus_ordering: BusOrdering | None = None,
     ) -> None:
         super().__init__(debug=debug)
+        self.bus_ordering = bus_ordering
         self.run_plausibility_check = run_plausibility_check
         self.plausibility_output_path = plausibility_output_path
         self.plausibility_result: PlausibilityResult | None = None
@@ -33,19 +43,38 @@ class PandapowerConverter(ConverterBase[PandapowerModel]):
         name: str,
         log_path: str | None = None,
     ) -> PandapowerModel:
-        Configuration().default_platform = Platform.PANDAPOWER
-        return super().from_gdf(
-            core_model,
-            name,
-            log_path,
-        )
+        with Configuration().scoped(Platform.PANDAPOWER):
+            return super().from_gdf(
+                core_model,
+                name,
+                log_path,
+            )
+
+    def reexport(
+        self,
+        core_model: CoreModel,
+        model: PandapowerModel,
+        name: str,
+        log_path: str | None = None,
+    ) -> PandapowerModel:
+        with Configuration().scoped(Platform.PANDAPOWER):
+            return super().reexport(core_model, model, name, log_path)
+
+    def to_gdf(self, model: PandapowerModel, log_path: str | None = None) -> CoreModel:
+        with Configuration().scoped(Platform.PANDAPOWER):
+            return super().to_gdf(model, log_path)
 
     def _export(
         self,
         core_model: CoreModel,
         name: str,
     ) -> PandapowerModel:
-        return export_pandapower(core_model)
+        return export_pandapower(core_model, self.bus_ordering)
+
+    def _patch_export(
+        self, core_model: CoreModel, model: PandapowerModel, journal: ChangeJournal
+    ) -> bool:
+        return patch_pandapower(core_model, model, journal)
 
     def _post_export(
         self,
@@ -69,6 +98,28 @@ class PandapowerConverter(ConverterBase[PandapowerModel]):
 
         return model
 
+    def serialize(self, model: PandapowerModel) -> bytes:
+        """Serialize the network as pandapower JSON together with the bus numbering. The source
+        model is lost, and the plausibility check is not run again for cached results."""
+        numbering = model.bus_numbering
+        payload = {
+            "network": pandapower.to_json(model.network),
+            "bus_numbering": (
+                None if numbering is None else {"uids": numbering.uids, "start": numbering.start}
+            ),
+        }
+        return json.dumps(payload).encode("utf-8")
+
+    def deserialize(self, data: bytes) -> PandapowerModel:
+        payload = json.loads(data.decode("utf-8"))
+        numbering = payload["bus_numbering"]
+        return PandapowerModel(
+            network=pandapower.from_json_string(payload["network"]),
+            bus_numbering=(
+                None if numbering is None else BusNumbering(numbering["uids"], numbering["start"])
+            ),
+        )
+
     def write_to_pandapower_json(
         self,
         model: PandapowerModel,
@@ -79,5 +130,9 @@ class PandapowerConverter(ConverterBase[PandapowerModel]):
             filename=filepath,
         )
 
-    def _import(self, model):
-        return model
\ No newline at end of file
+    def read_from_pandapower_json(self, filepath: str) -> PandapowerModel:
+        """Read a pandapower network from a JSON file."""
+        return PandapowerModel(network=pandapower.from_json(filepath))
+
+    def _import(self, model: PandapowerModel) -> CoreModel:
+        return import_pandapower(model)
\ No newline at end of file
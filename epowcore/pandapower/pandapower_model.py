@@ -22,6 +22,7 @@ from epowcore.gdf.transformers.three_winding_transformer import ThreeWindingTran
 from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
 from epowcore.gdf.utils import get_connected_bus
 from epowcore.gdf.ward import Ward
+from epowcore.generic.bus_numbering import BusNumbering
 from epowcore.generic.logger import Logger
 
 
@@ -35,6 +36,24 @@ class PandapowerModel:
     """
 
     network: pandapower.pandapowerNet
+    bus_numbering: BusNumbering | None = None
+    """Dense numbering of the pandapower buses. If None, the bus uids are used as index."""
+    source: CoreModel | None = None
+    """The flattened core model the network was exported from, kept to patch the export."""
+    journal_sequence: int | None = None
+    """Sequence number of the journal of the core model at the export, set by the converter."""
+
+    def bus_index(self, bus: Component) -> int:
+        """Get the pandapower index of a gdf bus.
+
+        :param bus: gdf bus to get the index for, e.g. a neighbor found in the graph.
+        :type bus: Component
+        :return: Index of the bus in the pandapower network.
+        :rtype: int
+        """
+        if self.bus_numbering is None:
+            return bus.uid
+        return self.bus_numbering.index(bus.uid)
 
     def create_bus_from_gdf(self, bus: Bus):
         """Create a pandapower bus in the pandapower network
@@ -51,7 +70,7 @@ class PandapowerModel:
         pandapower.create_bus(
             net=self.network,
             name=bus.name,
-            index=bus.uid,
+            index=self.bus_index(bus),
             geodata=bus.coords,
             vn_kv=bus.nominal_voltage,
             type=pandapower_type,
@@ -86,7 +105,7 @@ class PandapowerModel:
             net=self.network,
             name=load.name,
             index=load.uid,
-            bus=load_bus.uid,
+            bus=self.bus_index(load_bus),
             p_mw=load.active_power,
             q_mvar=load.reactive_power,
             const_z_p_percent=load.get_default(attr="const_z_percent"),
@@ -136,20 +155,9 @@ class PandapowerModel:
             return False
         # Calculate parameters
         # uktrr in pandapower powerfactory converter
-        if transformer.x1pu == 0:
-            vkr_percent = 0.0
-        else:
-            vkr_percent = (
-                math.sqrt(transformer.r1pu**2 + transformer.x1pu**2)
-                * 100
-                * transformer.r1pu
-                / transformer.x1pu
-            )
+        vkr_percent = transformer.r1pu * 100
         # uktr in pandapower powerfactory converter
-        # TODO: Check if this calculation is correct
         vk_percent = math.sqrt(transformer.r1pu**2 + transformer.x1pu**2) * 100
-        if vk_percent > 20.0:
-            vk_percent = 12.0
         # pandapower powerfactory converter: uk0tr
         vk0_percent = vk_percent
         # ur0tr in pandapower powerfactory converter
@@ -162,8 +170,8 @@ class PandapowerModel:
             net=self.network,
             name=transformer.name,
             index=transformer.uid,
-            hv_bus=high_voltage_bus[0].uid,
-            lv_bus=low_voltage_bus[0].uid,
+            hv_bus=self.bus_index(high_voltage_bus[0]),
+            lv_bus=self.bus_index(low_voltage_bus[0]),
             sn_mva=transformer.rating,
             vn_hv_kv=transformer.voltage_hv,
             vn_lv_kv=transformer.voltage_lv,
@@ -252,9 +260,9 @@ class PandapowerModel:
             net=self.network,
             name=transformer3w.name,
             index=transformer3w.uid,
-            hv_bus=high_voltage_bus[0].uid,
-            mv_bus=middle_voltage_bus[0].uid,
-            lv_bus=low_voltage_bus[0].uid,
+            hv_bus=self.bus_index(high_voltage_bus[0]),
+            mv_bus=self.bus_index(middle_voltage_bus[0]),
+            lv_bus=self.bus_index(low_voltage_bus[0]),
             vn_hv_kv=transformer3w.voltage_hv,
             vn_mv_kv=transformer3w.voltage_mv,
             vn_lv_kv=transformer3w.voltage_lv,
@@ -335,7 +343,7 @@ class PandapowerModel:
             net=self.network,
             name=synchronous_machine.name,
             index=synchronous_machine.uid,
-            bus=synchronous_machine_bus.uid,
+            bus=self.bus_index(synchronous_machine_bus),
             # active_power or rated_active_power
             # -> makes no difference for IEEE39
             # leaving active_power because its by definition more fitting
@@ -392,7 +400,8 @@ class PandapowerModel:
         pandapower.create_sgen(
             net=self.network,
             name=static_generator.name,
-            bus=static_generator_bus.uid,
+            index=static_generator.uid,
+            bus=self.bus_index(static_generator_bus),
             p_mw=static_generator.active_power,
             q_mvar=static_generator.reactive_power,
             max_p_mw=static_generator.p_max,
@@ -432,7 +441,7 @@ class PandapowerModel:
             net=self.network,
             name=external_grid.name,
             index=external_grid.uid,
-            bus=external_grid_bus.uid,
+            bus=self.bus_index(external_grid_bus),
             vm_pu=external_grid.u_setp,
         )
         return True
@@ -486,9 +495,10 @@ class PandapowerModel:
                 name=tline.name,
                 index=tline.uid,
                 geodata=tline.coords,
-                from_bus=from_bus[0].uid,
-                to_bus=to_bus[0].uid,
-                length_km=tline.length,
+                from_bus=self.bus_index(from_bus[0]),
+                to_bus=self.bus_index(to_bus[0]),
+                # without a length, the line parameters are absolute values
+                length_km=tline.length if tline.length is not None else 1.0,
                 r_ohm_per_km=tline.r1,
                 x_ohm_per_km=tline.x1,
                 c_nf_per_km=(tline.b1 * 1e3)
@@ -538,7 +548,7 @@ class PandapowerModel:
             net=self.network,
             name=ward.name,
             index=ward.uid,
-            bus=ward_bus,
+            bus=self.bus_index(ward_bus),
             ps_mw=-ward.p_gen + ward.p_load,
             qs_mvar=-ward.q_gen + ward.q_load,
             pz_mw=ward.p_zload,
@@ -571,8 +581,9 @@ class PandapowerModel:
         # Create shunt in pandapower network
         pandapower.create_shunt(
             net=self.network,
+            name=shunt.name,
             index=shunt.uid,
-            bus=shunt_bus,
+            bus=self.bus_index(shunt_bus),
             p_mw=shunt.p,
             q_mvar=shunt.q,
         )
@@ -645,8 +656,12 @@ class PandapowerModel:
             net=self.network,
             name=switch.name,
             index=switch.uid,
-            bus=switch_bus.uid,
-            element=switch_other_component.uid,
+            bus=self.bus_index(switch_bus),
+            element=(
+                self.bus_index(switch_other_component)
+                if isinstance(switch_other_component, Bus)
+                else switch_other_component.uid
+            ),
             et=switch_et,
             closed=switch.closed,
             in_ka=switch.get_default(attr="in_ka") * 1000 / voltage,
@@ -694,8 +709,12 @@ class PandapowerModel:
             net=self.network,
             name=tline.name,
             index=tline.uid,
-            bus=switch_bus.uid,
-            element=switch_other_component.uid,
+            bus=self.bus_index(switch_bus),
+            element=(
+                self.bus_index(switch_other_component)
+                if isinstance(switch_other_component, Bus)
+                else switch_other_component.uid
+            ),
             et=switch_et,
             closed=True,
             in_ka=tline.rating * 1000 / voltage,
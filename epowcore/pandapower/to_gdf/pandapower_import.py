@@ -0,0 +1,581 @@
+import math
+
+import numpy as np
+import numpy.typing as npt
+import pandapower
+import pandas as pd
+
+from epowcore.gdf.bus import Bus, BusType, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.external_grid import ExternalGrid, ExternalGridType
+from epowcore.gdf.generators.static_generator import StaticGenerator
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.load import Load
+from epowcore.gdf.shunt import Shunt
+from epowcore.gdf.switch import Switch
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.generic.configuration import Configuration
+from epowcore.generic.constants import Platform
+from epowcore.generic.logger import Logger
+from epowcore.generic.tools.table_import import Connection, float_column, machine_defaults
+from epowcore.pandapower.pandapower_model import PandapowerModel
+from epowcore.pandapower.utils import bus_coordinates
+
+# element tables that are not imported
+_UNSUPPORTED_TABLES = [
+    "trafo3w",
+    "impedance",
+    "ward",
+    "xward",
+    "dcline",
+    "storage",
+    "motor",
+    "asymmetric_load",
+    "asymmetric_sgen",
+    "svc",
+    "tcsc",
+    "ssc",
+]
+
+
+def import_pandapower(model: PandapowerModel) -> CoreModel:
+    """Import a pandapower network and convert it to a GDF CoreModel.
+
+    The element tables are processed column-wise: bus references are resolved for whole columns,
+    unit conversions are applied to all rows at once, uids are allocated in blocks and all
+    connections are inserted into the graph in one call.
+
+    The pandapower indices are used as uids as long as they are unique across all tables,
+    so exporting the imported model with `export_pandapower` preserves the indices.
+    Out of service elements are skipped.
+
+    :param model: The pandapower network to import.
+    :type model: PandapowerModel
+    :return: The imported CoreModel.
+    :rtype: CoreModel
+    """
+    net = model.network
+    core_model = CoreModel(base_frequency=float(net.f_hz), base_mva=float(net.sn_mva))
+
+    for table in _UNSUPPORTED_TABLES:
+        if table in net and len(net[table]) > 0:
+            Logger.log_to_selected(f"Skipping {len(net[table])} elements of table '{table}'")
+
+    bus_lookup = pd.Index(net.bus.index)
+
+    def bus_index(table: pd.DataFrame, column: str) -> npt.NDArray:
+        positions = bus_lookup.get_indexer(table[column].to_numpy())
+        if np.any(positions < 0):
+            unknown = table[column].to_numpy()[positions < 0]
+            raise ValueError(
+                f"pandapower table references unknown buses: {np.unique(unknown).tolist()}"
+            )
+        return positions
+
+    bus_in_service = net.bus["in_service"].to_numpy(dtype=bool)
+    if not np.all(bus_in_service):
+        Logger.log_to_selected(
+            f"Skipping {np.count_nonzero(~bus_in_service)} out of service buses "
+            "and their connected elements"
+        )
+
+    def active(name: str, bus_columns: list[str]) -> tuple[pd.DataFrame, list[npt.NDArray]]:
+        """The in-service rows of a table connected to in-service buses and their bus rows."""
+        table = net[name] if name in net else pd.DataFrame(columns=bus_columns)
+        positions = [bus_index(table, column) for column in bus_columns]
+        mask = float_column(table, "in_service", 1.0).astype(bool)
+        for pos in positions:
+            mask &= bus_in_service[pos]
+        if np.count_nonzero(~mask) > 0:
+            Logger.log_to_selected(
+                f"Skipping {np.count_nonzero(~mask)} out of service elements of table '{name}'"
+            )
+        return table[mask], [pos[mask] for pos in positions]
+
+    loads, (load_bus,) = active("load", ["bus"])
+    sgens, (sgen_bus,) = active("sgen", ["bus"])
+    gens, (gen_bus,) = active("gen", ["bus"])
+    ext_grids, (ext_grid_bus,) = active("ext_grid", ["bus"])
+    shunts, (shunt_bus,) = active("shunt", ["bus"])
+    lines, (line_from, line_to) = active("line", ["from_bus", "to_bus"])
+    trafos, (trafo_hv, trafo_lv) = active("trafo", ["hv_bus", "lv_bus"])
+    switches, (switch_bus,) = active("switch", ["bus"])
+
+    # switches at lines and transformers are not components of their own in pandapower
+    bus_switch = switches["et"].to_numpy() == "b"
+    switches, switch_bus = switches[bus_switch], switch_bus[bus_switch]
+    switch_element = bus_index(switches, "element")
+    switch_mask = bus_in_service[switch_element]
+    switches, switch_bus, switch_element = (
+        switches[switch_mask],
+        switch_bus[switch_mask],
+        switch_element[switch_mask],
+    )
+    open_lines, open_trafos = _open_branch_switches(net)
+    line_mask = ~lines.index.isin(open_lines)
+    trafo_mask = ~trafos.index.isin(open_trafos)
+    if not np.all(line_mask) or not np.all(trafo_mask):
+        Logger.log_to_selected(
+            f"Skipping {np.count_nonzero(~line_mask)} lines and {np.count_nonzero(~trafo_mask)} "
+            "transformers disconnected by open switches"
+        )
+    lines, line_from, line_to = lines[line_mask], line_from[line_mask], line_to[line_mask]
+    trafos, trafo_hv, trafo_lv = trafos[trafo_mask], trafo_hv[trafo_mask], trafo_lv[trafo_mask]
+
+    buses_table = net.bus[bus_in_service]
+    uids = _allocate_uids(
+        [buses_table, loads, sgens, gens, ext_grids, shunts, lines, trafos, switches]
+    )
+
+    lf_bus_type = np.full(len(net.bus), LFBusType.PQ.value, dtype=object)
+    lf_bus_type[gen_bus] = LFBusType.PV.value
+    lf_bus_type[gen_bus[float_column(gens, "slack", 0.0).astype(bool)]] = LFBusType.SL.value
+    lf_bus_type[ext_grid_bus] = LFBusType.SL.value
+
+    buses = _create_buses(core_model, net, uids[0], lf_bus_type)
+    connections = _create_loads(core_model, loads, uids[1], buses, load_bus)
+    connections += _create_static_generators(core_model, sgens, uids[2], buses, sgen_bus)
+    connections += _create_synchronous_machines(core_model, gens, uids[3], buses, gen_bus)
+    connections += _create_external_grids(core_model, ext_grids, uids[4], buses, ext_grid_bus)
+    connections += _create_shunts(core_model, shunts, uids[5], buses, shunt_bus)
+    connections += _create_lines(core_model, lines, uids[6], buses, line_from, line_to)
+    connections += _create_transformers(core_model, trafos, uids[7], buses, trafo_hv, trafo_lv)
+    connections += _create_switches(
+        core_model, switches, uids[8], buses, switch_bus, switch_element
+    )
+
+    core_model.graph.add_edges_from(connections)
+    return core_model
+
+
+def _open_branch_switches(net: pandapower.pandapowerNet) -> tuple[npt.NDArray, npt.NDArray]:
+    """Indices of the lines and transformers with an open switch at one of their ends."""
+    switch = net.switch
+    in_service = float_column(switch, "in_service", 1.0).astype(bool)
+    is_open = ~switch["closed"].to_numpy(dtype=bool) & in_service
+    # the export writes line switches as "I"
+    et = switch["et"].to_numpy()
+    return (
+        switch["element"].to_numpy()[is_open & np.isin(et, ["l", "I"])],
+        switch["element"].to_numpy()[is_open & (et == "t")],
+    )
+
+
+def _allocate_uids(tables: list[pd.DataFrame]) -> list[npt.NDArray]:
+    """Keep the indices of each table as uids if they do not collide with the indices of the
+    previous tables. The other tables get new uids in one block after the largest kept uid.
+    """
+    used = np.zeros(0, dtype=np.int64)
+    keep = []
+    for table in tables:
+        index = table.index.to_numpy()
+        valid = (
+            np.issubdtype(index.dtype, np.integer)
+            and (len(index) == 0 or index.min() >= 0)
+            and table.index.is_unique
+            and not np.any(np.isin(index, used))
+        )
+        keep.append(valid)
+        if valid:
+            used = np.concatenate([used, index.astype(np.int64)])
+
+    next_uid = int(used.max()) + 1 if len(used) > 0 else 0
+    uids = []
+    for table, valid in zip(tables, keep):
+        if valid:
+            uids.append(table.index.to_numpy(dtype=np.int64))
+        else:
+            uids.append(np.arange(next_uid, next_uid + len(table), dtype=np.int64))
+            next_uid += len(table)
+    return uids
+
+
+def _names(table: pd.DataFrame, prefix: str) -> list[str]:
+    """Names of the rows. Rows without a name are named after their index."""
+    fallback = prefix + " " + table.index.astype(str)
+    if "name" not in table.columns:
+        return fallback.tolist()
+    names = table["name"]
+    missing = names.isna().to_numpy() | (names.astype(str).to_numpy() == "")
+    return np.where(missing, fallback, names.astype(str)).tolist()
+
+
+def _create_buses(
+    core_model: CoreModel,
+    net: pandapower.pandapowerNet,
+    uids: npt.NDArray,
+    lf_bus_type: npt.NDArray,
+) -> dict[int, Bus]:
+    """Create the in-service buses, keyed by their row in the bus table."""
+    rows = np.flatnonzero(net.bus["in_service"].to_numpy(dtype=bool))
+    table = net.bus.iloc[rows]
+    coordinates = bus_coordinates(net).reindex(table.index)
+    coords = [
+        None if math.isnan(x) or math.isnan(y) else (x, y)
+        for x, y in zip(coordinates["x"].tolist(), coordinates["y"].tolist())
+    ]
+    junction = (
+        (table["type"] == "n").to_numpy()
+        if "type" in table.columns
+        else np.zeros(len(table), dtype=bool)
+    )
+
+    created = [
+        Bus(
+            uid,
+            name,
+            coord,
+            lf_bus_type=LFBusType(lf_type),
+            nominal_voltage=vn_kv,
+            bus_type=BusType.JUNCTION if is_junction else BusType.BUSBAR,
+        )
+        for uid, name, coord, lf_type, vn_kv, is_junction in zip(
+            uids.tolist(),
+            _names(table, "Bus"),
+            coords,
+            lf_bus_type[rows].tolist(),
+            table["vn_kv"].to_numpy(dtype=float).tolist(),
+            junction.tolist(),
+        )
+    ]
+    core_model.add_components(created)
+    return dict(zip(rows.tolist(), created))
+
+
+def _create_loads(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: dict[int, Bus],
+    bus_rows: npt.NDArray,
+) -> list[Connection]:
+    """Create the Loads with their scaled power."""
+    scaling = float_column(table, "scaling", 1.0)
+    loads = [
+        Load(uid, name, active_power=p, reactive_power=q)
+        for uid, name, p, q in zip(
+            uids.tolist(),
+            _names(table, "Load"),
+            (float_column(table, "p_mw", 0.0) * scaling).tolist(),
+            (float_column(table, "q_mvar", 0.0) * scaling).tolist(),
+        )
+    ]
+    core_model.add_components(loads)
+    return [(buses[i], load, {}) for i, load in zip(bus_rows.tolist(), loads)]
+
+
+def _create_static_generators(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: dict[int, Bus],
+    bus_rows: npt.NDArray,
+) -> list[Connection]:
+    """Create the StaticGenerators. Missing limits are set to the current operating point."""
+    scaling = float_column(table, "scaling", 1.0)
+    p = float_column(table, "p_mw", 0.0) * scaling
+    q = float_column(table, "q_mvar", 0.0) * scaling
+    values = np.column_stack(
+        [
+            float_column(table, "sn_mva", np.hypot(p, q)),
+            p,
+            q,
+            float_column(table, "min_p_mw", np.minimum(p, 0.0)),
+            float_column(table, "max_p_mw", p),
+            float_column(table, "min_q_mvar", q),
+            float_column(table, "max_q_mvar", q),
+        ]
+    ).tolist()
+    generators = [
+        StaticGenerator(
+            uid,
+            name,
+            rated_apparent_power=v[0],
+            rated_active_power=v[1],
+            active_power=v[1],
+            reactive_power=v[2],
+            voltage_set_point=1.0,
+            p_min=v[3],
+            p_max=v[4],
+            q_min=v[5],
+            q_max=v[6],
+        )
+        for uid, name, v in zip(uids.tolist(), _names(table, "SGen"), values)
+    ]
+    core_model.add_components(generators)
+    return [(buses[i], gen, {}) for i, gen in zip(bus_rows.tolist(), generators)]
+
+
+def _create_synchronous_machines(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: dict[int, Bus],
+    bus_rows: npt.NDArray,
+) -> list[Connection]:
+    """Create SynchronousMachines from the voltage controlled generators.
+    Dynamic parameters are not part of pandapower networks and are taken from the configuration.
+    """
+    defaults = machine_defaults(Platform.PANDAPOWER)
+    if len(table) > 0:
+        Logger.log_to_selected(f"Using defaults for imported synchronous machines: {defaults}")
+
+    scaling = float_column(table, "scaling", 1.0)
+    p = float_column(table, "p_mw", 0.0) * scaling
+    vn_kv = np.array([buses[i].nominal_voltage for i in bus_rows.tolist()])
+    values = np.column_stack(
+        [
+            float_column(table, "sn_mva", np.abs(p)),
+            float_column(table, "vn_kv", vn_kv),
+            p,
+            float_column(table, "vm_pu", 1.0),
+            float_column(table, "min_p_mw", np.minimum(p, 0.0)),
+            float_column(table, "max_p_mw", p),
+            float_column(table, "min_q_mvar", -np.abs(p)),
+            float_column(table, "max_q_mvar", np.abs(p)),
+            float_column(table, "xdss_pu", defaults["subtransient_reactance_x"]),
+        ]
+    ).tolist()
+    machines = [
+        SynchronousMachine(
+            uid,
+            name,
+            **{**defaults, "subtransient_reactance_x": v[8]},
+            rated_apparent_power=v[0],
+            rated_voltage=v[1],
+            rated_active_power=v[2],
+            active_power=v[2],
+            reactive_power=0.0,
+            voltage_set_point=v[3],
+            p_min=v[4],
+            p_max=v[5],
+            q_min=v[6],
+            q_max=v[7],
+            pc1=0.0,
+            pc2=0.0,
+            qc1_min=0.0,
+            qc1_max=0.0,
+            qc2_min=0.0,
+            qc2_max=0.0,
+        )
+        for uid, name, v in zip(uids.tolist(), _names(table, "Gen"), values)
+    ]
+    core_model.add_components(machines)
+    return [(buses[i], machine, {}) for i, machine in zip(bus_rows.tolist(), machines)]
+
+
+def _create_external_grids(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: dict[int, Bus],
+    bus_rows: npt.NDArray,
+) -> list[Connection]:
+    """Create the ExternalGrids as slack grids. Missing limits are taken from the configuration."""
+    if np.any(float_column(table, "va_degree", 0.0) != 0):
+        Logger.log_to_selected("Ignoring the voltage angle setpoints of external grids")
+    limits = {}
+    for attr in ("p_min", "p_max", "q_min", "q_max"):
+        value = Configuration().get_default("ExternalGrid", attr, Platform.PANDAPOWER)
+        if value is None:
+            raise ValueError(f"No default value found for ExternalGrid.{attr}")
+        limits[attr] = value
+    values = np.column_stack(
+        [
+            float_column(table, "vm_pu", 1.0),
+            float_column(table, "min_p_mw", limits["p_min"]),
+            float_column(table, "max_p_mw", limits["p_max"]),
+            float_column(table, "min_q_mvar", limits["q_min"]),
+            float_column(table, "max_q_mvar", limits["q_max"]),
+        ]
+    ).tolist()
+    grids = [
+        ExternalGrid(
+            uid,
+            name,
+            u_setp=v[0],
+            p=0.0,
+            q=0.0,
+            p_min=v[1],
+            p_max=v[2],
+            q_min=v[3],
+            q_max=v[4],
+            bus_type=ExternalGridType.SL,
+        )
+        for uid, name, v in zip(uids.tolist(), _names(table, "External Grid"), values)
+    ]
+    core_model.add_components(grids)
+    return [(buses[i], grid, {}) for i, grid in zip(bus_rows.tolist(), grids)]
+
+
+def _create_shunts(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: dict[int, Bus],
+    bus_rows: npt.NDArray,
+) -> list[Connection]:
+    """Create the Shunts with the power of their current step."""
+    step = float_column(table, "step", 1.0)
+    shunts = [
+        Shunt(uid, name, p=p, q=q)
+        for uid, name, p, q in zip(
+            uids.tolist(),
+            _names(table, "Shunt"),
+            (float_column(table, "p_mw", 0.0) * step).tolist(),
+            (float_column(table, "q_mvar", 0.0) * step).tolist(),
+        )
+    ]
+    core_model.add_components(shunts)
+    return [(buses[i], shunt, {}) for i, shunt in zip(bus_rows.tolist(), shunts)]
+
+
+def _create_lines(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: dict[int, Bus],
+    from_rows: npt.NDArray,
+    to_rows: npt.NDArray,
+) -> list[Connection]:
+    """Create the TLines. The rating of a single circuit is based on the voltage at the 'from'
+    bus."""
+    if np.any(float_column(table, "g_us_per_km", 0.0) != 0):
+        Logger.log_to_selected("Ignoring the conductance of lines")
+    vn_kv = np.array([buses[i].nominal_voltage for i in from_rows.tolist()])
+    omega = 2 * math.pi * core_model.base_frequency
+    values = np.column_stack(
+        [
+            float_column(table, "length_km", 1.0),
+            float_column(table, "r_ohm_per_km", 0.0),
+            float_column(table, "x_ohm_per_km", 0.0),
+            float_column(table, "c_nf_per_km", 0.0) * omega * 1e-3,
+            float_column(table, "max_i_ka", np.nan)
+            * float_column(table, "df", 1.0)
+            * math.sqrt(3)
+            * vn_kv,
+            float_column(table, "parallel", 1.0),
+            float_column(table, "r0_ohm_per_km", np.nan),
+            float_column(table, "x0_ohm_per_km", np.nan),
+        ]
+    ).tolist()
+    lines = [
+        TLine(
+            uid,
+            name,
+            length=v[0],
+            r1=v[1],
+            x1=v[2],
+            b1=v[3],
+            rating=v[4],
+            parallel_lines=int(v[5]),
+            r0=None if math.isnan(v[6]) else v[6],
+            x0=None if math.isnan(v[7]) else v[7],
+        )
+        for uid, name, v in zip(uids.tolist(), _names(table, "Line"), values)
+    ]
+    core_model.add_components(lines)
+    connections: list[Connection] = []
+    for f, t, line in zip(from_rows.tolist(), to_rows.tolist(), lines):
+        connections.append((buses[f], line, {line.uid: ["A"]}))
+        connections.append((buses[t], line, {line.uid: ["B"]}))
+    return connections
+
+
+def _create_transformers(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: dict[int, Bus],
+    hv_rows: npt.NDArray,
+    lv_rows: npt.NDArray,
+) -> list[Connection]:
+    """Create the TwoWindingTransformers. Parallel transformers are merged into one with the
+    combined rating."""
+    if "tap_side" in table.columns and np.any(table["tap_side"].to_numpy() == "lv"):
+        Logger.log_to_selected(
+            "Importing tap changers on the low voltage side as high voltage side"
+        )
+    shift = float_column(table, "shift_degree", 0.0)
+    shift_30 = np.rint(shift / 30)
+    rounded = np.count_nonzero(shift_30 * 30 != shift)
+    if rounded > 0:
+        Logger.log_to_selected(
+            f"Rounding the phase shift of {rounded} transformers to multiples of 30 degrees"
+        )
+
+    tap_defaults: dict[str, float] = {}
+    for attr in ("tap_changer_voltage", "tap_min", "tap_max", "tap_neutral", "tap_initial"):
+        default = Configuration().get_default("TwoWindingTransformer", attr, Platform.PANDAPOWER)
+        tap_defaults[attr] = float(default) if default is not None else np.nan
+    parallel = float_column(table, "parallel", 1.0)
+    vk_percent = float_column(table, "vk_percent", 0.0)
+    vkr_percent = float_column(table, "vkr_percent", 0.0)
+    values = np.column_stack(
+        [
+            float_column(table, "sn_mva", np.nan) * parallel,
+            float_column(table, "vn_hv_kv", np.nan),
+            float_column(table, "vn_lv_kv", np.nan),
+            vkr_percent / 100,
+            np.sqrt(np.maximum(vk_percent**2 - vkr_percent**2, 0.0)) / 100,
+            float_column(table, "pfe_kw", 0.0) * parallel,
+            float_column(table, "i0_percent", 0.0),
+            shift_30,
+            float_column(table, "tap_step_percent", tap_defaults["tap_changer_voltage"] * 100)
+            / 100,
+            float_column(table, "tap_min", tap_defaults["tap_min"]),
+            float_column(table, "tap_max", tap_defaults["tap_max"]),
+            float_column(table, "tap_neutral", tap_defaults["tap_neutral"]),
+            float_column(table, "tap_pos", tap_defaults["tap_initial"]),
+        ]
+    ).tolist()
+    trafos = [
+        TwoWindingTransformer(
+            uid,
+            name,
+            rating=v[0],
+            voltage_hv=v[1],
+            voltage_lv=v[2],
+            r1pu=v[3],
+            x1pu=v[4],
+            pfe_kw=v[5],
+            no_load_current=v[6],
+            phase_shift_30=int(v[7]),
+            tap_changer_voltage=v[8],
+            tap_min=int(v[9]),
+            tap_max=int(v[10]),
+            tap_neutral=int(v[11]),
+            tap_initial=int(v[12]),
+        )
+        for uid, name, v in zip(uids.tolist(), _names(table, "Trafo"), values)
+    ]
+    core_model.add_components(trafos)
+    connections: list[Connection] = []
+    for hv, lv, trafo in zip(hv_rows.tolist(), lv_rows.tolist(), trafos):
+        connections.append((buses[hv], trafo, {trafo.uid: ["HV"]}))
+        connections.append((buses[lv], trafo, {trafo.uid: ["LV"]}))
+    return connections
+
+
+def _create_switches(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: dict[int, Bus],
+    bus_rows: npt.NDArray,
+    element_rows: npt.NDArray,
+) -> list[Connection]:
+    """Create Switches between two buses."""
+    switches = [
+        Switch(uid, name, closed=closed)
+        for uid, name, closed in zip(
+            uids.tolist(), _names(table, "Switch"), table["closed"].to_numpy(dtype=bool).tolist()
+        )
+    ]
+    core_model.add_components(switches)
+    connections: list[Connection] = []
+    for bus, element, switch in zip(bus_rows.tolist(), element_rows.tolist(), switches):
+        connections.append((buses[bus], switch, {}))
+        connections.append((buses[element], switch, {}))
+    return connections
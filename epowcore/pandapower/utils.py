@@ -0,0 +1,25 @@
+import pandapower
+import pandas as pd
+
+
+def bus_coordinates(net: pandapower.pandapowerNet) -> pd.DataFrame:
+    """x and y coordinates of all buses with geodata, indexed by the bus index.
+
+    Supports GeoJSON points in the `geo` column of newer pandapower versions
+    as well as the `bus_geodata` table of older versions.
+    """
+    if "geo" in net.bus.columns:
+        coordinates = (
+            net.bus["geo"]
+            .dropna()
+            .astype(str)
+            .str.extract(r'"coordinates"\s*:\s*\[\s*([-+\d.eE]+)\s*,\s*([-+\d.eE]+)')
+            .astype(float)
+        )
+        coordinates.columns = ["x", "y"]
+        return coordinates.dropna()
+
+    if "bus_geodata" in net and not net.bus_geodata.empty:
+        return net.bus_geodata[["x", "y"]].astype(float).dropna()
+
+    return pd.DataFrame(columns=["x", "y"], dtype=float)
@@ -0,0 +1,275 @@
+"""Batch plausibility checks of GDF and pandapower JSON files.
+
+Usage: `python -m epowcore.plausibility.batch <directory or glob> ... --report report.jsonl`
+"""
+
+import argparse
+import glob
+import hashlib
+import json
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import pandapower
+import pandas as pd
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+from epowcore.plausibility.checker import PlausibilityThresholds
+from epowcore.plausibility.dc_checker import DcPlausibilityChecker
+from epowcore.plausibility.pandapower_checker import PandapowerPlausibilityChecker
+
+_RESULT_COUNTS = (
+    "soft_voltage_violations",
+    "hard_voltage_violations",
+    "overloaded_lines",
+    "overloaded_transformers",
+    "isolated_areas",
+)
+
+
+@dataclass(frozen=True)
+class BatchOptions:
+    """Options of the checks of each model."""
+
+    thresholds: PlausibilityThresholds = field(default_factory=PlausibilityThresholds)
+    """Limits of the checks."""
+    dc_screening: bool = False
+    """Use the DC screening instead of an AC load flow."""
+    output_path: str | None = None
+    """Directory for the JSON results and plots of each model, no output if None."""
+
+
+def find_models(sources: Iterable[str], exclude: Iterable[str | Path] = ()) -> list[Path]:
+    """Expand directories and glob patterns to the sorted list of JSON files.
+
+    :param sources: Directories (searched recursively for `*.json`), glob patterns or files.
+    :type sources: Iterable[str]
+    :param exclude: Directories whose files are skipped, e.g. the output of the checks,
+                    defaults to ()
+    :type exclude: Iterable[str | Path], optional
+    :return: The unique paths of all matching files.
+    :rtype: list[Path]
+    """
+    paths: set[Path] = set()
+    for source in sources:
+        if Path(source).is_dir():
+            paths.update(Path(source).rglob("*.json"))
+        else:
+            paths.update(Path(match) for match in glob.glob(source, recursive=True))
+    excluded = [Path(directory).resolve() for directory in exclude]
+    return sorted(
+        path
+        for path in paths
+        if path.is_file() and not any(path.resolve().is_relative_to(e) for e in excluded)
+    )
+
+
+def content_hash(data: bytes) -> str:
+    """SHA-256 hash of the content of a model file."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def options_hash(options: BatchOptions) -> str:
+    """SHA-256 hash of the options of the checks, records are reused only with equal options."""
+    return hashlib.sha256(json.dumps(asdict(options), sort_keys=True).encode()).hexdigest()
+
+
+def read_report(report_path: Path) -> dict[str, dict]:
+    """Read the records of a previous report, keyed by the model path.
+
+    :param report_path: The JSON lines report.
+    :type report_path: Path
+    :return: The last record of each model, empty if there is no report.
+    :rtype: dict[str, dict]
+    """
+    if not report_path.exists():
+        return {}
+    records = {}
+    with report_path.open("r", encoding="utf-8") as file:
+        for line in file:
+            if line.strip():
+                record = json.loads(line)
+                records[record["path"]] = record
+    return records
+
+
+def check_file(path: Path, options: BatchOptions) -> dict:
+    """Load, convert and check a single GDF or pandapower JSON file.
+
+    :param path: The model file.
+    :type path: Path
+    :param options: The options of the checks.
+    :type options: BatchOptions
+    :return: The report record of the model.
+    :rtype: dict
+    """
+    start = time.perf_counter()
+    data = path.read_bytes()
+    record: dict = {
+        "path": str(path),
+        "name": path.stem,
+        "content_hash": content_hash(data),
+        "options_hash": options_hash(options),
+        "format": None,
+        "status": "checked",
+    }
+    try:
+        text = data.decode("utf-8")
+        content = json.loads(text)
+        if "components" in content and "graph" in content:
+            record["format"] = "gdf"
+            model: CoreModel | pandapower.pandapowerNet = CoreModel.import_dict(content)
+            if not options.dc_screening:
+                model = PandapowerConverter().from_gdf(model, path.stem).network
+        else:
+            record["format"] = "pandapower"
+            model = pandapower.from_json_string(text)
+
+        checker: DcPlausibilityChecker | PandapowerPlausibilityChecker
+        if options.dc_screening:
+            checker = DcPlausibilityChecker(thresholds=options.thresholds)
+        else:
+            checker = PandapowerPlausibilityChecker(options.thresholds)
+        result = checker.run(model, options.output_path, path.stem)
+    except Exception as exc:  # pylint: disable=broad-except
+        record.update(status="failed", errors=[f"{type(exc).__name__}: {exc}"])
+        record["duration"] = time.perf_counter() - start
+        return record
+
+    record.update(
+        converged=result.converged,
+        successful=result.successful,
+        **{name: len(getattr(result, name)) for name in _RESULT_COUNTS},
+        errors=result.errors,
+        duration=time.perf_counter() - start,
+    )
+    return record
+
+
+class BatchPlausibilityChecker:
+    """Check collections of model files concurrently with a bounded number of worker processes.
+
+    The records are streamed into a JSON lines report as soon as each model is checked.
+    Models whose content hash and options match the record of the previous report are not
+    checked again. Files in the output directory of the options are not checked.
+    """
+
+    def __init__(
+        self,
+        options: BatchOptions | None = None,
+        max_workers: int = 4,
+    ) -> None:
+        self.options = options or BatchOptions()
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        sources: Iterable[str],
+        report_path: str | Path,
+        parquet_path: str | Path | None = None,
+        force: bool = False,
+    ) -> pd.DataFrame:
+        """Check all models and write the aggregated report.
+
+        :param sources: Directories, glob patterns or files of GDF or pandapower JSON models.
+        :type sources: Iterable[str]
+        :param report_path: The JSON lines report. Records of a previous run with the same
+                            options are reused for unchanged models.
+        :type report_path: str | Path
+        :param parquet_path: Additional Parquet report (requires `pyarrow`), defaults to None
+        :type parquet_path: str | Path | None, optional
+        :param force: Check all models even if they are unchanged, defaults to False
+        :type force: bool, optional
+        :return: The records of all models.
+        :rtype: pd.DataFrame
+        """
+        report_path = Path(report_path)
+        previous = {} if force else read_report(report_path)
+        output_path = self.options.output_path
+        paths = find_models(sources, [output_path] if output_path is not None else [])
+
+        records = []
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        with report_path.open("w", encoding="utf-8") as file:
+            for record in self._records(paths, previous):
+                file.write(json.dumps(record) + "\n")
+                file.flush()
+                records.append(record)
+
+        table = pd.DataFrame(records)
+        if parquet_path is not None:
+            parquet_table = table.copy()
+            if "errors" in parquet_table:
+                parquet_table["errors"] = parquet_table["errors"].map(json.dumps)
+            parquet_table.to_parquet(parquet_path, index=False)
+        return table
+
+    def _records(self, paths: list[Path], previous: dict[str, dict]) -> Iterator[dict]:
+        """Records of unchanged models first, then of each checked model when it is done."""
+        pending = []
+        options = options_hash(self.options)
+        for path in paths:
+            record = previous.get(str(path))
+            if (
+                record is not None
+                and record.get("status") != "failed"
+                and record.get("options_hash") == options
+                and record.get("content_hash") == content_hash(path.read_bytes())
+            ):
+                yield {**record, "status": "unchanged"}
+            else:
+                pending.append(path)
+
+        if self.max_workers <= 1:
+            for path in pending:
+                yield check_file(path, self.options)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            # submit at most two models per worker to bound the memory of queued work
+            queue = iter(pending)
+            running: set[Future] = set()
+            while True:
+                while len(running) < 2 * self.max_workers:
+                    queued = next(queue, None)
+                    if queued is None:
+                        break
+                    running.add(executor.submit(check_file, queued, self.options))
+                if not running:
+                    return
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Check GDF and pandapower JSON models for plausibility."
+    )
+    parser.add_argument("sources", nargs="+", help="directories, glob patterns or model files")
+    parser.add_argument("--report", required=True, help="JSON lines report")
+    parser.add_argument("--parquet", help="additional Parquet report")
+    parser.add_argument("--workers", type=int, default=4, help="number of worker processes")
+    parser.add_argument("--output", help="directory for the results and plots of each model")
+    parser.add_argument("--dc", action="store_true", help="use the DC screening")
+    parser.add_argument("--force", action="store_true", help="also check unchanged models")
+    args = parser.parse_args(argv)
+
+    options = BatchOptions(dc_screening=args.dc, output_path=args.output)
+    start = time.perf_counter()
+    table = BatchPlausibilityChecker(options, args.workers).run(
+        args.sources, args.report, args.parquet, args.force
+    )
+    status = table["status"].value_counts() if not table.empty else pd.Series(dtype=int)
+    print(
+        f"{len(table)} models in {time.perf_counter() - start:.1f}s: "
+        + ", ".join(f"{count} {name}" for name, count in status.items())
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from dataclasses import asdict
+from dataclasses import asdict, dataclass
 import json
 from pathlib import Path
 from typing import Generic, TypeVar
@@ -10,6 +10,22 @@ from epowcore.plausibility.plausibility_result import PlausibilityResult
 Model = TypeVar("Model")
 
 
+@dataclass(frozen=True)
+class PlausibilityThresholds:
+    """Limits of the plausibility checks."""
+
+    hard_vm_min_pu: float = 0.8
+    """Voltages below are hard violations."""
+    soft_vm_min_pu: float = 0.9
+    """Voltages below are soft violations."""
+    soft_vm_max_pu: float = 1.1
+    """Voltages above are soft violations."""
+    hard_vm_max_pu: float = 1.2
+    """Voltages above are hard violations."""
+    max_loading_percent: float = 100.0
+    """Loadings of lines and transformers above are overloads."""
+
+
 class PlausibilityChecker(ABC, Generic[Model]):
     """Generic interface for post-export plausibility checks."""
 
@@ -0,0 +1,211 @@
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+import pandapower
+import pandas as pd
+
+from epowcore.generic.logger import Logger
+from epowcore.plausibility.checker import PlausibilityThresholds
+from epowcore.plausibility.pandapower_checker import PandapowerPlausibilityChecker
+from epowcore.plausibility.plausibility_result import PlausibilityResult
+
+_SUMMARY_COUNTS = (
+    "soft_voltage_violations",
+    "hard_voltage_violations",
+    "overloaded_lines",
+    "overloaded_transformers",
+    "isolated_areas",
+    "errors",
+)
+
+
+@dataclass(frozen=True)
+class Contingency:
+    """Outage of a single element of a pandapower network."""
+
+    element: str
+    """Name of the element table, e.g. `line` or `trafo`."""
+    index: int
+    """Index of the element in its table."""
+
+
+@dataclass
+class ContingencyReport:
+    """Plausibility results of the base case and of all contingencies."""
+
+    base_case: PlausibilityResult
+    """Result of the network without outages."""
+    results: dict[Contingency, PlausibilityResult] = field(default_factory=dict)
+    """Result of each contingency."""
+    duration: float = 0.0
+    """Wall time of the contingency runs [s]"""
+
+    @property
+    def throughput(self) -> float:
+        """Contingencies per second."""
+        return len(self.results) / self.duration if self.duration > 0 else float("nan")
+
+    def summary_table(self) -> pd.DataFrame:
+        """One row per contingency with the number of issues of each type."""
+        rows = [
+            {
+                "element": contingency.element,
+                "index": contingency.index,
+                "converged": result.converged,
+                "successful": result.successful,
+                **{name: len(getattr(result, name)) for name in _SUMMARY_COUNTS},
+                "max_loading_percent": max(
+                    (
+                        violation["loading_percent"]
+                        for violation in result.overloaded_lines + result.overloaded_transformers
+                    ),
+                    default=float("nan"),
+                ),
+            }
+            for contingency, result in self.results.items()
+        ]
+        columns = ["element", "index", "converged", "successful", *_SUMMARY_COUNTS]
+        return pd.DataFrame(rows, columns=[*columns, "max_loading_percent"])
+
+    def summary(self) -> str:
+        table = self.summary_table()
+        return "\n".join(
+            [
+                f"Contingencies: {len(table)}",
+                f"Not converged: {int((~table['converged']).sum())}",
+                f"With issues: {int((~table['successful']).sum())}",
+                f"Throughput: {self.throughput:.1f} contingencies/s",
+            ]
+        )
+
+
+class ContingencyRunner:
+    """N-1 plausibility screening of a pandapower network.
+
+    The outages are created by toggling `in_service` of the elements on a single copy of the
+    network per worker process. Each load flow is started from the base case results.
+    """
+
+    def __init__(
+        self,
+        thresholds: PlausibilityThresholds | None = None,
+        processes: int | None = None,
+        chunk_size: int = 16,
+        runpp_options: dict | None = None,
+    ) -> None:
+        """
+        :param thresholds: Limits of the checks, defaults to the default thresholds
+        :type thresholds: PlausibilityThresholds | None, optional
+        :param processes: Number of worker processes, defaults to the number of CPUs.
+                          With 1, all contingencies are run in the calling process.
+        :type processes: int | None, optional
+        :param chunk_size: Number of contingencies per task of a worker, defaults to 16
+        :type chunk_size: int, optional
+        :param runpp_options: Additional keyword arguments of `pandapower.runpp`
+        :type runpp_options: dict | None, optional
+        """
+        self.thresholds = thresholds or PlausibilityThresholds()
+        self.processes = processes or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+        self.runpp_options = runpp_options or {}
+
+    def run(
+        self,
+        net: pandapower.pandapowerNet,
+        contingencies: list[Contingency] | None = None,
+    ) -> ContingencyReport:
+        """Check the base case and all contingencies.
+
+        :param net: The pandapower network. It is left with the base case results.
+        :type net: pandapower.pandapowerNet
+        :param contingencies: The contingencies to check, defaults to the outage of each line
+                              and two-winding transformer in service
+        :type contingencies: list[Contingency] | None, optional
+        :return: The results of the base case and the contingencies.
+        :rtype: ContingencyReport
+        """
+        base_checker = PandapowerPlausibilityChecker(self.thresholds, self.runpp_options)
+        report = ContingencyReport(base_case=base_checker.check(net))
+        if not report.base_case.converged:
+            Logger.log_to_selected("Base case did not converge, contingencies are not checked")
+            return report
+
+        if contingencies is None:
+            contingencies = all_branch_outages(net)
+        chunks = [
+            contingencies[start : start + self.chunk_size]
+            for start in range(0, len(contingencies), self.chunk_size)
+        ]
+
+        start = time.perf_counter()
+        if self.processes == 1 or len(chunks) <= 1:
+            base_results = {key: net[key].copy() for key in net if key.startswith("res_")}
+            _init_worker(net, self.thresholds, self.runpp_options)
+            try:
+                chunk_results = [_run_chunk(chunk) for chunk in chunks]
+            finally:
+                _init_worker(None, self.thresholds, self.runpp_options)
+                for key, table in base_results.items():
+                    net[key] = table
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(self.processes, len(chunks)),
+                initializer=_init_worker,
+                initargs=(net, self.thresholds, self.runpp_options),
+            ) as executor:
+                chunk_results = list(executor.map(_run_chunk, chunks))
+        report.duration = time.perf_counter() - start
+
+        for results in chunk_results:
+            report.results.update(results)
+        Logger.log_to_selected(report.summary())
+        return report
+
+
+def all_branch_outages(net: pandapower.pandapowerNet) -> list[Contingency]:
+    """Outages of all lines and two-winding transformers in service."""
+    return [
+        Contingency(element, int(index))
+        for element in ("line", "trafo")
+        for index in net[element].index[net[element]["in_service"].astype(bool)]
+    ]
+
+
+# state of a worker process, the network is transferred once per worker
+_worker_net: pandapower.pandapowerNet | None = None
+_worker_checker: PandapowerPlausibilityChecker | None = None
+_worker_base_results: pd.DataFrame | None = None
+
+
+def _init_worker(
+    net: pandapower.pandapowerNet | None,
+    thresholds: PlausibilityThresholds,
+    runpp_options: dict,
+) -> None:
+    global _worker_net, _worker_checker, _worker_base_results  # pylint: disable=global-statement
+    _worker_net = net
+    _worker_base_results = net.res_bus.copy() if net is not None else None
+    _worker_checker = PandapowerPlausibilityChecker(
+        thresholds, {**runpp_options, "init": "results"}
+    )
+
+
+def _run_chunk(chunk: list[Contingency]) -> dict[Contingency, PlausibilityResult]:
+    assert _worker_net is not None and _worker_checker is not None
+    assert _worker_base_results is not None
+    net = _worker_net
+    results = {}
+    for contingency in chunk:
+        table = net[contingency.element]
+        in_service = table.at[contingency.index, "in_service"]
+        table.at[contingency.index, "in_service"] = False
+        # warm start from the base case, not from the previous contingency
+        net.res_bus = _worker_base_results.copy()
+        try:
+            results[contingency] = _worker_checker.check(net)
+        finally:
+            table.at[contingency.index, "in_service"] = in_service
+    net.res_bus = _worker_base_results.copy()
+    return results
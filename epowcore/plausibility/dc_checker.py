@@ -0,0 +1,149 @@
+from pathlib import Path
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandapower
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.plausibility.checker import PlausibilityChecker, PlausibilityThresholds
+from epowcore.plausibility.dc_screening import DcScreening
+from epowcore.plausibility.pandapower_checker import PandapowerPlausibilityChecker
+from epowcore.plausibility.plausibility_result import PlausibilityResult
+
+# number of outages screened at once, bounds the memory of the dense LODF blocks
+OUTAGE_CHUNK_SIZE = 256
+
+
+class DcPlausibilityChecker(PlausibilityChecker[CoreModel | pandapower.pandapowerNet]):
+    """Fast screening of core models or pandapower networks with a DC load flow.
+
+    The B matrix is factorized once per model. Overloads are detected with the active power
+    flows against the branch ratings, optionally also for all single branch outages using
+    line outage distribution factors. Voltages are not checked.
+    """
+
+    def __init__(
+        self, contingencies: bool = False, thresholds: PlausibilityThresholds | None = None
+    ) -> None:
+        self.contingencies = contingencies
+        self.thresholds = thresholds or PlausibilityThresholds()
+
+    def check(self, model: CoreModel | pandapower.pandapowerNet) -> PlausibilityResult:
+        try:
+            if isinstance(model, CoreModel):
+                screening = DcScreening.from_core_model(model)
+            else:
+                screening = DcScreening.from_pandapower(model)
+        except (ValueError, RuntimeError, UserWarning) as exc:
+            result = PlausibilityResult()
+            result.errors.append(str(exc))
+            return result
+        return self.check_screening(screening)
+
+    def check_screening(self, screening: DcScreening) -> PlausibilityResult:
+        """Run the checks on an already factorized DC model."""
+        result = PlausibilityResult(converged=True)
+
+        unsupplied = ~screening.supplied[screening.bus_index]
+        if np.any(unsupplied):
+            islands = screening.island[screening.bus_index[unsupplied]]
+            bus_ids = screening.bus_ids[unsupplied]
+            result.isolated_areas = [
+                sorted(int(bus) for bus in bus_ids[islands == island])
+                for island in np.unique(islands)
+            ]
+
+        flows = screening.flows()
+        named = screening.branch_ids >= 0
+        with np.errstate(invalid="ignore"):
+            loading = np.abs(flows) / screening.rating_mva * 100.0
+        for index in np.flatnonzero(named & (loading > self.thresholds.max_loading_percent)):
+            self._add_overload(result, screening, index, float(loading[index]))
+
+        if self.contingencies:
+            self._screen_contingencies(result, screening, flows)
+        return result
+
+    def _screen_contingencies(
+        self, result: PlausibilityResult, screening: DcScreening, flows: np.ndarray
+    ) -> None:
+        """Add the overloads after single outages of supplied, named branches."""
+        named = screening.branch_ids >= 0
+        candidates = np.flatnonzero(named & (screening.b != 0) & ~np.isnan(flows))
+        monitored = named & ~np.isnan(screening.rating_mva)
+        for start in range(0, len(candidates), OUTAGE_CHUNK_SIZE):
+            outages = candidates[start : start + OUTAGE_CHUNK_SIZE]
+            lodf = screening.lodf(outages)[monitored]
+            with np.errstate(invalid="ignore"):
+                post_flows = flows[monitored, None] + lodf * flows[outages]
+                loading = np.abs(post_flows) / screening.rating_mva[monitored, None] * 100.0
+            # outages that split the grid are NaN and not reported
+            rows, columns = np.nonzero(loading > self.thresholds.max_loading_percent)
+            branches = np.flatnonzero(monitored)[rows]
+            for branch, column, value in zip(branches, columns, loading[rows, columns]):
+                if branch != outages[column]:
+                    self._add_overload(
+                        result,
+                        screening,
+                        branch,
+                        float(value),
+                        contingency=int(screening.branch_ids[outages[column]]),
+                    )
+
+    @staticmethod
+    def _add_overload(
+        result: PlausibilityResult,
+        screening: DcScreening,
+        index: int,
+        loading_percent: float,
+        contingency: int | None = None,
+    ) -> None:
+        if screening.branch_is_transformer[index]:
+            entry: dict = {"transformer_index": int(screening.branch_ids[index])}
+            overloads = result.overloaded_transformers
+        else:
+            entry = {"line_index": int(screening.branch_ids[index])}
+            overloads = result.overloaded_lines
+        entry["loading_percent"] = loading_percent
+        if contingency is not None:
+            entry["contingency"] = contingency
+        overloads.append(entry)
+
+    def plot_isolated_areas(
+        self,
+        model: CoreModel | pandapower.pandapowerNet,
+        result: PlausibilityResult,
+        filepath: Path,
+    ) -> None:
+        if not isinstance(model, CoreModel):
+            PandapowerPlausibilityChecker().plot_isolated_areas(model, result, filepath)
+            return
+        if not result.isolated_areas:
+            return
+
+        buses = {bus.uid: bus for bus in model.type_list(Bus)}
+        fig, ax = plt.subplots()
+        for area_number, area in enumerate(result.isolated_areas, start=1):
+            points: list[tuple[int, tuple[float, float]]] = []
+            for uid in area:
+                bus = buses.get(uid)
+                if bus is not None and isinstance(bus.coords, tuple):
+                    points.append((uid, bus.coords))
+            if not points:
+                continue
+            for uid, (x_value, y_value) in points:
+                ax.annotate(str(uid), (x_value, y_value))
+            ax.scatter(
+                [coords[0] for _, coords in points],
+                [coords[1] for _, coords in points],
+                label=f"Isolated area {area_number}",
+            )
+
+        ax.set_title("Isolated network areas")
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        if ax.has_data():
+            ax.legend()
+        fig.savefig(filepath)
+        plt.close(fig)
@@ -0,0 +1,330 @@
+from copy import deepcopy
+from dataclasses import dataclass, field
+
+import numpy as np
+import numpy.typing as npt
+import pandapower
+import scipy.sparse as sp
+from pandapower.auxiliary import _init_rundcpp_options
+from pandapower.pd2ppc import _pd2ppc
+from pandapower.pypower.idx_brch import BR_STATUS, BR_X, F_BUS, SHIFT, T_BUS, TAP
+from pandapower.pypower.idx_bus import BUS_TYPE, GS, NONE, REF
+from pandapower.pypower.makeSbus import makeSbus
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.generic.logger import Logger
+from epowcore.generic.manipulation.flatten import flatten
+from epowcore.loadflow.ac_loadflow import ISO, SL, build_bus_data
+from epowcore.loadflow.admittance import build_admittance
+
+MIN_REACTANCE = 1e-6
+"""Reactance of branches without reactance in the DC approximation [p.u.]"""
+
+
+@dataclass
+class DcScreening:
+    """DC approximation of a grid with the B matrix factorized once.
+
+    Branch flows, PTDFs and LODFs are computed with sparse solves on the factorization.
+    Buses that are not connected to a slack bus are excluded from the calculation.
+    """
+
+    bus_ids: npt.NDArray[np.int64]
+    """Id of each bus of the source model (uid or pandapower index)."""
+    bus_index: npt.NDArray[np.int64]
+    """Index of the DC bus of each bus of the source model. Buses may share a DC bus."""
+    branch_ids: npt.NDArray[np.int64]
+    """Id of each branch of the source model (uid or pandapower index)."""
+    branch_is_transformer: npt.NDArray[np.bool_]
+    """Whether a branch is a transformer."""
+    from_bus: npt.NDArray[np.int64]
+    """DC bus at the from end of each branch."""
+    to_bus: npt.NDArray[np.int64]
+    """DC bus at the to end of each branch."""
+    b: npt.NDArray[np.float64]
+    """Series susceptance of each branch, 0 for branches out of service [p.u.]"""
+    shift: npt.NDArray[np.float64]
+    """Phase shift of each branch [rad]"""
+    rating_mva: npt.NDArray[np.float64]
+    """Rating of each branch, NaN if unknown or unlimited. Ratings <= 0 mean unlimited [MVA]"""
+    p_injection: npt.NDArray[np.float64]
+    """Active power injection of each DC bus [p.u.]"""
+    slack: npt.NDArray[np.bool_]
+    """Whether a DC bus is a slack bus."""
+    base_mva: float
+    """Base power of the p.u. values [MVA]"""
+
+    island: npt.NDArray[np.int64] = field(init=False)
+    """Label of the connected area of each DC bus."""
+    supplied: npt.NDArray[np.bool_] = field(init=False)
+    """Whether a DC bus is connected to a slack bus."""
+    bf: sp.csr_matrix = field(init=False)
+    """Branch flows per bus angle."""
+
+    def __post_init__(self) -> None:
+        # a rating of 0 is unlimited in MATPOWER, such branches are not monitored
+        with np.errstate(invalid="ignore"):
+            self.rating_mva = np.where(self.rating_mva > 0, self.rating_mva, np.nan)
+        num_buses = len(self.slack)
+        num_branches = len(self.b)
+        rows = np.concatenate([np.arange(num_branches), np.arange(num_branches)])
+        incidence = sp.csr_matrix(
+            (
+                np.concatenate([np.ones(num_branches), -np.ones(num_branches)]),
+                (rows, np.concatenate([self.from_bus, self.to_bus])),
+            ),
+            shape=(num_branches, num_buses),
+        )
+        self.bf = (sp.diags(self.b) @ incidence).tocsr()
+        bbus = (incidence.T @ self.bf).tocsc()
+
+        in_service = self.b != 0
+        _, self.island = connected_components(
+            sp.csr_matrix(
+                (
+                    np.ones(np.count_nonzero(in_service)),
+                    (self.from_bus[in_service], self.to_bus[in_service]),
+                ),
+                shape=(num_buses, num_buses),
+            ),
+            directed=False,
+        )
+        self.supplied = np.isin(self.island, self.island[self.slack])
+
+        # the angles of all slack buses are fixed, the remaining buses are solved
+        self._solved = np.flatnonzero(self.supplied & ~self.slack)
+        self._position = np.full(num_buses, -1)
+        self._position[self._solved] = np.arange(len(self._solved))
+        self._lu = splu(bbus[self._solved][:, self._solved].tocsc()) if len(self._solved) else None
+        self._pfinj = -self.b * self.shift
+        self._pbusinj = incidence.T @ self._pfinj
+
+    def _solve(self, rhs: npt.NDArray[np.float64]) -> npt.NDArray[np.float64]:
+        """Solve the reduced B matrix for one or more right-hand sides of the solved buses."""
+        if self._lu is None:
+            return np.zeros_like(rhs)
+        return self._lu.solve(rhs)
+
+    def angles(self, p_injection: npt.NDArray[np.float64] | None = None) -> npt.NDArray[np.float64]:
+        """Bus voltage angles of the DC load flow.
+
+        :param p_injection: Active power injections of the DC buses [p.u.], defaults to the
+                            injections of the model
+        :type p_injection: npt.NDArray[np.float64] | None, optional
+        :return: The voltage angle of each DC bus, NaN for unsupplied buses [rad]
+        :rtype: npt.NDArray[np.float64]
+        """
+        if p_injection is None:
+            p_injection = self.p_injection
+        va = np.where(self.supplied, 0.0, np.nan)
+        va[self._solved] = self._solve((p_injection - self._pbusinj)[self._solved])
+        return va
+
+    def flows(self, p_injection: npt.NDArray[np.float64] | None = None) -> npt.NDArray[np.float64]:
+        """Active power flows of the branches in the DC load flow.
+
+        :param p_injection: Active power injections of the DC buses [p.u.], defaults to the
+                            injections of the model
+        :type p_injection: npt.NDArray[np.float64] | None, optional
+        :return: The flow of each branch from the from to the to end, NaN for unsupplied
+                 branches [MW]
+        :rtype: npt.NDArray[np.float64]
+        """
+        va = np.nan_to_num(self.angles(p_injection))
+        flows = (self.bf @ va + self._pfinj) * self.base_mva
+        flows[~self.supplied[self.from_bus]] = np.nan
+        return flows
+
+    def ptdf(self, branches: npt.ArrayLike | None = None) -> npt.NDArray[np.float64]:
+        """Power transfer distribution factors of the given branches.
+        The injections are balanced by the slack buses.
+
+        :param branches: Indices of the monitored branches, defaults to all branches
+        :type branches: npt.ArrayLike | None, optional
+        :return: Dense matrix of the change of the branch flows (rows) per injection at each
+                 DC bus (columns). Columns of slack and unsupplied buses are 0.
+        :rtype: npt.NDArray[np.float64]
+        """
+        bf = self.bf if branches is None else self.bf[np.asarray(branches)]
+        ptdf = np.zeros(bf.shape)
+        # B is symmetric, so the rows of Bf * B^-1 are solves with the rows of Bf
+        ptdf[:, self._solved] = self._solve(bf[:, self._solved].T.toarray()).T
+        return ptdf
+
+    def lodf(self, outages: npt.ArrayLike | None = None) -> npt.NDArray[np.float64]:
+        """Line outage distribution factors of the given branch outages.
+
+        :param outages: Indices of the outaged branches, defaults to all branches
+        :type outages: npt.ArrayLike | None, optional
+        :return: Dense matrix of the change of the flows of all branches (rows) per flow of the
+                 outaged branch before the outage (columns). Columns of outages that split the
+                 grid are NaN.
+        :rtype: npt.NDArray[np.float64]
+        """
+        outages = np.arange(len(self.b)) if outages is None else np.asarray(outages)
+        # transfer of one unit from the from to the to bus of each outaged branch
+        transfer = np.zeros((len(self._solved), len(outages)))
+        columns = np.arange(len(outages))
+        for buses, sign in ((self.from_bus[outages], 1.0), (self.to_bus[outages], -1.0)):
+            position = self._position[buses]
+            valid = position >= 0
+            transfer[position[valid], columns[valid]] = sign
+        va = np.zeros((len(self.slack), len(outages)))
+        va[self._solved] = self._solve(transfer)
+        flows = self.bf @ va
+
+        own_flow = flows[outages, columns]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            lodf = flows / (1.0 - own_flow)
+        lodf[:, np.isclose(own_flow, 1.0)] = np.nan
+        lodf[outages, columns] = -1.0
+        return lodf
+
+    @classmethod
+    def from_core_model(cls, core_model: CoreModel) -> "DcScreening":
+        """Build the DC model of a core model. Subsystems are flattened on a copy.
+
+        :param core_model: The core model.
+        :type core_model: CoreModel
+        :raises ValueError: Raised if there is no slack bus.
+        :return: The factorized DC model.
+        :rtype: DcScreening
+        """
+        if core_model.type_list(Subsystem):
+            core_model = deepcopy(core_model)
+            flatten(core_model)
+        admittance = build_admittance(core_model)
+        bus_data = build_bus_data(core_model, admittance)
+
+        branches: list[TLine | TwoWindingTransformer] = [
+            *core_model.type_list(TLine),
+            *core_model.type_list(TwoWindingTransformer),
+        ]
+        components = {branch.uid: branch for branch in branches}
+        ratings = np.full(len(admittance.branch_uids), np.nan)
+        is_transformer = np.zeros(len(admittance.branch_uids), dtype=bool)
+        for i, uid in enumerate(admittance.branch_uids):
+            match components.get(uid):
+                case TLine() as line:
+                    ratings[i] = line.rating * line.parallel_lines
+                case TwoWindingTransformer() as transformer:
+                    ratings[i] = transformer.rating
+                    is_transformer[i] = True
+
+        num_buses = len(admittance.bus_numbering)
+        # isolated buses are not solved
+        with np.errstate(divide="ignore", invalid="ignore"):
+            x = np.imag(1 / admittance.ys)
+        b = _susceptance(x, admittance.branch_uids) / np.abs(admittance.tap)
+        isolated = bus_data.bus_type == ISO
+        b[isolated[admittance.from_bus] | isolated[admittance.to_bus]] = 0.0
+        return cls(
+            bus_ids=np.array(admittance.bus_numbering.uids, dtype=np.int64),
+            bus_index=np.arange(num_buses),
+            branch_ids=np.asarray(admittance.branch_uids, dtype=np.int64),
+            branch_is_transformer=is_transformer,
+            from_bus=admittance.from_bus,
+            to_bus=admittance.to_bus,
+            b=b,
+            shift=np.angle(admittance.tap),
+            rating_mva=ratings,
+            p_injection=bus_data.s_injection.real - admittance.ysh.real,
+            slack=bus_data.bus_type == SL,
+            base_mva=core_model.base_mva_fb(),
+        )
+
+    @classmethod
+    def from_pandapower(cls, net: pandapower.pandapowerNet) -> "DcScreening":
+        """Build the DC model of a pandapower network from its MATPOWER representation.
+        Only lines and two-winding transformers are reported as branches, their ratings are
+        taken from `max_i_ka` and `sn_mva`.
+        Buses connected by closed bus-bus switches share a DC bus.
+
+        :param net: The pandapower network.
+        :type net: pandapower.pandapowerNet
+        :return: The factorized DC model.
+        :rtype: DcScreening
+        """
+        _init_rundcpp_options(
+            net,
+            trafo_model="t",
+            trafo_loading="current",
+            recycle=None,
+            check_connectivity=False,
+            switch_rx_ratio=2,
+            trafo3w_losses="hv",
+            numba=False,
+        )
+        ppc, _ = _pd2ppc(net)
+        lookups = net._pd2ppc_lookups
+
+        branch = ppc["branch"]
+        tap = np.real(branch[:, TAP])
+        tap[tap == 0] = 1.0
+        in_service = np.real(branch[:, BR_STATUS]) > 0
+        x = np.where(in_service, np.real(branch[:, BR_X]), 1.0)
+        b = np.where(in_service, _susceptance(x, np.arange(len(branch))) / tap, 0.0)
+        bus_type = np.real(ppc["bus"][:, BUS_TYPE])
+        isolated = bus_type == NONE
+        from_bus = np.real(branch[:, F_BUS]).astype(np.int64)
+        to_bus = np.real(branch[:, T_BUS]).astype(np.int64)
+        b[isolated[from_bus] | isolated[to_bus]] = 0.0
+
+        branch_ids = []
+        positions = []
+        ratings = []
+        is_transformer = []
+        for element in ("line", "trafo"):
+            if element not in lookups["branch"]:
+                continue
+            start, end = lookups["branch"][element]
+            table = net[element]
+            branch_ids.append(table.index.to_numpy())
+            positions.append(np.arange(start, end))
+            is_transformer.append(np.full(end - start, element == "trafo"))
+            if element == "line":
+                vn_kv = net.bus.vn_kv.loc[table.from_bus].to_numpy()
+                ratings.append(np.sqrt(3) * vn_kv * table.max_i_ka * table.df * table.parallel)
+            else:
+                ratings.append(table.sn_mva * table.parallel)
+        # other branches like switches and three-winding transformers are kept unnamed
+        selected = np.concatenate(positions) if positions else np.zeros(0, dtype=np.int64)
+        order = np.concatenate([selected, np.setdiff1d(np.arange(len(branch)), selected)])
+        num_unnamed = len(order) - len(selected)
+
+        s_bus = makeSbus(ppc["baseMVA"], ppc["bus"], ppc["gen"])
+        return cls(
+            bus_ids=net.bus.index.to_numpy(dtype=np.int64),
+            bus_index=lookups["bus"][net.bus.index.to_numpy()],
+            branch_ids=np.concatenate([*branch_ids, np.full(num_unnamed, -1)]).astype(np.int64),
+            branch_is_transformer=np.concatenate(
+                [*is_transformer, np.zeros(num_unnamed, dtype=bool)]
+            ),
+            from_bus=from_bus[order],
+            to_bus=to_bus[order],
+            b=b[order],
+            shift=np.deg2rad(np.real(branch[order, SHIFT])),
+            rating_mva=np.concatenate([*ratings, np.full(num_unnamed, np.nan)]).astype(float),
+            p_injection=np.real(s_bus) - np.real(ppc["bus"][:, GS]) / ppc["baseMVA"],
+            slack=(bus_type == REF) & ~isolated,
+            base_mva=float(ppc["baseMVA"]),
+        )
+
+
+def _susceptance(x: npt.NDArray[np.float64], branch_ids: npt.ArrayLike) -> npt.NDArray[np.float64]:
+    """DC susceptance of branches with the reactances [x] [p.u.]. Branches without reactance
+    get `MIN_REACTANCE` instead of an infinite susceptance."""
+    invalid = ~(np.abs(x) >= MIN_REACTANCE)
+    if np.any(invalid):
+        ids = np.asarray(branch_ids)[invalid]
+        Logger.log_to_selected(
+            f"{len(ids)} branches without reactance get {MIN_REACTANCE} p.u. in the DC "
+            f"approximation: {', '.join(str(i) for i in ids[:10])}"
+        )
+        x = np.where(invalid, MIN_REACTANCE, x)
+    return 1 / x
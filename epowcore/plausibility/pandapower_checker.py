@@ -1,12 +1,16 @@
-import json
 from pathlib import Path
 
 import matplotlib.pyplot as plt
 import networkx
 import pandapower
+import pandas as pd
 from pandapower.topology import create_nxgraph, unsupplied_buses
 
-from epowcore.plausibility.checker import PlausibilityChecker
+from epowcore.pandapower.utils import bus_coordinates
+from epowcore.plausibility.checker import (
+    PlausibilityChecker,
+    PlausibilityThresholds,
+)
 from epowcore.plausibility.plausibility_result import PlausibilityResult
 
 
@@ -15,6 +19,14 @@ class PandapowerPlausibilityChecker(
 ):
     """Run plausibility checks on a pandapower network."""
 
+    def __init__(
+        self,
+        thresholds: PlausibilityThresholds | None = None,
+        runpp_options: dict | None = None,
+    ) -> None:
+        self.thresholds = thresholds or PlausibilityThresholds()
+        self.runpp_options = runpp_options or {}
+
     def check(
         self,
         model: pandapower.pandapowerNet,
@@ -45,7 +57,7 @@ class PandapowerPlausibilityChecker(
             ]
 
         try:
-            pandapower.runpp(net)
+            pandapower.runpp(net, **self.runpp_options)
             result.converged = bool(net.converged)
         except Exception as exc:
             result.errors.append(str(exc))
@@ -54,47 +66,47 @@ class PandapowerPlausibilityChecker(
         if not result.converged:
             return result
 
-        for bus_index, row in net.res_bus.iterrows():
-            vm_pu = float(row["vm_pu"])
-
-            if vm_pu < 0.8 or vm_pu > 1.2:
-                result.hard_voltage_violations.append(
-                    {
-                        "bus_index": int(bus_index),
-                        "vm_pu": vm_pu,
-                    }
-                )
-            elif vm_pu < 0.9 or vm_pu > 1.1:
-                result.soft_voltage_violations.append(
-                    {
-                        "bus_index": int(bus_index),
-                        "vm_pu": vm_pu,
-                    }
-                )
+        for name, table in self.violation_tables(net).items():
+            setattr(result, name, table.to_dict("records"))
 
-        for line_index, row in net.res_line.iterrows():
-            loading_percent = float(row["loading_percent"])
-
-            if loading_percent > 100.0:
-                result.overloaded_lines.append(
-                    {
-                        "line_index": int(line_index),
-                        "loading_percent": loading_percent,
-                    }
-                )
-
-        for transformer_index, row in net.res_trafo.iterrows():
-            loading_percent = float(row["loading_percent"])
+        return result
 
-            if loading_percent > 100.0:
-                result.overloaded_transformers.append(
-                    {
-                        "transformer_index": int(transformer_index),
-                        "loading_percent": loading_percent,
-                    }
-                )
+    def violation_tables(
+        self,
+        net: pandapower.pandapowerNet,
+    ) -> dict[str, pd.DataFrame]:
+        """Classify the results of a converged load flow.
+
+        :param net: The pandapower network with load flow results.
+        :type net: pandapower.pandapowerNet
+        :return: One table per violation type, keyed by the field name in `PlausibilityResult`.
+        :rtype: dict[str, pd.DataFrame]
+        """
+        thresholds = self.thresholds
+
+        vm_pu = net.res_bus["vm_pu"].astype(float)
+        hard = (vm_pu < thresholds.hard_vm_min_pu) | (vm_pu > thresholds.hard_vm_max_pu)
+        soft = ~hard & (
+            (vm_pu < thresholds.soft_vm_min_pu) | (vm_pu > thresholds.soft_vm_max_pu)
+        )
 
-        return result
+        line_loading = net.res_line["loading_percent"].astype(float)
+        trafo_loading = net.res_trafo["loading_percent"].astype(float)
+
+        return {
+            "hard_voltage_violations": _violation_table(vm_pu[hard], "bus_index", "vm_pu"),
+            "soft_voltage_violations": _violation_table(vm_pu[soft], "bus_index", "vm_pu"),
+            "overloaded_lines": _violation_table(
+                line_loading[line_loading > thresholds.max_loading_percent],
+                "line_index",
+                "loading_percent",
+            ),
+            "overloaded_transformers": _violation_table(
+                trafo_loading[trafo_loading > thresholds.max_loading_percent],
+                "transformer_index",
+                "loading_percent",
+            ),
+        }
 
     def plot_isolated_areas(
         self,
@@ -107,44 +119,29 @@ class PandapowerPlausibilityChecker(
         if not result.isolated_areas:
             return
 
+        coordinates = bus_coordinates(net)
         fig, ax = plt.subplots()
 
         for area_number, area in enumerate(
             result.isolated_areas,
             start=1,
         ):
-            x_values = []
-            y_values = []
-
-            for bus_index in area:
-                geo_value = net.bus.at[bus_index, "geo"]
-
-                if not geo_value:
-                    continue
+            area_coordinates = coordinates.reindex(area).dropna()
 
-                geo_data = json.loads(geo_value)
-                coordinates = geo_data.get("coordinates")
-
-                if not coordinates or len(coordinates) < 2:
-                    continue
-
-                x_value = float(coordinates[0])
-                y_value = float(coordinates[1])
-
-                x_values.append(x_value)
-                y_values.append(y_value)
+            if area_coordinates.empty:
+                continue
 
+            for bus_index, x_value, y_value in area_coordinates.itertuples():
                 ax.annotate(
                     str(bus_index),
                     (x_value, y_value),
                 )
 
-            if x_values:
-                ax.scatter(
-                    x_values,
-                    y_values,
-                    label=f"Isolated area {area_number}",
-                )
+            ax.scatter(
+                area_coordinates["x"],
+                area_coordinates["y"],
+                label=f"Isolated area {area_number}",
+            )
 
         ax.set_title("Isolated network areas")
         ax.set_xlabel("x")
@@ -154,4 +151,18 @@ class PandapowerPlausibilityChecker(
             ax.legend()
 
         fig.savefig(filepath)
-        plt.close(fig)
\ No newline at end of file
+        plt.close(fig)
+
+
+def _violation_table(
+    values: pd.Series,
+    index_name: str,
+    value_name: str,
+) -> pd.DataFrame:
+    """Columnar table of the violating elements and their values."""
+    return pd.DataFrame(
+        {
+            index_name: values.index.to_numpy(dtype=int),
+            value_name: values.to_numpy(dtype=float),
+        }
+    )
@@ -30,6 +30,8 @@ def create_bus(self, bus: Bus) -> bool:
     pf_bus.SetAttribute("uknom", bus.nominal_voltage)
     pf_bus.SetAttribute("iUsage", bus_type[bus.bus_type])
     pf_bus.SetAttribute("systype", 0)  # 0: AC
+    # Register the bus, so that the elements are connected without searching the grid
+    self.pf_components.setdefault(bus.name, pf_bus)
     if bus.coords is not None:
         pf_bus.GPSlon = bus.coords[1]
         pf_bus.GPSlat = bus.coords[0]
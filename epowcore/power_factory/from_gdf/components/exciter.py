@@ -21,7 +21,7 @@ def create_ieee_st1a(self, exciter: IEEEST1A, parent: pf.DataObject) -> pf.DataO
     else:
         pf_exciter = parent.CreateObject("ElmDsl")
 
-    pf_exciter_type = self.pf_digsilent_library.GetContents("exc_IEEE_ST1A.BlkDef", 1)[0]
+    pf_exciter_type = self.get_library_object("exc_IEEE_ST1A.BlkDef")
     pf_exciter.SetAttribute("typ_id", pf_exciter_type)
 
     params = [
@@ -60,13 +60,6 @@ def create_synchronous_machine(self, gen: SynchronousMachine) -> bool:
     
     pf_gen.SetAttribute("bus1", add_cubicle_to_bus(pf_gen_bus))
 
-    # Get generator types folder
-    pf_gen_type_lib = self.pf_type_library.SearchObject(
-        self.pf_type_library.GetFullName() + "\\Generator Types"
-    )
-    # Create new gen type
-    pf_gen_type = pf_gen_type_lib.CreateObject("TypSym", gen.name + "_type")
-
     # Create generator power plant
     pf_power_plant = self.pf_grid.CreateObject("ElmComp", gen.name + " Power Plant")
 
@@ -82,44 +75,51 @@ def create_synchronous_machine(self, gen: SynchronousMachine) -> bool:
     pf_power_plant_pelm = []
     pf_power_plant_pblk = []
     
-    pf_power_plant_pblk.append(self.pf_digsilent_library.GetContents("Sym Slot.BlkSlot", 1)[0])
+    pf_power_plant_pblk.append(self.get_library_object("Sym Slot.BlkSlot"))
     pf_power_plant_pelm.append(pf_gen)
 
     for exciter in exciters:
-        pf_power_plant_pblk.append(self.pf_digsilent_library.GetContents("Avr Slot.BlkSlot", 1)[0])
+        pf_power_plant_pblk.append(self.get_library_object("Avr Slot.BlkSlot"))
         pf_power_plant_pelm.append(create_exciter(self, exciter, pf_power_plant))
 
     for governor in governors:
-        pf_power_plant_pblk.append(self.pf_digsilent_library.GetContents("Gov Slot.BlkSlot", 1)[0])
+        pf_power_plant_pblk.append(self.get_library_object("Gov Slot.BlkSlot"))
         pf_power_plant_pelm.append(create_governor(self, governor, pf_power_plant))
 
     for pss in power_system_stabilizers:
-        pf_power_plant_pblk.append(self.pf_digsilent_library.GetContents("Pss Slot.BlkSlot", 1)[0])
+        pf_power_plant_pblk.append(self.get_library_object("Pss Slot.BlkSlot"))
         pf_power_plant_pelm.append(create_pss(self, pss, pf_power_plant))
 
     pf_power_plant.SetAttribute("pblk", pf_power_plant_pblk)
     pf_power_plant.SetAttribute("pelm", pf_power_plant_pelm)
 
-    # Set attributes for newly crated gen type
-    pf_gen_type.SetAttribute("sgn", gen.rated_apparent_power)
-    pf_gen_type.SetAttribute("ugn", gen.rated_voltage)
-    pf_gen_type.SetAttribute("h", gen.inertia_constant)
-    pf_gen_type.SetAttribute("r0sy", gen.zero_sequence_resistance)
-    pf_gen_type.SetAttribute("x0sy", gen.zero_sequence_reactance)
-    pf_gen_type.SetAttribute("xl", gen.stator_leakage_reactance)
-    pf_gen_type.SetAttribute("rstr", gen.stator_resistance)
-    pf_gen_type.SetAttribute("xd", gen.synchronous_reactance_x)
-    pf_gen_type.SetAttribute("xds", gen.transient_reactance_x)
-    pf_gen_type.SetAttribute("xdss", gen.subtransient_reactance_x)
-    pf_gen_type.SetAttribute("xq", gen.synchronous_reactance_q)
-    pf_gen_type.SetAttribute("xqs", gen.transient_reactance_q)
-    pf_gen_type.SetAttribute("xqss", gen.subtransient_reactance_q)
-    pf_gen_type.SetAttribute("tds0", gen.tds0)
-    pf_gen_type.SetAttribute("tqs0", gen.tqs0)
-    pf_gen_type.SetAttribute("tdss0", gen.tdss0)
-    pf_gen_type.SetAttribute("tqss0", gen.tqss0)
-    pf_gen_type.SetAttribute("Q_min", gen.q_min)
-    pf_gen_type.SetAttribute("Q_max", gen.q_max)
+    # Generators with equal parameters share one generator type
+    pf_gen_type = self.types.get(
+        "Generator Types",
+        "TypSym",
+        gen.name + "_type",
+        {
+            "sgn": gen.rated_apparent_power,
+            "ugn": gen.rated_voltage,
+            "h": gen.inertia_constant,
+            "r0sy": gen.zero_sequence_resistance,
+            "x0sy": gen.zero_sequence_reactance,
+            "xl": gen.stator_leakage_reactance,
+            "rstr": gen.stator_resistance,
+            "xd": gen.synchronous_reactance_x,
+            "xds": gen.transient_reactance_x,
+            "xdss": gen.subtransient_reactance_x,
+            "xq": gen.synchronous_reactance_q,
+            "xqs": gen.transient_reactance_q,
+            "xqss": gen.subtransient_reactance_q,
+            "tds0": gen.tds0,
+            "tqs0": gen.tqs0,
+            "tdss0": gen.tdss0,
+            "tqss0": gen.tqss0,
+            "Q_min": gen.q_min,
+            "Q_max": gen.q_max,
+        },
+    )
 
     # Set attributes of the generator itself
     pf_gen.SetAttribute("pgini", gen.rated_active_power)
@@ -139,7 +139,7 @@ def create_synchronous_machine(self, gen: SynchronousMachine) -> bool:
         pf_gen.GPSlon = gen.coords[1]
         pf_gen.GPSlat = gen.coords[0]
 
-    # Set gen type attribute to the newly crated gen type
+    # Set gen type attribute to the shared gen type
     pf_gen.SetAttribute("typ_id", pf_gen_type)
 
     return True
@@ -20,7 +20,7 @@ def create_ieee_g1(self, governor: IEEEG1, parent: pf.DataObject) -> pf.DataObje
     else:
         pf_governor = parent.CreateObject("ElmDsl")
     
-    pf_governor_type = self.pf_digsilent_library.GetContents("gov_IEEE_IEEEG1.BlkDef", 1)[0]
+    pf_governor_type = self.get_library_object("gov_IEEE_IEEEG1.BlkDef")
     pf_governor.SetAttribute("typ_id", pf_governor_type)
     params = [
         governor.PNhp,
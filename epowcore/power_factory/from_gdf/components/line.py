@@ -46,23 +46,24 @@ def create_line(self, tline: TLine) -> bool:
     def zero_sequence_transform(a):
         return 0 if a is None else a
 
-    # Get line types folder
-    pf_line_type_lib = self.pf_type_library.SearchObject(
-        self.pf_type_library.GetFullName() + "\\Line Types"
-    )
-    # Create new type
-    pf_line_type = pf_line_type_lib.CreateObject("TypLne", tline.name + "_type")
-    # Set attributes for line type of line
-    pf_line_type.SetAttribute("rline", tline.r1)
-    pf_line_type.SetAttribute("xline", tline.x1)
-    pf_line_type.SetAttribute("bline", tline.b1)
     # Standard type cables for low voltage grids have a rating of 1kV
     rating_from_bus = pf_from_bus.GetAttribute("uknom")  # kV
-    pf_line_type.SetAttribute("uline", rating_from_bus)
-    pf_line_type.SetAttribute("sline", tline.rating / rating_from_bus)
-    pf_line_type.SetAttribute("rline0", zero_sequence_transform(tline.r0))
-    pf_line_type.SetAttribute("xline0", zero_sequence_transform(tline.x0))
-    pf_line_type.SetAttribute("bline0", zero_sequence_transform(tline.b0))
+    # Lines with equal parameters share one line type
+    pf_line_type = self.types.get(
+        "Line Types",
+        "TypLne",
+        tline.name + "_type",
+        {
+            "rline": tline.r1,
+            "xline": tline.x1,
+            "bline": tline.b1,
+            "uline": rating_from_bus,
+            "sline": tline.rating / rating_from_bus,
+            "rline0": zero_sequence_transform(tline.r0),
+            "xline0": zero_sequence_transform(tline.x0),
+            "bline0": zero_sequence_transform(tline.b0),
+        },
+    )
 
     # Set attributes of line itself
     pf_line.SetAttribute("nlnum", tline.parallel_lines)
@@ -70,7 +71,7 @@ def create_line(self, tline: TLine) -> bool:
     pf_line.SetAttribute("loc_name", tline.name)
     if tline.coords is not None:
         pf_line.GPScoords = [[coords[0], coords[1]] for coords in tline.coords]
-    # Set line type attribut to the newly crated line type
+    # Set line type attribute to the shared line type
     pf_line.SetAttribute("typ_id", pf_line_type)
 
     return True
\ No newline at end of file
@@ -21,7 +21,7 @@ def create_ieee_pss1a(self, pss: IEEEPSS1A, parent: pf.DataObject) -> pf.DataObj
     else:
         pf_pss = parent.CreateObject("ElmDsl")
 
-    pf_pss_type = self.pf_digsilent_library.GetContents("pss_IEEE_PSS1A.BlkDef", 1)[0]
+    pf_pss_type = self.get_library_object("pss_IEEE_PSS1A.BlkDef")
     pf_pss.SetAttribute("typ_id", pf_pss_type)
     vsi_in_dict = {
         PSS1AInputSelector.P_GEN: 0,
@@ -65,44 +65,38 @@ def create_three_wdg_trafo(self, trafo: ThreeWindingTransformer) -> bool:
     pf_trafo.SetAttribute("busmv", add_cubicle_to_bus(pf_mv_bus))
     pf_trafo.SetAttribute("buslv", add_cubicle_to_bus(pf_lv_bus))
 
-    # Get transformer types folder
-    pf_trafo_type_lib = self.pf_type_library.SearchObject(
-        self.pf_type_library.GetFullName() + "\\Transformer Types"
+    # Transformers with equal parameters share one transformer type
+    pf_trafo_type = self.types.get(
+        "Transformer Types",
+        "TypTr3",
+        trafo.name + "_type",
+        {
+            "strn3_h": trafo.rating_hv,
+            "strn3_m": trafo.rating_mv,
+            "strn3_l": trafo.rating_lv,
+            "utrn3_h": trafo.voltage_hv,
+            "utrn3_m": trafo.voltage_mv,
+            "utrn3_l": trafo.voltage_lv,
+            "x1_hm": trafo.x1pu_h,
+            "x1_ml": trafo.x1pu_m,
+            "x1_lh": trafo.x1pu_l,
+            "r1_hm": trafo.r1pu_h,
+            "r1_ml": trafo.r1pu_m,
+            "r1_lh": trafo.r1pu_l,
+            "pfe_kw": trafo.pfe_kw,
+            "curm3": trafo.no_load_current,
+            "tr3cn_h": REVERSE_WINDING_CONFIG_MAPPING[trafo.connection_type_hv],
+            "tr3cn_m": REVERSE_WINDING_CONFIG_MAPPING[trafo.connection_type_mv],
+            "tr3cn_l": REVERSE_WINDING_CONFIG_MAPPING[trafo.connection_type_lv],
+            "nt3ag_h": trafo.phase_shift_30_hv,
+            "nt3ag_m": trafo.phase_shift_30_mv,
+            "nt3ag_l": trafo.phase_shift_30_lv,
+        },
     )
-    # Create new trafo type
-    pf_trafo_type = pf_trafo_type_lib.CreateObject("TypTr3", trafo.name + "_type")
-
-    # Set attributes of the newly created trafo type
-    pf_trafo_type.SetAttribute("strn3_h", trafo.rating_hv)
-    pf_trafo_type.SetAttribute("strn3_m", trafo.rating_mv)
-    pf_trafo_type.SetAttribute("strn3_l", trafo.rating_lv)
-    pf_trafo_type.SetAttribute("utrn3_h", trafo.voltage_hv)
-    pf_trafo_type.SetAttribute("utrn3_m", trafo.voltage_mv)
-    pf_trafo_type.SetAttribute("utrn3_l", trafo.voltage_lv)
-    pf_trafo_type.SetAttribute("x1_hm", trafo.x1pu_h)
-    pf_trafo_type.SetAttribute("x1_ml", trafo.x1pu_m)
-    pf_trafo_type.SetAttribute("x1_lh", trafo.x1pu_l)
-    pf_trafo_type.SetAttribute("r1_hm", trafo.r1pu_h)
-    pf_trafo_type.SetAttribute("r1_ml", trafo.r1pu_m)
-    pf_trafo_type.SetAttribute("r1_lh", trafo.r1pu_l)
-    pf_trafo_type.SetAttribute("pfe_kw", trafo.pfe_kw)
-    pf_trafo_type.SetAttribute("curm3", trafo.no_load_current)
-    pf_trafo_type.SetAttribute(
-        "tr3cn_h", REVERSE_WINDING_CONFIG_MAPPING[trafo.connection_type_hv]
-    )
-    pf_trafo_type.SetAttribute(
-        "tr3cn_m", REVERSE_WINDING_CONFIG_MAPPING[trafo.connection_type_mv]
-    )
-    pf_trafo_type.SetAttribute(
-        "tr3cn_l", REVERSE_WINDING_CONFIG_MAPPING[trafo.connection_type_lv]
-    )
-    pf_trafo_type.SetAttribute("nt3ag_h", trafo.phase_shift_30_hv)
-    pf_trafo_type.SetAttribute("nt3ag_m", trafo.phase_shift_30_mv)
-    pf_trafo_type.SetAttribute("nt3ag_l", trafo.phase_shift_30_lv)
 
     # TODO: tap settings on the trafo itself missing
 
-    # Set trafo type attribute to the newly created trafo type
+    # Set trafo type attribute to the shared trafo type
     pf_trafo.SetAttribute("typ_id", pf_trafo_type)
     if trafo.coords is not None:
         pf_trafo.GPSlon = trafo.coords[1]
@@ -148,33 +142,33 @@ def create_two_wdg_trafo(self, trafo: TwoWindingTransformer) -> bool:
     pf_trafo.SetAttribute("bushv", add_cubicle_to_bus(pf_hv_bus))
     pf_trafo.SetAttribute("buslv", add_cubicle_to_bus(pf_lv_bus))
 
-    # Get transformer types folder
-    pf_trafo_type_lib = self.pf_type_library.SearchObject(
-        self.pf_type_library.GetFullName() + "\\Transformer Types"
+    # Transformers with equal parameters share one transformer type
+    pf_trafo_type = self.types.get(
+        "Transformer Types",
+        "TypTr2",
+        trafo.name + "_type",
+        {
+            "strn": trafo.rating,
+            "utrn_h": trafo.voltage_hv,
+            "utrn_l": trafo.voltage_lv,
+            "r1pu": trafo.r1pu,
+            "x1pu": trafo.x1pu,
+            "pfe": trafo.pfe_kw,
+            "curmg": trafo.no_load_current,
+            "tr2cn_h": REVERSE_WINDING_CONFIG_MAPPING[trafo.connection_type_hv],
+            "tr2cn_l": REVERSE_WINDING_CONFIG_MAPPING[trafo.connection_type_lv],
+            "nt2ag": trafo.phase_shift_30,
+            "dutap": trafo.tap_changer_voltage * 100,
+            "itapch": 1,  # 1 -> tap on
+            "ntpmn": trafo.tap_min,
+            "ntpmx": trafo.tap_max,
+            "nntap0": trafo.tap_neutral,
+        },
     )
-    # Create new trafo type
-    pf_trafo_type = pf_trafo_type_lib.CreateObject("TypTr2", trafo.name + "_type")
-
-    # Set attributes of the newly created trafo type
-    pf_trafo_type.SetAttribute("strn", trafo.rating)
-    pf_trafo_type.SetAttribute("utrn_h", trafo.voltage_hv)
-    pf_trafo_type.SetAttribute("utrn_l", trafo.voltage_lv)
-    pf_trafo_type.SetAttribute("r1pu", trafo.r1pu)
-    pf_trafo_type.SetAttribute("x1pu", trafo.x1pu)
-    pf_trafo_type.SetAttribute("pfe", trafo.pfe_kw)
-    pf_trafo_type.SetAttribute("curmg", trafo.no_load_current)
-    pf_trafo_type.SetAttribute("tr2cn_h", REVERSE_WINDING_CONFIG_MAPPING[trafo.connection_type_hv])
-    pf_trafo_type.SetAttribute("tr2cn_l", REVERSE_WINDING_CONFIG_MAPPING[trafo.connection_type_lv])
-    pf_trafo_type.SetAttribute("nt2ag", trafo.phase_shift_30)
-    pf_trafo_type.SetAttribute("dutap", trafo.tap_changer_voltage * 100)
-    pf_trafo_type.SetAttribute("itapch", 1)  # 1 -> tap on
-    pf_trafo_type.SetAttribute("ntpmn", trafo.tap_min)
-    pf_trafo_type.SetAttribute("ntpmx", trafo.tap_max)
-    pf_trafo_type.SetAttribute("nntap0", trafo.tap_neutral)
-    
+
     # Set attribute of trafo itself
     pf_trafo.SetAttribute("nntap", trafo.tap_initial)  # Attribute of the transformer itself
-    # Set trafo type attribut to the newly created trafo type
+    # Set trafo type attribute to the shared trafo type
     pf_trafo.SetAttribute("typ_id", pf_trafo_type)
     if  trafo.coords is not None:
         pf_trafo.GPSlon = trafo.coords[1]
@@ -23,6 +23,7 @@ from epowcore.power_factory.from_gdf.components.generators import create_synchro
 from epowcore.power_factory.from_gdf.components.generators import create_static_generator
 from epowcore.power_factory.from_gdf.components.switch import create_switch
 from epowcore.power_factory.from_gdf.components.pv_system import create_pv_system
+from epowcore.power_factory.from_gdf.type_library import TypeLibrary
 from epowcore.power_factory.power_factory_model import PFModel
 from epowcore.generic.logger import Logger
 
@@ -55,11 +56,16 @@ class PowerFactoryExporter:
         self.pf_type_library = self.pf_project.SearchObject(
             self.pf_library.GetFullName() + "\\Equipment Type Library"
         )
+        self.types = TypeLibrary(self.pf_type_library)
+        """Creates each distinct equipment type once"""
         # Get grid of the powerfactory network
         self.pf_grid = self.pf_project.SearchObject(
             self.pf_project.GetFullName()
             + "\\Network Model.IntPrjfolder\\Network Data.IntPrjfolder\\grid.ElmNet"
         )
+        self.pf_components: dict[str, pf.DataObject] = {}
+        """The created buses by name, to connect the elements without searching the grid"""
+        self._library_objects: dict[str, pf.DataObject] = {}
         # Standard Type for PV
         self.standard_pv_type = self.pf_digsilent_library.GetContents("Aleo S19.230.TypPvpanel", 1)[0]
         # Select Geografic or create a new one
@@ -94,8 +100,7 @@ class PowerFactoryExporter:
         Logger.log_to_selected(f"{c} out of {len(gdf_bus_list)} bus creations suceeded")
 
         # Creating load type folder
-        pf_load_type_lib = self.pf_type_library.CreateObject("IntPrjfolder", "Load Types")
-        pf_load_type_lib.iopt_typ = "equip"
+        self.types.create_folder("Load Types")
         # Converting all loads
         Logger.log_to_selected("Converting loads into the Powerfactory network")
         gdf_load_list = self.core_model.type_list(Load)
@@ -115,8 +120,7 @@ class PowerFactoryExporter:
         Logger.log_to_selected(f"{c} out of {len(gdf_shunt_list)} shunt creations suceeded")
 
         # Creating transformer type folder
-        pf_trafo_type_lib = self.pf_type_library.CreateObject("IntPrjfolder", "Transformer Types")
-        pf_trafo_type_lib.iopt_typ = "equip"
+        self.types.create_folder("Transformer Types")
         # Converting all two winding transformers
         Logger.log_to_selected("Converting two winding transformers into the Powerfactory network")
         gdf_trafo_list = self.core_model.type_list(TwoWindingTransformer)
@@ -142,8 +146,7 @@ class PowerFactoryExporter:
         )
 
         # Creating generator type folder
-        pf_gen_type_lib = self.pf_type_library.CreateObject("IntPrjfolder", "Generator Types")
-        pf_gen_type_lib.iopt_typ = "equip"
+        self.types.create_folder("Generator Types")
 
         # Converting all synchronous machines
         Logger.log_to_selected("Converting synchronous machines into powerfactory network")
@@ -168,8 +171,7 @@ class PowerFactoryExporter:
         )
 
         # Creating line type folder
-        pf_line_type_lib = self.pf_type_library.CreateObject("IntPrjfolder", "Line Types")
-        pf_line_type_lib.iopt_typ = "equip"
+        self.types.create_folder("Line Types")
         # Converting all lines
         Logger.log_to_selected("Converting lines into the Powerfactory network")
         gdf_tline_list = self.core_model.type_list(TLine)
@@ -204,6 +206,20 @@ class PowerFactoryExporter:
                 c += 1
         Logger.log_to_selected(f"{c} out of {len(gdf_external_grid_list)} external grid creations suceeded")
 
+    def get_library_object(self, name: str) -> pf.DataObject:
+        """Returns an object of the DIgSILENT library, which is searched only once.
+
+        :param name: The name of the object including its class, e.g. "Sym Slot.BlkSlot".
+        :type name: str
+        :return: The first object with the name in the library and its subfolders.
+        :rtype: pf.DataObject
+        """
+        library_object = self._library_objects.get(name)
+        if library_object is None:
+            library_object = self.pf_digsilent_library.GetContents(name, 1)[0]
+            self._library_objects[name] = library_object
+        return library_object
+
     def get_pf_model_object(self) -> PFModel:
         export_model = PFModel(
             project_name=self.pf_project.GetAttribute("loc_name"),
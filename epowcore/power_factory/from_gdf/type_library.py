@@ -0,0 +1,82 @@
+from typing import Any
+
+import powerfactory as pf
+
+
+class TypeLibrary:
+    """Creates the equipment types of the exported elements in the "Equipment Type Library".
+
+    Elements with equal type parameters share one type: each distinct set of parameters of a
+    type class is created once, named after the first element using it, and reused for all
+    following elements.
+
+    Example:
+        types = TypeLibrary(pf_type_library)
+        types.create_folder("Line Types")
+        pf_line.SetAttribute(
+            "typ_id", types.get("Line Types", "TypLne", "Line 1_type", {"rline": 0.02})
+        )
+    """
+
+    def __init__(self, library: pf.DataObject) -> None:
+        """
+        :param library: The "Equipment Type Library" folder of the project.
+        """
+        self.library = library
+        self.created = 0
+        """The number of created types."""
+        self.reused = 0
+        """The number of elements that reused an existing type."""
+        self._folders: dict[str, pf.DataObject] = {}
+        self._types: dict[tuple, pf.DataObject] = {}
+
+    def create_folder(self, name: str) -> pf.DataObject:
+        """Create a folder for equipment types in the library.
+
+        :param name: The name of the folder, e.g. "Line Types".
+        :type name: str
+        :return: The folder.
+        :rtype: pf.DataObject
+        """
+        folder = self.library.CreateObject("IntPrjfolder", name)
+        folder.iopt_typ = "equip"
+        self._folders[name] = folder
+        return folder
+
+    def folder(self, name: str) -> pf.DataObject:
+        """Returns a folder of the library, which is searched only once."""
+        folder = self._folders.get(name)
+        if folder is None:
+            folder = self.library.SearchObject(self.library.GetFullName() + "\\" + name)
+            if folder is None:
+                raise ValueError(f"The type folder {name} does not exist")
+            self._folders[name] = folder
+        return folder
+
+    def get(
+        self, folder: str, class_name: str, name: str, attributes: dict[str, Any]
+    ) -> pf.DataObject:
+        """Returns the type with the given parameters, creating it if it does not exist yet.
+
+        :param folder: The folder to create the type in, e.g. "Line Types".
+        :type folder: str
+        :param class_name: The PowerFactory class of the type, e.g. "TypLne".
+        :type class_name: str
+        :param name: The name of the type, if it is created.
+        :type name: str
+        :param attributes: The parameters of the type.
+        :type attributes: dict[str, Any]
+        :return: The type.
+        :rtype: pf.DataObject
+        """
+        key = (class_name, tuple(sorted(attributes.items())))
+        pf_type = self._types.get(key)
+        if pf_type is not None:
+            self.reused += 1
+            return pf_type
+        pf_type = self.folder(folder).CreateObject(class_name, name)
+        for attribute, value in attributes.items():
+            pf_type.SetAttribute(attribute, value)
+        self._types[key] = pf_type
+        self.created += 1
+        return pf_type
@@ -0,0 +1,157 @@
+from collections.abc import Iterable
+from typing import Any
+
+_MISSING = object()
+
+
+class CachedObject:
+    """Stands in for a PowerFactory data object and reads each of its attributes only once.
+
+    Every read of a PowerFactory object is a call into the PowerFactory process. The cached
+    object keeps the values read so far; references to other objects, e.g. `typ_id` or the
+    terminal of a cubicle, are returned as the cached object of the `ObjectCache`, so that
+    objects shared by many elements, like types and terminals, are read only once.
+    """
+
+    __slots__ = ("_cache", "_object", "_values")
+
+    def __init__(self, cache: "ObjectCache", obj: Any) -> None:
+        self._cache = cache
+        self._object = obj
+        self._values: dict[Any, Any] = {}
+
+    @property
+    def data_object(self) -> Any:
+        """The PowerFactory object."""
+        return self._object
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        value = self._values.get(name, _MISSING)
+        if value is _MISSING:
+            value = self._cache.read(self, name)
+        if value is _MISSING:
+            raise AttributeError(name)
+        return value
+
+    def GetClassName(self) -> str:  # pylint: disable=invalid-name
+        return self._call("GetClassName")
+
+    def GetParent(self) -> "CachedObject | None":  # pylint: disable=invalid-name
+        return self._call("GetParent")
+
+    def GetContents(self, *args: Any) -> list["CachedObject"]:  # pylint: disable=invalid-name
+        return self._call("GetContents", *args)
+
+    def GetAttribute(self, name: str) -> Any:  # pylint: disable=invalid-name
+        return self._call("GetAttribute", name)
+
+    def GetBusType(self) -> int:  # pylint: disable=invalid-name
+        return self._call("GetBusType")
+
+    def __str__(self) -> str:
+        return self._call("__str__")
+
+    def __repr__(self) -> str:
+        return f"CachedObject({self._object!r})"
+
+    def _call(self, method: str, *args: Any) -> Any:
+        key = (method, args)
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            self._cache.reads += 1
+            value = self._cache.wrap(getattr(self._object, method)(*args))
+            self._values[key] = value
+        return value
+
+
+class ObjectCache:
+    """Reads PowerFactory objects per element class and caches their attributes.
+
+    Each PowerFactory object is represented by exactly one `CachedObject`, so the cached objects
+    can be used as keys and graph nodes like the PowerFactory objects themselves.
+
+    Example:
+        cache = ObjectCache(app)
+        lines = cache.of_class("ElmLne", ["loc_name", "bus1.cterm", "typ_id.rline"])
+    """
+
+    def __init__(self, app: Any) -> None:
+        self.app = app
+        self.reads = 0
+        """The number of reads from PowerFactory."""
+        self._objects: dict[Any, CachedObject] = {}
+        self._classes: dict[str, list[CachedObject]] = {}
+
+    def of_class(self, class_name: str, attributes: Iterable[str] = ()) -> list[CachedObject]:
+        """Returns the calculation relevant objects of a class, read once per class.
+
+        :param class_name: The PowerFactory class, e.g. "ElmLne".
+        :type class_name: str
+        :param attributes: Attributes to read for all objects at once, see `prefetch`.
+        :type attributes: Iterable[str], optional
+        :return: The cached objects.
+        :rtype: list[CachedObject]
+        """
+        objects = self._classes.get(class_name)
+        if objects is None:
+            self.reads += 1
+            objects = self.wrap(self.app.GetCalcRelevantObjects(class_name))
+            self._classes[class_name] = objects
+        self.prefetch(objects, attributes)
+        return objects
+
+    def prefetch(self, objects: Iterable[CachedObject], attributes: Iterable[str]) -> None:
+        """Read the attributes of all objects column by column.
+
+        Attributes of referenced objects are given as path, e.g. "typ_id.rline".
+        Such attributes are read once for each distinct referenced object,
+        e.g. once per line type instead of once per line.
+
+        :param objects: The cached objects.
+        :type objects: Iterable[CachedObject]
+        :param attributes: The names or paths of the attributes.
+        :type attributes: Iterable[str]
+        """
+        objects = list(objects)
+        for attribute in attributes:
+            current = objects
+            *path, name = attribute.split(".")
+            for reference in path:
+                referenced = {}
+                for obj in current:
+                    value = getattr(obj, reference, None)
+                    if isinstance(value, CachedObject):
+                        referenced[id(value)] = value
+                current = list(referenced.values())
+            for obj in current:
+                if name not in obj._values:  # pylint: disable=protected-access
+                    self.read(obj, name)
+
+    def read(self, obj: CachedObject, name: str) -> Any:
+        """Read an attribute of an object from PowerFactory and cache it."""
+        self.reads += 1
+        value = getattr(obj.data_object, name, _MISSING)
+        if value is not _MISSING:
+            if callable(value):
+                method = value
+                value = lambda *args: self.wrap(method(*args))
+            else:
+                value = self.wrap(value)
+        obj._values[name] = value  # pylint: disable=protected-access
+        return value
+
+    def wrap(self, value: Any) -> Any:
+        """Replace PowerFactory objects, also in lists, by their cached objects."""
+        if isinstance(value, list):
+            return [self.wrap(v) for v in value]
+        if value is None or isinstance(value, (str, int, float, CachedObject)):
+            return value
+        if not hasattr(value, "GetClassName"):
+            return value
+        cached = self._objects.get(value)
+        if cached is None:
+            cached = CachedObject(self, value)
+            self._objects[value] = cached
+        return cached
@@ -0,0 +1,428 @@
+"""A stand-in for the `powerfactory` module, to test and benchmark the PowerFactory import and
+export without PowerFactory.
+
+The stand-in application holds the objects of a project and counts the calls made to them,
+which are calls into the PowerFactory process with the real module.
+
+Example:
+    stand_in.install()  # if the powerfactory module is not available
+    app = stand_in.synthetic_grid(1_000)
+    core_model = PowerFactoryExtractor("Grid", None, 50.0, app=app).get_core_model()
+"""
+
+# pylint: disable=invalid-name,protected-access
+
+import sys
+import time
+import types
+from typing import Any
+
+
+class StandInObject:
+    """A PowerFactory data object, whose attributes are kept in a dictionary."""
+
+    def __init__(
+        self,
+        app: "StandInApplication",
+        class_name: str,
+        name: str,
+        parent: "StandInObject | None" = None,
+        **attributes: Any,
+    ) -> None:
+        self._app = app
+        self._class_name = class_name
+        self._parent = parent
+        self._contents: list[StandInObject] = []
+        self._attributes: dict[str, Any] = {"loc_name": name, **attributes}
+        if parent is not None:
+            parent._contents.append(self)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        self._app.call()
+        try:
+            return self._attributes[name]
+        except KeyError as error:
+            raise AttributeError(name) from error
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+        else:
+            self.SetAttribute(name, value)
+
+    def set(self, **attributes: Any) -> None:
+        """Set attributes without counting calls."""
+        self._attributes.update(attributes)
+
+    def GetClassName(self) -> str:
+        self._app.call()
+        return self._class_name
+
+    def GetParent(self) -> "StandInObject | None":
+        self._app.call()
+        return self._parent
+
+    def GetFullName(self) -> str:
+        self._app.call()
+        return self._full_name()
+
+    def GetContents(self, pattern: str = "*", recursive: int = 0) -> list["StandInObject"]:
+        self._app.call()
+        return [obj for obj in self._descendants(recursive) if _matches(obj, pattern)]
+
+    def SearchObject(self, path: str) -> "StandInObject | None":
+        """Find an object by its full name or its path relative to this object."""
+        self._app.call()
+        prefix = self._full_name() + "\\"
+        if path.startswith(prefix):
+            path = path[len(prefix) :]
+        obj = self
+        for segment in path.split("\\"):
+            child = next((child for child in obj._contents if _matches(child, segment)), None)
+            if child is None:
+                return None
+            obj = child
+        return obj
+
+    def CreateObject(self, class_name: str, name: str = "") -> "StandInObject":
+        self._app.call()
+        obj = self._app.create(class_name, name, self)
+        if class_name == "StaCubic":
+            obj._attributes["cterm"] = self
+        elif class_name == "IntGrfnet":
+            StandInObject(self._app, "IntFolder", "Layers", obj)
+        return obj
+
+    def GetAttribute(self, name: str) -> Any:
+        self._app.call()
+        if name not in self._attributes:
+            raise AttributeError(name)
+        return self._attributes[name]
+
+    def SetAttribute(self, name: str, value: Any) -> None:
+        self._app.call()
+        if isinstance(value, StandInObject) and value._class_name == "StaCubic":
+            # connecting an element to a cubicle sets the element of the cubicle
+            value._attributes["obj_id"] = self
+        self._attributes[name] = value
+
+    def GetConnectedCubicles(self, *args: Any) -> list["StandInObject"]:
+        self._app.call()
+        return [obj for obj in self._contents if obj._class_name == "StaCubic"]
+
+    def GetBusType(self) -> int:
+        self._app.call()
+        return self._attributes.get("bus_type", 1)
+
+    def Activate(self) -> int:
+        self._app.call()
+        return 0
+
+    def Execute(self) -> int:
+        self._app.call()
+        return 0
+
+    def Show(self) -> int:
+        self._app.call()
+        return 0
+
+    def Close(self) -> int:
+        self._app.call()
+        return 0
+
+    def SetGeoCoordinateSystem(self, code: int) -> None:
+        self._app.call()
+        self._attributes["geo_coordinate_system"] = code
+
+    def __str__(self) -> str:
+        return f"{self._attributes['loc_name']}.{self._class_name}"
+
+    def _full_name(self) -> str:
+        parent = "" if self._parent is None else self._parent._full_name()
+        return f"{parent}\\{self}"
+
+    def _descendants(self, recursive: int) -> list["StandInObject"]:
+        if not recursive:
+            return self._contents
+        objects = []
+        for obj in self._contents:
+            objects.append(obj)
+            objects.extend(obj._descendants(recursive))
+        return objects
+
+
+class StandInApplication:
+    """A PowerFactory application with a database holding the DIgSILENT library and the active
+    project. A project "Project" with the grid "Grid" is active at the start."""
+
+    def __init__(self, latency: float = 0.0) -> None:
+        """
+        :param latency: Seconds each call takes, to simulate the latency of PowerFactory.
+        """
+        self.latency = latency
+        self.calls = 0
+        """The number of calls to PowerFactory objects."""
+        self.objects: list[StandInObject] = []
+        """The objects created in projects, e.g. the elements of the grid."""
+        self.database = StandInObject(self, "IntDatabase", "Database")
+        self.user = StandInObject(self, "IntUser", "User", self.database)
+        self.library = StandInObject(self, "IntLibrary", "Lib", self.database)
+        StandInObject(self, "TypPvpanel", "Aleo S19.230", self.library)
+        folder = self.library
+        for name in ("Arch", "PF 2022 Models", "DynPsse", "Frm"):
+            folder = StandInObject(self, "IntFolder", name, folder)
+        frame = StandInObject(self, "BlkDef", "SYM Frame_no droop", folder)
+        for name in ("Sym Slot", "Avr Slot", "Gov Slot", "Pss Slot"):
+            StandInObject(self, "BlkSlot", name, frame)
+        for name in ("exc_IEEE_ST1A", "gov_IEEE_IEEEG1", "pss_IEEE_PSS1A"):
+            StandInObject(self, "BlkDef", name, folder)
+        self._create_project("Project", "Grid")
+
+    def call(self) -> None:
+        """Count a call and wait for the latency."""
+        self.calls += 1
+        if self.latency > 0:
+            time.sleep(self.latency)
+
+    def create(
+        self,
+        class_name: str,
+        name: str,
+        parent: StandInObject | None = None,
+        **attributes: Any,
+    ) -> StandInObject:
+        """Create an object in the project."""
+        obj = StandInObject(self, class_name, name, parent, **attributes)
+        self.objects.append(obj)
+        return obj
+
+    def CreateProject(self, name: str, grid_name: str) -> StandInObject:
+        """Create a project with a grid and activate it."""
+        self.call()
+        return self._create_project(name, grid_name)
+
+    def ActivateProject(self, name: str) -> int:
+        self.call()
+        return 0
+
+    def GetActiveProject(self) -> StandInObject:
+        self.call()
+        return self.project
+
+    def GetProjectFolder(self, name: str) -> StandInObject:
+        self.call()
+        return self.folders[name]
+
+    def GetActiveStudyCase(self) -> StandInObject:
+        self.call()
+        return self.study_case
+
+    def GetFromStudyCase(self, name: str) -> StandInObject:
+        self.call()
+        commands = self.study_case._contents
+        command = next((obj for obj in commands if obj._class_name == name), None)
+        if command is None:
+            command = StandInObject(self, name, name, self.study_case)
+        return command
+
+    def GetCalcRelevantObjects(self, pattern: str) -> list[StandInObject]:
+        self.call()
+        if "." not in pattern:
+            pattern = "*." + pattern
+        return [obj for obj in self.objects if _matches(obj, pattern)]
+
+    def _create_project(self, name: str, grid_name: str) -> StandInObject:
+        self.project = StandInObject(self, "IntPrj", name, self.user)
+        library = StandInObject(self, "IntPrjfolder", "Library", self.project)
+        network = StandInObject(self, "IntPrjfolder", "Network Model", self.project)
+        data = StandInObject(self, "IntPrjfolder", "Network Data", network)
+        study = StandInObject(self, "IntPrjfolder", "Study Cases", self.project)
+        self.folders = {
+            "lib": library,
+            "equip": StandInObject(self, "IntPrjfolder", "Equipment Type Library", library),
+            "dia": StandInObject(self, "IntPrjfolder", "Diagrams", network),
+            "study": study,
+        }
+        self.study_case = StandInObject(self, "IntCase", "Base", study)
+        self.grid = StandInObject(self, "ElmNet", grid_name, data)
+        return self.project
+
+
+def _matches(obj: StandInObject, pattern: str) -> bool:
+    name = obj._attributes["loc_name"]
+    return pattern in ("*", name, f"{name}.{obj._class_name}", f"*.{obj._class_name}")
+
+
+def module() -> types.ModuleType:
+    """A module with the names of the `powerfactory` module used by epowcore."""
+    stand_in = types.ModuleType("powerfactory")
+    setattr(stand_in, "DataObject", StandInObject)
+    setattr(stand_in, "Application", StandInApplication)
+    setattr(stand_in, "GetApplication", lambda: None)
+    return stand_in
+
+
+def install() -> None:
+    """Register the stand-in as `powerfactory` module, unless the module is available."""
+    try:
+        import powerfactory  # pylint: disable=import-outside-toplevel,unused-import
+    except ImportError:
+        sys.modules["powerfactory"] = module()
+
+
+def synthetic_grid(
+    num_buses: int, latency: float = 0.0, buses_per_site: int = 10
+) -> StandInApplication:
+    """A meshed grid of [num_buses] buses in a ring, with a line to the next bus and every
+    tenth bus, a load at each bus, a generator at every fifth bus and a transformer to
+    a low voltage bus at every twentieth bus. The buses are grouped into sites.
+
+    :param num_buses: The number of high voltage buses.
+    :type num_buses: int
+    :param latency: Seconds each call takes.
+    :type latency: float, optional
+    :param buses_per_site: The number of buses in each site.
+    :type buses_per_site: int, optional
+    :return: The application holding the grid.
+    :rtype: StandInApplication
+    """
+    app = StandInApplication(latency)
+    grid = app.grid
+    line_types = [
+        app.create(
+            "TypLne",
+            f"Line Type {i}",
+            uline=380.0,
+            sline=1.0 + i,
+            rline=0.02,
+            xline=0.25 + 0.01 * i,
+            bline=4.0,
+            rline0=0.0,
+            xline0=0.0,
+            bline0=0.0,
+        )
+        for i in range(4)
+    ]
+    machine_type = app.create(
+        "TypSym",
+        "Machine Type",
+        sgn=500.0,
+        ugn=21.0,
+        h=5.0,
+        r0sy=0.0,
+        x0sy=0.1,
+        xl=0.15,
+        rstr=0.003,
+        xd=2.0,
+        xds=0.3,
+        xdss=0.2,
+        xq=1.9,
+        xqs=0.5,
+        xqss=0.2,
+        tds0=6.0,
+        tqs0=0.5,
+        tdss0=0.05,
+        tqss0=0.05,
+        Q_min=-200.0,
+        Q_max=300.0,
+    )
+    transformer_type = app.create(
+        "TypTr2",
+        "Transformer Type",
+        strn=100.0,
+        utrn_h=380.0,
+        utrn_l=110.0,
+        r1pu=0.002,
+        x1pu=0.12,
+        pfe=50.0,
+        curmg=0.1,
+        tr2cn_h="YN",
+        tr2cn_l="YN",
+        nt2ag=0.0,
+        dutap=1.25,
+        ntpmn=-10,
+        ntpmx=10,
+        nntap0=0,
+    )
+
+    def create_bus(name: str, parent: StandInObject, voltage: float) -> StandInObject:
+        return app.create(
+            "ElmTerm",
+            name,
+            parent,
+            cStatName=parent.loc_name,
+            uknom=voltage,
+            iUsage=0,
+            GPSlat=49.0 + len(app.objects) * 1e-4,
+            GPSlon=8.4,
+        )
+
+    def connect(element: StandInObject, bus: StandInObject) -> StandInObject:
+        cubicle = StandInObject(app, "StaCubic", f"Cub_{len(bus._contents) + 1}", bus)
+        cubicle.set(obj_id=element, cterm=bus)
+        return cubicle
+
+    sites = [
+        app.create("ElmSite", f"Site {i}", grid, GPSlat=49.0, GPSlon=8.4)
+        for i in range(-(-num_buses // buses_per_site))
+    ]
+    buses = [create_bus(f"Bus {i}", sites[i // buses_per_site], 380.0) for i in range(num_buses)]
+    buses[0].set(bus_type=3)
+
+    for i, bus in enumerate(buses):
+        site = sites[i // buses_per_site]
+        for j, other in enumerate((buses[(i + 1) % num_buses], buses[(i + 10) % num_buses])):
+            if other is bus:
+                continue
+            line = app.create(
+                "ElmLne",
+                f"Line {i}_{j}",
+                grid,
+                typ_id=line_types[(i + j) % len(line_types)],
+                dline=50.0 + i % 7,
+                nlnum=1,
+                GPSlat=0.0,
+                GPSlon=0.0,
+            )
+            line.set(bus1=connect(line, bus), bus2=connect(line, other))
+        load = app.create(
+            "ElmLod", f"Load {i}", site, plini=100.0, qlini=30.0, GPSlat=0.0, GPSlon=0.0
+        )
+        connect(load, bus)
+        if i % 5 == 0:
+            machine = app.create(
+                "ElmSym",
+                f"Gen {i}",
+                site,
+                typ_id=machine_type,
+                pgini=400.0,
+                qgini=50.0,
+                ngnum=1,
+                usetp=1.0,
+                Pmin_uc=0.0,
+                P_max=500.0,
+                Pmax_uc=500.0,
+                cQ_min=-200.0,
+                cQ_max=300.0,
+                c_pmod=None,
+                GPSlat=0.0,
+                GPSlon=0.0,
+            )
+            machine.set(bus1=connect(machine, bus))
+        if i % 20 == 0:
+            lv_bus = create_bus(f"LV Bus {i}", site, 110.0)
+            transformer = app.create(
+                "ElmTr2",
+                f"Transformer {i}",
+                site,
+                typ_id=transformer_type,
+                ntnum=1,
+                nntap=0,
+                GPSlat=0.0,
+                GPSlon=0.0,
+            )
+            transformer.set(bushv=connect(transformer, bus), buslv=connect(transformer, lv_bus))
+    app.calls = 0
+    return app
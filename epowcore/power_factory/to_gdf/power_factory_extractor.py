@@ -14,6 +14,7 @@ from epowcore.gdf.subsystem import Subsystem
 from epowcore.generic.component_graph import ComponentGraph
 from epowcore.generic.configuration import Configuration
 from epowcore.generic.logger import Logger
+from epowcore.power_factory.object_cache import CachedObject, ObjectCache
 from epowcore.power_factory.utils import get_coords
 
 
@@ -46,6 +47,8 @@ class PowerFactoryExtractor:
 
         if self.app is None:
             raise ValueError("No PowerFactory Application found!")
+        self.objects = ObjectCache(self.app)
+        """Reads the elements per class and caches their attributes"""
 
         # Activate Project
         self.app.ActivateProject(project_name)
@@ -99,20 +102,30 @@ class PowerFactoryExtractor:
     def get_hierarchy(self) -> dict:
         """Returns the hierarchy of the PowerFactory elements as a hierarchy."""
         parents: dict = {}
+        skipped = set()
+        # each component is extracted once, so the children need no duplicate check
         for component in self._component_dict:
             parent = component.GetParent()
-            if parent.GetClassName() not in ["ElmNet", "ElmXnet"]:
-                if parent not in parents:
-                    parents[parent] = []
-                if not component in parents[parent]:
-                    parents[parent].append(component)
+            if parent in skipped:
+                continue
+            if parent not in parents:
+                if parent.GetClassName() in ["ElmNet", "ElmXnet"]:
+                    skipped.add(parent)
+                    continue
+                parents[parent] = []
+            parents[parent].append(component)
         return parents
 
+    def get_objects(self, class_name: str) -> list[CachedObject]:
+        """Returns the calculation relevant objects of a class with their common attributes read
+        in bulk. The objects are cached and can be used like the PowerFactory objects."""
+        return self.objects.of_class(class_name, _BULK_ATTRIBUTES.get(class_name, ()))
+
     def extract_bus(self, use_station_name: bool = False) -> None:
         """Extract the PowerFactory buses to the data format"""
 
         # Get the buses from the studycase
-        pf_buses = self.app.GetCalcRelevantObjects("ElmTerm")
+        pf_buses = self.get_objects("ElmTerm")
         for pf_bus in pf_buses:
             try:
                 bus = Components.create_bus(pf_bus, self.uid, use_station_name)
@@ -126,8 +139,8 @@ class PowerFactoryExtractor:
     def extract_load(self) -> None:
         """Extract the PowerFactory loads to the data format"""
         # Get the loads from the studycase
-        pf_loads = self.app.GetCalcRelevantObjects("ElmLod")
-        pf_loads_lv = self.app.GetCalcRelevantObjects("ElmLodlv")
+        pf_loads = self.get_objects("ElmLod")
+        pf_loads_lv = self.get_objects("ElmLodlv")
         for pf_load in pf_loads:
             load = Components.create_load(pf_load, self.uid)
             self.uid += 1
@@ -144,7 +157,7 @@ class PowerFactoryExtractor:
     def extract_two_winding_transformers(self) -> None:
         """Extract the PowerFactory transformers with two windings to the data format"""
         # Get the two winding transformers from the studycase
-        pf_transformers = self.app.GetCalcRelevantObjects("ElmTr2")
+        pf_transformers = self.get_objects("ElmTr2")
         for pf_transformer in pf_transformers:
             two_winding_transformer = Components.create_two_wdg_trafo(pf_transformer, self.uid)
             self.uid += 1
@@ -160,7 +173,7 @@ class PowerFactoryExtractor:
     def extract_three_winding_transformers(self) -> None:
         """Extract the PowerFactory transformers with three windings to the data format"""
         # Get the three winding transformers from the studycase
-        pf_transformers = self.app.GetCalcRelevantObjects("ElmTr3")
+        pf_transformers = self.get_objects("ElmTr3")
         for pf_transformer in pf_transformers:
             if pf_transformer.outserv == 1:
                 continue
@@ -179,7 +192,7 @@ class PowerFactoryExtractor:
     def extract_lines(self) -> None:
         """Extract the PowerFactory transmission lines to the data format"""
         # Get the transmission lines from the study case
-        pf_tlines = self.app.GetCalcRelevantObjects("ElmLne")
+        pf_tlines = self.get_objects("ElmLne")
         for pf_tline in pf_tlines:
             if pf_tline.bus1 is None or pf_tline.bus2 is None:
                 Logger.log_to_selected(
@@ -198,7 +211,7 @@ class PowerFactoryExtractor:
     def extract_synchronous_machines(self, use_load_flow: bool = False) -> None:
         """Extract the PowerFactory synchronous machines to the data format"""
         # Get the synchronous machines from the study case
-        pf_generators = self.app.GetCalcRelevantObjects("ElmSym")
+        pf_generators = self.get_objects("ElmSym")
         for pf_generator in pf_generators:
             generator = Components.create_synchronous_machine(pf_generator, self.uid, use_load_flow)
             self.uid += 1
@@ -214,7 +227,7 @@ class PowerFactoryExtractor:
     def extract_static_generators(self, use_load_flow: bool = False) -> None:
         """Extract the PowerFactory static generators to the data format"""
         # Get the static generators from the study case
-        pf_generators = self.app.GetCalcRelevantObjects("ElmGenStat")
+        pf_generators = self.get_objects("ElmGenStat")
         for pf_generator in pf_generators:
             generator = Components.create_static_generator(pf_generator, self.uid, use_load_flow)
             self.uid += 1
@@ -224,7 +237,7 @@ class PowerFactoryExtractor:
 
     def extract_ward_equivalents(self) -> None:
         """Extract the PowerFactory Ward equivalents to the data format"""
-        pf_wards = self.app.GetCalcRelevantObjects("ElmVac")
+        pf_wards = self.get_objects("ElmVac")
         for pf_ward in pf_wards:
             if pf_ward.itype == 2:
                 ward = Components.create_ward(pf_ward, self.uid)
@@ -239,7 +252,7 @@ class PowerFactoryExtractor:
 
     def extract_impedances(self) -> None:
         """Extract the PowerFactory impedances lines to the data format"""
-        pf_impedances = self.app.GetCalcRelevantObjects("ElmZpu")
+        pf_impedances = self.get_objects("ElmZpu")
         for pf_impedance in pf_impedances:
             impedance = Components.create_impedance(pf_impedance, self.uid)
             self.uid += 1
@@ -250,7 +263,7 @@ class PowerFactoryExtractor:
 
     def extract_pv_systems(self) -> None:
         """Extract the PowerFactory PV systems to the data format"""
-        pf_pv_systems = self.app.GetCalcRelevantObjects("ElmPvsys")
+        pf_pv_systems = self.get_objects("ElmPvsys")
         for pf_pv_system in pf_pv_systems:
             pv_system = Components.create_pv_system(pf_pv_system, self.uid)
             self.uid += 1
@@ -260,7 +273,7 @@ class PowerFactoryExtractor:
 
     def extract_external_grids(self) -> None:
         """Extract the PowerFactory external grids to the data format"""
-        pf_extgrids = self.app.GetCalcRelevantObjects("ElmXnet")
+        pf_extgrids = self.get_objects("ElmXnet")
         for pf_extgrid in pf_extgrids:
             extgrid = Components.create_external_grid(pf_extgrid, self.uid)
             self.uid += 1
@@ -275,7 +288,7 @@ class PowerFactoryExtractor:
         #     self.uid += 1
         #     self.transformation_dict[pf_switch] = switch
         #     self.graph.add_node(pf_switch)
-        pf_switches = self.app.GetCalcRelevantObjects("ElmCoup")
+        pf_switches = self.get_objects("ElmCoup")
         for pf_switch in pf_switches:
             switch = Components.create_switch(pf_switch, self.uid)
             self.uid += 1
@@ -284,7 +297,7 @@ class PowerFactoryExtractor:
 
     def extract_fuses(self) -> None:
         """Extract the PowerFactory fuses to the data format. Currently represented as a switch for the gdf"""
-        pf_fuses = self.app.GetCalcRelevantObjects("RelFuse")
+        pf_fuses = self.get_objects("RelFuse")
         for pf_fuse in pf_fuses:
             switch = Components.create_switch(pf_fuse, self.uid)
             self.uid += 1
@@ -293,7 +306,7 @@ class PowerFactoryExtractor:
 
     def extract_shunts(self) -> None:
         """Extract the PowerFactory shunts to the data format"""
-        pf_shunts = self.app.GetCalcRelevantObjects("ElmShnt")
+        pf_shunts = self.get_objects("ElmShnt")
         for pf_shunt in pf_shunts:
             shunt = Components.create_shunt(pf_shunt, self.uid)
             self.uid += 1
@@ -412,6 +425,23 @@ class PowerFactoryExtractor:
         )
 
 
+_LINE_TYPE = ("uline", "sline", "rline", "xline", "bline", "rline0", "xline0", "bline0")
+_SYNCHRONOUS_MACHINE_TYPE = (
+    *("sgn", "ugn", "h", "r0sy", "x0sy", "xl", "rstr", "xd", "xds", "xdss", "xq", "xqs"),
+    *("xqss", "tds0", "tqs0", "tdss0", "tqss0", "Q_min", "Q_max"),
+)
+_BULK_ATTRIBUTES: dict[str, tuple[str, ...]] = {
+    "ElmTerm": ("loc_name", "uknom", "iUsage"),
+    "ElmLod": ("loc_name", "plini", "qlini"),
+    "ElmTr2": ("loc_name", "ntnum", "nntap", "bushv.cterm", "buslv.cterm"),
+    "ElmLne": ("loc_name", "dline", "nlnum", "bus1.cterm", "bus2.cterm")
+    + tuple(f"typ_id.{name}" for name in _LINE_TYPE),
+    "ElmSym": ("loc_name", "pgini", "qgini", "ngnum", "usetp", "c_pmod")
+    + tuple(f"typ_id.{name}" for name in _SYNCHRONOUS_MACHINE_TYPE),
+}
+"""Attributes read for all objects of a class at once, the others are read on first use."""
+
+
 def _get_controller_index(frame_blocks: list[pf.DataObject], extensions: list[str]) -> int | None:
     for i, block in enumerate(frame_blocks):
         for ext in extensions:
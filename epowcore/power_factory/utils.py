@@ -68,12 +68,16 @@ def get_ctrl_param(ctrl_obj: Any, param: str | list[str]) -> Any:
 
 def get_pf_grid_component(self, component_name: str) -> pf.DataObject | None:
     """Gets a component from the pf_grid by it's name.
+    Components registered in `pf_components` of the exporter are returned without searching.
 
     :param component_name: Components name, defined by its loc_name variable
     :type component_name: str
     :return: Returns a reference to the object or none, if no object of the given name was found
     :rtype: pf.DataObject | None
     """
+    component = self.pf_components.get(component_name)
+    if component is not None:
+        return component
     component = self.pf_grid.SearchObject(self.pf_grid.GetFullName() + "\\" + component_name)
 
     if component is None or not isinstance(component, pf.DataObject):
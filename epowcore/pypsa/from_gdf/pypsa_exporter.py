@@ -180,6 +180,7 @@ class PyPSAExporter:
 
         bus0 = bus0_list[0]
         bus1 = bus1_list[0]
+        length = line.length if not line.length is None else 1
 
         line_name = self.pypsa_model.components.lines.add(
             name=line.uid,
@@ -187,10 +188,11 @@ class PyPSAExporter:
             bus0=bus0.uid,
             bus1=bus1.uid,
             type="",
-            x=line.x1 * (line.length if not line.length is None else 1),
-            r=line.r1 * (line.length if not line.length is None else 1),
-            b=line.b1 * (line.length if not line.length is None else 1) / 10e6,
-            s_nom=line.rating,
+            # PyPSA expects the totals of all parallel circuits for lines without a type
+            x=line.x1 * length / line.parallel_lines,
+            r=line.r1 * length / line.parallel_lines,
+            b=line.b1 * length * 1e-6 * line.parallel_lines,
+            s_nom=line.rating * line.parallel_lines,
             length=line.length,
             carrier="AC",
             num_parallel=line.parallel_lines,
@@ -227,7 +229,7 @@ class PyPSAExporter:
             bus=load_bus.uid,
             type="",
             p_set=abs(load.active_power),
-            q_set=abs(load.reactive_power),
+            q_set=-sign * load.reactive_power,
             sign=sign,
             active=True,
         )
@@ -264,6 +266,15 @@ class PyPSAExporter:
             )
             return False
 
+        if isinstance(generator, (SynchronousMachine, StaticGenerator)):
+            self.pypsa_model.components.buses.static.loc[str(generator_bus.uid), "v_mag_pu_set"] = (
+                generator.voltage_set_point
+            )
+        elif isinstance(generator, ExternalGrid):
+            self.pypsa_model.components.buses.static.loc[str(generator_bus.uid), "v_mag_pu_set"] = (
+                generator.u_setp
+            )
+
         match generator:
             case EPowGenerator():
                 return self.add_generator_from_gdf_epowgenerator(
@@ -386,7 +397,7 @@ class PyPSAExporter:
             type="",
             p_nom=generator.rated_active_power,
             p_min_pu=(generator.p_min / generator.rated_active_power),
-            p_max_pu=(generator.p_min / generator.rated_active_power),
+            p_max_pu=(generator.p_max / generator.rated_active_power),
             p_set=generator.active_power,
             p_init=generator.active_power,
             q_set=generator.reactive_power,
@@ -561,7 +572,8 @@ class PyPSAExporter:
             name=shunt.uid,
             bus=shunt_bus.uid,
             g=shunt.p / (shunt_bus.nominal_voltage**2),
-            b=shunt.q / (shunt_bus.nominal_voltage**2),
+            # a positive susceptance is capacitive in PyPSA
+            b=-shunt.q / (shunt_bus.nominal_voltage**2),
         )
 
         creation_result = shunt_name[0] in self.pypsa_model.components.shunt_impedances.static.index
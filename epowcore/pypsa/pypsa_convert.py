@@ -9,41 +9,47 @@ from epowcore.gdf.ward import Ward
 from epowcore.generic.configuration import Configuration
 from epowcore.generic.constants import Platform
 from epowcore.generic.converter_base import ConverterBase
+from epowcore.generic.manipulation.batch_rewrite import BatchRewrite
 from epowcore.generic.manipulation.flatten import flatten
 from epowcore.pypsa.from_gdf.pypsa_exporter import PyPSAExporter
+from epowcore.pypsa.to_gdf.pypsa_import import import_pypsa
 
 
 class PyPSAConverter(ConverterBase[pypsa_network]):
     def from_gdf(
         self, core_model: CoreModel, name: str, log_path: str | None = None
     ) -> pypsa_network:
-        Configuration().default_platform = Platform.PYPSA
-        return super().from_gdf(core_model, name, log_path)
+        with Configuration().scoped(Platform.PYPSA):
+            return super().from_gdf(core_model, name, log_path)
 
     def _pre_export(self, core_model: CoreModel, name: str) -> CoreModel:
 
         flatten(core_model)
 
+        # Each pass collects its replacements and applies them in one sweep
         # Replace all three winding transformers as they are not supported by pypsa
-        three_winding_transformers = core_model.type_list(ThreeWindingTransformer)
-        for trafo in three_winding_transformers:
-            trafo.replace_with_two_winding_transformers(core_model)
+        with BatchRewrite(core_model) as rewrite:
+            for trafo in core_model.type_list(ThreeWindingTransformer):
+                trafo.replace_with_two_winding_transformers(core_model, rewrite)
 
-        wards = core_model.type_list(Ward)
-        for ward in wards:
-            ward.replace_with_load_and_shunt(core_model)
+        # Order is important because ExtendedWard is also a Ward!
+        with BatchRewrite(core_model) as rewrite:
+            for extended_ward in core_model.type_list(ExtendedWard):
+                extended_ward.replace_with_load_shunt_vsource(
+                    core_model, core_model.base_mva_fb(Platform.PYPSA), rewrite
+                )
 
-        extended_wards = core_model.type_list(ExtendedWard)
-        for extended_ward in extended_wards:
-            extended_ward.replace_with_load_shunt_vsource(core_model, core_model.base_mva)
+        with BatchRewrite(core_model) as rewrite:
+            for ward in core_model.type_list(Ward):
+                ward.replace_with_load_and_shunt(core_model, rewrite)
 
-        impedances = core_model.type_list(Impedance)
-        for impedance in impedances:
-            impedance.replace_with_line(core_model, Platform.PYPSA)
+        with BatchRewrite(core_model) as rewrite:
+            for impedance in core_model.type_list(Impedance):
+                impedance.replace_with_line(core_model, Platform.PYPSA, rewrite)
 
-        switches = core_model.type_list(Switch)
-        for switch in switches:
-            switch.replace_with_line_if_closed(core_model, Platform.PYPSA)
+        with BatchRewrite(core_model) as rewrite:
+            for switch in core_model.type_list(Switch):
+                switch.replace_with_line_if_closed(core_model, Platform.PYPSA, rewrite)
 
         return core_model
 
@@ -51,7 +57,8 @@ class PyPSAConverter(ConverterBase[pypsa_network]):
         return PyPSAExporter.export_pypsa(core_model=core_model, name=name)
 
     def to_gdf(self, model: pypsa_network, log_path: str | None = None) -> CoreModel:
-        return NotImplementedError
+        with Configuration().scoped(Platform.PYPSA):
+            return super().to_gdf(model, log_path)
 
     def _import(self, model: pypsa_network) -> CoreModel:
-        raise NotImplementedError
+        return import_pypsa(model)
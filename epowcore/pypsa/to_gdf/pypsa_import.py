@@ -0,0 +1,576 @@
+import math
+
+import numpy as np
+import numpy.typing as npt
+import pandas as pd
+from pypsa import Network
+
+from epowcore.gdf.bus import Bus, BusType, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.generators.generator import GeneratorCategory
+from epowcore.gdf.generators.static_generator import StaticGenerator
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.load import Load
+from epowcore.gdf.shunt import Shunt
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.generic.configuration import Configuration
+from epowcore.generic.constants import Platform
+from epowcore.generic.logger import Logger
+from epowcore.generic.tools.table_import import (
+    MACHINE_DEFAULT_ATTRIBUTES,
+    Connection,
+    float_column,
+    machine_defaults,
+)
+
+# carriers of PyPSA-Eur networks that are not named like a generator category
+_CARRIER_CATEGORIES = {
+    "onwind": GeneratorCategory.WIND,
+    "offwind-ac": GeneratorCategory.WIND,
+    "offwind-dc": GeneratorCategory.WIND,
+    "offwind-float": GeneratorCategory.WIND,
+    "solar": GeneratorCategory.SOLAR,
+    "solar-hsat": GeneratorCategory.SOLAR,
+    "ror": GeneratorCategory.HYDRO,
+    "hydro": GeneratorCategory.HYDRO,
+    "phs": GeneratorCategory.PUMP_STORAGE,
+    "nuclear": GeneratorCategory.NUCLEAR,
+    "coal": GeneratorCategory.COAL,
+    "lignite": GeneratorCategory.COAL,
+    "ccgt": GeneratorCategory.GAS,
+    "ocgt": GeneratorCategory.GAS,
+    "oil": GeneratorCategory.OIL,
+    "biomass": GeneratorCategory.BIOFUEL,
+    "geothermal": GeneratorCategory.GEOTHERMAL,
+    **{category.value.lower(): category for category in GeneratorCategory},
+}
+
+# components that are not imported
+_UNSUPPORTED_COMPONENTS = ["links", "storage_units", "stores"]
+
+
+def import_pypsa(network: Network) -> CoreModel:
+    """Import a PyPSA network and convert it to a GDF CoreModel.
+
+    The static component tables are processed column-wise: bus references are resolved for whole
+    columns, unit conversions are applied to all rows at once, uids are allocated in blocks and
+    all connections are inserted into the graph in one call.
+    Only the static data is imported, time series (e.g. of PyPSA-Eur networks) are ignored.
+
+    The component names are used as uids as long as all of them are non-negative integers
+    that are unique across all tables, so exporting the imported model with `PyPSAExporter`
+    preserves the names. Inactive components are skipped.
+
+    :param network: The PyPSA network to import.
+    :type network: Network
+    :return: The imported CoreModel.
+    :rtype: CoreModel
+    """
+    base_frequency = Configuration().get_default("Network", "base_frequency", Platform.PYPSA)
+    if base_frequency is None:
+        raise ValueError("No default value found for Network.base_frequency")
+    core_model = CoreModel(base_frequency=base_frequency)
+
+    components = network.components
+    for name in _UNSUPPORTED_COMPONENTS:
+        if len(components[name].static) > 0:
+            Logger.log_to_selected(
+                f"Skipping {len(components[name].static)} components of type '{name}'"
+            )
+
+    buses_table = components.buses.static
+    bus_lookup = pd.Index(buses_table.index)
+
+    def bus_index(table: pd.DataFrame, column: str) -> npt.NDArray:
+        positions = bus_lookup.get_indexer(table[column].to_numpy())
+        if np.any(positions < 0):
+            unknown = table[column].to_numpy()[positions < 0]
+            raise ValueError(
+                f"PyPSA components reference unknown buses: {np.unique(unknown).tolist()}"
+            )
+        return positions
+
+    def active(name: str, bus_columns: list[str]) -> tuple[pd.DataFrame, list[npt.NDArray]]:
+        """The active rows of a component table and their bus rows."""
+        table = components[name].static
+        mask = float_column(table, "active", 1.0).astype(bool)
+        if np.count_nonzero(~mask) > 0:
+            Logger.log_to_selected(f"Skipping {np.count_nonzero(~mask)} inactive {name}")
+        table = table[mask]
+        return table, [bus_index(table, column) for column in bus_columns]
+
+    loads, (load_bus,) = active("loads", ["bus"])
+    generators, (generator_bus,) = active("generators", ["bus"])
+    shunts, (shunt_bus,) = active("shunt_impedances", ["bus"])
+    lines, (line_from, line_to) = active("lines", ["bus0", "bus1"])
+    trafos, (trafo_hv, trafo_lv) = active("transformers", ["bus0", "bus1"])
+
+    uids = _allocate_uids(
+        [buses_table.index, loads.index, generators.index, shunts.index, lines.index, trafos.index]
+    )
+
+    # PyPSA determines the bus types from the control of the connected generators
+    control = _strings(generators, "control", "PQ")
+    lf_bus_type = np.full(len(buses_table), LFBusType.PQ.value, dtype=object)
+    lf_bus_type[generator_bus[control == "PV"]] = LFBusType.PV.value
+    lf_bus_type[generator_bus[control == "Slack"]] = LFBusType.SL.value
+
+    buses = _create_buses(core_model, buses_table, uids[0], lf_bus_type)
+    v_nom = float_column(buses_table, "v_nom", np.nan)
+    v_set = float_column(buses_table, "v_mag_pu_set", 1.0)
+
+    connections = _create_loads(core_model, loads, uids[1], buses, load_bus)
+    connections += _create_generators(
+        core_model, generators, uids[2], buses, generator_bus, v_nom, v_set
+    )
+    connections += _create_shunts(core_model, shunts, uids[3], buses, shunt_bus, v_nom)
+    connections += _create_lines(
+        core_model, network, lines, uids[4], buses, line_from, line_to, v_nom
+    )
+    connections += _create_transformers(
+        core_model, network, trafos, uids[5], buses, trafo_hv, trafo_lv, v_nom
+    )
+
+    core_model.graph.add_edges_from(connections)
+    return core_model
+
+
+def _allocate_uids(indices: list[pd.Index]) -> list[npt.NDArray]:
+    """Use the component names as uids if all of them are non-negative integers that are unique
+    across all tables. Otherwise, all components are numbered consecutively.
+    """
+    names = pd.Index(np.concatenate([index.to_numpy(dtype=object) for index in indices]))
+    numbers = pd.to_numeric(pd.Series(names, dtype=object), errors="coerce").to_numpy()
+    valid = (
+        not np.any(np.isnan(numbers))
+        and np.all(numbers >= 0)
+        and np.all(numbers == np.floor(numbers))
+        and names.astype(str).equals(pd.Index(numbers.astype(np.int64)).astype(str))
+        and pd.Index(numbers).is_unique
+    )
+    if valid:
+        uids = numbers.astype(np.int64)
+    else:
+        Logger.log_to_selected("Component names are not unique integers, allocating new uids")
+        uids = np.arange(len(names), dtype=np.int64)
+    return np.split(uids, np.cumsum([len(index) for index in indices])[:-1])
+
+
+def _strings(table: pd.DataFrame, column: str, default: str) -> npt.NDArray:
+    """String values of an optional column. Missing columns and values are replaced by
+    [default]."""
+    if column not in table.columns:
+        return np.full(len(table), default, dtype=object)
+    return table[column].fillna(default).astype(str).to_numpy(dtype=object)
+
+
+def _optional(values: list[float]) -> list[float | None]:
+    """Replace NaN and infinite values by None."""
+    return [value if math.isfinite(value) else None for value in values]
+
+
+def _create_buses(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    lf_bus_type: npt.NDArray,
+) -> list[Bus]:
+    """Create the Buses, indexed like the rows of the bus table."""
+    x = float_column(table, "x", np.nan).tolist()
+    y = float_column(table, "y", np.nan).tolist()
+    coords = [
+        None if math.isnan(bus_x) or math.isnan(bus_y) else (bus_x, bus_y)
+        for bus_x, bus_y in zip(x, y)
+    ]
+    # the export writes the bus type to the otherwise unused 'type' column
+    bus_types: dict[BusType | str, BusType] = {bus_type: bus_type for bus_type in BusType}
+    bus_types.update((bus_type.value, bus_type) for bus_type in BusType)
+    types = (
+        table["type"].map(bus_types).fillna(BusType.BUSBAR).tolist()
+        if "type" in table.columns
+        else [BusType.BUSBAR] * len(table)
+    )
+    buses = [
+        Bus(
+            uid,
+            name,
+            coord,
+            lf_bus_type=LFBusType(lf_type),
+            nominal_voltage=v_nom,
+            bus_type=bus_type,
+        )
+        for uid, name, coord, lf_type, v_nom, bus_type in zip(
+            uids.tolist(),
+            table.index.astype(str).tolist(),
+            coords,
+            lf_bus_type.tolist(),
+            float_column(table, "v_nom", np.nan).tolist(),
+            types,
+        )
+    ]
+    core_model.add_components(buses)
+    return buses
+
+
+def _create_loads(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: list[Bus],
+    bus_rows: npt.NDArray,
+) -> list[Connection]:
+    """Create the Loads. PyPSA loads with the default sign of -1 consume [p_set]."""
+    sign = -float_column(table, "sign", -1.0)
+    loads = [
+        Load(uid, name, active_power=p, reactive_power=q)
+        for uid, name, p, q in zip(
+            uids.tolist(),
+            table.index.astype(str).tolist(),
+            (float_column(table, "p_set", 0.0) * sign).tolist(),
+            (float_column(table, "q_set", 0.0) * sign).tolist(),
+        )
+    ]
+    core_model.add_components(loads)
+    return [(buses[i], load, {}) for i, load in zip(bus_rows.tolist(), loads)]
+
+
+def _create_generators(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: list[Bus],
+    bus_rows: npt.NDArray,
+    v_nom: npt.NDArray,
+    v_set: npt.NDArray,
+) -> list[Connection]:
+    """Create SynchronousMachines from the voltage controlling generators and StaticGenerators
+    from the PQ generators. PyPSA has no reactive power limits, they are set to the rated
+    apparent power. Dynamic parameters are taken from the configuration.
+    """
+    defaults = machine_defaults(Platform.PYPSA, MACHINE_DEFAULT_ATTRIBUTES + ["power_factor"])
+    power_factor = defaults.pop("power_factor")
+
+    controlling = _strings(table, "control", "PQ") != "PQ"
+    if np.any(controlling):
+        Logger.log_to_selected(f"Using defaults for imported synchronous machines: {defaults}")
+
+    carriers = pd.Series(_strings(table, "carrier", ""))
+    categories = carriers.str.lower().map(_CARRIER_CATEGORIES).fillna(GeneratorCategory.OTHER)
+
+    sign = float_column(table, "sign", 1.0)
+    p_nom = float_column(table, "p_nom", 0.0)
+    s_nom = np.where(controlling, np.abs(p_nom) / power_factor, np.abs(p_nom))
+    values = np.column_stack(
+        [
+            s_nom,
+            p_nom,
+            float_column(table, "p_set", 0.0) * sign,
+            float_column(table, "q_set", 0.0) * sign,
+            float_column(table, "p_min_pu", 0.0) * p_nom,
+            float_column(table, "p_max_pu", 1.0) * p_nom,
+            v_nom[bus_rows],
+            v_set[bus_rows],
+        ]
+    ).tolist()
+
+    generators: list[SynchronousMachine | StaticGenerator] = []
+    for uid, name, is_machine, category, v in zip(
+        uids.tolist(),
+        table.index.astype(str).tolist(),
+        controlling.tolist(),
+        categories.tolist(),
+        values,
+    ):
+        common = {
+            "uid": uid,
+            "name": name,
+            "rated_apparent_power": v[0],
+            "rated_active_power": v[1],
+            "active_power": v[2],
+            "reactive_power": v[3],
+            "voltage_set_point": v[7],
+            "p_min": v[4],
+            "p_max": v[5],
+            "q_min": -v[0],
+            "q_max": v[0],
+        }
+        if is_machine:
+            generators.append(
+                SynchronousMachine(
+                    **common,
+                    **defaults,
+                    rated_voltage=v[6],
+                    pc1=0.0,
+                    pc2=0.0,
+                    qc1_min=0.0,
+                    qc1_max=0.0,
+                    qc2_min=0.0,
+                    qc2_max=0.0,
+                )
+            )
+        else:
+            generators.append(StaticGenerator(**common))
+        # the category is not a dataclass field of the generators
+        generators[-1].category = category
+    core_model.add_components(generators)
+    return [(buses[i], gen, {}) for i, gen in zip(bus_rows.tolist(), generators)]
+
+
+def _create_shunts(
+    core_model: CoreModel,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: list[Bus],
+    bus_rows: npt.NDArray,
+    v_nom: npt.NDArray,
+) -> list[Connection]:
+    """Create the Shunts with their power at nominal voltage.
+    A positive PyPSA susceptance is capacitive and generates reactive power."""
+    v_squared = v_nom[bus_rows] ** 2
+    shunts = [
+        Shunt(uid, name, p=p, q=q)
+        for uid, name, p, q in zip(
+            uids.tolist(),
+            table.index.astype(str).tolist(),
+            (float_column(table, "g", 0.0) * v_squared).tolist(),
+            (-float_column(table, "b", 0.0) * v_squared).tolist(),
+        )
+    ]
+    core_model.add_components(shunts)
+    return [(buses[i], shunt, {}) for i, shunt in zip(bus_rows.tolist(), shunts)]
+
+
+def _type_data(
+    types: pd.DataFrame, table: pd.DataFrame, columns: list[str], kind: str
+) -> tuple[npt.NDArray, pd.DataFrame]:
+    """Mask of the rows with a standard type and the type data of all rows."""
+    type_names = _strings(table, "type", "")
+    typed = type_names != ""
+    unknown = ~pd.Index(type_names[typed]).isin(types.index)
+    if np.any(unknown):
+        raise ValueError(f"Unknown {kind} types: {np.unique(type_names[typed][unknown]).tolist()}")
+    return typed, types.reindex(type_names)[columns]
+
+
+def _create_lines(
+    core_model: CoreModel,
+    network: Network,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: list[Bus],
+    from_rows: npt.NDArray,
+    to_rows: npt.NDArray,
+    v_nom: npt.NDArray,
+) -> list[Connection]:
+    """Create the TLines with the per km values of a single circuit.
+
+    The impedances of lines without a standard type are the totals of all parallel circuits.
+    Lines without a length get absolute values. A fractional number of parallel circuits is
+    merged into the per km values of one circuit.
+    """
+    length = float_column(table, "length", 0.0)
+    num_parallel = float_column(table, "num_parallel", 1.0)
+    integral = (num_parallel >= 1) & (num_parallel == np.floor(num_parallel))
+    parallel = np.where(integral, num_parallel, 1.0)
+    if not np.all(integral):
+        Logger.log_to_selected(
+            f"Merging the circuits of {np.count_nonzero(~integral)} lines with a fractional "
+            "number of parallel circuits"
+        )
+
+    per_km = length > 0
+    divisor = np.where(per_km, length, 1.0)
+    r = float_column(table, "r", 0.0) * parallel / divisor
+    x = float_column(table, "x", 0.0) * parallel / divisor
+    b = float_column(table, "b", 0.0) * 1e6 / parallel / divisor
+    rating = float_column(table, "s_nom", 0.0) / parallel
+
+    typed, types = _type_data(
+        network.components.line_types.static,
+        table,
+        ["f_nom", "r_per_length", "x_per_length", "c_per_length", "i_nom"],
+        "line",
+    )
+    if np.any(typed):
+        per_km |= typed
+        share = parallel / num_parallel
+        r = np.where(typed, types["r_per_length"].to_numpy() * share, r)
+        x = np.where(typed, types["x_per_length"].to_numpy() * share, x)
+        c_nf = types["c_per_length"].to_numpy()
+        b = np.where(typed, 2 * math.pi * types["f_nom"].to_numpy() * c_nf * 1e-3 / share, b)
+        i_ka = types["i_nom"].to_numpy()
+        rating = np.where(typed, math.sqrt(3) * i_ka * v_nom[from_rows] / share, rating)
+
+    values = np.column_stack(
+        [
+            np.where(per_km, length, np.nan),
+            r,
+            x,
+            b,
+            rating,
+            parallel,
+            float_column(table, "v_ang_min", np.nan),
+            float_column(table, "v_ang_max", np.nan),
+        ]
+    ).tolist()
+    lines = [
+        TLine(
+            uid,
+            name,
+            length=None if math.isnan(v[0]) else v[0],
+            r1=v[1],
+            x1=v[2],
+            b1=v[3],
+            rating=v[4],
+            parallel_lines=int(v[5]),
+            angle_min=angle_min,
+            angle_max=angle_max,
+        )
+        for uid, name, v, angle_min, angle_max in zip(
+            uids.tolist(),
+            table.index.astype(str).tolist(),
+            values,
+            _optional([v[6] for v in values]),
+            _optional([v[7] for v in values]),
+        )
+    ]
+    core_model.add_components(lines)
+    connections: list[Connection] = []
+    for f, t, line in zip(from_rows.tolist(), to_rows.tolist(), lines):
+        connections.append((buses[f], line, {line.uid: ["A"]}))
+        connections.append((buses[t], line, {line.uid: ["B"]}))
+    return connections
+
+
+def _create_transformers(
+    core_model: CoreModel,
+    network: Network,
+    table: pd.DataFrame,
+    uids: npt.NDArray,
+    buses: list[Bus],
+    bus0_rows: npt.NDArray,
+    bus1_rows: npt.NDArray,
+    v_nom: npt.NDArray,
+) -> list[Connection]:
+    """Create the TwoWindingTransformers with p.u. values based on the total rating of all
+    parallel units. Transformers with 'bus1' on the higher voltage are turned around, with the
+    inverse tap ratio and the negated phase shift."""
+    swapped = v_nom[bus0_rows] < v_nom[bus1_rows]
+    if np.any(swapped):
+        Logger.log_to_selected(
+            f"Connecting 'bus1' of {np.count_nonzero(swapped)} transformers "
+            "to the high voltage side"
+        )
+    hv_rows = np.where(swapped, bus1_rows, bus0_rows)
+    lv_rows = np.where(swapped, bus0_rows, bus1_rows)
+
+    tap_defaults = {
+        attr: Configuration().get_default("TwoWindingTransformer", attr, Platform.PYPSA)
+        for attr in ("tap_changer_voltage", "tap_min", "tap_max", "tap_neutral")
+    }
+    s_nom = float_column(table, "s_nom", 0.0)
+    g = float_column(table, "g", 0.0)
+    rating = s_nom
+    r = float_column(table, "r", 0.0)
+    x = float_column(table, "x", 0.0)
+    pfe_kw = g * s_nom * 1000
+    no_load_current = np.hypot(g, float_column(table, "b", 0.0)) * 100
+    phase_shift = float_column(table, "phase_shift", 0.0)
+    tap_changer_voltage = np.full(len(table), tap_defaults["tap_changer_voltage"], dtype=float)
+    tap_min = np.full(len(table), tap_defaults["tap_min"], dtype=float)
+    tap_max = np.full(len(table), tap_defaults["tap_max"], dtype=float)
+    tap_neutral = np.full(len(table), tap_defaults["tap_neutral"], dtype=float)
+    tap_position = float_column(table, "tap_position", 0.0)
+    tap_ratio = float_column(table, "tap_ratio", 1.0)
+
+    typed, types = _type_data(
+        network.components.transformer_types.static,
+        table,
+        ["s_nom", "vsc", "vscr", "pfe", "i0", "phase_shift", "tap_step", "tap_min", "tap_max"]
+        + ["tap_neutral"],
+        "transformer",
+    )
+    if np.any(typed):
+        num_parallel = float_column(table, "num_parallel", 1.0)
+        vsc, vscr = types["vsc"].to_numpy(), types["vscr"].to_numpy()
+        rating = np.where(typed, types["s_nom"].to_numpy() * num_parallel, rating)
+        r = np.where(typed, vscr / 100, r)
+        x = np.where(typed, np.sqrt(np.maximum(vsc**2 - vscr**2, 0.0)) / 100, x)
+        pfe_kw = np.where(typed, types["pfe"].to_numpy() * num_parallel, pfe_kw)
+        no_load_current = np.where(typed, types["i0"].to_numpy(), no_load_current)
+        phase_shift = np.where(typed, types["phase_shift"].to_numpy(), phase_shift)
+        tap_changer_voltage = np.where(
+            typed, types["tap_step"].to_numpy() / 100, tap_changer_voltage
+        )
+        tap_min = np.where(typed, types["tap_min"].to_numpy(), tap_min)
+        tap_max = np.where(typed, types["tap_max"].to_numpy(), tap_max)
+        tap_neutral = np.where(typed, types["tap_neutral"].to_numpy(), tap_neutral)
+        tap_ratio = np.where(
+            typed, 1 + (tap_position - tap_neutral) * tap_changer_voltage, tap_ratio
+        )
+
+    # the tap ratio is given at 'bus0'
+    tap_ratio = np.divide(1.0, tap_ratio, out=tap_ratio.copy(), where=swapped & (tap_ratio != 0))
+    shift_30 = np.rint(np.where(swapped, -phase_shift, phase_shift) / 30)
+    rounded = np.count_nonzero(shift_30 * 30 != np.where(swapped, -phase_shift, phase_shift))
+    if rounded > 0:
+        Logger.log_to_selected(
+            f"Rounding the phase shift of {rounded} transformers to multiples of 30 degrees"
+        )
+
+    values = np.column_stack(
+        [
+            rating,
+            v_nom[hv_rows],
+            v_nom[lv_rows],
+            r,
+            x,
+            pfe_kw,
+            no_load_current,
+            shift_30,
+            tap_changer_voltage,
+            tap_min,
+            tap_max,
+            tap_neutral,
+            tap_position,
+            tap_ratio,
+            float_column(table, "v_ang_min", np.nan),
+            float_column(table, "v_ang_max", np.nan),
+        ]
+    ).tolist()
+    trafos = [
+        TwoWindingTransformer(
+            uid,
+            name,
+            rating=v[0],
+            voltage_hv=v[1],
+            voltage_lv=v[2],
+            r1pu=v[3],
+            x1pu=v[4],
+            pfe_kw=v[5],
+            no_load_current=v[6],
+            phase_shift_30=int(v[7]),
+            tap_changer_voltage=v[8],
+            tap_min=int(v[9]),
+            tap_max=int(v[10]),
+            tap_neutral=int(v[11]),
+            tap_initial=int(v[12]),
+            tap_ratio=v[13],
+            angle_min=angle_min,
+            angle_max=angle_max,
+        )
+        for uid, name, v, angle_min, angle_max in zip(
+            uids.tolist(),
+            table.index.astype(str).tolist(),
+            values,
+            _optional([v[14] for v in values]),
+            _optional([v[15] for v in values]),
+        )
+    ]
+    core_model.add_components(trafos)
+    connections: list[Connection] = []
+    for hv, lv, trafo in zip(hv_rows.tolist(), lv_rows.tolist(), trafos):
+        connections.append((buses[hv], trafo, {trafo.uid: ["HV"]}))
+        connections.append((buses[lv], trafo, {trafo.uid: ["LV"]}))
+    return connections
@@ -111,11 +111,11 @@ def add_elements_to_hierarchy(
             load_cost += gm.load_unit_costs[component.uuid]
             del gm.load_unit_costs[component.uuid]
         else:
-            load_cost += component.load_units
+            load_cost += gm.component_load_units(component)
         hierarchy.add_component(component)
     if bus_label_duplicate is not None:
         hierarchy.add_component(bus_label_duplicate)
-        load_cost += bus_label_duplicate.load_units
+        load_cost += gm.component_load_units(bus_label_duplicate)
     # Add components like busline or wire to the hierarchy
     if connecting_items is not None:
         for item in connecting_items:
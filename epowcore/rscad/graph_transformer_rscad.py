@@ -1,13 +1,18 @@
 from collections import defaultdict
 import math
+from typing import TYPE_CHECKING
 
 import networkx as nx
-from pyapi_rts.api import Draft, Subsystem
-from pyapi_rts.api.lark.rlc_tline import RLCTLine
 
-from pyapi_rts.api.component import Component as RSCADComponent
 from epowcore.gdf.component import Component
 from epowcore.generic.component_graph import ComponentGraph
+from epowcore.generic.configuration import Configuration
+from epowcore.rscad.rack_partitioner import RackPartition, partition_racks
+
+if TYPE_CHECKING:
+    from pyapi_rts.api import Draft, Subsystem
+    from pyapi_rts.api.component import Component as RSCADComponent
+    from pyapi_rts.api.lark.rlc_tline import RLCTLine
 
 
 class GraphTransformerRscad:
@@ -15,26 +20,42 @@ class GraphTransformerRscad:
 
     def __init__(self) -> None:
         super().__init__()
+        self.cost_table: dict[str, int] = dict(Configuration().get("RSCAD.LoadUnitCosts") or {})
+        """Load unit costs by RSCAD component type, overriding the costs of the components."""
         # Setup dictionary containing the load unit costs of hierarchy boxes
-        # TODO: What are default costs?
-        self.load_unit_costs: dict[str, int] = defaultdict(lambda: 10)
+        self.load_unit_costs: dict[str, int] = defaultdict(
+            lambda: self.cost_table.get("HIERARCHY", 10)
+        )
         self.line_connection_graph: dict = defaultdict(list)
 
+    def component_load_units(self, component: "RSCADComponent") -> int:
+        """Returns the load unit costs of a component from the cost table or the component."""
+        return self.cost_table.get(component.type, component.load_units)
+
     def relabel_nodes(
         self, graph: ComponentGraph, transformation_dict: dict[Component, str]
     ) -> nx.Graph:
-        """Relabels the nodes of the given graph with the given transformation_dict."""
-        int_graph = graph.get_internal_graph()
-        # edge = tuple: component uid, component uid, data
-        for left, right, data in list(graph.edges.data()):
+        """Relabels the nodes of the given graph with the given transformation_dict.
+        The connector names of each edge are additionally stored under the new labels."""
+        int_graph = graph.get_internal_graph(copy=False)
+        relabeled = nx.Graph()
+        relabeled.add_nodes_from(
+            (transformation_dict.get(node, node), dict(data))
+            for node, data in int_graph.nodes(data=True)
+        )
+        # edge = tuple: component, component, connector names by component uid
+        edges = []
+        for left, right, data in int_graph.edges(data=True):
             left_id = transformation_dict[left]
             right_id = transformation_dict[right]
-            left_data = data.get(left.uid, [])
-            right_data = data.get(right.uid, [])
-            int_graph.edges[left, right].update({left_id: left_data, right_id: right_data})
-        return nx.relabel_nodes(int_graph, transformation_dict)
-
-    def get_subgraph(self, nodes: list[RSCADComponent], graph: nx.Graph) -> nx.Graph:
+            edge_data = {key: list(value) for key, value in data.items()}
+            edge_data[left_id] = list(data.get(left.uid, []))
+            edge_data[right_id] = list(data.get(right.uid, []))
+            edges.append((left_id, right_id, edge_data))
+        relabeled.add_edges_from(edges)
+        return relabeled
+
+    def get_subgraph(self, nodes: "list[RSCADComponent]", graph: nx.Graph) -> nx.Graph:
         """Returns a copy of a subgraph from the given nodes of graph"""
         return graph.subgraph([node.uuid for node in nodes]).copy()
 
@@ -42,20 +63,19 @@ class GraphTransformerRscad:
         self,
         graph: nx.Graph,
         subgraph: nx.Graph,
-        new_node: RSCADComponent,
-        draft: Draft,
-        bus_edge: RSCADComponent | None = None,
-    ) -> list[RSCADComponent]:
+        new_node: "RSCADComponent",
+        draft: "Draft",
+        bus_edge: "RSCADComponent | None" = None,
+    ) -> "list[RSCADComponent]":
         """Replaces the given subgraph with newNode in graph.
         newNode gets the outgoing edges from subgraph to graph.
         Returns a list of nodes to remove from the original graph"""
-        # Get all edges between subgraph and graph
-
+        # Get all edges between subgraph and graph from the neighbors of the subgraph nodes
         outgoing_edges = [
-            e
-            for e in graph.edges
-            if (e[0] in subgraph and e[1] in graph and e[1] not in subgraph)
-            or (e[0] in graph and e[1] in subgraph and e[0] not in subgraph)
+            (node, neighbor)
+            for node in subgraph.nodes
+            for neighbor in graph.adj[node]
+            if neighbor not in subgraph
         ]
 
         # Remove all edges of the subgraph from the original graph, except for RSCAD busLabel
@@ -80,8 +100,8 @@ class GraphTransformerRscad:
         return nodes_to_remove
 
     def replace_single_subgraph(
-        self, graph: nx.Graph, subgraph: nx.Graph, new_node: RSCADComponent
-    ) -> list[RSCADComponent]:
+        self, graph: nx.Graph, subgraph: nx.Graph, new_node: "RSCADComponent"
+    ) -> "list[RSCADComponent]":
         """Replaces a group of nodes with a single new node without adding any edges from the removed nodes back"""
         nodes_to_remove = []
         for node in subgraph.nodes:
@@ -92,7 +112,7 @@ class GraphTransformerRscad:
         return nodes_to_remove
 
     def create_tline_connection_graph(
-        self, subsystem: Subsystem, tli_files: list[RLCTLine]
+        self, subsystem: "Subsystem", tli_files: "list[RLCTLine] | dict[str, RLCTLine]"
     ) -> nx.Graph:
         """Creates a connection graph on the highest hierarchy level containing the hierarchy
         bus boxes as nodes and TLine elements as edges"""
@@ -101,85 +121,93 @@ class GraphTransformerRscad:
         hierarchy_ids = [c.uuid for c in subsystem.get_components(False, False) if c.type == "HIERARCHY"]
         connection_graph.add_nodes_from(hierarchy_ids, visited=False)
         edge_nodes = self.extract_edges()
-        nx.set_node_attributes(connection_graph, self.load_unit_costs, "LoadUnitCosts")
+        nx.set_node_attributes(
+            connection_graph,
+            {hierarchy: self.load_unit_costs[hierarchy] for hierarchy in hierarchy_ids},
+            "LoadUnitCosts",
+        )
+        tli_index = tli_files if isinstance(tli_files, dict) else self.index_tli_files(tli_files)
+        added_lines = set()
         for hierarchy in hierarchy_ids:
-            edges = self.line_connection_graph.get(hierarchy)
-            if edges is not None:
-                for edge in edges:
-                    nodes = edge_nodes[edge]
-                    tli_file = edge
-                    # Add the transmission time of the TLine as an edge attribute
-                    propagation_time = self.get_transmission_time(tli_file, tli_files)
-                    connection_graph.add_edge(nodes[0], nodes[1], time=propagation_time)
+            for tli_file in self.line_connection_graph.get(hierarchy, []):
+                nodes = edge_nodes[tli_file]
+                # Skip lines inside a hierarchy and lines to hierarchies of other subsystems
+                if (
+                    tli_file in added_lines
+                    or len(set(nodes)) != 2
+                    or not all(node in connection_graph for node in nodes)
+                ):
+                    continue
+                added_lines.add(tli_file)
+                # Add the transmission time of the TLine as an edge attribute,
+                # parallel lines are counted and the shortest time is kept
+                propagation_time = self.get_transmission_time(tli_file, tli_index)
+                if connection_graph.has_edge(nodes[0], nodes[1]):
+                    data = connection_graph.edges[nodes[0], nodes[1]]
+                    data["time"] = min(data["time"], propagation_time)
+                    data["lines"] += 1
+                else:
+                    connection_graph.add_edge(nodes[0], nodes[1], time=propagation_time, lines=1)
         return connection_graph
 
-    def get_transmission_time(self, tline: RLCTLine, tli_files: list[RLCTLine]) -> float:
-        """Returns the lowest transmission time of the given RLCTLine file"""
-        time = 0.00005
+    def get_transmission_time(
+        self, tline: str, tli_files: "list[RLCTLine] | dict[str, RLCTLine]"
+    ) -> float:
+        """Returns the lowest transmission time of the given RLCTLine file.
+
+        :param tline: The name of the TLine.
+        :param tli_files: The TLI files, or the TLI files by TLine name, see `index_tli_files`.
+        :return: The transmission time in seconds, 50 µs if there is no file for the TLine.
+        """
+        if isinstance(tli_files, list):
+            tli_files = self.index_tli_files(tli_files)
+        tli_file = tli_files.get(tline)
+        if tli_file is None:
+            return 0.00005
+        l0 = tli_file.xind0 / (2 * math.pi * tli_file.frequency)
+        if tli_file.xcap0 != 0:
+            c0 = 1 / (2 * math.pi * tli_file.frequency * tli_file.xcap0)
+        else:
+            c0 = 1
+        time0 = math.sqrt(l0 * c0) * tli_file.length
+        l1 = tli_file.xind1 / (2 * math.pi * tli_file.frequency)
+        if tli_file.xcap1 != 0:
+            c1 = 1 / (2 * math.pi * tli_file.frequency * tli_file.xcap1)
+        else:
+            c1 = 1
+        time1 = math.sqrt(l1 * c1) * tli_file.length
+        # Return the minimum of the transmission times
+        return min(time0, time1)
+
+    def index_tli_files(self, tli_files: "list[RLCTLine]") -> "dict[str, RLCTLine]":
+        """Returns the TLine files by their name. The first file of a name is used."""
+        index: dict[str, RLCTLine] = {}
         for tli_file in tli_files:
-            if tli_file.name == tline:
-                l0 = tli_file.xind0 / (2 * math.pi * tli_file.frequency)
-                if tli_file.xcap0 != 0:
-                    c0 = 1 / (2 * math.pi * tli_file.frequency * tli_file.xcap0)
-                else:
-                    c0 = 1
-                time0 = math.sqrt(l0 * c0) * tli_file.length
-                l1 = tli_file.xind1 / (2 * math.pi * tli_file.frequency)
-                if tli_file.xcap0 != 0:
-                    c1 = 1 / (2 * math.pi * tli_file.frequency * tli_file.xcap1)
-                else:
-                    c1 = 1
-                time1 = math.sqrt(l1 * c1) * tli_file.length
-                # Return the minimum of the transmission times
-                return min(time0, time1)
-        return time
+            index.setdefault(tli_file.name, tli_file)
+        return index
 
-    def distribute_load_unit_costs(
+    def partition_subsystem(
         self,
-        load_costs: int,
-        subsystem: Subsystem,
-        propagation_time: float,
+        subsystem: "Subsystem",
         max_load: int,
-        tli_files: list[RLCTLine],
-    ) -> set[str]:
-        """Returns nodes to move into a new subsystem to reduce the load unit costs of the given subsystem
+        timestep: float,
+        tli_files: "list[RLCTLine] | dict[str, RLCTLine]",
+        num_racks: int | None = None,
+    ) -> RackPartition:
+        """Distributes the hierarchies of the subsystem onto RTDS racks with balanced load unit
+        costs and as few lines between the racks as possible, see `partition_racks`.
 
-        :param load_costs: The load unit costs of the subsystem
         :param subsystem: The subsystem to distribute the load unit costs in
-        :param propagation_time: The maximum propagation time of the subsystem
-        :param max_load: The maximum load unit costs of the subsystem
-        :param tli_files: The TLines between the hierarchy bus boxes
-        :return: The nodes to move into a new subsystem
+        :param max_load: The maximum load unit costs of a rack
+        :param timestep: The simulation time step, shorter lines do not decouple racks
+        :param tli_files: The TLI files of the TLines, or the TLI files by TLine name
+        :param num_racks: The number of racks, defaults to the minimum number of racks needed
+        :return: The hierarchy ids of each rack
         """
         hierarchy_graph = self.create_tline_connection_graph(subsystem, tli_files)
-        # TODO: Causes a key error when the case is divided into a third subsystem
-        # Some nodes are in the graph without load unit costs
-        # and some nodes in the graph are not in the subsystem
-        moved_nodes = set()
-        edges_to_remove = {
-            (u, v) for u, v, d in hierarchy_graph.edges(data=True) if d["time"] >= propagation_time
-        }
-        subgraph_dict = {}
-        # Check the every node for its neighbors
-        # Remove the edges
-        hierarchy_graph.remove_edges_from(edges_to_remove)
-        # Write all subgraphs with their costs into a dictionary
-
-        for subgraph in (
-            hierarchy_graph.subgraph(c) for c in nx.connected_components(hierarchy_graph)
-        ):
-            sum_cost = sum(subgraph.nodes[node]["LoadUnitCosts"] for node in subgraph.nodes)
-            subgraph_dict[subgraph] = sum_cost
-
-        # Move until the load costs are below the maximum load
-        for subgraph, cost in subgraph_dict.items():
-            if load_costs < max_load:
-                break
-            load_costs -= cost
-            moved_nodes.update(subgraph.nodes)
-        return moved_nodes
-
-    def extract_edges(self) -> dict[RSCADComponent, list]:
+        return partition_racks(hierarchy_graph, max_load, timestep, num_racks)
+
+    def extract_edges(self) -> "dict[RSCADComponent, list]":
         """Return a dict containing the Tlines as keys with their connected hierarchies as values"""
         connections = list(self.line_connection_graph.items())
         edge_dictionary = defaultdict(list)
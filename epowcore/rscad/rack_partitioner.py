@@ -0,0 +1,261 @@
+import math
+from collections import defaultdict
+from collections.abc import Hashable
+from dataclasses import dataclass
+
+import networkx as nx
+
+from epowcore.generic.logger import Logger
+
+
+@dataclass
+class RackPartition:
+    """The result of distributing the hierarchies of a subsystem onto RTDS racks."""
+
+    racks: list[set[Hashable]]
+    """The nodes of each rack."""
+    loads: list[float]
+    """The summed load unit costs of each rack."""
+    cut_lines: int
+    """The number of lines between hierarchies in different racks."""
+
+
+def partition_racks(
+    graph: nx.Graph,
+    max_load: float,
+    timestep: float,
+    num_racks: int | None = None,
+    imbalance: float = 0.05,
+    max_passes: int = 20,
+) -> RackPartition:
+    """Distribute the nodes of a connection graph onto racks with balanced load unit costs and
+    as few lines between the racks as possible.
+
+    Nodes are hierarchies with their costs in the "LoadUnitCosts" attribute. Edges are lines with
+    their propagation time in the "time" attribute and optionally the number of parallel lines in
+    the "lines" attribute. Only lines with a propagation time of at least [timestep] decouple the
+    racks, nodes connected by shorter lines are always placed in the same rack.
+
+    The groups of nodes that cannot be separated are assigned to the racks twice: in the order of
+    descending costs, each to the rack it has the most lines to among the racks with enough
+    capacity left, and by growing one rack after the other from its most connected groups.
+    Both are refined by moving groups between racks as long as that reduces the number of cut
+    lines or improves the balance, and the partition with fewer cut lines is kept.
+    Racks that are left without nodes are dropped, so there are at most as many racks as groups.
+
+    :param graph: The connection graph of the hierarchies.
+    :type graph: nx.Graph
+    :param max_load: The maximum load unit costs of a rack.
+    :type max_load: float
+    :param timestep: The simulation time step; lines with a shorter propagation time are not cut.
+    :type timestep: float
+    :param num_racks: The number of racks, capped at the number of groups of nodes that cannot be
+                      separated; defaults to the minimum number of racks that fit.
+    :type num_racks: int | None, optional
+    :param imbalance: Allowed share of the costs of a rack above the average, defaults to 0.05.
+    :type imbalance: float, optional
+    :param max_passes: Maximum number of refinement passes, defaults to 20.
+    :type max_passes: int, optional
+    :raises ValueError: If the nodes do not fit onto [num_racks] racks or a group of nodes that
+                        cannot be separated exceeds [max_load].
+    :return: The partition with the nodes and costs of each rack.
+    :rtype: RackPartition
+    """
+    groups, costs, weights = _contract_coupled_nodes(graph, timestep)
+    if costs and max(costs) > max_load:
+        largest = max(range(len(groups)), key=costs.__getitem__)
+        raise ValueError(
+            f"Hierarchies {sorted(map(str, groups[largest]))} with {costs[largest]} load units "
+            f"exceed the rack limit of {max_load} but are coupled by lines shorter than the "
+            f"time step {timestep}"
+        )
+
+    total = sum(costs)
+    if num_racks is not None:
+        candidates = [min(num_racks, max(1, len(groups)))]
+        if candidates[0] < num_racks:
+            Logger.log_to_selected(
+                f"Only {len(groups)} groups of hierarchies can be separated, "
+                f"using {candidates[0]} instead of {num_racks} racks"
+            )
+    else:
+        minimum = max(1, math.ceil(total / max_load)) if max_load > 0 else 1
+        candidates = list(range(minimum, max(minimum, len(groups)) + 1))
+    for count in candidates:
+        best: tuple[int, list[int], list[float]] | None = None
+        for initial in (_assign_largest_first, _assign_grown):
+            assignment, loads = initial(costs, weights, count, max_load, imbalance)
+            _refine(assignment, loads, costs, weights, max_load, imbalance, max_passes)
+            cut = _cut_lines(assignment, weights)
+            if max(loads, default=0.0) <= max_load and (best is None or cut < best[0]):
+                best = (cut, assignment, loads)
+        if best is not None:
+            cut_lines, assignment, loads = best
+            break
+    else:
+        raise ValueError(
+            f"Load units of {total} cannot be distributed onto {candidates[-1]} racks "
+            f"with at most {max_load} load units each"
+        )
+
+    # drop the racks that were left empty
+    used = sorted(set(assignment))
+    index = {rack: i for i, rack in enumerate(used)}
+    loads = [loads[rack] for rack in used]
+    racks: list[set[Hashable]] = [set() for _ in used]
+    for group, rack in zip(groups, assignment):
+        racks[index[rack]].update(group)
+    Logger.log_to_selected(
+        f"Distributed {len(graph.nodes)} hierarchies onto {len(racks)} racks "
+        f"with loads {loads} and {cut_lines} lines between racks"
+    )
+    return RackPartition(racks, loads, cut_lines)
+
+
+def _contract_coupled_nodes(
+    graph: nx.Graph, timestep: float
+) -> tuple[list[set[Hashable]], list[float], list[dict[int, int]]]:
+    """Group the nodes that are coupled by lines shorter than the time step.
+
+    :return: The groups sorted by descending costs, their costs and the number of lines
+             between the groups as adjacency list.
+    """
+    coupled = nx.Graph()
+    coupled.add_nodes_from(graph.nodes)
+    coupled.add_edges_from(
+        (u, v) for u, v, data in graph.edges(data=True) if data.get("time", 0.0) < timestep
+    )
+    groups = [set(nodes) for nodes in nx.connected_components(coupled)]
+    costs = [sum(graph.nodes[node].get("LoadUnitCosts", 0) for node in group) for group in groups]
+    # deterministic order independent of the insertion order of the graph
+    order = sorted(
+        range(len(groups)), key=lambda i: (-costs[i], min(str(node) for node in groups[i]))
+    )
+    groups = [groups[i] for i in order]
+    costs = [costs[i] for i in order]
+
+    group_of = {node: i for i, group in enumerate(groups) for node in group}
+    weights: list[dict[int, int]] = [defaultdict(int) for _ in groups]
+    for u, v, data in graph.edges(data=True):
+        group1, group2 = group_of[u], group_of[v]
+        if group1 != group2:
+            lines = data.get("lines", 1)
+            weights[group1][group2] += lines
+            weights[group2][group1] += lines
+    return groups, costs, weights
+
+
+def _capacity(total: float, num_racks: int, max_load: float, imbalance: float) -> float:
+    """The maximum load of a rack that keeps the racks balanced."""
+    return min(max_load, total / num_racks * (1 + imbalance))
+
+
+def _assign_largest_first(
+    costs: list[float],
+    weights: list[dict[int, int]],
+    num_racks: int,
+    max_load: float,
+    imbalance: float,
+) -> tuple[list[int], list[float]]:
+    """Assign the groups, sorted by descending costs, to the racks one by one."""
+    capacity = _capacity(sum(costs), num_racks, max_load, imbalance)
+    assignment = [-1] * len(costs)
+    loads = [0.0] * num_racks
+    for group, cost in enumerate(costs):
+        connections = [0] * num_racks
+        for neighbor, lines in weights[group].items():
+            if assignment[neighbor] >= 0:
+                connections[assignment[neighbor]] += lines
+        fitting = [rack for rack in range(num_racks) if loads[rack] + cost <= capacity]
+        if fitting:
+            rack = max(fitting, key=lambda r: (connections[r], -loads[r]))
+        else:
+            rack = min(range(num_racks), key=loads.__getitem__)
+        assignment[group] = rack
+        loads[rack] += cost
+    return assignment, loads
+
+
+def _assign_grown(
+    costs: list[float],
+    weights: list[dict[int, int]],
+    num_racks: int,
+    max_load: float,
+    imbalance: float,
+) -> tuple[list[int], list[float]]:
+    """Fill the racks one after the other, starting from the largest unassigned group and adding
+    the group with the most lines to the rack until the rack reaches the average load."""
+    average = sum(costs) / num_racks
+    capacity = _capacity(sum(costs), num_racks, max_load, imbalance)
+    assignment = [-1] * len(costs)
+    loads = [0.0] * num_racks
+    unassigned = iter(range(len(costs)))
+    for rack in range(num_racks):
+        seed = next((group for group in unassigned if assignment[group] < 0), None)
+        if seed is None:
+            break
+        frontier = {seed: 0}
+        while frontier and loads[rack] < average:
+            group = max(frontier, key=lambda g: (frontier[g], costs[g], -g))
+            del frontier[group]
+            if loads[rack] + costs[group] > capacity:
+                continue
+            assignment[group] = rack
+            loads[rack] += costs[group]
+            for neighbor, lines in weights[group].items():
+                if assignment[neighbor] < 0:
+                    frontier[neighbor] = frontier.get(neighbor, 0) + lines
+    for group, cost in enumerate(costs):
+        if assignment[group] < 0:
+            rack = min(range(num_racks), key=loads.__getitem__)
+            assignment[group] = rack
+            loads[rack] += cost
+    return assignment, loads
+
+
+def _refine(
+    assignment: list[int],
+    loads: list[float],
+    costs: list[float],
+    weights: list[dict[int, int]],
+    max_load: float,
+    imbalance: float,
+    max_passes: int,
+) -> None:
+    """Move single groups to other racks while that reduces the cut lines without exceeding
+    the capacity of the target rack, or reduces the load of an overloaded rack."""
+    capacity = _capacity(sum(costs), len(loads), max_load, imbalance)
+    for _ in range(max_passes):
+        moved = False
+        for group, cost in enumerate(costs):
+            source = assignment[group]
+            connections: dict[int, int] = defaultdict(int)
+            for neighbor, lines in weights[group].items():
+                connections[assignment[neighbor]] += lines
+            best, best_key = None, (0, 0.0)
+            for target in range(len(loads)):
+                if target == source or loads[target] + cost > capacity:
+                    continue
+                gain = connections[target] - connections[source]
+                # with equal cut, only move to improve the balance
+                balance = loads[source] - loads[target] - cost
+                if gain > 0 or (gain == 0 and balance > 0) or loads[source] > capacity:
+                    key = (gain, balance)
+                    if best is None or key > best_key:
+                        best, best_key = target, key
+            if best is not None:
+                assignment[group] = best
+                loads[source] -= cost
+                loads[best] += cost
+                moved = True
+        if not moved:
+            break
+
+
+def _cut_lines(assignment: list[int], weights: list[dict[int, int]]) -> int:
+    return sum(
+        lines
+        for group1, neighbors in enumerate(weights)
+        for group2, lines in neighbors.items()
+        if group1 < group2 and assignment[group1] != assignment[group2]
+    )
@@ -11,6 +11,8 @@ from pyapi_rts.generated.stickynotedef import (
 from pyapi_rts.api.lark.rlc_tline import RLCTLine
 from pyapi_rts.generated.rtdsriscNET import rtdsriscNET
 
+from epowcore.generic.configuration import Configuration
+from epowcore.generic.layout import grid_order, sparse_stress_layout
 from epowcore.generic.logger import Logger
 from epowcore.rscad.constants import GRID_OFFSET, GRID_STEP_SIZE
 
@@ -42,6 +44,9 @@ GENERATOR_CONTROLS = [
     "_rtds_PSS1A.def",
 ]
 
+TOP_LEVEL_COLUMNS = 7
+"""The number of components per row on the top level, see `place_top_level_components`."""
+
 REQUIRED_ROTATION = {
     "rtds_udc_DYLOAD": 3,
 }
@@ -57,7 +62,7 @@ class RscadCanvasDrawer:
         graph: nx.Graph,
         draft: Draft,
         graph_manager: GraphTransformerRscad,
-        tli_files: list[RLCTLine],
+        tli_files: dict[str, RLCTLine],
     ):
         # Graph of Rscad elements with "abstract" connections
         self.graph = graph
@@ -66,6 +71,7 @@ class RscadCanvasDrawer:
         self.subsystem = self.draft.subsystems[0]
         self.graph_manager = graph_manager
         self.tli_files = tli_files
+        """The TLI file of each TLine by the name of the TLine."""
 
     def draw_elements_on_canvas(self) -> None:
         """Place all elements onto their final position on the grid."""
@@ -73,6 +79,9 @@ class RscadCanvasDrawer:
         self.buses_to_hierarchy()
         self.bus_hierarchies_to_hierarchy()
         self.place_last_bus_boxes(self.subsystem)
+        max_load = Configuration().get("RSCAD.Racks.max_load_units")
+        if max_load is not None:
+            self.check_load_costs(max_load, self.subsystem)
 
     def generators_to_hierarchy(self) -> None:
         """Aggregate every Generator to a hierarchy box with its connected control elements and bus."""
@@ -416,14 +425,25 @@ class RscadCanvasDrawer:
             self.remove_from_draft_by_node(calculation_blocks)
         network_solution = rtdsriscNET()
         subsystem.add_component(network_solution)
-        # Check if subsystem must be divided, max costs and transmission time need to be added as Parameters.
-        # self.checkLoadCosts(30000, subsystem)
         # Place every component in the subystem on the canvas
         self.place_top_level_components(calculation_blocks + [network_solution], subsystem)
         hierarchies = [c for c in subsystem.get_components(False, False) if c.type == "HIERARCHY"]
+        hierarchies = self.order_by_connections(hierarchies, subsystem)
         self.place_top_level_components(hierarchies + [network_solution], subsystem)
         connection_setter.remove_single_bus_links(subsystem)
 
+    def order_by_connections(
+        self, hierarchies: list[Component], subsystem: Subsystem
+    ) -> list[Component]:
+        """Order the hierarchy boxes along a layout of the TLines between them, so that connected
+        boxes are placed close to each other by `place_top_level_components`."""
+        connection_graph = self.graph_manager.create_tline_connection_graph(
+            subsystem, self.tli_files
+        )
+        order = grid_order(sparse_stress_layout(connection_graph), TOP_LEVEL_COLUMNS)
+        rank = {uuid: i for i, uuid in enumerate(order)}
+        return sorted(hierarchies, key=lambda hierarchy: rank.get(hierarchy.uuid, len(rank)))
+
     def place_top_level_components(self, components: list[Component], subsystem: Subsystem) -> None:
         """Strategy for placing the component in the highest level of hierarchy on the canvas"""
         x_position = GRID_OFFSET + GRID_STEP_SIZE * 3
@@ -471,23 +491,32 @@ class RscadCanvasDrawer:
             summed_load_units += self.graph_manager.load_unit_costs[component.uuid]
         return summed_load_units
 
-    def check_load_costs(self, max_load: int, subsystem: Subsystem) -> bool:
+    def check_load_costs(
+        self, max_load: int, subsystem: Subsystem, timestep: float | None = None
+    ) -> bool:
         """Checks if the sum of load Costs is higher than maxLoad and if calls a method to divide a subsystem"""
         sum_load_costs = self.sum_load_costs(subsystem)
         if sum_load_costs > max_load:
-            self.divide_subsystems(sum_load_costs, subsystem)
+            if timestep is None:
+                timestep = Configuration().get("RSCAD.Racks.timestep")
+            self.divide_subsystems(subsystem, max_load, timestep)
             return True
         return False
 
-    def divide_subsystems(self, sum_load_costs: int, subsystem: Subsystem) -> None:
-        """Divides a single subsystem into two by removing components from the
-        old subsystem and adding them to the new one"""
-        new_subsystem = self.create_new_subsystem()
-        moved_components = self.graph_manager.distribute_load_unit_costs(
-            sum_load_costs, subsystem, 0.0005, 10000, self.tli_files
+    def divide_subsystems(self, subsystem: Subsystem, max_load: int, timestep: float) -> None:
+        """Divides a subsystem onto as many subsystems as racks are needed for its load costs.
+        The rack with the most hierarchies stays in the old subsystem,
+        the others are moved to new subsystems."""
+        partition = self.graph_manager.partition_subsystem(
+            subsystem, max_load, timestep, self.tli_files
         )
-        if moved_components:
-            for component in moved_components:
+        racks = sorted(partition.racks, key=len, reverse=True)
+        if len(racks) < 2:
+            Logger.log_to_selected("No valid elements were found to move to a new subsystem")
+            return
+        for rack in racks[1:]:
+            new_subsystem = self.create_new_subsystem()
+            for component in rack:
                 component_to_add = self.draft.get_by_id(component)
                 if component_to_add is None:
                     raise ValueError(
@@ -495,14 +524,12 @@ class RscadCanvasDrawer:
                     )
                 new_subsystem.add_component(component_to_add)
                 subsystem.remove_component(component)
-            connection_setter.remove_single_bus_links(subsystem)
             self.place_last_bus_boxes(new_subsystem)
-            Logger.log_to_selected(
-                f"Subsystem {subsystem.tab_name} was divided into two subsystems ({len(moved_components)} components moved)"
-            )
-        else:
-            # TODO: Option to remove the newly created but empty subsystem
-            Logger.log_to_selected("No valid elements were found to move to a new subsystem")
+        connection_setter.remove_single_bus_links(subsystem)
+        Logger.log_to_selected(
+            f"Subsystem {subsystem.tab_name} was divided into {len(racks)} subsystems "
+            f"with load units {partition.loads} and {partition.cut_lines} lines between them"
+        )
 
     def create_new_subsystem(self) -> Subsystem:
         """Creates a new subsystem"""
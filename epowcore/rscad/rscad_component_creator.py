@@ -48,6 +48,8 @@ class RscadComponentCreator:
 
     def __init__(self, graph: ComponentGraph, base_frequency: float) -> None:
         self.graph = graph
+        self.tli_cache: dict[tuple[float, ...], RLCTLine] = {}
+        """The created TLI files by their electrical parameters."""
         self.base_frequency = base_frequency
 
     def create_rscad_bus(self, bus: Bus) -> rbus.rtdssharcsldBUSLABEL:
@@ -64,9 +66,11 @@ class RscadComponentCreator:
 
         return RSCADDyload.create(load, vbus)
 
-    def create_rscad_tline(self, tline: TLine) -> TLineElements:
+    def create_rscad_tline(self, tline: TLine, tli_name: str | None = None) -> TLineElements:
         """Creates two RSCAD TLines (SE and RE) and a TLine calculation block from a core model
-        TLine element and sets the available values. Return as a hierarchy box"""
+        TLine element and sets the available values. Return as a hierarchy box.
+        The calculation block reads the line constants from the TLI file [tli_name],
+        which defaults to the name of the TLine."""
         # Generate sending line
         rs_line_sending = rscadTLine.lfrtdssharcsldTLINE()
         rs_line_sending.CONFIGURATION.Tnam1.value = RSCADComponentBuilder.sanitize_string(
@@ -95,7 +99,9 @@ class RscadComponentCreator:
         # Generate the Calculation Box
         rs_calc_box = rscadTLineCalc.lfrtdssharcsldTL16CAL()
         rs_calc_box.CONFIGURATION.Name.value = RSCADComponentBuilder.sanitize_string(tline.name)
-        rs_calc_box.CONFIGURATION.Dnm1.value = RSCADComponentBuilder.sanitize_string(tline.name)
+        rs_calc_box.CONFIGURATION.Dnm1.value = (
+            tli_name if tli_name is not None else RSCADComponentBuilder.sanitize_string(tline.name)
+        )
         rs_calc_box.OPTIONSWHENUSINGBERGERONDATA.alwpi.value = Noyes2Enum.No
         rs_calc_box.OPTIONSWHENUSINGBERGERONDATA.raistt.value = RaisttEnum.RaiseTT
         return (rs_line_sending, rs_line_receiving, rs_calc_box)
@@ -159,6 +165,31 @@ class RscadComponentCreator:
             Logger.log_to_selected(log_string)
         return tli_file
 
+    def get_tli_file(self, tline: TLine) -> tuple[RLCTLine, bool]:
+        """Returns a .tli file with the values of tLine, shared by all TLines with the same
+        electrical parameters and length if RSCAD.TLine.share_tli_files is set.
+
+        :param tline: The core model TLine.
+        :type tline: TLine
+        :return: The TLI file and whether it was newly created.
+        :rtype: tuple[RLCTLine, bool]
+        """
+        tli_file = self.create_tli_file(tline)
+        if not Configuration().get("RSCAD.TLine.share_tli_files"):
+            return tli_file, True
+        key = (
+            tli_file.r1,
+            tli_file.xind1,
+            tli_file.xcap1,
+            tli_file.r0,
+            tli_file.xind0,
+            tli_file.xcap0,
+            tli_file.length,
+            tli_file.frequency,
+        )
+        shared = self.tli_cache.setdefault(key, tli_file)
+        return shared, shared is tli_file
+
     def create_pi_from_tline(self, tline: TLine) -> PiSection:
         "Create a Pi component from a line to substitute it"
         pi_section = PiSection()
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 
 from pyapi_rts.api import Draft
@@ -16,6 +17,7 @@ from epowcore.gdf.power_system_stabilizers.power_system_stabilizer import PowerS
 from epowcore.gdf.tline import TLine
 from epowcore.gdf.transformers.transformer import Transformer
 from epowcore.generic.manipulation.insert_buses import insert_buses
+from epowcore.rscad.components.base_component_builder import RSCADComponentBuilder
 from epowcore.rscad.components.dummy import Dummy
 
 from .graph_transformer_rscad import GraphTransformerRscad
@@ -28,11 +30,26 @@ class RscadModel:
     draft: Draft
     tli_files: list[RLCTLine]
 
-    def write_file(self, path: str, file_name: str) -> None:
-        """Write the created RSCAD system to a draft file and TLI files."""
+    def write_file(self, path: str, file_name: str, max_workers: int = 1) -> None:
+        """Write the created RSCAD system to a draft file and TLI files.
+
+        :param path: The directory to write the files to.
+        :type path: str
+        :param file_name: The file name of the draft.
+        :type file_name: str
+        :param max_workers: The number of threads writing the TLI files, defaults to 1.
+        :type max_workers: int, optional
+        :raises ValueError: If a TLI file could not be written.
+        """
         self.draft.write_file(path + "/" + file_name)
-        if not all(tli_file.write_file(path) for tli_file in self.tli_files):
-            raise ValueError("Failed to write tli file.")
+        if max_workers > 1 and len(self.tli_files) > 1:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                written = list(executor.map(lambda tli: tli.write_file(path), self.tli_files))
+        else:
+            written = [tli_file.write_file(path) for tli_file in self.tli_files]
+        failed = [tli.name for tli, success in zip(self.tli_files, written) if not success]
+        if failed:
+            raise ValueError(f"Failed to write tli files {failed}.")
 
 
 class RscadExporter:
@@ -54,6 +71,8 @@ class RscadExporter:
         self.draft.add_subsystem(self.subsystem)
         # Initializes .tli file for transmission line data
         self.tli_file_container: list[RLCTLine] = []
+        self.tli_by_line: dict[str, RLCTLine] = {}
+        """The TLI file of each TLine by the name of the TLine, TLI files can be shared."""
         self.creator = RscadComponentCreator(self.graph, self.core_model.base_frequency)
 
     def export(self) -> RscadModel:
@@ -75,10 +94,14 @@ class RscadExporter:
             self.subsystem.add_component(rs_dyload)
         # Create and add all TLine and TLine components
         for tline in self.core_model.type_list(TLine):
-            # Create a TLine file for the RLC values and add it to the file container
-            self.tli_file_container.append(self.creator.create_tli_file(tline))
+            # Get a TLine file for the RLC values and add new files to the file container
+            tli_file, created = self.creator.get_tli_file(tline)
+            if created:
+                self.tli_file_container.append(tli_file)
+            rscad_line_elements = self.creator.create_rscad_tline(tline, tli_file.name)
+            self.tli_by_line[RSCADComponentBuilder.sanitize_string(tline.name)] = tli_file
             # Create hierarchy box of necessary Tline elements
-            self._place_tli_in_graph(tline, self.creator.create_rscad_tline(tline))
+            self._place_tli_in_graph(tline, rscad_line_elements)
         # Create and add all transformer components
         for transformer in self.core_model.type_list(Transformer):
             rs_transformer = self.creator.create_rscad_transformer(transformer)
@@ -149,6 +172,6 @@ class RscadExporter:
         # Relabel the nodes of the elements of the generic core model with the uuids of the Rscad API components
         relabeled_graph = rscad_graph_manager.relabel_nodes(self.graph, self.transform_dict)
         drawer = RscadCanvasDrawer(
-            relabeled_graph, self.draft, rscad_graph_manager, self.tli_file_container
+            relabeled_graph, self.draft, rscad_graph_manager, self.tli_by_line
         )
         drawer.draw_elements_on_canvas()
@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from enum import Enum
 from epowcore.gdf.bus import Bus, LFBusType
 from epowcore.gdf.core_model import CoreModel
@@ -21,7 +21,7 @@ class Phases(Enum):
 
 
 def create_bus(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     bus: Bus,
     core_model: CoreModel,
     model_name: str,
@@ -1,5 +1,5 @@
 from math import pi
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.bus import Bus
 from epowcore.gdf.common_impedance import CommonImpedance
 from epowcore.gdf.core_model import CoreModel
@@ -10,7 +10,7 @@ BLOCK_TYPE = SimscapeBlockType.COMMON_IMPEDANCE
 
 
 def create_common_impedance(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     impedance: CommonImpedance,
     core_model: CoreModel,
     model_name: str,
@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.governors.gast import GAST
 from epowcore.simscape.block import SimscapeBlock
 from epowcore.simscape.shared import SimscapeBlockType
@@ -6,9 +6,7 @@ from epowcore.simscape.shared import SimscapeBlockType
 BLOCK_TYPE = SimscapeBlockType.GAST
 
 
-def create_gast(
-    eng: matlab.engine.MatlabEngine, gov: GAST, model_name: str
-) -> SimscapeBlock:
+def create_gast(eng: MatlabEngine, gov: GAST, model_name: str) -> SimscapeBlock:
     """Create a Simscape block for the GAST governor."""
 
     block_name = f"{model_name}/{gov.name}"
@@ -18,7 +16,7 @@ def create_gast(
     return SimscapeBlock(block_name, BLOCK_TYPE)
 
 
-def set_parameters_gast(eng: matlab.engine.MatlabEngine, gov: GAST, block_name: str) -> None:
+def set_parameters_gast(eng: MatlabEngine, gov: GAST, block_name: str) -> None:
     """Set the parameter values of an existing Simscape block."""
 
     eng.set_param(
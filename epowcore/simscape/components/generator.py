@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.bus import Bus, LFBusType
 from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
 from epowcore.gdf.core_model import CoreModel
@@ -14,7 +14,7 @@ BUS_TYPES = {
 
 
 def create_generator(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     generator: SynchronousMachine,
     core_model: CoreModel,
     model_name: str,
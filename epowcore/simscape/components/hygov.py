@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.governors.hygov import HYGOV
 from epowcore.simscape.block import SimscapeBlock
 from epowcore.simscape.shared import SimscapeBlockType
@@ -6,9 +6,7 @@ from epowcore.simscape.shared import SimscapeBlockType
 BLOCK_TYPE = SimscapeBlockType.HYGOV
 
 
-def create_hygov(
-    eng: matlab.engine.MatlabEngine, gov: HYGOV, model_name: str
-) -> SimscapeBlock:
+def create_hygov(eng: MatlabEngine, gov: HYGOV, model_name: str) -> SimscapeBlock:
     """Create a Simscape block for the HYGOV governor."""
 
     block_name = f"{model_name}/{gov.name}"
@@ -18,7 +16,7 @@ def create_hygov(
     return SimscapeBlock(block_name, BLOCK_TYPE)
 
 
-def set_parameters_hygov(eng: matlab.engine.MatlabEngine, gov: HYGOV, block_name: str) -> None:
+def set_parameters_hygov(eng: MatlabEngine, gov: HYGOV, block_name: str) -> None:
     """Set the parameter values of an existing Simscape block."""
 
     eng.set_param(
@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.governors.ieee_g1 import IEEEG1
 from epowcore.simscape.block import SimscapeBlock
 from epowcore.simscape.shared import SimscapeBlockType
@@ -6,9 +6,7 @@ from epowcore.simscape.shared import SimscapeBlockType
 BLOCK_TYPE = SimscapeBlockType.IEEEG1
 
 
-def create_ieee_g1(
-    eng: matlab.engine.MatlabEngine, gov: IEEEG1, model_name: str
-) -> SimscapeBlock:
+def create_ieee_g1(eng: MatlabEngine, gov: IEEEG1, model_name: str) -> SimscapeBlock:
     """Create a Simscape block for the IEEEG1 governor."""
 
     block_name = f"{model_name}/{gov.name}"
@@ -18,7 +16,7 @@ def create_ieee_g1(
     return SimscapeBlock(block_name, BLOCK_TYPE)
 
 
-def set_parameters_ieeeg1(eng: matlab.engine.MatlabEngine, ieeeg1: IEEEG1, block_name: str) -> None:
+def set_parameters_ieeeg1(eng: MatlabEngine, ieeeg1: IEEEG1, block_name: str) -> None:
     """Set the parameter values of an existing Simscape block."""
 
     eng.set_param(
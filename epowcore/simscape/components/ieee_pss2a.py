@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.power_system_stabilizers.ieee_pss2a import IEEEPSS2A
 from epowcore.simscape.block import SimscapeBlock
 from epowcore.simscape.shared import SimscapeBlockType
@@ -6,9 +6,7 @@ from epowcore.simscape.shared import SimscapeBlockType
 BLOCK_TYPE = SimscapeBlockType.IEEEPSS2A
 
 
-def create_ieee_pss2a(
-    eng: matlab.engine.MatlabEngine, pss: IEEEPSS2A, model_name: str
-) -> SimscapeBlock:
+def create_ieee_pss2a(eng: MatlabEngine, pss: IEEEPSS2A, model_name: str) -> SimscapeBlock:
     """Create a Simscape block for the IEEEPSS2A power system stabilizer."""
 
     block_name = f"{model_name}/{pss.name}"
@@ -18,9 +16,7 @@ def create_ieee_pss2a(
     return SimscapeBlock(block_name, BLOCK_TYPE)
 
 
-def set_parameters_ieee_pss2a(
-    eng: matlab.engine.MatlabEngine, pss: IEEEPSS2A, block_name: str
-) -> None:
+def set_parameters_ieee_pss2a(eng: MatlabEngine, pss: IEEEPSS2A, block_name: str) -> None:
     """Set the parameter values of an existing Simscape block."""
 
     eng.set_param(
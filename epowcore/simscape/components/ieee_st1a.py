@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.exciters.ieee_st1a import IEEEST1A
 from epowcore.simscape.block import SimscapeBlock
 from epowcore.simscape.shared import SimscapeBlockType
@@ -8,9 +8,7 @@ from epowcore.simscape.tools import get_param_in_bounds
 BLOCK_TYPE = SimscapeBlockType.IEEEST1A
 
 
-def create_ieee_st1a(
-    eng: matlab.engine.MatlabEngine, exc: IEEEST1A, model_name: str
-) -> SimscapeBlock:
+def create_ieee_st1a(eng: MatlabEngine, exc: IEEEST1A, model_name: str) -> SimscapeBlock:
     """Create a Simscape block for the IEEEST1A exciter."""
     block_name = f"{model_name}/{exc.name}"
     eng.add_block(BLOCK_TYPE.value, block_name, nargout=0)
@@ -20,9 +18,7 @@ def create_ieee_st1a(
     return SimscapeBlock(block_name, BLOCK_TYPE)
 
 
-def set_parameters_ieee_st1a(
-    eng: matlab.engine.MatlabEngine, exc: IEEEST1A, block_name: str
-) -> None:
+def set_parameters_ieee_st1a(eng: MatlabEngine, exc: IEEEST1A, block_name: str) -> None:
     """Set the parameter values of an existing Simscape block."""
     kf = get_param_in_bounds(exc.Kf, 1e-3, 0.3, f"{block_name}.Kf")
 
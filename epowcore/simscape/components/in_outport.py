@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.port import Port
 from epowcore.simscape.block import SimscapeBlock
 from epowcore.simscape.shared import SimscapeBlockType
@@ -9,7 +9,7 @@ BLOCK_TYPE_OUTPORT = SimscapeBlockType.OUTPORT
 
 
 def create_inport(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     port: Port,
     model_name: str,
 ) -> SimscapeBlock:
@@ -26,7 +26,7 @@ def create_inport(
 
 
 def create_outport(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     port: Port,
     model_name: str,
 ) -> SimscapeBlock:
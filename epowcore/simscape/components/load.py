@@ -1,16 +1,15 @@
-import matlab.engine
-
 from epowcore.gdf.bus import Bus
 from epowcore.gdf.core_model import CoreModel
 from epowcore.gdf.load import Load
 from epowcore.simscape.block import SimscapeBlock
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.simscape.shared import SimscapeBlockType
 
 BLOCK_TYPE = SimscapeBlockType.LOAD
 
 
 def create_load(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     load: Load,
     core_model: CoreModel,
     model_name: str,
@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.exciters.sexs import SEXS
 from epowcore.simscape.block import SimscapeBlock
 from epowcore.simscape.shared import SimscapeBlockType
@@ -7,7 +7,7 @@ from epowcore.simscape.shared import SimscapeBlockType
 BLOCK_TYPE = SimscapeBlockType.SEXS
 
 
-def create_sexs(eng: matlab.engine.MatlabEngine, exc: SEXS, model_name: str) -> SimscapeBlock:
+def create_sexs(eng: MatlabEngine, exc: SEXS, model_name: str) -> SimscapeBlock:
     """Create a Simscape block for the SEXS exciter."""
     block_name = f"{model_name}/{exc.name}"
     eng.add_block(BLOCK_TYPE.value, block_name, nargout=0)
@@ -17,7 +17,7 @@ def create_sexs(eng: matlab.engine.MatlabEngine, exc: SEXS, model_name: str) ->
     return SimscapeBlock(block_name, BLOCK_TYPE)
 
 
-def set_parameters_sexs(eng: matlab.engine.MatlabEngine, exc: SEXS, block_name: str) -> None:
+def set_parameters_sexs(eng: MatlabEngine, exc: SEXS, block_name: str) -> None:
     """Set the parameter values of an existing Simscape block."""
 
     eng.set_param(
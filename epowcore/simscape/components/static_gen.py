@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.bus import Bus
 from epowcore.gdf.generators.static_generator import StaticGenerator
 from epowcore.gdf.core_model import CoreModel
@@ -9,7 +9,7 @@ BLOCK_TYPE = SimscapeBlockType.STATIC_GEN
 
 
 def create_static_generator(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     gen: StaticGenerator,
     core_model: CoreModel,
     model_name: str,
@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.transformers.three_winding_transformer import ThreeWindingTransformer
 from epowcore.gdf.core_model import CoreModel
 from epowcore.simscape.block import SimscapeBlock
@@ -8,7 +8,7 @@ BLOCK_TYPE = SimscapeBlockType.THW_TRANSFORMER
 
 
 def create_thw_trans(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     thw_trans: ThreeWindingTransformer,
     core_model: CoreModel,
     model_name: str,
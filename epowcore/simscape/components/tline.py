@@ -1,5 +1,5 @@
 from math import pi
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.gdf.tline import TLine
 from epowcore.gdf.core_model import CoreModel
 from epowcore.simscape.block import SimscapeBlock
@@ -9,7 +9,7 @@ BLOCK_TYPE = SimscapeBlockType.PI_SECTION
 
 
 def create_tline(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     tline: TLine,
     core_model: CoreModel,
     model_name: str,
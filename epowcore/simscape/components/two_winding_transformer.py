@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 
 from epowcore.gdf.transformers.transformer import WindingConfig
 from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
@@ -10,7 +10,7 @@ BLOCK_TYPE = SimscapeBlockType.TW_TRANSFORMER
 
 
 def create_tw_trans(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     tw_trans: TwoWindingTransformer,
     core_model: CoreModel,
     model_name: str,
@@ -1,4 +1,4 @@
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.simscape.block import SimscapeBlock
 from epowcore.simscape.shared import SimscapeBlockType
 from epowcore.simscape.tools import sanitize_tag_name
@@ -8,7 +8,7 @@ BLOCK_TYPE = SimscapeBlockType.VI_MEASUREMENT
 
 
 def create_vi_measurement(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     vi_name: str,
     model_name: str,
     add_scope: bool = False,
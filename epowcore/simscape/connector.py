@@ -1,12 +1,13 @@
-import matlab.engine
+from typing import Any
 
+from epowcore.simscape.engine import MatlabEngine
 from epowcore.simscape.config_manager import ConfigManager
 from epowcore.simscape.port_handles import PortHandles
 from epowcore.simscape.block import SimscapeBlock
 
 
 def connect(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     sys_name: str,
     out_block: SimscapeBlock,
     out_ports: str | None,
@@ -42,11 +43,11 @@ def connect(
 
 
 def _get_matlab_port_handles(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     block: SimscapeBlock,
     handles: PortHandles,
     target_length: int | None = None,
-) -> matlab.double | float:
+) -> Any:
     if target_length is None:
         target_length = handles.length
 
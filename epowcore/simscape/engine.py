@@ -0,0 +1,30 @@
+from typing import Any, TypeAlias
+
+try:
+    import matlab
+    import matlab.engine
+except ImportError:  # MATLAB is not installed, scripts can still be generated
+    matlab = None
+
+# the MATLAB engine package has no type information
+MatlabEngine: TypeAlias = Any
+
+
+def start_matlab() -> MatlabEngine:
+    """Start a new MATLAB engine.
+
+    :raises ValueError: If MATLAB is not installed or the engine could not be started.
+    :return: The started MATLAB engine.
+    :rtype: MatlabEngine
+    """
+    if matlab is None:
+        raise ValueError("The MATLAB engine is not installed")
+    eng = matlab.engine.start_matlab()
+    if not isinstance(eng, matlab.engine.MatlabEngine):
+        raise ValueError("Failed to start matlab engine")
+    return eng
+
+
+def is_matlab_array(value: Any) -> bool:
+    """Whether the value is a numeric array returned by the MATLAB engine."""
+    return matlab is not None and isinstance(value, matlab.double)
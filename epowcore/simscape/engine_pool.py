@@ -0,0 +1,191 @@
+import atexit
+import contextvars
+import queue
+import threading
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import TypeVar
+
+from epowcore.generic.configuration import Configuration
+from epowcore.generic.logger import Logger
+from epowcore.simscape.engine import MatlabEngine, start_matlab
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class EnginePool:
+    """A pool of MATLAB engines that are started once and reused by all exports,
+    to build the subsystems of a model in parallel.
+
+    Engines are started on first use, up to [size] engines. An engine is leased by one thread at
+    a time. Engines whose lease ends with an exception are quit, as their session state is unknown.
+
+    Example:
+        converter = SimscapeConverter(pool=EnginePool.shared())
+        converter.from_gdf(core_model, "grid")
+    """
+
+    _shared: "EnginePool | None" = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self, size: int | None = None, factory: Callable[[], MatlabEngine] = start_matlab
+    ) -> None:
+        """
+        :param size: The maximum number of engines, defaults to `Simscape.EnginePool.size`.
+        :param factory: Starts a new engine, e.g. `StandInEngine` for testing without MATLAB.
+        """
+        if size is None:
+            size = Configuration().get("Simscape.EnginePool.size") or 1
+        if size < 1:
+            raise ValueError(f"The engine pool needs at least one engine, not {size}")
+        self.size = size
+        self.factory = factory
+        self.started = 0
+        """The number of engines started by the pool."""
+        self._idle: list[MatlabEngine] = []
+        self._closed = False
+        self._condition = threading.Condition()
+
+    @classmethod
+    def shared(cls) -> "EnginePool":
+        """The pool shared by all exports of the process, closed when the interpreter exits."""
+        with cls._shared_lock:
+            if cls._shared is None or cls._shared._closed:
+                cls._shared = EnginePool()
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    @contextmanager
+    def lease(self) -> Iterator[MatlabEngine]:
+        """Lease an engine, waiting until one is available."""
+        with self._condition:
+            while True:
+                engine = self._try_acquire()
+                if engine is not None:
+                    break
+                self._condition.wait()
+        with self._leased_engine(engine):
+            yield engine
+
+    def map(
+        self,
+        function: Callable[[MatlabEngine, T], R],
+        items: Iterable[T],
+        engine: MatlabEngine | None = None,
+    ) -> list[R]:
+        """Call [function] with an engine and each item on the engines of the pool in parallel.
+
+        :param function: The function to call with the engine and the item.
+        :type function: Callable[[MatlabEngine, T], R]
+        :param items: The items.
+        :type items: Iterable[T]
+        :param engine: An engine of the caller that also takes items, e.g. the engine of the
+            parent model, so that the items are processed even if all engines are leased.
+        :type engine: MatlabEngine | None, optional
+        :return: The results in the order of the items.
+        :rtype: list[R]
+        """
+        items = list(items)
+        results: dict[int, R] = {}
+        pending: queue.SimpleQueue[int] = queue.SimpleQueue()
+        for i in range(len(items)):
+            pending.put(i)
+
+        def work(worker_engine: MatlabEngine) -> None:
+            while True:
+                try:
+                    i = pending.get_nowait()
+                except queue.Empty:
+                    return
+                results[i] = function(worker_engine, items[i])
+
+        def work_on_pool() -> None:
+            with self._condition:
+                worker_engine = self._try_acquire()
+            if worker_engine is not None:
+                with self._leased_engine(worker_engine):
+                    work(worker_engine)
+
+        num_workers = min(self.size, len(items))
+        if num_workers > 0:
+            with ThreadPoolExecutor(max_workers=num_workers) as executor:
+                # the workers see the configuration and logger of the caller; a context can only
+                # be entered by one thread at a time, so every worker gets its own copy
+                futures = [
+                    executor.submit(contextvars.copy_context().run, work_on_pool)
+                    for _ in range(num_workers)
+                ]
+                if engine is not None:
+                    work(engine)
+                for future in futures:
+                    future.result()
+        if not pending.empty():
+            # all engines were leased by others
+            with self.lease() as worker_engine:
+                work(worker_engine)
+        return [results[i] for i in range(len(items))]
+
+    def close(self) -> None:
+        """Quit all idle engines; leased engines are quit when their lease ends."""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._condition.notify_all()
+        for engine in idle:
+            self._quit(engine)
+
+    def __enter__(self) -> "EnginePool":
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _try_acquire(self) -> MatlabEngine | None:
+        """Take an idle engine or start a new one, if the pool is not full.
+        Must be called while holding the condition."""
+        if self._closed:
+            raise ValueError("The engine pool is closed")
+        if self._idle:
+            return self._idle.pop()
+        if self.started >= self.size:
+            return None
+        self.started += 1
+        try:
+            # engines are started outside of the lock, so that they can start in parallel
+            self._condition.release()
+            try:
+                return self.factory()
+            finally:
+                self._condition.acquire()
+        except BaseException:
+            self.started -= 1
+            self._condition.notify()
+            raise
+
+    @contextmanager
+    def _leased_engine(self, engine: MatlabEngine) -> Iterator[None]:
+        try:
+            yield
+        except BaseException:
+            Logger.log_to_selected("Quitting a MATLAB engine after an error in its session")
+            with self._condition:
+                self.started -= 1
+                self._condition.notify()
+            self._quit(engine)
+            raise
+        with self._condition:
+            if not self._closed:
+                self._idle.append(engine)
+                self._condition.notify()
+                return
+        self._quit(engine)
+
+    @staticmethod
+    def _quit(engine: MatlabEngine) -> None:
+        try:
+            engine.quit()
+        except Exception as error:  # pylint: disable=broad-except
+            Logger.log_to_selected(f"Failed to quit MATLAB engine: {error}")
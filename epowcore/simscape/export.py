@@ -2,7 +2,8 @@ from datetime import datetime
 import pathlib
 import time
 
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine, start_matlab
+from epowcore.simscape.engine_pool import EnginePool
 
 from epowcore.gdf.bus import Bus
 from epowcore.gdf.common_impedance import CommonImpedance
@@ -44,9 +45,11 @@ from epowcore.simscape.components.three_winding_transformer import create_thw_tr
 from epowcore.simscape.components.vi_measurement import create_vi_measurement
 from epowcore.simscape.connector import connect
 from epowcore.simscape.layouter import layout_model
+from epowcore.simscape.script_engine import ScriptEngine
 from epowcore.simscape.block import SimscapeBlock
 from epowcore.simscape import simscape_graph_transformer
 from epowcore.simscape.subsystem_helper import (
+    build_subsystem_models,
     get_subsystem_template,
     insert_subsystem,
     insert_subsystem_template,
@@ -60,24 +63,45 @@ PATH = pathlib.Path(__file__).parent.resolve()
 def export(
     core_model: CoreModel,
     model_name: str,
-    engine: matlab.engine.MatlabEngine | None = None,
+    engine: MatlabEngine | None = None,
     is_subsystem: bool = False,
+    batch: bool = False,
+    pool: EnginePool | None = None,
 ) -> None:
-    """Take the core model, go through its components and create a Simscape model accordingly."""
+    """Take the core model, go through its components and create a Simscape model accordingly.
+
+    :param core_model: GDF Core model
+    :param model_name: Name of the model
+    :param engine: MATLAB engine, a new engine is started if None
+    :param is_subsystem: If True, no powergui block is added
+    :param batch: If True, the commands are recorded as one script that is run by the engine,
+        instead of calling the engine for every command
+    :param pool: If set, the subsystems are built as separate models in parallel on the engines
+        of the pool and then copied into the model
+    """
     if engine is None:
-        eng = matlab.engine.start_matlab()
-        if not isinstance(eng, matlab.engine.MatlabEngine):
-            raise ValueError("Failed to start matlab engine")
+        eng = start_matlab()
     else:
         eng = engine
 
+    if batch and not isinstance(eng, ScriptEngine):
+        script_engine = ScriptEngine()
+        export(core_model, model_name, script_engine, is_subsystem, pool=pool)
+        start = time.perf_counter()
+        script_engine.run(eng)
+        print(
+            f"running {len(script_engine.commands)} recorded commands instead of "
+            f"{script_engine.round_trips} engine calls: {time.perf_counter() - start:.1f}s"
+        )
+        return
+
     eng.addpath(str(PATH / "lib"), nargout=0)
 
     Logger.log_to_selected(f"Start export to simscape model '{model_name}'")
     eng.new_system(model_name)  # type: ignore
 
     start = time.perf_counter()
-    created_components = __create_components(eng, core_model, model_name)
+    created_components = __create_components(eng, core_model, model_name, pool)
     print(f"component creation: {time.perf_counter() - start:.1f}s")
 
     print(f"{datetime.now().timestamp()} Layouting model")
@@ -106,13 +130,14 @@ def export(
 
 
 def __create_components(
-    eng: matlab.engine.MatlabEngine, core_model: CoreModel, model_name: str
+    eng: MatlabEngine, core_model: CoreModel, model_name: str, pool: EnginePool | None = None
 ) -> dict[Component, SimscapeBlock]:
     """Create all components in the model and return a dict with the created components.
 
     :param eng: MATLAB engine
     :param core_model: GDF Core model
     :param model_name: Name of the model
+    :param pool: Engines to build the subsystems in parallel
     :return: Mapping from the GDF components to the created Simscape blocks
     """
     created_components: dict[Component, SimscapeBlock] = {}
@@ -171,7 +196,16 @@ def __create_components(
         # TODO:Identify whether the port is an inport or an outport
         created_components[component] = create_inport(eng, component, model_name)
 
-    for subsystem in core_model.type_list(Subsystem):
+    subsystems = core_model.type_list(Subsystem)
+    subsystem_models: dict[Subsystem, str] = {}
+    if pool is not None:
+        subsystem_models = build_subsystem_models(
+            pool,
+            eng,
+            [subsystem for subsystem in subsystems if get_subsystem_template(subsystem) is None],
+            core_model.base_frequency,
+        )
+    for subsystem in subsystems:
         print(f"{datetime.now().timestamp()} Creating subsystem {subsystem.name}")
         # check for available subsystem templates
         subsystem_template = get_subsystem_template(subsystem)
@@ -179,7 +213,11 @@ def __create_components(
         if subsystem_template is None:
             # No template available -> Create simple subsystem
             created_components[subsystem] = insert_subsystem(
-                eng, subsystem, model_name, core_model.base_frequency
+                eng,
+                subsystem,
+                model_name,
+                core_model.base_frequency,
+                subsystem_models.get(subsystem),
             )
         else:
             # Use templated subsystem with additional components
@@ -196,7 +234,7 @@ def __create_components(
 
 
 def __connect_components(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     core_model: CoreModel,
     model_name: str,
     created_components: dict[Component, SimscapeBlock],
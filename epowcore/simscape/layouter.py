@@ -1,15 +1,16 @@
 from math import sqrt
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
 
 import networkx as nx
 
 from epowcore.gdf.component import Component
+from epowcore.generic.layout import layout_graph
 from epowcore.simscape.block import SimscapeBlock
 from epowcore.simscape.tools import set_position
 
 
 def layout_model(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     graph: nx.Graph,
     created_components: dict[Component, SimscapeBlock],
 ) -> None:
@@ -17,7 +18,7 @@ def layout_model(
     accordingly.
 
     :param eng: The Matlab engine.
-    :type eng: matlab.engine
+    :type eng: MatlabEngine
     :param graph: The graph describing the system.
     :type graph: nx.Graph
     :param created_components: Dictionary mapping the graph components to created Simscape blocks.
@@ -28,12 +29,11 @@ def layout_model(
     width = round(sqrt(2 * len(graph.nodes)) * 4) * 100
     height = width / 2
 
-    # let networkx create a layout for the graph
-    # spectral_layout is also promising
-    pos_dict = nx.kamada_kawai_layout(graph)
+    # the layout is shared with other exports of the same model; y points down on the canvas
+    pos_dict = layout_graph(graph)
 
     x_coords: list[float] = [c[0] for c in pos_dict.values()]
-    y_coords: list[float] = [c[1] for c in pos_dict.values()]
+    y_coords: list[float] = [-c[1] for c in pos_dict.values()]
 
     min_x = min(x_coords)
     max_x = max(x_coords)
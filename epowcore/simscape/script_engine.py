@@ -0,0 +1,314 @@
+import itertools
+import os
+import re
+import tempfile
+import time
+from typing import Any, Callable, SupportsIndex
+
+from epowcore.simscape.engine import MatlabEngine
+
+
+class MatlabExpression(str):
+    """MATLAB code that is written to the script as is, e.g. a variable."""
+
+    size = None
+
+    def __getitem__(self, key: SupportsIndex | slice) -> "MatlabExpression":
+        # mimic the indexing of port handle arrays returned by the engine
+        if isinstance(key, slice):
+            start = 0 if key.start is None else key.start
+            if key.stop is None:
+                return MatlabExpression(f"{self}({start + 1}:end)")
+            return MatlabExpression(f"{self}({start + 1}:{key.stop})")
+        if key == 0:
+            return self
+        raise IndexError(f"Unsupported index {key} of {self}")
+
+
+def matlab_literal(value: Any) -> str:
+    """Format a Python value as MATLAB literal.
+
+    :param value: A string, number, bool, list of numbers or MATLAB expression.
+    :type value: Any
+    :raises TypeError: If the value cannot be written as MATLAB literal.
+    :return: The MATLAB literal.
+    :rtype: str
+    """
+    if isinstance(value, MatlabExpression):
+        return str(value)
+    if isinstance(value, str):
+        parts = ["'" + part.replace("'", "''") + "'" for part in value.split("\n")]
+        return parts[0] if len(parts) == 1 else "[" + " newline ".join(parts) + "]"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value).replace("inf", "Inf").replace("nan", "NaN")
+    if isinstance(value, (list, tuple)):
+        return "[" + " ".join(matlab_literal(v) for v in value) + "]"
+    raise TypeError(f"Cannot write {value!r} as MATLAB literal")
+
+
+def _parse_position(value: Any) -> list[float]:
+    if isinstance(value, str):
+        return [float(v) for v in re.split(r"[\s,]+", value.strip("[] "))]
+    return [float(v) for v in value]
+
+
+class _BlockQuery(MatlabExpression):
+    """The result of `Simulink.findBlocks`, which can only be passed to `getfullname`."""
+
+
+class _Namespace:
+    """Records calls of functions in MATLAB packages like `Simulink.SubSystem`."""
+
+    def __init__(self, engine: "ScriptEngine", name: str) -> None:
+        self._engine = engine
+        self._name = name
+
+    def __getattr__(self, name: str) -> "_Namespace":
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return _Namespace(self._engine, f"{self._name}.{name}")
+
+    def __call__(self, *args: Any, nargout: int = 1) -> Any:
+        if self._name == "Simulink.findBlocks":
+            self._engine.round_trips += 1
+            return _BlockQuery(args[0])
+        return self._engine.call(self._name, *args, nargout=nargout)
+
+
+class ScriptEngine:
+    """Records the commands of a Simscape export in a MATLAB script instead of sending each one
+    to the MATLAB engine, so that the model is built by a single call.
+
+    It can be passed to the export in place of a MATLAB engine. The values the export reads
+    back are answered from the recorded commands: parameters like the position are known once
+    they were set, the port handles of a block are read into a variable of the script and
+    referenced symbolically. Reading anything else raises a ValueError.
+    """
+
+    def __init__(self) -> None:
+        self.commands: list[str] = []
+        """The recorded MATLAB statements."""
+        self.round_trips = 0
+        """The number of calls a MATLAB engine would have needed for the recorded commands."""
+        self.blocks: list[str] = []
+        """The full names of the added blocks."""
+        self.Simulink = _Namespace(self, "Simulink")  # pylint: disable=invalid-name
+        self._params: dict[str, dict[str, Any]] = {}
+        self._handles: dict[str, MatlabExpression] = {}
+        self._variables = itertools.count(1)
+
+    def call(self, function: str, *args: Any, nargout: int = 0) -> None:
+        """Record a call of a MATLAB function without return values.
+
+        :param function: The name of the function.
+        :type function: str
+        :raises ValueError: If return values are requested.
+        """
+        if nargout != 0:
+            raise ValueError(f"The result of {function} is not known before the script runs")
+        self.round_trips += 1
+        # the ports of a block can change with any command involving it
+        for arg in args:
+            if isinstance(arg, str):
+                self._handles.pop(arg, None)
+        self.commands.append(f"{function}({', '.join(matlab_literal(a) for a in args)});")
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, nargout=1: self.call(name, *args, nargout=nargout)
+
+    def new_system(self, name: str, nargout: int = 0) -> None:
+        self.call("new_system", name)
+
+    def load_system(self, name: str, nargout: int = 0) -> None:
+        self.call("load_system", name)
+
+    def save_system(self, name: str, nargout: int = 0) -> None:
+        self.call("save_system", name)
+
+    def add_block(self, source: str, name: str, *params: Any, nargout: int = 0) -> None:
+        self._track(name, params)
+        self.blocks.append(name)
+        self.call("add_block", source, name, *params, nargout=nargout)
+
+    def set_param(self, name: str, *params: Any, nargout: int = 0) -> None:
+        self._track(name, params)
+        self.call("set_param", name, *params, nargout=nargout)
+
+    def add_line(self, system: str, *params: Any, nargout: int = 0) -> None:
+        self.call("add_line", system, *params)
+
+    def get_param(self, name: str, param: str) -> Any:
+        """Returns a parameter that was set before, or the port handles as variable."""
+        self.round_trips += 1
+        if param == "PortHandles":
+            variable = self._handles.get(name)
+            if variable is None:
+                variable = MatlabExpression(f"ph{next(self._variables)}")
+                self.commands.append(
+                    f"{variable} = get_param({matlab_literal(name)}, 'PortHandles');"
+                )
+                self._handles[name] = variable
+            return _PortHandleFields(variable)
+        value = self._params.get(name, {}).get(param)
+        if value is None:
+            raise ValueError(f"{param} of {name} is not known before the script runs")
+        if param == "Position":
+            return [_parse_position(value)]
+        return value
+
+    def set_position(self, name: str, pos_x: int, pos_y: int) -> None:
+        """Move a block, keeping its size. Blocks whose size is not known yet are moved by the
+        script."""
+        position = self._params.get(name, {}).get("Position")
+        if position is not None:
+            x1, y1, x2, y2 = (round(v) for v in _parse_position(position))
+            self.set_param(name, "Position", [pos_x, pos_y, pos_x + x2 - x1, pos_y + y2 - y1])
+            self.round_trips += 1
+            return
+        self.round_trips += 2
+        self._params.setdefault(name, {}).pop("Position", None)
+        self.commands.append(f"p = get_param({matlab_literal(name)}, 'Position');")
+        self.commands.append(
+            f"set_param({matlab_literal(name)}, 'Position', "
+            f"[{pos_x} {pos_y} ({pos_x} + p(3) - p(1)) ({pos_y} + p(4) - p(2))]);"
+        )
+
+    def getfullname(self, query: Any) -> list[str]:
+        """Returns the full names of the blocks found by `Simulink.findBlocks`."""
+        if not isinstance(query, _BlockQuery):
+            raise ValueError("Only the results of Simulink.findBlocks are known")
+        self.round_trips += 1
+        return [block for block in self.blocks if block.startswith(f"{query}/")]
+
+    def exist(self, name: str) -> float:
+        """Files cannot be checked before the script runs and are reported as missing."""
+        return 0.0
+
+    def script(self) -> str:
+        """The recorded commands as MATLAB script."""
+        return "\n".join(self.commands) + "\n"
+
+    def write(self, path: str) -> None:
+        """Write the recorded commands to a MATLAB script file."""
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(self.script())
+
+    def run(self, engine: MatlabEngine, batch_size: int | None = None) -> int:
+        """Run the recorded commands with a MATLAB engine.
+
+        :param engine: The MATLAB engine.
+        :type engine: MatlabEngine
+        :param batch_size: Number of statements per `eval` call; by default the commands are
+                           written to a temporary script that is run by one call.
+        :type batch_size: int | None, optional
+        :return: The number of calls of the engine.
+        :rtype: int
+        """
+        if batch_size is not None:
+            batches = range(0, len(self.commands), batch_size)
+            for start in batches:
+                engine.eval("\n".join(self.commands[start : start + batch_size]), nargout=0)
+            return len(batches)
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "epowcore_export.m")
+        try:
+            self.write(path)
+            engine.run(path, nargout=0)
+        finally:
+            os.remove(path)
+            os.rmdir(directory)
+        return 1
+
+    def _track(self, name: str, params: tuple[Any, ...]) -> None:
+        values = self._params.setdefault(name, {})
+        for key, value in zip(params[::2], params[1::2]):
+            values[key] = value
+
+
+class _PortHandleFields(dict):
+    """The port handles of a block, each field referencing the variable in the script."""
+
+    def __init__(self, variable: MatlabExpression) -> None:
+        super().__init__()
+        self.variable = variable
+
+    def __missing__(self, key: str) -> MatlabExpression:
+        return MatlabExpression(f"{self.variable}.{key}")
+
+
+class RecordingEngine:
+    """Stands in for a MATLAB engine by recording all calls instead of executing them,
+    e.g. to test and benchmark the script generation without MATLAB."""
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple[Any, ...]]] = []
+        self.scripts: list[str] = []
+        """The contents of the scripts passed to `run`."""
+
+    def __getattr__(self, name: str) -> Callable[..., None]:
+        if name.startswith("_"):
+            raise AttributeError(name)
+
+        def record(*args: Any, nargout: int = 1) -> None:
+            self.calls.append((name, args))
+            if name == "run":
+                with open(args[0], "r", encoding="utf-8") as file:
+                    self.scripts.append(file.read())
+
+        return record
+
+
+class StandInEngine(ScriptEngine):
+    """Stands in for a MATLAB engine session without MATLAB, e.g. in an `EnginePool` for testing.
+
+    Like a `ScriptEngine`, it records the commands and answers the queries of the export.
+    Stand-in engines sharing the same [models] see the models of each other like sessions sharing
+    a working directory: a model created in another session can only be loaded once it is saved.
+    """
+
+    def __init__(self, models: dict[str, bool] | None = None, latency: float = 0.0) -> None:
+        """
+        :param models: Whether each model created by the sessions is saved, shared between them.
+        :param latency: Seconds each call takes, to simulate the latency of MATLAB.
+        """
+        super().__init__()
+        self.models = models if models is not None else {}
+        self.latency = latency
+        self.open_models: set[str] = set()
+        """The models created or loaded in this session."""
+        self.closed = False
+
+    def call(self, function: str, *args: Any, nargout: int = 0) -> None:
+        if self.closed:
+            raise ValueError("The MATLAB session was quit")
+        if self.latency > 0:
+            time.sleep(self.latency)
+        super().call(function, *args, nargout=nargout)
+
+    def new_system(self, name: str, nargout: int = 0) -> None:
+        super().new_system(name)
+        self.models[name] = False
+        self.open_models.add(name)
+
+    def load_system(self, name: str, nargout: int = 0) -> None:
+        if name not in self.open_models and self.models.get(name) is False:
+            raise ValueError(f"The model {name} was not saved by the session that created it")
+        super().load_system(name)
+        self.open_models.add(name)
+
+    def save_system(self, name: str, nargout: int = 0) -> None:
+        super().save_system(name)
+        self.models[name] = True
+
+    def close_system(self, name: str, *args: Any, nargout: int = 0) -> None:
+        """Close a model without saving it."""
+        self.call("close_system", name, *args)
+        self.open_models.discard(name)
+
+    def quit(self) -> None:
+        """End the session."""
+        self.closed = True
@@ -1,10 +1,10 @@
-import matlab.engine
-
 from epowcore.gdf.core_model import CoreModel
 from epowcore.generic.converter_base import ConverterBase
 from epowcore.generic.manipulation.group_subsystem_rules import (
     apply_group_subsystem_rules,
 )
+from epowcore.simscape.engine import MatlabEngine, start_matlab
+from epowcore.simscape.engine_pool import EnginePool
 from epowcore.simscape.export import export
 from epowcore.simscape.simscape_graph_transformer import rename_duplicate_nodes
 
@@ -12,18 +12,30 @@ from epowcore.simscape.simscape_graph_transformer import rename_duplicate_nodes
 class SimscapeConverter(ConverterBase[str]):
     """Converter for Matlab/Simscape models."""
 
-    def __init__(self, eng: matlab.engine.MatlabEngine | None = None, debug: bool = False) -> None:
+    def __init__(
+        self,
+        eng: MatlabEngine | None = None,
+        debug: bool = False,
+        batch: bool = False,
+        pool: EnginePool | None = None,
+    ) -> None:
         """
-        :param eng: Matlab engine to use. If None, a new engine will be started.
+        :param eng: Matlab engine to use. If None, a new engine will be started,
+            or an engine of the [pool] is used for each export.
+            Pass a `ScriptEngine` to only generate the MATLAB script of the model.
         :param debug: If True, debug information and plots will be generated.
+        :param batch: If True, the model is built by one generated script instead of
+            calling the engine for every block, parameter and line.
+        :param pool: Engines that build the subsystems in parallel and are reused across
+            exports, e.g. `EnginePool.shared()`.
         """
-        if eng is None:
-            eng = matlab.engine.start_matlab()  # type: ignore
-            if not isinstance(eng, matlab.engine.MatlabEngine):
-                raise TypeError("Matlab engine not started")
-        self.eng: matlab.engine.MatlabEngine = eng
+        if eng is None and pool is None:
+            eng = start_matlab()
+        self.eng: MatlabEngine | None = eng
+        self.pool = pool
         self._apply_rules = True
         self._is_subsystem = False
+        self.batch = batch
 
         super().__init__(debug)
 
@@ -47,8 +59,22 @@ class SimscapeConverter(ConverterBase[str]):
         return core_model
 
     def _export(self, core_model: CoreModel, name: str) -> str:
-        export(core_model, name, self.eng, is_subsystem=self._is_subsystem)
+        if self.eng is None and self.pool is not None:
+            with self.pool.lease() as eng:
+                self.__export_with(eng, core_model, name)
+        else:
+            self.__export_with(self.eng, core_model, name)
         return name
 
+    def __export_with(self, eng: MatlabEngine, core_model: CoreModel, name: str) -> None:
+        export(
+            core_model,
+            name,
+            eng,
+            is_subsystem=self._is_subsystem,
+            batch=self.batch,
+            pool=self.pool,
+        )
+
     def _import(self, model: str) -> CoreModel:
         raise NotImplementedError()
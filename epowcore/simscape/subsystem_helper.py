@@ -1,9 +1,9 @@
-import os
 import random
 import string
 import time
 
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine
+from epowcore.simscape.engine_pool import EnginePool
 from epowcore.gdf.exciters.ieee_st1a import IEEEST1A
 from epowcore.gdf.exciters.sexs import SEXS
 from epowcore.gdf.governors.gast import GAST
@@ -48,7 +48,7 @@ def get_subsystem_template(subsystem: Subsystem) -> SubsystemTemplate | None:
 
 
 def insert_subsystem_template(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     model_name: str,
     subsystem: Subsystem,
     template: SubsystemTemplate,
@@ -119,21 +119,27 @@ def insert_subsystem_template(
 
 
 def insert_subsystem(
-    eng: matlab.engine.MatlabEngine, subsystem: Subsystem, model_name: str, base_frequency: float
+    eng: MatlabEngine,
+    subsystem: Subsystem,
+    model_name: str,
+    base_frequency: float,
+    subsystem_model: str | None = None,
 ) -> SimscapeBlock:
     """Inserts a subsystem into the model from the components.
 
     :param eng: MATLAB engine
     :param subsystem: Subsystem to insert
     :param model_name: Name of the model
+    :param subsystem_model: The saved model of the subsystem, see `build_subsystem_models`;
+        built with [eng] if None
     :return: The inserted Subsystem in Simscape
     """
 
     # Create intermediate model from the components
-    random_name = "".join(random.choices(string.ascii_letters, k=10))
-    data_stucture = CoreModel(base_frequency=base_frequency, graph=subsystem.graph)
-    converter = epowcore.simscape.simscape_converter.SimscapeConverter(eng)
-    converter.from_gdf(data_stucture, random_name, apply_rules=False, is_subsystem=True)
+    if subsystem_model is None:
+        random_name = __build_subsystem_model(eng, subsystem, base_frequency)
+    else:
+        random_name = subsystem_model
     eng.load_system(random_name, nargout=0)
     eng.load_system(model_name, nargout=0)
 
@@ -148,13 +154,44 @@ def insert_subsystem(
         subsystem_full_name,
         nargout=0,
     )
-    os.remove(f"{random_name}.slx")
+    # deleted by MATLAB, so that it also works when the commands are recorded as script
+    eng.delete(f"{random_name}.slx", nargout=0)
     return SimscapeBlock(subsystem_full_name, SimscapeBlockType.SUBSYSTEM)
 
 
-def __insert_template(
-    eng: matlab.engine.MatlabEngine, template: str, subsystem_full_name: str
-) -> None:
+def build_subsystem_models(
+    pool: EnginePool, eng: MatlabEngine, subsystems: list[Subsystem], base_frequency: float
+) -> dict[Subsystem, str]:
+    """Build the intermediate models of the subsystems in parallel on the engines of the pool.
+    The models are saved, so that `insert_subsystem` can copy them into the model of [eng].
+
+    :param pool: The engines building the models.
+    :param eng: The MATLAB engine of the model, which also builds models.
+    :param subsystems: The subsystems.
+    :param base_frequency: The base frequency of the model.
+    :return: The names of the models by subsystem.
+    """
+
+    def build(engine: MatlabEngine, subsystem: Subsystem) -> str:
+        name = __build_subsystem_model(engine, subsystem, base_frequency)
+        if engine is not eng:
+            # keep the sessions of the pool clean for the next exports
+            engine.close_system(name, 0, nargout=0)
+        return name
+
+    return dict(zip(subsystems, pool.map(build, subsystems, eng)))
+
+
+def __build_subsystem_model(eng: MatlabEngine, subsystem: Subsystem, base_frequency: float) -> str:
+    """Export the subsystem as separate model with a random name and return the name."""
+    random_name = "".join(random.choices(string.ascii_letters, k=10))
+    data_stucture = CoreModel(base_frequency=base_frequency, graph=subsystem.graph)
+    converter = epowcore.simscape.simscape_converter.SimscapeConverter(eng)
+    converter.from_gdf(data_stucture, random_name, apply_rules=False, is_subsystem=True)
+    return random_name
+
+
+def __insert_template(eng: MatlabEngine, template: str, subsystem_full_name: str) -> None:
     if "/" in template:
         temp_name = "temp_" + str(hash(time.time()))
         eng.new_system(temp_name)
@@ -1,17 +1,21 @@
 import re
 from typing import Any
-import matlab.engine
+from epowcore.simscape.engine import MatlabEngine, is_matlab_array
 from epowcore.generic.logger import Logger
 from epowcore.simscape.block import SimscapeBlock
+from epowcore.simscape.script_engine import ScriptEngine
 
 
 def set_position(
-    eng: matlab.engine.MatlabEngine,
+    eng: MatlabEngine,
     block: SimscapeBlock,
     pos_x: int | float,
     pos_y: int | float,
 ) -> None:
     """Set the position of a Simulink block."""
+    if isinstance(eng, ScriptEngine):
+        eng.set_position(block.name, int(pos_x), int(pos_y))
+        return
     old_pos = matlab_array_to_list(eng.get_param(block.name, "Position"))
 
     eng.set_param(
@@ -22,7 +26,7 @@ def set_position(
     )
 
 
-def get_position(eng: matlab.engine.MatlabEngine, block: SimscapeBlock) -> tuple[float, ...]:
+def get_position(eng: MatlabEngine, block: SimscapeBlock) -> tuple[float, ...]:
     """Get the position of a Simulink block."""
     return tuple(matlab_array_to_list(eng.get_param(block.name, "Position")))
 
@@ -46,7 +50,7 @@ def format_position(pos_array: list[float], pos_x: int, pos_y: int) -> str:
 
 def matlab_array_to_list(matlab_array: Any) -> list[float]:
     """Convert a Matlab array to a Python list."""
-    if not isinstance(matlab_array, (list, matlab.double)):
+    if not isinstance(matlab_array, list) and not is_matlab_array(matlab_array):
         raise TypeError(f"Expected list, got {type(matlab_array)}")
     return [float(x) for x in matlab_array[0]]
 
@@ -63,7 +67,7 @@ def sanitize_tag_name(name: str, max_length: int = 63) -> str:
     return sname
 
 
-def flip_block_left_right(eng: matlab.engine.MatlabEngine, block: SimscapeBlock) -> None:
+def flip_block_left_right(eng: MatlabEngine, block: SimscapeBlock) -> None:
     """Flip a block left or right."""
     if eng.get_param(block.name, "Orientation") == "left":
         eng.set_param(block.name, "Orientation", "right", nargout=0)
@@ -0,0 +1,44 @@
+"""Benchmark building the sparse admittance matrices directly from a core model.
+
+Usage: `python scripts/benchmarks/admittance_benchmark.py [case file ...]`
+Without arguments, the synthetic meshed cases of the Matpower import benchmark are used.
+"""
+
+import sys
+import time
+
+from matpower_import_benchmark import synthetic_case
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.loadflow.admittance import build_admittance
+from epowcore.matpower.matpower_converter import MatpowerConverter
+
+SIZES = [10_000, 50_000, 100_000]
+
+
+def benchmark(name: str, core_model: CoreModel) -> None:
+    start = time.perf_counter()
+    admittance = build_admittance(core_model)
+    duration = time.perf_counter() - start
+
+    num_branches = len(admittance.branch_uids)
+    print(
+        f"{name}: {admittance.ybus.shape[0]} buses, {num_branches} branches, "
+        f"Ybus with {admittance.ybus.nnz} non-zeros in {duration:.2f}s "
+        f"({num_branches / duration:,.0f} branches/s)"
+    )
+
+
+def main() -> None:
+    converter = MatpowerConverter()
+    if len(sys.argv) > 1:
+        for file_path in sys.argv[1:]:
+            benchmark(file_path, converter.file_to_gdf(file_path))
+        return
+
+    for size in SIZES:
+        benchmark(f"synthetic {size}", converter.to_gdf(synthetic_case(size)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark the replacement passes of the PyPSA pre-export, one component at a time
+and batched.
+
+Usage: `python scripts/benchmarks/batch_rewrite_benchmark.py`
+"""
+
+import time
+
+from epowcore.gdf.bus import Bus, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.extended_ward import ExtendedWard
+from epowcore.gdf.impedance import Impedance
+from epowcore.gdf.switch import Switch
+from epowcore.gdf.ward import Ward
+from epowcore.generic.constants import Platform
+from epowcore.generic.manipulation.batch_rewrite import BatchRewrite
+
+SIZES = [500, 1_000, 2_000]
+
+
+def ward_model(num_buses: int) -> CoreModel:
+    """A chain of buses with a ward on every bus, an extended ward on every fourth bus and
+    impedances and switches between neighbouring buses."""
+    core_model = CoreModel(base_frequency=50.0)
+    buses = [
+        Bus(uid=i, name=f"bus{i}", lf_bus_type=LFBusType.PQ, nominal_voltage=110.0)
+        for i in range(num_buses)
+    ]
+    uid = num_buses
+    for bus in buses:
+        core_model.add_connection(bus, Ward(uid=uid, name=f"ward{uid}", p_load=10.0))
+        uid += 1
+    for bus in buses[::4]:
+        ext_ward = ExtendedWard(uid=uid, name=f"xward{uid}", p_load=5.0, u_setp=1.0, x_ext=0.1)
+        core_model.add_connection(bus, ext_ward)
+        uid += 1
+    for i, (bus1, bus2) in enumerate(zip(buses, buses[1:])):
+        if i % 2 == 0:
+            branch = Impedance(uid=uid, name=f"imp{uid}", sn_mva=100.0, r_pu=0.01, x_pu=0.1)
+        else:
+            branch = Switch(uid=uid, name=f"switch{uid}", closed=i % 3 != 0)
+        core_model.add_connection(bus1, branch)
+        core_model.add_connection(bus2, branch)
+        uid += 1
+    return core_model
+
+
+def replace(core_model: CoreModel, batched: bool) -> None:
+    passes = [
+        (ExtendedWard, lambda c, r: c.replace_with_load_shunt_vsource(core_model, 100.0, r)),
+        (Ward, lambda c, r: c.replace_with_load_and_shunt(core_model, r)),
+        (Impedance, lambda c, r: c.replace_with_line(core_model, Platform.PYPSA, r)),
+        (Switch, lambda c, r: c.replace_with_line_if_closed(core_model, Platform.PYPSA, r)),
+    ]
+    for component_type, replace_component in passes:
+        if batched:
+            with BatchRewrite(core_model) as rewrite:
+                for component in core_model.type_list(component_type):
+                    replace_component(component, rewrite)
+        else:
+            for component in core_model.type_list(component_type):
+                replace_component(component, None)
+
+
+def main() -> None:
+    for size in SIZES:
+        durations = []
+        for batched in (False, True):
+            core_model = ward_model(size)
+            num_components = len(core_model.graph.nodes)
+            start = time.perf_counter()
+            replace(core_model, batched)
+            durations.append(time.perf_counter() - start)
+        print(
+            f"{size} buses, {num_components} components: single {durations[0]:.2f}s, "
+            f"batched {durations[1]:.2f}s ({durations[0] / durations[1]:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
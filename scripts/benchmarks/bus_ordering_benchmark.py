@@ -0,0 +1,134 @@
+"""Benchmark the downstream power flow with and without solver-friendly bus renumbering.
+
+Usage: `python scripts/benchmarks/bus_ordering_benchmark.py [case file ...]`
+Without arguments, synthetic meshed grids with randomly assigned bus numbers are generated.
+
+For pandapower, the time of `pandapower.runpp` is measured.
+As there is no MATLAB engine in the benchmark, the Matpower export is measured by the fill-in and
+time of the sparse LU factorization of a matrix with the pattern of its admittance matrix,
+factorized in the exported bus order like a solver that does not reorder by itself.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandapower
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.generic.bus_numbering import BusOrdering
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.matpower.matpower_model import MatpowerModel
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+
+# the per element creation of the pandapower export dominates the runtime for larger grids
+SIZES = [20, 40]
+REPETITIONS = 3
+
+
+def synthetic_grid(side: int, seed: int = 0) -> MatpowerModel:
+    """Create a meshed grid of side x side buses with randomly assigned bus numbers."""
+    rng = np.random.default_rng(seed)
+    num_buses = side * side
+    numbers = rng.permutation(num_buses) + 1
+
+    bus = np.zeros((num_buses, 13))
+    bus[:, 0] = numbers
+    bus[:, 1] = 1
+    bus[:, 2] = rng.uniform(0, 5, num_buses)
+    bus[:, 3] = rng.uniform(0, 2, num_buses)
+    bus[:, 6:8] = 1
+    bus[:, 9] = 110.0
+    bus[:, 10] = 1
+    bus[:, 11:13] = (1.1, 0.9)
+
+    grid = numbers.reshape(side, side)
+    ends = np.vstack(
+        [
+            np.column_stack([grid[:, :-1].ravel(), grid[:, 1:].ravel()]),
+            np.column_stack([grid[:-1, :].ravel(), grid[1:, :].ravel()]),
+        ]
+    )
+    branch = np.zeros((len(ends), 13))
+    branch[:, 0:2] = ends
+    branch[:, 2] = rng.uniform(0.001, 0.005, len(ends))
+    branch[:, 3] = rng.uniform(0.01, 0.05, len(ends))
+    branch[:, 4] = rng.uniform(0.0, 0.02, len(ends))
+    branch[:, 5:8] = 250.0
+    branch[:, 10] = 1
+    branch[:, 11:13] = (-360.0, 360.0)
+
+    # slack in one corner, generators spread over the grid
+    gen_buses = grid[::5, ::5].ravel()
+    bus[np.isin(bus[:, 0], gen_buses), 1] = 2
+    bus[bus[:, 0] == gen_buses[0], 1] = 3
+    gen = np.zeros((len(gen_buses), 21))
+    gen[:, 0] = gen_buses
+    gen[:, 1] = bus[:, 2].sum() / len(gen_buses)
+    gen[:, 3:5] = (9999.0, -9999.0)
+    gen[:, 5] = 1.0
+    gen[:, 6] = 100.0
+    gen[:, 7] = 1
+    # the pandapower export dispatches the rated active power
+    gen[:, 8] = gen[:, 1]
+
+    return MatpowerModel.from_dict(
+        {"mpc": {"baseMVA": 100.0, "bus": bus, "branch": branch, "gen": gen}}
+    )
+
+
+def pandapower_runtime(core_model: CoreModel, ordering: BusOrdering | None) -> float:
+    network = PandapowerConverter(bus_ordering=ordering).from_gdf(core_model, "benchmark").network
+    durations = []
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        pandapower.runpp(network, numba=False)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+def matpower_factorization(core_model: CoreModel, ordering: BusOrdering) -> tuple[int, float]:
+    model = MatpowerConverter(bus_ordering=ordering).from_gdf(core_model, "benchmark")
+    num_buses = len(model.bus)
+    ends = np.array([(b.from_bus, b.to_bus) for b in model.branch]) - 1
+    rows = np.concatenate([ends[:, 0], ends[:, 1]])
+    cols = np.concatenate([ends[:, 1], ends[:, 0]])
+    adjacency = sp.csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(num_buses, num_buses))
+    degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    matrix = (sp.diags(degree + 1.0) - adjacency).tocsc()
+
+    start = time.perf_counter()
+    lu = splu(matrix, permc_spec="NATURAL", diag_pivot_thresh=0.0)
+    return lu.L.nnz + lu.U.nnz, time.perf_counter() - start
+
+
+def benchmark(name: str, core_model: CoreModel) -> None:
+    print(f"{name}:")
+    for ordering in (None, *BusOrdering):
+        label = "uid (raw)" if ordering is None else ordering.value
+        start = time.perf_counter()
+        duration = pandapower_runtime(core_model, ordering)
+        print(
+            f"  pandapower {label:>9}: runpp {duration:.3f}s "
+            f"(incl. export {time.perf_counter() - start:.2f}s)"
+        )
+    for ordering in BusOrdering:
+        fill_in, duration = matpower_factorization(core_model, ordering)
+        print(f"  matpower   {ordering.value:>9}: LU fill-in {fill_in:,} nnz in {duration:.4f}s")
+
+
+def main() -> None:
+    converter = MatpowerConverter()
+    if len(sys.argv) > 1:
+        for file_path in sys.argv[1:]:
+            benchmark(file_path, converter.file_to_gdf(file_path))
+        return
+
+    for side in SIZES:
+        benchmark(f"synthetic grid ({side * side} buses)", converter.to_gdf(synthetic_grid(side)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Benchmark the N-1 contingency plausibility runner.
+
+Usage: `python scripts/benchmarks/contingency_benchmark.py [case file ...]`
+Without arguments, a synthetic meshed grid of the bus ordering benchmark is used.
+
+The runner is measured in the calling process and with a process pool. For comparison,
+a subset of the outages is run the naive way: a deep copy of the network per outage and
+a load flow from a flat start.
+"""
+
+import copy
+import os
+import sys
+import time
+
+import pandapower
+from bus_ordering_benchmark import synthetic_grid
+
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+from epowcore.plausibility.contingency import ContingencyRunner, all_branch_outages
+from epowcore.plausibility.pandapower_checker import PandapowerPlausibilityChecker
+
+SIDE = 20
+NUM_NAIVE = 50
+RUNPP_OPTIONS = {"numba": False}
+
+
+def naive_throughput(net: pandapower.pandapowerNet) -> float:
+    checker = PandapowerPlausibilityChecker(runpp_options=RUNPP_OPTIONS)
+    contingencies = all_branch_outages(net)[:NUM_NAIVE]
+    start = time.perf_counter()
+    for contingency in contingencies:
+        variant = copy.deepcopy(net)
+        variant[contingency.element].at[contingency.index, "in_service"] = False
+        checker.check(variant)
+    return len(contingencies) / (time.perf_counter() - start)
+
+
+def benchmark(name: str, net: pandapower.pandapowerNet) -> None:
+    print(f"{name}: {len(net.bus)} buses, {len(all_branch_outages(net))} contingencies")
+    print(f"  naive deepcopy + flat start: {naive_throughput(net):.1f} contingencies/s")
+    for processes in sorted({1, os.cpu_count() or 1}):
+        report = ContingencyRunner(processes=processes, runpp_options=RUNPP_OPTIONS).run(net)
+        table = report.summary_table()
+        print(
+            f"  runner with {processes} process(es): {report.throughput:.1f} contingencies/s, "
+            f"{int((~table['successful']).sum())} with issues"
+        )
+
+
+def main() -> None:
+    converter = MatpowerConverter()
+    if len(sys.argv) > 1:
+        for file_path in sys.argv[1:]:
+            core_model = converter.file_to_gdf(file_path)
+            benchmark(file_path, PandapowerConverter().from_gdf(core_model, "benchmark").network)
+        return
+
+    core_model = converter.to_gdf(synthetic_grid(SIDE))
+    network = PandapowerConverter().from_gdf(core_model, "benchmark").network
+    benchmark(f"synthetic grid ({SIDE * SIDE} buses)", network)
+
+
+if __name__ == "__main__":
+    main()
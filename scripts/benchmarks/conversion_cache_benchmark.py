@@ -0,0 +1,68 @@
+"""Benchmark exports served from the conversion cache versus exports without a cache,
+for the IEEE 39 bus model and a synthetic model with 1000 buses.
+
+Usage: `python scripts/benchmarks/conversion_cache_benchmark.py`
+"""
+
+import json
+import pathlib
+import tempfile
+import time
+
+from reexport_benchmark import synthetic_model
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.generic.conversion_cache import ConversionCache
+from epowcore.generic.converter_base import ConverterBase
+from epowcore.geo_json.geo_json_converter import GeoJSONConverter
+from epowcore.jmdl.jmdl_converter import JmdlConverter
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+
+MODEL_PATH = pathlib.Path(__file__).parents[2] / "tests/models/gdf/IEEE39_gdf.json"
+REPETITIONS = 3
+
+
+def measure(converter: ConverterBase, core_model: CoreModel) -> float:
+    """The mean duration of an export in seconds."""
+    start = time.perf_counter()
+    for _ in range(REPETITIONS):
+        converter.from_gdf(core_model, "benchmark")
+    return (time.perf_counter() - start) / REPETITIONS
+
+
+def benchmark(core_model: CoreModel, cache: ConversionCache) -> None:
+    for converter in (
+        JmdlConverter(),
+        MatpowerConverter(),
+        PandapowerConverter(),
+        GeoJSONConverter(),
+    ):
+        export_duration = measure(converter, core_model)
+        converter.cache = cache
+        converter.from_gdf(core_model, "benchmark")
+        hit_duration = measure(converter, core_model)
+        key_start = time.perf_counter()
+        cache.key(converter, core_model, "benchmark")
+        key_duration = time.perf_counter() - key_start
+        print(
+            f"  {type(converter).__name__}: export {export_duration * 1000:.1f}ms, "
+            f"cache hit {hit_duration * 1000:.1f}ms (key {key_duration * 1000:.1f}ms, "
+            f"{export_duration / hit_duration:.1f}x)"
+        )
+
+
+def main() -> None:
+    with open(MODEL_PATH, "r", encoding="utf-8") as file:
+        models = {"IEEE 39": CoreModel.import_dict(json.load(file))}
+    models["Synthetic 1000"] = synthetic_model(1000)
+    with tempfile.TemporaryDirectory() as directory:
+        cache = ConversionCache(directory)
+        for name, core_model in models.items():
+            print(f"{name}, {len(core_model.graph.nodes)} components")
+            benchmark(core_model, cache)
+        print(f"Cache size: {cache.size() / 1024:.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
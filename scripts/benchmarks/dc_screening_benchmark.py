@@ -0,0 +1,58 @@
+"""Benchmark the DC screening mode of the plausibility checks.
+
+Usage: `python scripts/benchmarks/dc_screening_benchmark.py [case file ...]`
+Without arguments, the synthetic meshed grids of the bus ordering benchmark are used.
+
+The build time includes the admittance matrices and the factorization of the B matrix,
+the remaining times only use the factorization.
+"""
+
+import sys
+import time
+
+import numpy as np
+from bus_ordering_benchmark import synthetic_grid
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.plausibility.dc_checker import DcPlausibilityChecker
+from epowcore.plausibility.dc_screening import DcScreening
+
+SIZES = [30, 100, 200]
+NUM_MONITORED = 100
+NUM_OUTAGES = 256
+
+
+def benchmark(name: str, core_model: CoreModel) -> None:
+    start = time.perf_counter()
+    screening = DcScreening.from_core_model(core_model)
+    built = time.perf_counter()
+    result = DcPlausibilityChecker().check_screening(screening)
+    checked = time.perf_counter()
+    screening.ptdf(np.arange(NUM_MONITORED))
+    ptdf = time.perf_counter()
+    screening.lodf(np.arange(NUM_OUTAGES))
+    lodf = time.perf_counter()
+
+    print(
+        f"{name}: {len(screening.slack)} buses, {len(screening.b)} branches, "
+        f"build {built - start:.2f}s, check {checked - built:.3f}s "
+        f"({len(result.overloaded_lines)} overloaded lines), "
+        f"PTDF of {NUM_MONITORED} branches {ptdf - checked:.3f}s, "
+        f"LODF of {NUM_OUTAGES} outages {lodf - ptdf:.3f}s"
+    )
+
+
+def main() -> None:
+    converter = MatpowerConverter()
+    if len(sys.argv) > 1:
+        for file_path in sys.argv[1:]:
+            benchmark(file_path, converter.file_to_gdf(file_path))
+        return
+
+    for side in SIZES:
+        benchmark(f"synthetic grid ({side * side} buses)", converter.to_gdf(synthetic_grid(side)))
+
+
+if __name__ == "__main__":
+    main()
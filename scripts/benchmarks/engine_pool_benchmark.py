@@ -0,0 +1,74 @@
+"""Benchmark the parallel export of subsystems on an engine pool with stand-in engines that
+simulate the latency of MATLAB, compared to building all subsystems on the engine of the model.
+
+Usage: `python scripts/benchmarks/engine_pool_benchmark.py`
+"""
+
+import contextlib
+import dataclasses
+import io
+import json
+import time
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.load import Load
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.generic.component_graph import ComponentGraph
+from epowcore.simscape.engine_pool import EnginePool
+from epowcore.simscape.script_engine import StandInEngine
+from epowcore.simscape.simscape_converter import SimscapeConverter
+
+NUM_SUBSYSTEMS = 16
+ISLAND_SIZE = 5
+POOL_SIZES = [1, 2, 4, 8]
+CALL_LATENCY = 0.002
+"""Seconds per engine call."""
+START_TIME = 1.0
+"""Seconds to start an engine; `start_matlab` usually takes several seconds."""
+
+
+def create_model() -> CoreModel:
+    """IEEE39 with subsystems, each containing buses with loads."""
+    with open("tests/models/gdf/IEEE39_gdf.json", "r", encoding="utf-8") as file:
+        core_model = CoreModel.import_dict(json.load(file))
+    bus, load = core_model.type_list(Bus)[0], core_model.type_list(Load)[0]
+    for i in range(NUM_SUBSYSTEMS):
+        graph = ComponentGraph()
+        uid = core_model.get_valid_id() + 2 * ISLAND_SIZE * i
+        for j in range(ISLAND_SIZE):
+            island_bus = dataclasses.replace(bus, uid=uid + 2 * j, name=f"Bus {j}")
+            island_load = dataclasses.replace(load, uid=uid + 2 * j + 1, name=f"Load {j}")
+            graph.add_edge(island_bus, island_load)
+        core_model.graph.add_node(Subsystem(core_model.get_valid_id(), f"Area {i}", None, graph))
+    return core_model
+
+
+def start_engine() -> StandInEngine:
+    time.sleep(START_TIME)
+    return StandInEngine(latency=CALL_LATENCY)
+
+
+def export(converter: SimscapeConverter, core_model: CoreModel) -> float:
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        converter.from_gdf(core_model, "IEEE39")
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    core_model = create_model()
+    print(f"IEEE39 with {NUM_SUBSYSTEMS} subsystems, {CALL_LATENCY * 1e3:.0f} ms per call:")
+    duration = export(SimscapeConverter(start_engine()), core_model)
+    print(f"  one engine:   {duration:6.2f}s (+ {START_TIME:.0f}s start)")
+    for size in POOL_SIZES:
+        with EnginePool(size, start_engine) as pool:
+            first = export(SimscapeConverter(pool=pool), core_model)
+            second = export(SimscapeConverter(pool=pool), core_model)
+        print(
+            f"  pool of {size}:    {second:6.2f}s, first export with starting engines {first:.2f}s"
+        )
+
+
+if __name__ == "__main__":
+    main()
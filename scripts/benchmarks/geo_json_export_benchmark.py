@@ -0,0 +1,99 @@
+"""Benchmark the GeoJSON export of a synthetic model with detailed line geometries: the
+in-memory export as before, the streamed export with simplified lines and parallel workers,
+and the web map tiles.
+
+Usage: `python scripts/benchmarks/geo_json_export_benchmark.py`
+"""
+
+import io
+import math
+import os
+import tempfile
+import time
+
+import geojson
+
+from epowcore.gdf.bus import Bus, BusType, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.tline import TLine
+from epowcore.geo_json.from_gdf.geo_json_export import export_geo_json, write_geo_json, write_tiles
+
+NUM_BUSES = 5_000
+POINTS_PER_LINE = 200
+TOLERANCE = 1e-4
+"""About 10 m."""
+WORKERS = os.cpu_count() or 1
+
+
+def synthetic_model(num_buses: int) -> CoreModel:
+    """Buses on a grid with lines to the right and lower neighbours, following a curve."""
+    core_model = CoreModel(base_frequency=50.0)
+    width = int(math.sqrt(num_buses))
+    buses = [
+        Bus(
+            i,
+            f"Bus {i}",
+            coords=(47.0 + 0.05 * (i // width), 6.0 + 0.05 * (i % width)),
+            lf_bus_type=LFBusType.PQ,
+            nominal_voltage=110.0,
+            bus_type=BusType.BUSBAR,
+        )
+        for i in range(num_buses)
+    ]
+    uid = num_buses
+    for i, bus in enumerate(buses):
+        for j in (i + 1, i + width):
+            if j >= num_buses or (j == i + 1 and j % width == 0):
+                continue
+            (lat_a, lon_a), (lat_b, lon_b) = bus.coords, buses[j].coords
+            coords = []
+            for k in range(POINTS_PER_LINE):
+                t = k / (POINTS_PER_LINE - 1)
+                bend = 0.005 * math.sin(math.pi * t) + 0.0002 * math.sin(40 * t)
+                coords.append((lat_a + t * (lat_b - lat_a) + bend, lon_a + t * (lon_b - lon_a)))
+            line = TLine(
+                uid,
+                f"Line {i}_{j}",
+                coords=coords,
+                length=5.0,
+                r1=0.1,
+                x1=0.4,
+                b1=3.0,
+                rating=100.0,
+            )
+            core_model.add_connection(line, bus, "A")
+            core_model.add_connection(line, buses[j], "B")
+            uid += 1
+    return core_model
+
+
+def main() -> None:
+    core_model = synthetic_model(NUM_BUSES)
+    print(f"{NUM_BUSES} buses, {len(core_model.graph.nodes)} components, {WORKERS} CPUs")
+
+    start = time.perf_counter()
+    text = geojson.dumps(export_geo_json(core_model))
+    print(f"  in memory:           {time.perf_counter() - start:6.2f}s  {len(text) / 1e6:7.1f} MB")
+
+    for tolerance, workers in [(None, 1), (TOLERANCE, 1), (TOLERANCE, WORKERS)]:
+        output = io.StringIO()
+        start = time.perf_counter()
+        write_geo_json(core_model, output, tolerance=tolerance, max_workers=workers)
+        duration = time.perf_counter() - start
+        label = f"streamed, {'full' if tolerance is None else 'simplified'}, {workers} worker(s)"
+        print(f"  {label + ':':<40} {duration:6.2f}s  {len(output.getvalue()) / 1e6:7.1f} MB")
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        tiles = write_tiles(core_model, directory, max_zoom=10, max_workers=WORKERS)
+        duration = time.perf_counter() - start
+        size = sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, names in os.walk(directory)
+            for name in names
+        )
+        print(f"  tiles, zoom 0-10:    {duration:6.2f}s  {size / 1e6:7.1f} MB in {tiles} tiles")
+
+
+if __name__ == "__main__":
+    main()
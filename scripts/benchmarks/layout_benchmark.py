@@ -0,0 +1,48 @@
+"""Benchmark the layout of synthetic models with the sparse stress model, compared to the
+Kamada-Kawai layout previously used by the Simscape export on the smallest model, and the
+lookup of a cached layout.
+
+Usage: `python scripts/benchmarks/layout_benchmark.py`
+"""
+
+import time
+
+import networkx as nx
+import numpy as np
+from reexport_benchmark import synthetic_model
+
+from epowcore.generic.layout import LayoutCache, layout_graph
+
+SIZES = [200, 2_000, 10_000]
+KAMADA_KAWAI_SIZES = [200]
+
+
+def edge_lengths(graph: nx.Graph, pos: dict) -> str:
+    lengths = np.array([np.hypot(*np.subtract(pos[u], pos[v])) for u, v in graph.edges()])
+    return f"edge length {lengths.mean():.2f} ± {lengths.std() / lengths.mean():.0%}"
+
+
+def main() -> None:
+    for num_buses in SIZES:
+        graph = synthetic_model(num_buses).graph.get_internal_graph(copy=False)
+        print(f"{num_buses} buses, {len(graph.nodes)} components:")
+
+        if num_buses in KAMADA_KAWAI_SIZES:
+            start = time.perf_counter()
+            pos = nx.kamada_kawai_layout(graph)
+            duration = time.perf_counter() - start
+            # relative to the mean, the scale of the layouts differs
+            print(f"  Kamada-Kawai:  {duration:8.3f}s  {edge_lengths(graph, pos)}")
+
+        cache = LayoutCache()
+        start = time.perf_counter()
+        pos = layout_graph(graph, cache=cache)
+        print(f"  sparse stress: {time.perf_counter() - start:8.3f}s  {edge_lengths(graph, pos)}")
+
+        start = time.perf_counter()
+        layout_graph(graph, cache=cache)
+        print(f"  cached:        {time.perf_counter() - start:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark the built-in AC load flow against the pandapower export followed by `runpp`.
+
+Usage: `python scripts/benchmarks/loadflow_benchmark.py [case file ...]`
+Without arguments, the synthetic meshed grids of the bus ordering benchmark are used.
+Larger grids are only solved with the built-in load flow, as the per element creation of the
+pandapower export dominates the runtime there.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandapower
+from bus_ordering_benchmark import synthetic_grid
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.loadflow.ac_loadflow import LoadFlowAlgorithm, run_loadflow
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+
+SIZES = [20, 40]
+NATIVE_SIZES = [100, 200]
+
+
+def native(core_model: CoreModel) -> None:
+    for algorithm in LoadFlowAlgorithm:
+        start = time.perf_counter()
+        result = run_loadflow(core_model, algorithm)
+        print(
+            f"  native {algorithm.value:>4}: {time.perf_counter() - start:.3f}s, "
+            f"{result.iterations} iterations, converged: {result.converged}"
+        )
+
+
+def export_and_runpp(core_model: CoreModel) -> None:
+    start = time.perf_counter()
+    network = PandapowerConverter().from_gdf(core_model, "benchmark").network
+    exported = time.perf_counter()
+    pandapower.runpp(network, numba=False)
+    end = time.perf_counter()
+    print(
+        f"  pandapower  : {end - start:.3f}s (export {exported - start:.3f}s, "
+        f"runpp {end - exported:.3f}s), converged: {network.converged}"
+    )
+
+    result = run_loadflow(core_model)
+    deviation = np.max(np.abs(result.vm_pu - network.res_bus.vm_pu.loc[result.bus_uids]))
+    print(f"  max. voltage deviation: {deviation:.2e} p.u.")
+
+
+def main() -> None:
+    converter = MatpowerConverter()
+    if len(sys.argv) > 1:
+        for file_path in sys.argv[1:]:
+            core_model = converter.file_to_gdf(file_path)
+            print(f"{file_path}:")
+            native(core_model)
+            export_and_runpp(core_model)
+        return
+
+    for side in SIZES:
+        core_model = converter.to_gdf(synthetic_grid(side))
+        print(f"synthetic grid ({side * side} buses):")
+        native(core_model)
+        export_and_runpp(core_model)
+    for side in NATIVE_SIZES:
+        core_model = converter.to_gdf(synthetic_grid(side))
+        print(f"synthetic grid ({side * side} buses):")
+        native(core_model)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark the ingestion rate of the Matpower import.
+
+Usage: `python scripts/benchmarks/matpower_import_benchmark.py [case file ...]`
+Without arguments, synthetic meshed cases of increasing size are generated.
+Real cases like case2869pegase.m or case13659pegase.m can be passed as arguments.
+"""
+
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.matpower.matpower_model import MatpowerModel
+
+SIZES = [1_000, 10_000, 50_000]
+
+
+def synthetic_case(num_buses: int, seed: int = 0) -> MatpowerModel:
+    """Create a meshed synthetic case: a ring with random chords and 5 % transformers."""
+    rng = np.random.default_rng(seed)
+    bus = np.zeros((num_buses, 13))
+    bus[:, 0] = np.arange(1, num_buses + 1)
+    bus[:, 1] = 1
+    bus[0, 1] = 3
+    bus[:, 2] = rng.uniform(0, 50, num_buses)
+    bus[:, 3] = rng.uniform(0, 20, num_buses)
+    bus[:, 6:8] = 1
+    bus[:, 9] = 220.0
+    bus[:, 10] = 1
+    bus[:, 11:13] = (1.1, 0.9)
+
+    ring = np.column_stack([bus[:, 0], np.roll(bus[:, 0], -1)])
+    chords = rng.integers(1, num_buses + 1, size=(num_buses // 2, 2))
+    chords = chords[chords[:, 0] != chords[:, 1]]
+    ends = np.vstack([ring, chords])
+    branch = np.zeros((len(ends), 13))
+    branch[:, 0:2] = ends
+    branch[:, 2] = rng.uniform(0.001, 0.02, len(ends))
+    branch[:, 3] = rng.uniform(0.01, 0.2, len(ends))
+    branch[:, 4] = rng.uniform(0.0, 0.3, len(ends))
+    branch[:, 5:8] = 250.0
+    branch[rng.random(len(ends)) < 0.05, 8] = 1.0
+    branch[:, 10] = 1
+    branch[:, 11:13] = (-360.0, 360.0)
+
+    gen_buses = rng.choice(bus[:, 0], size=max(num_buses // 10, 1), replace=False)
+    gen_buses[0] = 1
+    gen = np.zeros((len(gen_buses), 21))
+    gen[:, 0] = gen_buses
+    gen[:, 1] = rng.uniform(50, 300, len(gen_buses))
+    gen[:, 3:5] = (300.0, -300.0)
+    gen[:, 5] = 1.0
+    gen[:, 6] = 100.0
+    gen[:, 7] = 1
+    gen[:, 8] = 400.0
+
+    return MatpowerModel.from_dict(
+        {"mpc": {"baseMVA": 100.0, "bus": bus, "branch": branch, "gen": gen}}
+    )
+
+
+def benchmark(name: str, model: MatpowerModel) -> None:
+    converter = MatpowerConverter()
+    num_rows = len(model.bus) + len(model.branch) + len(model.gen)
+
+    start = time.perf_counter()
+    core_model = converter.to_gdf(model)
+    duration = time.perf_counter() - start
+
+    print(
+        f"{name}: {len(model.bus)} buses, {len(model.branch)} branches, {len(model.gen)} gens "
+        f"-> {len(core_model.graph.nodes)} components in {duration:.2f}s "
+        f"({num_rows / duration:,.0f} rows/s)"
+    )
+
+
+def main() -> None:
+    converter = MatpowerConverter()
+    if len(sys.argv) > 1:
+        for file_path in sys.argv[1:]:
+            start = time.perf_counter()
+            model = converter.read_from_file(file_path)
+            print(f"reading {file_path} took {time.perf_counter() - start:.2f}s")
+            benchmark(file_path, model)
+        return
+
+    for size in SIZES:
+        model = synthetic_case(size)
+        # include parsing of a written .mat file
+        with tempfile.TemporaryDirectory() as directory:
+            converter.write_to_matfile(model, f"{directory}/case.mat")
+            start = time.perf_counter()
+            model = converter.read_from_file(f"{directory}/case.mat")
+            print(f"reading synthetic case ({size} buses) took {time.perf_counter() - start:.2f}s")
+        benchmark(f"synthetic {size}", model)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Benchmark fingerprinting and comparing synthetic models, from scratch and with the
+fingerprints of unchanged components cached.
+
+Usage: `python scripts/benchmarks/model_diff_benchmark.py`
+"""
+
+import copy
+import time
+
+from reexport_benchmark import synthetic_model
+
+from epowcore.gdf.load import Load
+from epowcore.generic.fingerprint import Fingerprinter
+from epowcore.generic.model_diff import diff_models
+
+SIZES = [1_000, 5_000]
+NUM_CHANGES = 10
+
+
+def main() -> None:
+    for size in SIZES:
+        core_model = synthetic_model(size)
+        old = copy.deepcopy(core_model)
+        print(f"{size} buses, {len(core_model.graph.nodes)} components")
+
+        fingerprinter = Fingerprinter()
+        start = time.perf_counter()
+        fingerprinter.model(old)
+        fingerprinter.model(core_model)
+        print(f"  fingerprint two models: {time.perf_counter() - start:.3f}s")
+
+        for load in core_model.type_list(Load)[:NUM_CHANGES]:
+            core_model.update_component(load, active_power=load.active_power + 1.0)
+
+        start = time.perf_counter()
+        diff = diff_models(old, core_model)
+        print(f"  diff from scratch: {time.perf_counter() - start:.3f}s, {len(diff)} differences")
+        start = time.perf_counter()
+        diff = diff_models(old, core_model, fingerprinter)
+        print(f"  diff with cache: {time.perf_counter() - start:.3f}s, {len(diff)} differences")
+        start = time.perf_counter()
+        equal = old.graph == core_model.graph
+        print(f"  graph equality: {time.perf_counter() - start:.3f}s, equal: {equal}")
+
+
+if __name__ == "__main__":
+    main()
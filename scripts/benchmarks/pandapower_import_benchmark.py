@@ -0,0 +1,54 @@
+"""Benchmark the ingestion rate of the pandapower import.
+
+Usage: `python scripts/benchmarks/pandapower_import_benchmark.py [pandapower JSON file ...]`
+Without arguments, the synthetic cases of the Matpower import benchmark are converted to
+pandapower networks of increasing size.
+"""
+
+import sys
+import time
+
+import pandapower
+import pandapower.converter
+from matpower_import_benchmark import synthetic_case
+
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+from epowcore.pandapower.pandapower_model import PandapowerModel
+
+SIZES = [1_000, 10_000, 50_000]
+TABLES = ["bus", "line", "trafo", "load", "sgen", "gen", "ext_grid", "shunt", "switch"]
+
+
+def benchmark(name: str, net: pandapower.pandapowerNet) -> None:
+    converter = PandapowerConverter()
+    num_rows = sum(len(net[table]) for table in TABLES)
+
+    start = time.perf_counter()
+    core_model = converter.to_gdf(PandapowerModel(network=net))
+    duration = time.perf_counter() - start
+
+    print(
+        f"{name}: {len(net.bus)} buses, {num_rows} rows "
+        f"-> {len(core_model.graph.nodes)} components in {duration:.2f}s "
+        f"({num_rows / duration:,.0f} rows/s)"
+    )
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        for file_path in sys.argv[1:]:
+            start = time.perf_counter()
+            net = pandapower.from_json(file_path)
+            print(f"reading {file_path} took {time.perf_counter() - start:.2f}s")
+            benchmark(file_path, net)
+        return
+
+    for size in SIZES:
+        mpc = synthetic_case(size).as_dict()["mpc"]
+        ppc = {"baseMVA": mpc["baseMVA"], "bus": mpc["bus"], "branch": mpc["branch"]}
+        net = pandapower.converter.from_ppc({**ppc, "gen": mpc["gen"]}, f_hz=50)
+        benchmark(f"synthetic {size}", net)
+
+
+if __name__ == "__main__":
+    main()
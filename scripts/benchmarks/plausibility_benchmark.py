@@ -0,0 +1,95 @@
+"""Benchmark the violation detection of the pandapower plausibility checks on large networks.
+
+Usage: `python scripts/benchmarks/plausibility_benchmark.py`
+
+The classification only depends on the result tables, so networks with synthetic load flow
+results are used instead of running `pandapower.runpp` on large networks. The vectorized
+violation tables are compared with the former row-by-row classification using
+`DataFrame.iterrows()`. The geodata parsing of the isolated area plot is compared with the
+former per-bus lookup and `json.loads`.
+"""
+
+import json
+import time
+
+import numpy as np
+import pandapower
+import pandas as pd
+
+from epowcore.pandapower.utils import bus_coordinates
+from epowcore.plausibility.pandapower_checker import PandapowerPlausibilityChecker
+
+SIZES = [10_000, 50_000, 200_000]
+
+
+def synthetic_net(num_buses: int, seed: int = 0) -> pandapower.pandapowerNet:
+    """Network with result tables of num_buses buses, 1.5 lines and 0.1 transformers per bus."""
+    rng = np.random.default_rng(seed)
+    net = pandapower.create_empty_network()
+    num_lines = num_buses * 3 // 2
+    num_trafos = num_buses // 10
+    net.res_bus = pd.DataFrame({"vm_pu": rng.normal(1.0, 0.05, num_buses)})
+    net.res_line = pd.DataFrame({"loading_percent": rng.uniform(0.0, 110.0, num_lines)})
+    net.res_trafo = pd.DataFrame({"loading_percent": rng.uniform(0.0, 110.0, num_trafos)})
+    net.bus = pd.DataFrame(
+        {
+            "geo": [
+                json.dumps({"type": "Point", "coordinates": [float(i), float(i % 100)]})
+                for i in range(num_buses)
+            ]
+        }
+    )
+    return net
+
+
+def row_by_row(net: pandapower.pandapowerNet) -> int:
+    """The former classification, returns the number of violations."""
+    violations = []
+    for bus_index, row in net.res_bus.iterrows():
+        vm_pu = float(row["vm_pu"])
+        if vm_pu < 0.9 or vm_pu > 1.1:
+            violations.append({"bus_index": int(bus_index), "vm_pu": vm_pu})
+    for table in (net.res_line, net.res_trafo):
+        for index, row in table.iterrows():
+            loading_percent = float(row["loading_percent"])
+            if loading_percent > 100.0:
+                violations.append({"index": int(index), "loading_percent": loading_percent})
+    return len(violations)
+
+
+def benchmark(num_buses: int) -> None:
+    net = synthetic_net(num_buses)
+
+    start = time.perf_counter()
+    num_violations = row_by_row(net)
+    loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    tables = PandapowerPlausibilityChecker().violation_tables(net)
+    records = {name: table.to_dict("records") for name, table in tables.items()}
+    vectorized = time.perf_counter() - start
+    assert sum(len(violations) for violations in records.values()) == num_violations
+
+    # the former plot looked up and parsed the geodata bus by bus
+    start = time.perf_counter()
+    for bus_index in net.bus.index:
+        json.loads(net.bus.at[bus_index, "geo"]).get("coordinates")
+    geo_loop = time.perf_counter() - start
+    start = time.perf_counter()
+    bus_coordinates(net)
+    geo_vectorized = time.perf_counter() - start
+
+    print(
+        f"{num_buses} buses, {num_violations} violations: "
+        f"iterrows {loop:.3f}s, vectorized {vectorized:.3f}s (incl. records); "
+        f"geodata json.loads {geo_loop:.3f}s, vectorized {geo_vectorized:.3f}s"
+    )
+
+
+def main() -> None:
+    for num_buses in SIZES:
+        benchmark(num_buses)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark the PowerFactory export to the PowerFactory stand-in, comparing shared equipment
+types and the bus index to a type per element and searching the buses in the grid.
+
+The stand-in counts the calls into PowerFactory; the time with PowerFactory is estimated from
+the calls and the latency of a call.
+
+Usage: `python scripts/benchmarks/powerfactory_export_benchmark.py`
+"""
+
+import time
+from typing import Any
+
+from epowcore.power_factory import stand_in
+
+stand_in.install()
+
+# pylint: disable=wrong-import-position
+from epowcore.gdf.bus import Bus, BusType, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.load import Load
+from epowcore.gdf.tline import TLine
+from epowcore.power_factory.from_gdf.power_factory_exporter import PowerFactoryExporter
+from epowcore.power_factory.from_gdf.type_library import TypeLibrary
+
+SIZES = [500, 2_000]
+LINE_TYPES = [(0.03, 0.3, 3.5), (0.05, 0.4, 2.8), (0.12, 0.39, 2.9), (0.02, 0.25, 4.5)]
+"""r1, x1 and b1 of the line types used by the synthetic grid."""
+CALL_LATENCY = 50e-6
+"""Seconds per call into PowerFactory."""
+
+
+class PerElementTypes(TypeLibrary):
+    """Creates a type for each element, as the export did before the type library."""
+
+    def get(self, folder: str, class_name: str, name: str, attributes: dict[str, Any]) -> Any:
+        pf_type = self.folder(folder).CreateObject(class_name, name)
+        for attribute, value in attributes.items():
+            pf_type.SetAttribute(attribute, value)
+        self.created += 1
+        return pf_type
+
+
+class Unindexed(dict):
+    """Does not register the created buses, so that they are searched in the grid."""
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        return default
+
+
+def synthetic_model(num_buses: int) -> CoreModel:
+    """A ring of buses with a load at each bus and a chord to every seventh bus."""
+    core_model = CoreModel(base_frequency=50.0)
+    buses = [
+        Bus(
+            i,
+            f"Bus {i}",
+            lf_bus_type=LFBusType.PQ,
+            nominal_voltage=110.0,
+            bus_type=BusType.BUSBAR,
+        )
+        for i in range(num_buses)
+    ]
+    uid = num_buses
+    for i, bus in enumerate(buses):
+        load = Load(uid, f"Load {i}", active_power=10.0, reactive_power=3.0)
+        core_model.add_connection(load, bus)
+        uid += 1
+        for j in (1, 7):
+            r1, x1, b1 = LINE_TYPES[(i + j) % len(LINE_TYPES)]
+            line = TLine(uid, f"Line {i}_{j}", length=20.0, r1=r1, x1=x1, b1=b1, rating=100.0)
+            core_model.add_connection(line, bus, "A")
+            core_model.add_connection(line, buses[(i + j) % num_buses], "B")
+            uid += 1
+    return core_model
+
+
+def export(core_model: CoreModel, shared: bool) -> tuple[float, int, int]:
+    app = stand_in.StandInApplication()
+    start = time.perf_counter()
+    exporter = PowerFactoryExporter(core_model, "Grid", app)
+    if not shared:
+        exporter.types = PerElementTypes(exporter.pf_type_library)
+        exporter.pf_components = Unindexed()
+    exporter.convert_model()
+    return time.perf_counter() - start, app.calls, exporter.types.created
+
+
+def main() -> None:
+    print(f"Estimated time with {CALL_LATENCY * 1e6:.0f} µs per call into PowerFactory")
+    for num_buses in SIZES:
+        core_model = synthetic_model(num_buses)
+        for shared in (False, True):
+            elapsed, calls, created = export(core_model, shared)
+            print(
+                f"{num_buses:>6} buses, {'shared' if shared else 'per element':>11}: "
+                f"{created:>5} types, {elapsed:6.2f} s local, {calls:>8} calls, "
+                f"{elapsed + calls * CALL_LATENCY:6.2f} s estimated"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark the PowerFactory import on synthetic grids of the PowerFactory stand-in, comparing
+the extraction with cached objects to reading every attribute from the PowerFactory objects.
+
+The stand-in counts the calls into PowerFactory; the time with PowerFactory is estimated from
+the calls and the latency of a call.
+
+Usage: `python scripts/benchmarks/powerfactory_extraction_benchmark.py`
+"""
+
+import time
+from typing import Any
+
+from epowcore.power_factory import stand_in
+
+stand_in.install()
+
+# pylint: disable=wrong-import-position
+from epowcore.power_factory.object_cache import ObjectCache
+from epowcore.power_factory.to_gdf.power_factory_extractor import PowerFactoryExtractor
+
+SIZES = [1_000, 5_000, 10_000]
+CALL_LATENCY = 50e-6
+"""Seconds per call into PowerFactory."""
+
+
+class UncachedObjects(ObjectCache):
+    """Returns the PowerFactory objects themselves, as the extraction did before the cache."""
+
+    def of_class(self, class_name: str, attributes: Any = ()) -> list:
+        return self.app.GetCalcRelevantObjects(class_name)
+
+
+def list_hierarchy(components: list) -> dict:
+    """The hierarchy with a membership test on lists."""
+    parents: dict = {}
+    for component in components:
+        parent = component.GetParent()
+        if parent.GetClassName() not in ["ElmNet", "ElmXnet"]:
+            if parent not in parents:
+                parents[parent] = []
+            if not component in parents[parent]:
+                parents[parent].append(component)
+    return parents
+
+
+def extract(num_buses: int, cached: bool) -> tuple[float, int, float]:
+    app = stand_in.synthetic_grid(num_buses)
+    start = time.perf_counter()
+    extractor = PowerFactoryExtractor("Grid", "Base", 50.0, app=app)
+    if not cached:
+        extractor.objects = UncachedObjects(app)
+    extractor.get_core_model()
+    if cached:
+        extractor.get_hierarchy()
+    else:
+        list_hierarchy(list(extractor._component_dict))  # pylint: disable=protected-access
+    elapsed = time.perf_counter() - start
+    return elapsed, app.calls, elapsed + app.calls * CALL_LATENCY
+
+
+def main() -> None:
+    print(f"Estimated time with {CALL_LATENCY * 1e6:.0f} µs per call into PowerFactory")
+    for num_buses in SIZES:
+        for cached in (False, True):
+            elapsed, calls, estimate = extract(num_buses, cached)
+            print(
+                f"{num_buses:>6} buses, {'cached' if cached else 'per object':>10}: "
+                f"{elapsed:7.2f} s local, {calls:>9} calls, {estimate:7.2f} s estimated"
+            )
+
+
+if __name__ == "__main__":
+    main()
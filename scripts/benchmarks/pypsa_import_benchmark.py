@@ -0,0 +1,118 @@
+"""Benchmark the ingestion rate of the PyPSA import.
+
+Usage: `python scripts/benchmarks/pypsa_import_benchmark.py [PyPSA netCDF file ...]`
+Without arguments, PyPSA-Eur like synthetic networks of increasing size are imported.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pypsa
+
+from epowcore.pypsa.pypsa_convert import PyPSAConverter
+
+SIZES = [5_000, 20_000, 50_000]
+COMPONENTS = ["buses", "lines", "transformers", "generators", "loads", "shunt_impedances"]
+
+
+def synthetic_network(num_buses: int, seed: int = 0) -> pypsa.Network:
+    """A meshed 380/220 kV network with typed and untyped lines, coordinates and
+    named components."""
+    rng = np.random.default_rng(seed)
+    n = pypsa.Network()
+    names = np.array([f"way/{i}" for i in range(num_buses)])
+    n.add(
+        "Bus",
+        names,
+        v_nom=np.where(np.arange(num_buses) % 10 == 0, 220.0, 380.0),
+        x=rng.uniform(-10, 30, num_buses),
+        y=rng.uniform(35, 70, num_buses),
+    )
+
+    # a ring through all 380 kV buses plus random chords
+    ehv = names[np.arange(num_buses) % 10 != 0]
+    chords = rng.integers(0, len(ehv), size=(len(ehv) // 2, 2))
+    bus0 = np.concatenate([ehv, ehv[chords[:, 0]]])
+    bus1 = np.concatenate([np.roll(ehv, -1), ehv[chords[:, 1]]])
+    typed = rng.random(len(bus0)) < 0.5
+    n.add(
+        "Line",
+        [f"relation/{i}" for i in range(len(bus0))],
+        bus0=bus0,
+        bus1=bus1,
+        type=np.where(typed, "Al/St 240/40 4-bundle 380.0", ""),
+        length=rng.uniform(5, 200, len(bus0)),
+        num_parallel=rng.integers(1, 4, len(bus0)).astype(float),
+        r=np.where(typed, 0.0, rng.uniform(0.5, 5, len(bus0))),
+        x=np.where(typed, 0.0, rng.uniform(5, 50, len(bus0))),
+        b=np.where(typed, 0.0, rng.uniform(1e-5, 1e-3, len(bus0))),
+        s_nom=rng.uniform(500, 3000, len(bus0)),
+    )
+
+    hv = names[np.arange(num_buses) % 10 == 0]
+    n.add(
+        "Transformer",
+        [f"trafo/{i}" for i in range(len(hv))],
+        bus0=names[np.flatnonzero(np.arange(num_buses) % 10 == 0) + 1],
+        bus1=hv,
+        s_nom=rng.uniform(200, 1000, len(hv)),
+        x=0.1,
+        r=0.001,
+    )
+
+    generator_buses = rng.choice(names, num_buses // 4)
+    n.add(
+        "Generator",
+        [f"gen/{i}" for i in range(len(generator_buses))],
+        bus=generator_buses,
+        p_nom=rng.uniform(10, 1000, len(generator_buses)),
+        carrier=rng.choice(["onwind", "solar", "CCGT", "nuclear", "ror"], len(generator_buses)),
+        control=np.where(np.arange(len(generator_buses)) == 0, "Slack", "PQ"),
+    )
+    n.add(
+        "Load",
+        [f"load/{i}" for i in range(num_buses // 2)],
+        bus=rng.choice(names, num_buses // 2),
+        p_set=rng.uniform(1, 300, num_buses // 2),
+        q_set=rng.uniform(0, 50, num_buses // 2),
+    )
+    n.add(
+        "ShuntImpedance",
+        [f"shunt/{i}" for i in range(num_buses // 50)],
+        bus=rng.choice(names, num_buses // 50),
+        b=rng.uniform(-1e-4, 1e-4, num_buses // 50),
+    )
+    return n
+
+
+def benchmark(name: str, network: pypsa.Network) -> None:
+    converter = PyPSAConverter()
+    num_rows = sum(len(network.components[component].static) for component in COMPONENTS)
+
+    start = time.perf_counter()
+    core_model = converter.to_gdf(network)
+    duration = time.perf_counter() - start
+
+    print(
+        f"{name}: {len(network.components.buses.static)} buses, {num_rows} rows "
+        f"-> {len(core_model.graph.nodes)} components in {duration:.2f}s "
+        f"({num_rows / duration:,.0f} rows/s)"
+    )
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        for file_path in sys.argv[1:]:
+            start = time.perf_counter()
+            network = pypsa.Network(file_path)
+            print(f"reading {file_path} took {time.perf_counter() - start:.2f}s")
+            benchmark(file_path, network)
+        return
+
+    for size in SIZES:
+        benchmark(f"synthetic {size}", synthetic_network(size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Benchmark distributing the hierarchies of an RSCAD subsystem onto RTDS racks, comparing the
+k-way partitioner with the previous greedy split.
+
+The connection graphs resemble the bus hierarchies of the IEEE 399 bus system: geometric graphs
+with a few hundred hierarchies, random load unit costs and lines with random propagation times.
+
+Usage: `python scripts/benchmarks/rack_partitioner_benchmark.py`
+"""
+
+import math
+import time
+
+import networkx as nx
+import numpy as np
+
+from epowcore.rscad.rack_partitioner import partition_racks
+
+SIZES = [100, 399, 2_000]
+TIMESTEP = 5e-5
+RACK_SHARES = [0.5, 0.25, 0.125]
+"""Maximum load of a rack as share of the total load units."""
+
+
+def connection_graph(num_hierarchies: int, seed: int = 0) -> nx.Graph:
+    rng = np.random.default_rng(seed)
+    radius = math.sqrt(6 / (math.pi * num_hierarchies))
+    graph = nx.random_geometric_graph(num_hierarchies, radius, seed=seed)
+    graph = nx.relabel_nodes(graph, {node: f"Bus_Box_{node}" for node in graph.nodes})
+    for node in graph.nodes:
+        graph.nodes[node]["LoadUnitCosts"] = int(rng.integers(5, 60))
+    for u, v in graph.edges:
+        graph.edges[u, v]["time"] = float(
+            rng.choice([1e-5, 1e-4, 3e-4, 1e-3], p=[0.05, 0.35, 0.35, 0.25])
+        )
+        graph.edges[u, v]["lines"] = 1
+    return graph
+
+
+def greedy_split(graph: nx.Graph, max_load: float, timestep: float) -> list[set]:
+    """The previous approach: cut all decoupling lines and move whole connected components into a
+    new rack until the remaining costs fit, repeated for the new rack. A single component that
+    does not fit is kept in an overloaded rack."""
+    cut = graph.copy()
+    cut.remove_edges_from([(u, v) for u, v, d in graph.edges(data=True) if d["time"] >= timestep])
+    components = [set(c) for c in nx.connected_components(cut)]
+    cost = lambda nodes: sum(graph.nodes[n]["LoadUnitCosts"] for n in nodes)
+    racks = []
+    remaining = components
+    while remaining:
+        load = sum(cost(c) for c in remaining)
+        moved = []
+        while len(remaining) > 1 and load > max_load:
+            component = remaining.pop(0)
+            load -= cost(component)
+            moved.append(component)
+        racks.append(set().union(*remaining) if remaining else set())
+        remaining = moved
+    return [rack for rack in racks if rack]
+
+
+def summarize(graph: nx.Graph, racks: list[set]) -> str:
+    rack_of = {node: i for i, rack in enumerate(racks) for node in rack}
+    loads = [sum(graph.nodes[n]["LoadUnitCosts"] for n in rack) for rack in racks]
+    cut_lines = sum(1 for u, v in graph.edges if rack_of[u] != rack_of[v])
+    imbalance = max(loads) / (sum(loads) / len(loads)) - 1
+    return (
+        f"{len(racks)} racks, max load {max(loads):6d}, imbalance {imbalance:5.1%}, "
+        f"{cut_lines:4d} cut lines"
+    )
+
+
+def main() -> None:
+    for size in SIZES:
+        graph = connection_graph(size)
+        total = sum(cost for _, cost in graph.nodes(data="LoadUnitCosts"))
+        print(f"{size} hierarchies, {graph.number_of_edges()} lines, {total} load units")
+        for share in RACK_SHARES:
+            max_load = math.ceil(total * share * 1.1)
+            start = time.perf_counter()
+            greedy = greedy_split(graph, max_load, TIMESTEP)
+            greedy_duration = time.perf_counter() - start
+            print(f"  rack limit {max_load}")
+            print(f"    greedy:      {summarize(graph, greedy)}, {greedy_duration * 1000:6.1f}ms")
+            start = time.perf_counter()
+            try:
+                partition = partition_racks(graph, max_load, TIMESTEP)
+            except ValueError as error:
+                print(f"    partitioner: {error}")
+                continue
+            duration = time.perf_counter() - start
+            print(f"    partitioner: {summarize(graph, partition.racks)}, {duration * 1000:6.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
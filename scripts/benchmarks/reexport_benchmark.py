@@ -0,0 +1,114 @@
+"""Benchmark re-exporting a model after small parameter changes, patching the previous export
+versus exporting the whole model again.
+
+Usage: `python scripts/benchmarks/reexport_benchmark.py`
+"""
+
+import time
+
+import numpy as np
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.load import Load
+from epowcore.gdf.tline import TLine
+from epowcore.generic.converter_base import ConverterBase
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.matpower.matpower_model import MatpowerModel
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+
+SIZES = [1_000, 2_000]
+CHANGE_SHARES = [0.01, 0.1]
+
+
+def synthetic_model(num_buses: int, seed: int = 0) -> CoreModel:
+    """Import a meshed synthetic Matpower case: a ring with random chords."""
+    rng = np.random.default_rng(seed)
+    bus = np.zeros((num_buses, 13))
+    bus[:, 0] = np.arange(1, num_buses + 1)
+    bus[:, 1] = 1
+    bus[0, 1] = 3
+    bus[:, 2] = rng.uniform(0, 50, num_buses)
+    bus[:, 3] = rng.uniform(0, 20, num_buses)
+    bus[:, 6:8] = 1
+    bus[:, 9] = 220.0
+    bus[:, 10] = 1
+    bus[:, 11:13] = (1.1, 0.9)
+
+    ring = np.column_stack([bus[:, 0], np.roll(bus[:, 0], -1)])
+    chords = rng.integers(1, num_buses + 1, size=(num_buses // 2, 2))
+    ends = np.vstack([ring, chords[chords[:, 0] != chords[:, 1]]])
+    branch = np.zeros((len(ends), 13))
+    branch[:, 0:2] = ends
+    branch[:, 2] = rng.uniform(0.001, 0.02, len(ends))
+    branch[:, 3] = rng.uniform(0.01, 0.2, len(ends))
+    branch[:, 4] = rng.uniform(0.0, 0.3, len(ends))
+    branch[:, 5:8] = 250.0
+    branch[:, 10] = 1
+    branch[:, 11:13] = (-360.0, 360.0)
+
+    gen_buses = rng.choice(bus[:, 0], size=num_buses // 10, replace=False)
+    gen_buses[0] = 1
+    gen = np.zeros((len(gen_buses), 21))
+    gen[:, 0] = gen_buses
+    gen[:, 1] = rng.uniform(50, 300, len(gen_buses))
+    gen[:, 3:5] = (300.0, -300.0)
+    gen[:, 5] = 1.0
+    gen[:, 6] = 100.0
+    gen[:, 7] = 1
+    gen[:, 8] = 400.0
+
+    case = MatpowerModel.from_dict(
+        {"mpc": {"baseMVA": 100.0, "bus": bus, "branch": branch, "gen": gen}}
+    )
+    return MatpowerConverter().to_gdf(case)
+
+
+def change_parameters(core_model: CoreModel, share: float, rng: np.random.Generator) -> int:
+    """Scale a parameter of [share] of the loads, lines and generators."""
+    candidates = core_model.type_list([Load, TLine, SynchronousMachine])
+    count = int(share * len(candidates))
+    for i in rng.choice(len(candidates), count, replace=False):
+        component = candidates[i]
+        if isinstance(component, Load):
+            core_model.update_component(component, active_power=component.active_power * 1.05)
+        elif isinstance(component, TLine):
+            core_model.update_component(component, x1=component.x1 * 1.05)
+        elif isinstance(component, SynchronousMachine):
+            core_model.update_component(component, active_power=component.active_power * 1.05)
+    return count
+
+
+def benchmark(converter: ConverterBase, core_model: CoreModel, share: float) -> None:
+    rng = np.random.default_rng(1)
+    core_model.track_changes()
+    model = converter.from_gdf(core_model, "benchmark")
+    count = change_parameters(core_model, share, rng)
+
+    start = time.perf_counter()
+    patched = converter.reexport(core_model, model, "benchmark")
+    patch_duration = time.perf_counter() - start
+    assert patched is model
+
+    change_parameters(core_model, share, rng)
+    start = time.perf_counter()
+    converter.from_gdf(core_model, "benchmark")
+    export_duration = time.perf_counter() - start
+
+    print(
+        f"  {type(converter).__name__}, {count} changes: export {export_duration:.2f}s, "
+        f"re-export {patch_duration:.3f}s ({export_duration / patch_duration:.0f}x)"
+    )
+
+
+def main() -> None:
+    for size in SIZES:
+        core_model = synthetic_model(size)
+        print(f"{size} buses, {len(core_model.graph.nodes)} components")
+        for share in CHANGE_SHARES:
+            for converter in (PandapowerConverter(), MatpowerConverter()):
+                benchmark(converter, core_model, share)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Benchmark the graph pipeline of the RSCAD export on synthetic drafts: relabeling the core model
+graph and packing every bus with its neighbors into a hierarchy box, comparing the boundary edge
+query by adjacency with the previous scan over all edges, and the whole export.
+
+Usage: `python scripts/benchmarks/rscad_graph_benchmark.py`
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Any, cast
+
+import networkx as nx
+from reexport_benchmark import synthetic_model
+
+from epowcore.gdf.bus import Bus
+from epowcore.rscad.graph_transformer_rscad import GraphTransformerRscad
+from epowcore.rscad.rscad_converter import RscadConverter
+
+SIZES = [1_000, 5_000]
+NOT_PACKED = {"Bus", "TLine", "TwoWindingTransformer", "HIERARCHY"}
+"""Types that are not packed into bus boxes, like the unwanted bus connections of the drawer."""
+
+
+@dataclass
+class PackedComponent:
+    uuid: str
+    type: str
+
+
+class ComponentTypes:
+    """The part of a draft used by `replace_subgraph`: looking up components by id."""
+
+    def __init__(self) -> None:
+        self.components: dict[str, PackedComponent] = {}
+
+    def get_by_id(self, uuid: str) -> PackedComponent | None:
+        return self.components.get(uuid)
+
+
+def full_scan_boundary(graph: nx.Graph, subgraph: nx.Graph) -> list[tuple]:
+    """The previous boundary edge query of `replace_subgraph`."""
+    return [
+        e
+        for e in graph.edges
+        if (e[0] in subgraph and e[1] in graph and e[1] not in subgraph)
+        or (e[0] in graph and e[1] in subgraph and e[0] not in subgraph)
+    ]
+
+
+def pack_buses(graph: nx.Graph, buses: list[str], draft: ComponentTypes) -> float:
+    transformer = GraphTransformerRscad()
+    start = time.perf_counter()
+    for i, bus in enumerate(buses):
+        nodes = [
+            node for node in graph.adj[bus] if draft.components[node].type not in NOT_PACKED
+        ] + [bus]
+        subgraph = graph.subgraph(nodes).copy()
+        new_node = PackedComponent(f"box-{i}", "HIERARCHY")
+        draft.components[new_node.uuid] = new_node
+        transformer.replace_subgraph(graph, subgraph, cast(Any, new_node), cast(Any, draft))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    for size in SIZES:
+        core_model = synthetic_model(size)
+        mapping = {component: f"uuid-{component.uid}" for component in core_model.graph.nodes}
+        print(f"{size} buses, {len(core_model.graph.edges)} connections")
+
+        start = time.perf_counter()
+        graph = GraphTransformerRscad().relabel_nodes(core_model.graph, mapping)
+        print(f"  relabel:             {time.perf_counter() - start:8.3f}s")
+
+        draft = ComponentTypes()
+        for component, uuid in mapping.items():
+            draft.components[uuid] = PackedComponent(uuid, type(component).__name__)
+        buses = [mapping[bus] for bus in core_model.type_list(Bus)]
+        duration = pack_buses(graph.copy(), buses, draft)
+        print(f"  pack buses:          {duration:8.3f}s")
+
+        sample = buses[:50]
+        start = time.perf_counter()
+        for bus in sample:
+            nodes = [
+                node for node in graph.adj[bus] if draft.components[node].type not in NOT_PACKED
+            ]
+            full_scan_boundary(graph, graph.subgraph([bus, *nodes]))
+        scan = (time.perf_counter() - start) / len(sample) * len(buses)
+        print(f"  pack buses, scanned: {scan:8.3f}s (extrapolated boundary queries only)")
+
+        start = time.perf_counter()
+        RscadConverter().from_gdf(core_model, "benchmark")
+        print(f"  RSCAD export:        {time.perf_counter() - start:8.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""Benchmark the Simscape export with the script backend on synthetic models: recording the
+commands into a MATLAB script instead of calling the engine for each of them.
+
+The export is run without MATLAB, so only the script generation is timed. The time saved with
+a real engine is estimated from the avoided engine calls and their latency.
+
+Usage: `python scripts/benchmarks/simscape_script_benchmark.py`
+"""
+
+import contextlib
+import io
+import time
+
+from reexport_benchmark import synthetic_model
+
+from epowcore.gdf.tline import TLine
+from epowcore.simscape.script_engine import ScriptEngine
+from epowcore.simscape.simscape_converter import SimscapeConverter
+
+SIZES = [200, 1_000]
+CALL_LATENCIES = [0.001, 0.01]
+"""Assumed seconds per call of the MATLAB engine, excluding the work done by MATLAB."""
+
+
+def main() -> None:
+    for num_buses in SIZES:
+        core_model = synthetic_model(num_buses)
+        for tline in core_model.type_list(TLine):
+            # Matpower branches have no length, Simscape lines need one
+            tline.length = 100.0
+        eng = ScriptEngine()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            SimscapeConverter(eng).from_gdf(core_model, f"synthetic{num_buses}")
+        duration = time.perf_counter() - start
+
+        saved = eng.round_trips - 1
+        print(
+            f"{num_buses} buses: {len(eng.commands)} commands in {duration:.2f}s, "
+            f"{len(eng.script()) / 1e6:.1f} MB script, "
+            f"{eng.round_trips} engine calls replaced by 1"
+        )
+        for latency in CALL_LATENCIES:
+            print(f"  at {latency * 1e3:.0f} ms per call: {saved * latency:.1f}s saved")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Benchmark the spatial index against a linear scan over the coordinates of all components:
+bounding box queries of a region, nearest bus queries, and queries between updates.
+
+Usage: `python scripts/benchmarks/spatial_index_benchmark.py`
+"""
+
+import copy
+import math
+import random
+import time
+
+from epowcore.gdf.bus import Bus, BusType, LFBusType
+from epowcore.gdf.component import Component
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.tline import TLine
+
+SIZES = [10_000, 100_000]
+QUERIES = 200
+UPDATES = 1_000
+REGION = 0.5
+"""Size of the queried regions in degrees, about a district of a national model."""
+
+
+def synthetic_model(num_buses: int, rng: random.Random) -> CoreModel:
+    """Buses on a jittered grid spread over a country, connected to their eastern and northern
+    neighbours by lines with five points."""
+    core_model = CoreModel(base_frequency=50.0)
+    width = math.isqrt(num_buses)
+    spacing = 8.0 / width
+    buses = [
+        Bus(
+            i,
+            f"Bus {i}",
+            coords=(
+                47.0 + spacing * (i // width + rng.uniform(-0.3, 0.3)),
+                6.0 + spacing * (i % width + rng.uniform(-0.3, 0.3)),
+            ),
+            lf_bus_type=LFBusType.PQ,
+            nominal_voltage=110.0,
+            bus_type=BusType.BUSBAR,
+        )
+        for i in range(num_buses)
+    ]
+    core_model.add_components(buses)
+    uid = num_buses
+    for i, bus in enumerate(buses):
+        for j in (i + 1, i + width):
+            if j >= num_buses or (j == i + 1 and j % width == 0):
+                continue
+            (lat_a, lon_a), (lat_b, lon_b) = bus.coords, buses[j].coords
+            coords = [
+                (lat_a + (lat_b - lat_a) * t / 4, lon_a + (lon_b - lon_a) * t / 4) for t in range(5)
+            ]
+            line = TLine(uid, f"Line {uid}", coords=coords, r1=0.1, x1=0.4, b1=3.0, rating=100.0)
+            core_model.add_connection(line, bus, "A")
+            core_model.add_connection(line, buses[j], "B")
+            uid += 1
+    return core_model
+
+
+def scan_bbox(core_model: CoreModel, bbox: tuple[float, float, float, float]) -> list[Component]:
+    """Components with a point in the bounding box, as found without an index."""
+    min_lat, min_lon, max_lat, max_lon = bbox
+    result = []
+    for component in core_model.graph.nodes:
+        coords = component.coords
+        points = [coords] if isinstance(coords, tuple) else coords or []
+        if any(min_lat <= lat <= max_lat and min_lon <= lon <= max_lon for lat, lon in points):
+            result.append(component)
+    return result
+
+
+def scan_nearest_bus(core_model: CoreModel, point: tuple[float, float]) -> Component:
+    scale = math.cos(math.radians(point[0]))
+    return min(
+        core_model.type_list(Bus),
+        key=lambda bus: math.hypot(bus.coords[0] - point[0], (bus.coords[1] - point[1]) * scale),
+    )
+
+
+def main() -> None:
+    rng = random.Random(7)
+    for num_buses in SIZES:
+        core_model = synthetic_model(num_buses, rng)
+        corners = [(rng.uniform(47.0, 54.5), rng.uniform(6.0, 13.5)) for _ in range(QUERIES)]
+        boxes = [(lat, lon, lat + REGION, lon + REGION) for lat, lon in corners]
+        print(f"{num_buses} buses, {len(core_model.graph.nodes)} components:")
+
+        start = time.perf_counter()
+        scanned = [scan_bbox(core_model, bbox) for bbox in boxes]
+        scan_time = (time.perf_counter() - start) / QUERIES
+        start = time.perf_counter()
+        nearest_scanned = [scan_nearest_bus(core_model, point) for point in corners]
+        scan_nearest_time = (time.perf_counter() - start) / QUERIES
+
+        start = time.perf_counter()
+        index = core_model.get_spatial_index()
+        num_entries = len(index)
+        print(f"  build:             {time.perf_counter() - start:9.3f}s  {num_entries} entries")
+        start = time.perf_counter()
+        found = [index.intersecting(bbox) for bbox in boxes]
+        index_time = (time.perf_counter() - start) / QUERIES
+        start = time.perf_counter()
+        nearest = [index.nearest(point, component_type=Bus)[0] for point in corners]
+        index_nearest_time = (time.perf_counter() - start) / QUERIES
+        # the index also finds lines crossing a region without a point in it
+        assert all(set(a) <= set(b) for a, b in zip(scanned, found))
+        assert nearest == nearest_scanned
+
+        print(
+            f"  bbox query:    scan {scan_time * 1e3:9.3f}ms  index {index_time * 1e3:7.3f}ms"
+            f"  ({scan_time / index_time:5.0f}x)"
+        )
+        print(
+            f"  nearest bus:   scan {scan_nearest_time * 1e3:9.3f}ms"
+            f"  index {index_nearest_time * 1e3:7.3f}ms"
+            f"  ({scan_nearest_time / index_nearest_time:5.0f}x)"
+        )
+
+        # only the index is updated, `CoreModel.update_component` also relabels the graph
+        buses = core_model.type_list(Bus)
+        start = time.perf_counter()
+        for i in range(UPDATES):
+            j = rng.randrange(len(buses))
+            buses[j] = copy.copy(buses[j])
+            buses[j].coords = (buses[j].coords[0] + 0.01, buses[j].coords[1])
+            index.insert(buses[j])
+            index.intersecting(boxes[i % QUERIES])
+        duration = (time.perf_counter() - start) / UPDATES
+        print(f"  update + query:    {duration * 1e3:9.3f}ms  {index.builds} builds")
+
+
+if __name__ == "__main__":
+    main()
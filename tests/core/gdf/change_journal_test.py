@@ -0,0 +1,118 @@
+import unittest
+
+from helpers.gdf_component_creator import GdfTestComponentCreator
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.load import Load
+from epowcore.generic.converter_base import ConverterBase
+
+
+class DummyConverter(ConverterBase[CoreModel]):
+    def _export(self, core_model: CoreModel, name: str) -> CoreModel:
+        return core_model
+
+    def _import(self, model: CoreModel) -> CoreModel:
+        return model
+
+
+class ChangeJournalTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.creator = GdfTestComponentCreator()
+        self.buses = [self.creator.create_bus() for _ in range(2)]
+        self.line = self.creator.create_tline()
+        self.load = Load(self.creator.next_uid, "Load", active_power=10.0)
+        self.core_model = self.creator.core_model
+        self.core_model.add_connection(self.buses[0], self.line, "", "A")
+        self.core_model.add_connection(self.buses[1], self.line, "", "B")
+        self.core_model.add_connection(self.buses[0], self.load)
+
+    def test_update_component_keeps_connections(self) -> None:
+        updated = self.core_model.update_component(self.load, active_power=20.0)
+
+        self.assertEqual(self.load.active_power, 10.0)
+        self.assertEqual(updated.active_power, 20.0)
+        self.assertFalse(self.core_model.graph.has_node(self.load))
+        self.assertEqual(self.core_model.get_neighbors(updated), [self.buses[0]])
+        self.assertTrue(self.core_model.sanity_check())
+        with self.assertRaises(ValueError):
+            self.core_model.update_component(updated, uid=42)
+        # outdated versions are found by uid
+        updated = self.core_model.update_component(self.load, reactive_power=5.0)
+        self.assertEqual((updated.active_power, updated.reactive_power), (20.0, 5.0))
+        with self.assertRaises(ValueError):
+            self.core_model.update_component(Load(42, "Other Load"), active_power=30.0)
+
+    def test_changes_are_recorded(self) -> None:
+        journal = self.core_model.track_changes()
+        self.assertEqual(len(journal), 0)
+
+        first = self.core_model.update_component(self.load, active_power=20.0)
+        second = self.core_model.update_component(first, reactive_power=5.0)
+        self.assertEqual(journal.modified, {self.load.uid: (self.load, second)})
+        self.assertEqual(journal.num_structural, 0)
+
+        new_load = Load(self.core_model.get_valid_id(), "New Load")
+        self.core_model.add_connection(self.buses[1], new_load)
+        self.core_model.remove_component(self.line)
+        self.assertEqual(journal.added, {new_load.uid: new_load})
+        self.assertEqual(journal.removed, {self.line.uid: self.line})
+        self.assertEqual(
+            journal.edges,
+            {
+                frozenset((self.buses[1].uid, new_load.uid)),
+                frozenset((self.buses[0].uid, self.line.uid)),
+                frozenset((self.buses[1].uid, self.line.uid)),
+            },
+        )
+        self.assertEqual(journal.num_structural, 5)
+
+        # removing an added component forgets it, removing a modified one keeps its old state
+        self.core_model.remove_component(new_load)
+        self.core_model.remove_component(second)
+        self.assertEqual(journal.added, {})
+        self.assertEqual(journal.modified, {})
+        self.assertEqual(journal.removed, {self.line.uid: self.line, self.load.uid: self.load})
+
+    def test_changes_since_sequence(self) -> None:
+        journal = self.core_model.track_changes()
+        first = self.core_model.update_component(self.load, active_power=20.0)
+        sequence = journal.sequence
+        second = self.core_model.update_component(first, reactive_power=5.0)
+        self.core_model.remove_component(self.line)
+
+        changes = journal.since(sequence)
+        assert changes is not None
+        self.assertEqual(changes.modified, {self.load.uid: (first, second)})
+        self.assertEqual(changes.removed, {self.line.uid: self.line})
+        self.assertEqual(journal.modified, {self.load.uid: (self.load, second)})
+        unchanged = journal.since(journal.sequence)
+        assert unchanged is not None
+        self.assertEqual(len(unchanged), 0)
+
+        # changes before clearing the journal are unknown
+        journal.clear()
+        self.assertEqual(len(journal), 0)
+        self.assertIsNone(journal.since(sequence))
+
+    def test_export_keeps_journal(self) -> None:
+        journal = self.core_model.track_changes()
+        self.core_model.update_component(self.load, active_power=20.0)
+
+        exported = DummyConverter().from_gdf(self.core_model, "test")
+        self.assertEqual(len(journal), 1)
+        self.assertIsNone(exported.journal)
+        self.assertNotIn("journal", self.core_model.export_dict())
+
+    def test_reexport_without_patch_exports_again(self) -> None:
+        converter = DummyConverter()
+        self.core_model.track_changes()
+        exported = converter.from_gdf(self.core_model, "test")
+        self.core_model.update_component(self.load, active_power=20.0)
+
+        reexported = converter.reexport(self.core_model, exported, "test")
+        self.assertIsNot(reexported, exported)
+        self.assertEqual(reexported.type_list(Load)[0].active_power, 20.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,146 @@
+import unittest
+
+from helpers.gdf_component_creator import GdfTestComponentCreator
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.extended_ward import ExtendedWard
+from epowcore.gdf.impedance import Impedance
+from epowcore.gdf.load import Load
+from epowcore.gdf.switch import Switch
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.three_winding_transformer import ThreeWindingTransformer
+from epowcore.gdf.ward import Ward
+from epowcore.generic.constants import Platform
+from epowcore.generic.manipulation.batch_rewrite import BatchRewrite
+
+
+def create_model() -> CoreModel:
+    """Buses with wards, extended wards, impedances, switches and a three winding transformer.
+    The component with the largest uid is never replaced."""
+    creator = GdfTestComponentCreator()
+    core_model = creator.core_model
+    buses = [creator.create_bus() for _ in range(8)]
+    trafo = creator.create_3w_transformer()
+    for bus in buses[5:]:
+        core_model.add_connection(bus, trafo)
+
+    uid = creator.next_uid
+    for i, bus in enumerate(buses):
+        core_model.add_connection(bus, Ward(uid + i, f"ward{i}", p_load=i, q_gen=1.0))
+    uid += len(buses)
+    for i, bus in enumerate(buses[:2]):
+        ext_ward = ExtendedWard(uid + i, f"xward{i}", p_load=1.0, u_setp=1.0, r_ext=1.0, x_ext=2.0)
+        core_model.add_connection(bus, ext_ward)
+    uid += 2
+    for i in range(4):
+        impedance = Impedance(uid + i, f"impedance{i}", sn_mva=100.0, r_pu=0.01, x_pu=0.1)
+        core_model.add_connection(buses[i], impedance, "", "A")
+        core_model.add_connection(buses[i + 1], impedance, "", "B")
+    uid += 4
+    for i, closed in enumerate([True, False]):
+        switch = Switch(uid + i, f"switch{i}", closed=closed)
+        core_model.add_connection(buses[4], switch)
+        core_model.add_connection(buses[5 + i], switch)
+    core_model.add_connection(buses[0], Load(uid + 2, "anchor", active_power=1.0))
+    return core_model
+
+
+def replace_all(core_model: CoreModel, batched: bool) -> None:
+    """Run the replacement passes of the PyPSA export, batched or one component at a time."""
+    passes = [
+        lambda c, r: c.replace_with_two_winding_transformers(core_model, r),
+        lambda c, r: c.replace_with_load_shunt_vsource(core_model, 100.0, r),
+        lambda c, r: c.replace_with_load_and_shunt(core_model, r),
+        lambda c, r: c.replace_with_line(core_model, Platform.PYPSA, r),
+        lambda c, r: c.replace_with_line_if_closed(core_model, Platform.PYPSA, r),
+    ]
+    types = [ThreeWindingTransformer, ExtendedWard, Ward, Impedance, Switch]
+    for component_type, replace in zip(types, passes):
+        if batched:
+            with BatchRewrite(core_model) as rewrite:
+                for component in core_model.type_list(component_type):
+                    replace(component, rewrite)
+        else:
+            for component in core_model.type_list(component_type):
+                replace(component, None)
+
+
+def edge_data(core_model: CoreModel) -> dict[frozenset[int], dict[int, list[str]]]:
+    return {frozenset((u.uid, v.uid)): data for u, v, data in core_model.graph.edges.data()}
+
+
+class BatchRewriteTest(unittest.TestCase):
+    def test_batched_passes_match_single_replacements(self) -> None:
+        batched, single = create_model(), create_model()
+        replace_all(batched, batched=True)
+        replace_all(single, batched=False)
+
+        self.assertEqual(set(batched.graph.nodes), set(single.graph.nodes))
+        self.assertEqual(edge_data(batched), edge_data(single))
+        for component_type in (ThreeWindingTransformer, Ward, Impedance, Switch):
+            self.assertEqual(batched.type_list(component_type), [])
+        # a closed switch becomes a line, an open one is removed
+        self.assertEqual(len([l for l in batched.type_list(TLine) if "switch" in l.name]), 1)
+        uids = [component.uid for component in batched.component_list()]
+        self.assertEqual(len(uids), len(set(uids)))
+
+    def test_ids_are_allocated_once(self) -> None:
+        core_model = create_model()
+        rewrite = BatchRewrite(core_model)
+        first = rewrite.new_ids(3)
+        second = rewrite.new_id()
+        self.assertEqual(first.start, core_model.get_valid_id())
+        self.assertEqual(second, first.stop)
+
+    def test_connections_are_merged(self) -> None:
+        core_model = create_model()
+        bus = core_model.type_list(Bus)[0]
+        (load,) = core_model.type_list(Load)
+        with BatchRewrite(core_model) as rewrite:
+            rewrite.add_connection(bus, load, "", "B")
+            rewrite.add_connection(load, bus, "C", None)
+        self.assertEqual(
+            core_model.graph.edges[bus, load], {bus.uid: ["", ""], load.uid: ["", "B", "C"]}
+        )
+
+    def test_removed_component_cannot_be_connected(self) -> None:
+        core_model = create_model()
+        bus = core_model.type_list(Bus)[0]
+        (load,) = core_model.type_list(Load)
+        rewrite = BatchRewrite(core_model)
+        rewrite.remove_component(load)
+        rewrite.add_connection(bus, load)
+        with self.assertRaises(ValueError):
+            rewrite.apply()
+
+    def test_failed_pass_is_not_applied(self) -> None:
+        core_model = create_model()
+        nodes = set(core_model.graph.nodes)
+        with self.assertRaises(RuntimeError):
+            with BatchRewrite(core_model) as rewrite:
+                for ward in core_model.type_list(Ward):
+                    ward.replace_with_load_and_shunt(core_model, rewrite)
+                raise RuntimeError()
+        self.assertEqual(set(core_model.graph.nodes), nodes)
+
+    def test_spatial_index_is_updated(self) -> None:
+        creator = GdfTestComponentCreator()
+        core_model = creator.core_model
+        bus = core_model.update_component(creator.create_bus(), coords=(50.0, 10.0))
+        ward = Ward(creator.next_uid, "ward", coords=(50.1, 10.1), p_load=1.0)
+        core_model.add_connection(bus, ward)
+        index = core_model.get_spatial_index()
+        bbox = (49.0, 9.0, 51.0, 11.0)
+        self.assertEqual(index.intersecting(bbox), [bus, ward])
+
+        with BatchRewrite(core_model) as rewrite:
+            ward.replace_with_load_and_shunt(core_model, rewrite)
+            load = Load(rewrite.new_id(), "load", coords=(50.2, 10.2), active_power=1.0)
+            rewrite.add_component(load)
+            rewrite.add_connection(bus, load)
+        self.assertEqual(index.intersecting(bbox), [bus, load])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import json
+import pathlib
+import unittest
+
+import numpy as np
+import scipy.sparse as sp
+from scipy.sparse.linalg import splu
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.generic.bus_numbering import BusNumbering, BusOrdering, bus_adjacency
+from epowcore.generic.manipulation.flatten import flatten
+
+PATH = pathlib.Path(__file__).parent.parent.parent.resolve()
+
+
+class BusNumberingTest(unittest.TestCase):
+    """Tests the solver-friendly bus numbering of exported models."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        with open(PATH / "models/gdf/IEEE39_gdf.json", "r", encoding="utf-8") as file:
+            cls.core_model = CoreModel.import_dict(json.load(file))
+        flatten(cls.core_model)
+        cls.buses = sorted(cls.core_model.type_list(Bus), key=lambda b: b.uid)
+
+    def test_bidirectional_mapping(self) -> None:
+        for ordering in BusOrdering:
+            with self.subTest(ordering=ordering):
+                numbering = BusNumbering.from_core_model(self.core_model, ordering, start=1)
+                self.assertEqual(len(numbering), len(self.buses))
+                self.assertEqual(sorted(numbering.uids), [b.uid for b in self.buses])
+                self.assertEqual(
+                    sorted(numbering.indices.values()), list(range(1, len(self.buses) + 1))
+                )
+                for bus in self.buses:
+                    self.assertEqual(numbering.uid(numbering.index(bus.uid)), bus.uid)
+
+    def test_uid_ordering(self) -> None:
+        numbering = BusNumbering.from_core_model(self.core_model, BusOrdering.UID)
+        self.assertEqual(numbering.uids, [b.uid for b in self.buses])
+
+    def test_adjacency(self) -> None:
+        adjacency = bus_adjacency(self.core_model, self.buses)
+        self.assertEqual(adjacency.shape, (39, 39))
+        self.assertEqual((adjacency != adjacency.T).nnz, 0)
+        # 34 lines and 12 transformers, none of them in parallel
+        self.assertEqual(adjacency.nnz, 2 * 46)
+
+    def test_orderings_reduce_fill_in(self) -> None:
+        adjacency = bus_adjacency(self.core_model, self.buses)
+        positions = {b.uid: i for i, b in enumerate(self.buses)}
+
+        def fill_in(ordering: BusOrdering) -> int:
+            numbering = BusNumbering.from_core_model(self.core_model, ordering)
+            permutation = [positions[uid] for uid in numbering.uids]
+            matrix = adjacency[permutation][:, permutation]
+            degree = np.asarray(matrix.sum(axis=1)).ravel()
+            lu = splu(
+                (sp.diags(degree + 1.0) - matrix).tocsc(),
+                permc_spec="NATURAL",
+                diag_pivot_thresh=0.0,
+            )
+            return lu.L.nnz + lu.U.nnz
+
+        uid_fill_in = fill_in(BusOrdering.UID)
+        self.assertLessEqual(fill_in(BusOrdering.RCM), uid_fill_in)
+        self.assertLess(fill_in(BusOrdering.AMD), uid_fill_in)
+
+
+if __name__ == "__main__":
+    unittest.main()
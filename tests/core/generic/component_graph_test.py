@@ -174,6 +174,21 @@ class ComponentGraphTest(unittest.TestCase):
         self.assertEqual(len(edges_with_1), 1)
         self.assertIn(node1, edges_with_1[0])
 
+    def test_equality_ignores_order(self) -> None:
+        node1 = Component(0, "One", None)
+        node2 = Component(1, "Two", None)
+        node3 = Component(2, "Three", None)
+        tgraph1 = ComponentGraph()
+        tgraph1.add_edges_from([(node1, node2, {0: ["A"], 1: [""]}), (node2, node3)])
+        tgraph2 = ComponentGraph()
+        tgraph2.add_node(node3)
+        tgraph2.add_edges_from([(node3, node2), (node2, node1, {0: ["A"], 1: [""]})])
+
+        self.assertEqual(tgraph1, tgraph2)
+        self.assertEqual(hash(tgraph1), hash(tgraph2))
+        tgraph2.edges.update(node1, node2, {0: ["B"]})
+        self.assertNotEqual(tgraph1, tgraph2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,137 @@
+import json
+import pathlib
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.generic.configuration import Configuration
+from epowcore.generic.constants import Platform
+from epowcore.generic.logger import Logger
+from epowcore.jmdl.jmdl_converter import JmdlConverter
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+
+PATH = pathlib.Path(__file__).parent.parent.parent.resolve()
+ROUNDS = 4
+PANDAPOWER_TABLES = ("bus", "load", "gen", "ext_grid", "line", "trafo", "shunt")
+
+
+def load_model(name: str) -> CoreModel:
+    with open(PATH / "models/gdf" / name, "r", encoding="utf8") as file:
+        return CoreModel.import_dict(json.load(file))
+
+
+def export(platform: Platform, core_model: CoreModel, log_path: str) -> object:
+    """Export the model and return a comparable representation of the result."""
+    if platform == Platform.JMDL:
+        return JmdlConverter().from_gdf(core_model, "stress", log_path).to_json()
+    if platform == Platform.MATPOWER:
+        mpc = MatpowerConverter().from_gdf(core_model, "stress", log_path).as_dict()["mpc"]
+        return {key: mpc[key] for key in ("bus", "branch", "gen")}
+    net = PandapowerConverter().from_gdf(core_model, "stress", log_path).network
+    return {table: net[table] for table in PANDAPOWER_TABLES}
+
+
+class ConcurrencyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # other tests set the global default platform
+        self.default_platform = Configuration().default_platform
+        Configuration().default_platform = None
+
+    def tearDown(self) -> None:
+        Configuration().default_platform = self.default_platform
+
+    def assert_same_export(self, platform: Platform, expected: Any, actual: Any) -> None:
+        if platform == Platform.JMDL:
+            self.assertEqual(expected, actual)
+        elif platform == Platform.MATPOWER:
+            for key, array in expected.items():
+                np.testing.assert_array_equal(array, actual[key])
+        else:
+            for table, frame in expected.items():
+                self.assertTrue(frame.equals(actual[table]), table)
+
+    def test_concurrent_exports(self) -> None:
+        """Exports for different platforms in parallel threads match the serial exports."""
+        core_model = load_model("IEEE39_gdf.json")
+        platforms = [Platform.JMDL, Platform.MATPOWER, Platform.PANDAPOWER]
+        with tempfile.TemporaryDirectory() as directory:
+            expected = {
+                platform: export(platform, core_model, f"{directory}/{platform.value}.log")
+                for platform in platforms
+            }
+            tasks = [
+                (platform, f"{directory}/{platform.value}_{i}.log")
+                for i in range(ROUNDS)
+                for platform in platforms
+            ]
+            with ThreadPoolExecutor(max_workers=len(platforms) * 2) as executor:
+                futures = [
+                    executor.submit(export, platform, core_model, log_path)
+                    for platform, log_path in tasks
+                ]
+                results = [future.result() for future in futures]
+
+            for (platform, log_path), result in zip(tasks, results):
+                self.assert_same_export(platform, expected[platform], result)
+                # every log only contains the messages of its own conversion
+                with open(log_path, "r", encoding="utf8") as file:
+                    content = file.read()
+                with open(f"{directory}/{platform.value}.log", "r", encoding="utf8") as file:
+                    self.assertEqual(content, file.read())
+
+        self.assertIsNone(Configuration().default_platform)
+
+    def test_scoped_platform(self) -> None:
+        """The default platform of a scope is only visible in its own thread."""
+        barrier = threading.Barrier(2)
+        seen: dict[Platform, Platform | None] = {}
+
+        def run(platform: Platform) -> None:
+            with Configuration().scoped(platform):
+                barrier.wait()
+                seen[platform] = Configuration().default_platform
+                barrier.wait()
+
+        threads = [
+            threading.Thread(target=run, args=(platform,))
+            for platform in (Platform.JMDL, Platform.PANDAPOWER)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(
+            seen, {Platform.JMDL: Platform.JMDL, Platform.PANDAPOWER: Platform.PANDAPOWER}
+        )
+        self.assertIsNone(Configuration().default_platform)
+
+    def test_scoped_overrides(self) -> None:
+        with Configuration().scoped(overrides={"test": {"value": 1}}):
+            with Configuration().scoped(overrides={"test": {"other": 2}}):
+                self.assertEqual(Configuration().get("test.value"), 1)
+                self.assertEqual(Configuration().get("test.other"), 2)
+            self.assertIsNone(Configuration().get("test.other"))
+        self.assertIsNone(Configuration().get("test.value"))
+
+    def test_logger_selection_is_thread_local(self) -> None:
+        logger = Logger.new("main", print_to_console=False)
+
+        def run() -> bool:
+            return Logger.log_to_selected("from thread")
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertFalse(executor.submit(run).result())
+        self.assertTrue(Logger.log_to_selected("from main"))
+        self.assertEqual(logger.entries, ["from main"])
+        logger.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
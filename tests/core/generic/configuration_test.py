@@ -31,6 +31,7 @@ class ConfigurationTest(unittest.TestCase):
         self.assertEqual(Configuration().get("test.list"), ["Hello", "World!"])
         Configuration().delete_config(0)
         self.assertEqual(Configuration().get("test.list"), None)
+        Configuration().load_config("config.yml")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,123 @@
+import json
+import os
+import pathlib
+import tempfile
+import unittest
+
+from helpers.gdf_component_creator import GdfTestComponentCreator
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.generic.configuration import Configuration
+from epowcore.generic.conversion_cache import ConversionCache
+from epowcore.generic.bus_numbering import BusOrdering
+from epowcore.generic.converter_base import ConverterBase
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+
+PATH = pathlib.Path(__file__).parent.parent.parent.resolve()
+
+
+class CountingConverter(ConverterBase[dict]):
+    """Exports the uids and names of the components and counts the exports."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.exports: list[str] = []
+
+    def _export(self, core_model: CoreModel, name: str) -> dict:
+        self.exports.append(name)
+        return {"name": name, "components": sorted(c.name for c in core_model.component_list())}
+
+    def _import(self, model: dict) -> CoreModel:
+        raise NotImplementedError()
+
+    def serialize(self, model: dict) -> bytes:
+        return json.dumps(model).encode("utf-8")
+
+    def deserialize(self, data: bytes) -> dict:
+        return json.loads(data)
+
+
+def create_model() -> CoreModel:
+    creator = GdfTestComponentCreator()
+    bus1, bus2, line = creator.create_bus(), creator.create_bus(), creator.create_tline()
+    creator.core_model.add_connection(bus1, line, "", "A")
+    creator.core_model.add_connection(bus2, line, "", "B")
+    return creator.core_model
+
+
+class ConversionCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = ConversionCache(self.directory.name)
+        self.converter = CountingConverter()
+        self.converter.cache = self.cache
+        # other tests set the global default platform
+        self.default_platform = Configuration().default_platform
+        Configuration().default_platform = None
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        Configuration().default_platform = self.default_platform
+
+    def test_hit_does_not_convert_again(self) -> None:
+        core_model = create_model()
+        first = self.converter.from_gdf(core_model, "test")
+        second = self.converter.from_gdf(create_model(), "test")
+        self.assertEqual(self.converter.exports, ["test"])
+        self.assertEqual(first, second)
+
+    def test_key_depends_on_content_configuration_and_name(self) -> None:
+        core_model = create_model()
+        key = self.cache.key(self.converter, core_model, "test")
+        self.assertEqual(key, self.cache.key(self.converter, create_model(), "test"))
+        self.assertNotEqual(key, self.cache.key(self.converter, core_model, "other"))
+        with Configuration().scoped(overrides={"Bus": {"default_nominal_voltage": 1.0}}):
+            self.assertNotEqual(key, self.cache.key(self.converter, core_model, "test"))
+
+        bus = core_model.component_list()[0]
+        core_model.update_component(bus, name="renamed")
+        self.assertNotEqual(key, self.cache.key(self.converter, core_model, "test"))
+
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        for i, key in enumerate(("a", "b", "c")):
+            self.cache.put(key, bytes(100))
+            os.utime(self.cache.directory / f"{key}.bin", ns=(i, i))
+        self.assertIsNotNone(self.cache.get("a"))
+
+        self.cache.max_size = self.cache.size()
+        self.cache.put("d", bytes(100))
+        self.assertLessEqual(self.cache.size(), self.cache.max_size)
+        self.assertIsNone(self.cache.get("b"))
+        for key in ("a", "c", "d"):
+            self.assertIsNotNone(self.cache.get(key))
+
+    def test_bus_numbering_is_cached(self) -> None:
+        with open(PATH / "models/gdf/IEEE39_gdf.json", "r", encoding="utf-8") as file:
+            core_model = CoreModel.import_dict(json.load(file))
+        for converter in (
+            MatpowerConverter(bus_ordering=BusOrdering.RCM),
+            PandapowerConverter(bus_ordering=BusOrdering.RCM),
+        ):
+            converter.cache = self.cache
+            exported = converter.from_gdf(core_model, "test")
+            cached = converter.from_gdf(core_model, "test")
+            self.assertIsNot(cached, exported)
+            self.assertIsNotNone(exported.bus_numbering)
+            self.assertEqual(cached.bus_numbering, exported.bus_numbering)
+
+    def test_corrupted_entry_is_a_miss(self) -> None:
+        core_model = create_model()
+        self.converter.from_gdf(core_model, "test")
+        key = self.cache.key(self.converter, core_model, "test")
+        path = self.cache.directory / f"{key}.bin"
+        path.write_bytes(path.read_bytes()[:-5])
+
+        model = self.converter.from_gdf(core_model, "test")
+        self.assertEqual(len(self.converter.exports), 2)
+        self.assertEqual(model["name"], "test")
+        self.assertIsNotNone(self.cache.get(key))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+
+from helpers.gdf_component_creator import GdfTestComponentCreator
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.load import Load
+from epowcore.gdf.port import Port
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.gdf.tline import TLine
+from epowcore.generic.manipulation.extract_region import extract_region
+
+WEST = (48.9, 7.9, 49.1, 8.15)
+"""The bounding box around the two western buses."""
+
+
+def create_chain() -> tuple[CoreModel, list[Bus]]:
+    """Four buses from west to east, connected by lines, with a load at each bus
+    and a generator with a governor at the first bus, all without coordinates."""
+    creator = GdfTestComponentCreator(base_frequency=50.0)
+    core_model = creator.core_model
+    buses = [
+        core_model.update_component(creator.create_bus(), coords=(49.0, 8.0 + 0.1 * i))
+        for i in range(4)
+    ]
+    for left, right in zip(buses, buses[1:]):
+        line = core_model.update_component(
+            creator.create_tline(), coords=[left.coords, right.coords]
+        )
+        core_model.add_connection(line, left, "A")
+        core_model.add_connection(line, right, "B")
+    for bus in buses:
+        core_model.add_connection(creator.create_load(), bus)
+    generator = creator.create_synchronous_machine()
+    core_model.add_connection(generator, buses[0])
+    core_model.add_connection(creator.create_ieeeg1(), generator)
+    return core_model, buses
+
+
+class ExtractRegionTest(unittest.TestCase):
+    def test_extract_bbox(self) -> None:
+        core_model, buses = create_chain()
+        region = extract_region(core_model, WEST)
+
+        self.assertEqual(set(region.type_list(Bus)), set(buses[:2]))
+        self.assertEqual(len(region.type_list(Load)), 2)
+        self.assertEqual(len(region.type_list(TLine)), 1)
+        self.assertEqual(len(region.component_list()), 7)
+        self.assertTrue(region.graph.sanity_check())
+        self.assertEqual(region.base_frequency, 50.0)
+        # the original model is not changed
+        self.assertEqual(len(core_model.component_list()), 13)
+
+        line = region.type_list(TLine)[0]
+        self.assertEqual(region.graph.edges[line, buses[0]][line.uid], ["A"])
+        region.add_connection(line, buses[0], "C")
+        self.assertEqual(core_model.graph.edges[line, buses[0]][line.uid], ["A"])
+
+    def test_keep_boundary(self) -> None:
+        core_model, buses = create_chain()
+        region = extract_region(core_model, WEST, keep_boundary=True)
+
+        self.assertEqual(set(region.type_list(Bus)), set(buses[:3]))
+        self.assertEqual(len(region.type_list(TLine)), 2)
+        # the boundary bus keeps its load, but not its other line
+        self.assertEqual(len(region.type_list(Load)), 3)
+
+    def test_polygon(self) -> None:
+        core_model, buses = create_chain()
+        region = extract_region(core_model, polygon=[(48.9, 8.25), (49.1, 8.25), (49.1, 8.45)])
+
+        self.assertEqual(region.type_list(Bus), [buses[3]])
+        self.assertEqual(len(region.component_list()), 2)
+        with self.assertRaises(ValueError):
+            extract_region(core_model)
+        with self.assertRaises(ValueError):
+            extract_region(core_model, WEST, polygon=[(48.9, 8.25), (49.1, 8.25), (49.1, 8.45)])
+
+    def test_subsystems(self) -> None:
+        core_model, buses = create_chain()
+        line = next(
+            c for c in core_model.type_list(TLine) if c.coords == [buses[1].coords, buses[2].coords]
+        )
+        loads = [
+            n for b in buses[1:3] for n in core_model.graph.neighbors(b) if isinstance(n, Load)
+        ]
+        inner = [buses[1], buses[2], line, *loads]
+        Subsystem.from_components(core_model, inner, name="Middle")
+
+        region = extract_region(core_model, WEST)
+
+        subsystem = region.type_list(Subsystem)[0]
+        self.assertEqual(subsystem.name, "Middle")
+        contained = set(subsystem.graph.nodes)
+        self.assertEqual(len(contained), 3)
+        self.assertIn(buses[1], contained)
+        self.assertEqual(len([node for node in contained if isinstance(node, Load)]), 1)
+        # the port to the first line is kept, the port to the eastern line is not
+        ports = [node for node in contained if isinstance(node, Port)]
+        self.assertEqual(len(ports), 1)
+        self.assertIn(ports[0].connection_component, {c.uid for c in region.component_list()})
+        self.assertEqual(len(core_model.type_list(Subsystem)[0].graph.nodes), len(inner) + 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
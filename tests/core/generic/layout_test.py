@@ -0,0 +1,106 @@
+import gc
+import json
+import pathlib
+import tempfile
+import unittest
+import weakref
+from unittest import mock
+
+import networkx as nx
+from helpers.gdf_component_creator import GdfTestComponentCreator
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.generic import layout as layout_module
+from epowcore.generic.layout import LayoutCache, grid_order, layout_graph, sparse_stress_layout
+
+PATH = pathlib.Path(__file__).parent.parent.parent.resolve()
+
+
+def load_model(name: str) -> CoreModel:
+    with open(PATH / "models/gdf" / name, "r", encoding="utf-8") as file:
+        return CoreModel.import_dict(json.load(file))
+
+
+def distance(pos: dict, node1: object, node2: object) -> float:
+    return float(sum((a - b) ** 2 for a, b in zip(pos[node1], pos[node2])) ** 0.5)
+
+
+class LayoutTest(unittest.TestCase):
+    def test_grid_is_unfolded(self) -> None:
+        graph = nx.grid_2d_graph(10, 10)
+        pos = sparse_stress_layout(graph)
+
+        for node1, node2 in graph.edges:
+            self.assertAlmostEqual(distance(pos, node1, node2), 1.0, delta=0.5)
+        self.assertGreater(distance(pos, (0, 0), (9, 9)), 9.0)
+        self.assertEqual(sparse_stress_layout(graph), pos)
+
+    def test_components_are_placed_apart(self) -> None:
+        graph = nx.disjoint_union_all([nx.cycle_graph(8), nx.path_graph(4), nx.empty_graph(2)])
+        pos = sparse_stress_layout(graph)
+
+        self.assertEqual(len(pos), 14)
+        components = [range(8), range(8, 12), [12], [13]]
+        for i, nodes1 in enumerate(components):
+            for nodes2 in components[i + 1 :]:
+                gap = min(distance(pos, n1, n2) for n1 in nodes1 for n2 in nodes2)
+                self.assertGreaterEqual(gap, 1.0)
+
+    def test_layout_ignores_insertion_order(self) -> None:
+        core_model = load_model("IEEE39_gdf.json")
+        reversed_graph = nx.Graph()
+        reversed_graph.add_nodes_from(reversed(list(core_model.graph.nodes)))
+        reversed_graph.add_edges_from(reversed(list(core_model.graph.edges.data())))
+
+        pos = layout_graph(core_model.graph.get_internal_graph(copy=False), cache=None)
+        reversed_pos = layout_graph(reversed_graph, cache=None)
+        self.assertEqual(pos, reversed_pos)
+
+    def test_geographic_coordinates_are_kept(self) -> None:
+        creator = GdfTestComponentCreator()
+        buses = [creator.create_bus() for _ in range(6)]
+        for i, bus in enumerate(buses):
+            bus.coords = (49.0 + (i % 2) * 0.5, 8.0 + i * 0.5)
+            if i > 0:
+                tline = creator.create_tline()
+                creator.core_model.add_connection(buses[i - 1], tline)
+                creator.core_model.add_connection(tline, bus)
+        pos = layout_graph(creator.core_model.graph.get_internal_graph(copy=False), cache=None)
+
+        # west to east, every second bus further north
+        x_coords = [pos[bus][0] for bus in buses]
+        self.assertEqual(x_coords, sorted(x_coords))
+        for i in range(1, len(buses) - 1, 2):
+            self.assertGreater(pos[buses[i]][1], pos[buses[i - 1]][1])
+            self.assertGreater(pos[buses[i]][1], pos[buses[i + 1]][1])
+
+    def test_layouts_are_cached_by_fingerprint(self) -> None:
+        graph = load_model("IEEE39_gdf.json").graph.get_internal_graph(copy=False)
+        copied = load_model("IEEE39_gdf.json").graph.get_internal_graph(copy=False)
+        with tempfile.TemporaryDirectory() as directory:
+            pos = layout_graph(graph, cache=LayoutCache(directory))
+            with mock.patch.object(
+                layout_module, "sparse_stress_layout", side_effect=AssertionError
+            ):
+                cached = layout_graph(copied, cache=LayoutCache(directory))
+            self.assertEqual(
+                {node.uid: position for node, position in cached.items()},
+                {node.uid: tuple(position) for node, position in pos.items()},
+            )
+
+    def test_cache_does_not_keep_components(self) -> None:
+        cache = LayoutCache(max_entries=2)
+        model = load_model("IEEE39_gdf.json")
+        layout_graph(model.graph.get_internal_graph(copy=False), cache=cache)
+        component = weakref.ref(next(iter(model.graph.nodes)))
+        del model
+        gc.collect()
+        self.assertIsNone(component())
+
+    def test_grid_order(self) -> None:
+        pos = {"a": (0.0, 1.0), "b": (1.0, 0.0), "c": (0.0, 0.0), "d": (1.0, 1.1), "e": (2.0, 2.0)}
+        self.assertEqual(grid_order(pos, 2), ["c", "b", "a", "d", "e"])
+
+
+if __name__ == "__main__":
+    unittest.main()
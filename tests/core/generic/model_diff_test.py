@@ -0,0 +1,90 @@
+import copy
+import json
+import pathlib
+import unittest
+from unittest import mock
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.load import Load
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.generic import fingerprint as fingerprint_module
+from epowcore.generic.fingerprint import Fingerprinter, fingerprint
+from epowcore.generic.model_diff import diff_models
+
+PATH = pathlib.Path(__file__).parent.parent.parent.resolve()
+
+
+def load_model(name: str) -> CoreModel:
+    with open(PATH / "models/gdf" / name, "r", encoding="utf-8") as file:
+        return CoreModel.import_dict(json.load(file))
+
+
+def reversed_copy(core_model: CoreModel) -> CoreModel:
+    """A copy of the model with nodes and edges inserted in reverse order."""
+    result = CoreModel(base_frequency=core_model.base_frequency, base_mva=core_model.base_mva)
+    result.graph.add_nodes_from(reversed(list(core_model.graph.nodes)))
+    result.graph.add_edges_from(reversed(list(core_model.graph.edges.data())))
+    return result
+
+
+class ModelDiffTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.core_model = load_model("IEEE39_gdf.json")
+
+    def test_fingerprint_ignores_insertion_order(self) -> None:
+        expected = fingerprint(self.core_model)
+        self.assertEqual(fingerprint(reversed_copy(self.core_model)), expected)
+        self.assertEqual(fingerprint(copy.deepcopy(self.core_model)), expected)
+        self.assertEqual(reversed_copy(self.core_model).graph, self.core_model.graph)
+
+        bus = self.core_model.type_list(Bus)[0]
+        self.core_model.update_component(bus, nominal_voltage=bus.nominal_voltage + 1.0)
+        self.assertNotEqual(fingerprint(self.core_model), expected)
+
+    def test_equal_models_have_no_differences(self) -> None:
+        diff = diff_models(self.core_model, reversed_copy(self.core_model))
+        self.assertEqual(len(diff), 0)
+
+    def test_changes_are_reported(self) -> None:
+        old = copy.deepcopy(self.core_model)
+        subsystem = self.core_model.type_list(Subsystem)[0]
+        inner = next(c for c in subsystem.graph.nodes if type(c).__name__ != "Port")
+        changed = self.core_model.update_component(inner, name="changed")
+        load = self.core_model.type_list(Load)[0]
+        neighbors = list(self.core_model.graph.neighbors(load))
+        self.core_model.remove_component(load)
+        bus1, bus2 = self.core_model.type_list(Bus)[:2]
+        self.core_model.add_connection(bus1, bus2)
+        self.core_model.base_mva = 50.0
+
+        diff = diff_models(old, self.core_model)
+        self.assertEqual(diff.changed, [(inner, changed)])
+        self.assertEqual([c.uid for c in diff.removed], [load.uid])
+        self.assertEqual(diff.added, [])
+        self.assertEqual(
+            sorted(diff.removed_connections),
+            sorted(tuple(sorted((load.uid, n.uid))) for n in neighbors),
+        )
+        self.assertEqual(diff.added_connections, [tuple(sorted((bus1.uid, bus2.uid)))])
+        self.assertEqual(diff.attributes, {"base_mva": (old.base_mva, 50.0)})
+
+    def test_only_new_components_are_hashed_again(self) -> None:
+        fingerprinter = Fingerprinter()
+        fingerprinter.model(self.core_model)
+        num_edges = 0
+        for load in self.core_model.type_list(Load)[:3]:
+            load = self.core_model.update_component(load, active_power=load.active_power + 1.0)
+            num_edges += len(list(self.core_model.graph.neighbors(load)))
+
+        with mock.patch.object(
+            fingerprint_module, "_digest", wraps=fingerprint_module._digest
+        ) as digest:
+            fingerprinter.model(self.core_model)
+        num_subsystems = len(self.core_model.type_list(Subsystem))
+        # the loads and their edges, the attributes of the subsystems and of the model
+        self.assertEqual(digest.call_count, 3 + num_edges + num_subsystems + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
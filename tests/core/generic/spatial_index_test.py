@@ -0,0 +1,159 @@
+import math
+import random
+import unittest
+
+from helpers.gdf_component_creator import GdfTestComponentCreator
+
+from epowcore.gdf.bus import Bus, BusType, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.gdf.tline import TLine
+from epowcore.generic.spatial_index import SpatialIndex
+
+
+def create_grid(size: int = 4) -> tuple[CoreModel, list[list[Bus]]]:
+    """Buses on a grid with 0.1° spacing from (49.0, 8.0), connected in rows by straight lines
+    and with a load without coordinates at each bus."""
+    creator = GdfTestComponentCreator()
+    core_model = creator.core_model
+    grid = []
+    for row in range(size):
+        buses = []
+        for column in range(size):
+            coords = (49.0 + 0.1 * row, 8.0 + 0.1 * column)
+            bus = core_model.update_component(creator.create_bus(), coords=coords)
+            core_model.add_connection(creator.create_load(), bus)
+            buses.append(bus)
+        for left, right in zip(buses, buses[1:]):
+            line = core_model.update_component(
+                creator.create_tline(), coords=[left.coords, right.coords]
+            )
+            core_model.add_connection(line, left, "A")
+            core_model.add_connection(line, right, "B")
+        grid.append(buses)
+    return core_model, grid
+
+
+def create_bus(uid: int, coords: tuple[float, float]) -> Bus:
+    return Bus(
+        uid,
+        f"Bus {uid}",
+        coords=coords,
+        lf_bus_type=LFBusType.PQ,
+        nominal_voltage=110.0,
+        bus_type=BusType.BUSBAR,
+    )
+
+
+def uids(components: list) -> list[int]:
+    return [component.uid for component in components]
+
+
+class SpatialIndexTest(unittest.TestCase):
+    def test_bbox(self) -> None:
+        core_model, grid = create_grid()
+        index = core_model.get_spatial_index()
+
+        found = index.intersecting((48.95, 7.95, 49.15, 8.05), component_type=Bus)
+        self.assertEqual(found, [grid[0][0], grid[1][0]])
+        self.assertEqual(len(index.intersecting((48.95, 7.95, 49.15, 8.05))), 4)
+        # lines crossing the box without a point inside it are found as well
+        found = index.intersecting((48.95, 8.02, 49.05, 8.08), component_type=TLine)
+        self.assertEqual(len(found), 1)
+        self.assertEqual(found[0].coords, [grid[0][0].coords, grid[0][1].coords])
+
+    def test_line_geometry(self) -> None:
+        core_model, _ = create_grid(1)
+        bend = TLine(
+            100,
+            "Bend",
+            coords=[(50.0, 8.0), (50.0, 9.0), (51.0, 9.0)],
+            r1=0.1,
+            x1=0.1,
+            b1=0.1,
+            rating=1.0,
+        )
+        core_model.add_component(bend)
+        index = core_model.get_spatial_index()
+
+        # inside the bounding box of the line, but not touching it
+        self.assertEqual(index.intersecting((50.5, 8.0, 51.0, 8.5)), [])
+        self.assertEqual(index.intersecting((50.5, 8.5, 51.0, 9.5)), [bend])
+        triangle = [(50.2, 8.1), (50.9, 8.1), (50.9, 8.8)]
+        self.assertEqual(index.intersecting_polygon(triangle), [])
+        self.assertEqual(
+            index.intersecting_polygon([(49.9, 8.4), (50.1, 8.4), (50.1, 8.6)]), [bend]
+        )
+        with self.assertRaises(ValueError):
+            index.intersecting_polygon([(50.0, 8.0), (51.0, 9.0)])
+
+    def test_nearest(self) -> None:
+        core_model, grid = create_grid()
+        index = core_model.get_spatial_index()
+
+        self.assertEqual(index.nearest((49.21, 8.19), component_type=Bus), [grid[2][2]])
+        line = index.nearest((49.21, 8.15))[0]
+        self.assertEqual(line.coords, [grid[2][1].coords, grid[2][2].coords])
+        nearest = index.nearest((49.21, 8.15), k=2, component_type=Bus)
+        self.assertEqual(set(uids(nearest)), {grid[2][1].uid, grid[2][2].uid})
+        self.assertEqual(len(index.nearest((0.0, 0.0), k=100)), 28)
+
+    def test_updates(self) -> None:
+        core_model, grid = create_grid()
+        index = core_model.get_spatial_index()
+        self.assertEqual(len(index), 28)
+
+        moved = core_model.update_component(grid[0][0], coords=(52.0, 8.0))
+        self.assertEqual(index.nearest((51.9, 8.0)), [moved])
+        self.assertEqual(index.intersecting((48.95, 7.95, 49.05, 8.05), Bus), [])
+        core_model.remove_component(grid[3][3])
+        self.assertEqual(index.nearest((49.3, 8.3), component_type=Bus), [grid[3][2]])
+        new_bus = create_bus(200, (49.3, 8.3))
+        core_model.add_component(new_bus)
+        self.assertEqual(index.nearest((49.3, 8.3), component_type=Bus), [new_bus])
+        self.assertEqual(index.builds, 1)
+
+        # the index is built again with the components in the subsystem
+        Subsystem.from_components(core_model, [moved, new_bus], name="Area")
+        self.assertEqual(index.nearest((51.9, 8.0)), [moved])
+        self.assertEqual(index.intersecting((49.25, 8.25, 49.35, 8.35), Bus), [new_bus])
+        self.assertEqual(index.builds, 2)
+
+    def test_matches_linear_scan(self) -> None:
+        rng = random.Random(3)
+        core_model = CoreModel(base_frequency=50.0)
+        for uid in range(500):
+            coords = (rng.uniform(45.0, 55.0), rng.uniform(5.0, 15.0))
+            core_model.add_component(create_bus(uid, coords))
+        # a small node capacity for a tree with several levels
+        index = SpatialIndex(core_model, node_capacity=4)
+        core_model.spatial_index = index
+
+        for step in range(50):
+            component = rng.choice(core_model.component_list())
+            if step % 3 == 0:
+                core_model.remove_component(component)
+            else:
+                coords = (rng.uniform(45.0, 55.0), rng.uniform(5.0, 15.0))
+                core_model.update_component(component, coords=coords)
+            lat, lon = rng.uniform(45.0, 54.0), rng.uniform(5.0, 14.0)
+            expected = [
+                c.uid
+                for c in core_model.component_list()
+                if lat <= c.coords[0] <= lat + 1.0 and lon <= c.coords[1] <= lon + 1.0
+            ]
+            self.assertEqual(
+                uids(index.intersecting((lat, lon, lat + 1.0, lon + 1.0))), sorted(expected)
+            )
+            scale = math.cos(math.radians(lat))
+            closest = sorted(
+                core_model.component_list(),
+                key=lambda c: math.hypot(c.coords[0] - lat, (c.coords[1] - lon) * scale),
+            )
+            self.assertEqual(index.nearest((lat, lon), k=5), closest[:5])
+        self.assertEqual(len(index), len(core_model.component_list()))
+        self.assertGreater(index.builds, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
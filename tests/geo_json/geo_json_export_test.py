@@ -0,0 +1,115 @@
+import io
+import json
+import math
+import pathlib
+import tempfile
+import unittest
+from unittest import mock
+
+import geojson
+import numpy as np
+from helpers.gdf_component_creator import GdfTestComponentCreator
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.geo_json.from_gdf import geo_json_export
+from epowcore.geo_json.from_gdf.geo_json_export import export_geo_json, write_geo_json, write_tiles
+from epowcore.geo_json.from_gdf.geometry import simplify_line, tile_coordinates
+
+
+def create_model(num_buses: int = 4) -> CoreModel:
+    """Buses in a row, connected by lines with wavy geometries."""
+    creator = GdfTestComponentCreator()
+    core_model = creator.core_model
+    buses = []
+    for i in range(num_buses):
+        bus = core_model.update_component(creator.create_bus(), coords=(49.0 + 0.1 * i, 8.4))
+        buses.append(bus)
+    for i in range(num_buses - 1):
+        coords = [(49.0 + 0.1 * i + 0.002 * k, 8.4 + 0.001 * math.sin(k)) for k in range(51)]
+        line = core_model.update_component(creator.create_tline(), coords=coords)
+        core_model.add_connection(line, buses[i], "A")
+        core_model.add_connection(line, buses[i + 1], "B")
+    return core_model
+
+
+class GeoJSONExportTest(unittest.TestCase):
+    def test_coordinates_are_longitude_first(self) -> None:
+        core_model = create_model()
+        features = export_geo_json(core_model)["features"]
+
+        self.assertEqual(len(features), 7)
+        points = [f for f in features if f["geometry"]["type"] == "Point"]
+        self.assertEqual(points[1]["geometry"]["coordinates"], [8.4, 49.1])
+        line = next(f for f in features if f["geometry"]["type"] == "LineString")
+        self.assertEqual(len(line["geometry"]["coordinates"]), 51)
+        self.assertEqual(line["geometry"]["coordinates"][1], [8.400841, 49.002])
+        self.assertEqual(line["properties"]["type"], "TLine")
+
+    def test_subsystems_are_exported(self) -> None:
+        core_model = create_model()
+        buses = sorted(core_model.type_list(Bus), key=lambda c: c.uid)[:2]
+        Subsystem.from_components(core_model, buses, name="Area")
+
+        features = export_geo_json(core_model)["features"]
+
+        self.assertEqual(len(features), 7)
+        areas = {f["properties"]["uid"]: f["properties"].get("subsystem") for f in features}
+        self.assertEqual(areas[buses[0].uid], "Area")
+        self.assertEqual(sum(area == "Area" for area in areas.values()), 2)
+
+    def test_simplification(self) -> None:
+        core_model = create_model()
+        full = export_geo_json(core_model)["features"]
+        simplified = export_geo_json(core_model, tolerance=0.0005)["features"]
+
+        for before, after in zip(full, simplified):
+            coordinates = after["geometry"]["coordinates"]
+            if after["geometry"]["type"] == "LineString":
+                self.assertLess(len(coordinates), 51)
+                self.assertEqual(coordinates[0], before["geometry"]["coordinates"][0])
+                self.assertEqual(coordinates[-1], before["geometry"]["coordinates"][-1])
+            else:
+                self.assertEqual(coordinates, before["geometry"]["coordinates"])
+
+    def test_douglas_peucker(self) -> None:
+        straight = np.column_stack([np.arange(10.0), np.zeros(10)])
+        np.testing.assert_array_equal(simplify_line(straight, 0.1), straight[[0, -1]])
+
+        zigzag = np.array([[0.0, 0.0], [1.0, 1.0], [2.0, 0.05], [3.0, 1.0], [4.0, 0.0]])
+        np.testing.assert_array_equal(simplify_line(zigzag, 0.5), zigzag[[0, 1, 2, 3, 4]])
+        np.testing.assert_array_equal(simplify_line(zigzag, 2.0), zigzag[[0, 4]])
+
+    def test_streamed_export_matches(self) -> None:
+        core_model = create_model(8)
+        expected = json.loads(geojson.dumps(export_geo_json(core_model, tolerance=0.0005)))
+
+        serial = io.StringIO()
+        self.assertEqual(write_geo_json(core_model, serial, tolerance=0.0005), 15)
+        with mock.patch.object(geo_json_export, "CHUNK_SIZE", 4):
+            parallel = io.StringIO()
+            write_geo_json(core_model, parallel, tolerance=0.0005, max_workers=2)
+
+        self.assertEqual(json.loads(serial.getvalue()), expected)
+        self.assertEqual(json.loads(parallel.getvalue()), expected)
+
+    def test_tiles(self) -> None:
+        core_model = create_model()
+        with tempfile.TemporaryDirectory() as directory:
+            count = write_tiles(core_model, directory, min_zoom=0, max_zoom=8)
+            files = sorted(pathlib.Path(directory).rglob("*.geojson"))
+
+            self.assertEqual(count, len(files))
+            with open(pathlib.Path(directory) / "0/0/0.geojson", "r", encoding="utf-8") as file:
+                self.assertEqual(len(json.load(file)["features"]), 7)
+            x, y = tile_coordinates(np.array([[8.4, 49.0]]), 8)[0]
+            with open(
+                pathlib.Path(directory) / f"8/{x}/{y}.geojson", "r", encoding="utf-8"
+            ) as file:
+                tile = json.load(file)
+            self.assertIn(core_model.type_list(Bus)[0].uid, [f["id"] for f in tile["features"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import dataclasses
+import json
+import pathlib
+import unittest
+
+import networkx as nx
+import numpy as np
+import pandapower
+
+from epowcore.gdf.bus import Bus, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.gdf.utils import get_connected_bus
+from epowcore.loadflow.ac_loadflow import LoadFlowAlgorithm, run_loadflow
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+
+PATH = pathlib.Path(__file__).parent.parent.resolve()
+MODELS = ("IEEE9_pf", "IEEE39", "IEEE399")
+
+
+def load_model(name: str) -> CoreModel:
+    with open(PATH / f"models/gdf/{name}_gdf.json", "r", encoding="utf-8") as file:
+        return CoreModel.import_dict(json.load(file))
+
+
+def set_bus_type(core_model: CoreModel, bus: Bus, lf_bus_type: LFBusType) -> None:
+    # buses are hashed by value, so the graph node is replaced instead of modified in place
+    nx.relabel_nodes(
+        core_model.graph.get_internal_graph(copy=False),
+        {bus: dataclasses.replace(bus, lf_bus_type=lf_bus_type)},
+        copy=False,
+    )
+
+
+class AcLoadflowTest(unittest.TestCase):
+    def test_pandapower_results(self) -> None:
+        for name in MODELS:
+            core_model = load_model(name)
+            # the pandapower export controls the voltage of all synchronous machines
+            for machine in core_model.type_list(SynchronousMachine):
+                bus = get_connected_bus(core_model.graph, machine, max_depth=1)
+                if bus is not None and bus.lf_bus_type == LFBusType.PQ:
+                    set_bus_type(core_model, bus, LFBusType.PV)
+
+            network = PandapowerConverter().from_gdf(core_model, name).network
+            pandapower.runpp(network, trafo_model="pi", numba=False)
+
+            for algorithm in LoadFlowAlgorithm:
+                with self.subTest(model=name, algorithm=algorithm):
+                    result = run_loadflow(core_model, algorithm)
+                    self.assertTrue(result.converged)
+
+                    buses = result.bus_results()
+                    expected = network.res_bus.loc[buses.index]
+                    np.testing.assert_allclose(buses.vm_pu, expected.vm_pu, atol=1e-6)
+                    np.testing.assert_allclose(buses.va_degree, expected.va_degree, atol=1e-5)
+                    # pandapower reports the bus power as demand
+                    np.testing.assert_allclose(buses.p_mw, -expected.p_mw, atol=1e-4)
+                    np.testing.assert_allclose(buses.q_mvar, -expected.q_mvar, atol=1e-4)
+
+                    branches = result.branch_results()
+                    lines = [l.uid for l in core_model.type_list(TLine)]
+                    expected = network.res_line.loc[lines]
+                    np.testing.assert_allclose(
+                        branches.loc[lines].p_from_mw, expected.p_from_mw, atol=1e-4
+                    )
+                    np.testing.assert_allclose(
+                        branches.loc[lines].q_to_mvar, expected.q_to_mvar, atol=1e-4
+                    )
+                    trafos = [t.uid for t in core_model.type_list(TwoWindingTransformer)]
+                    expected = network.res_trafo.loc[trafos]
+                    np.testing.assert_allclose(
+                        branches.loc[trafos].p_from_mw, expected.p_hv_mw, atol=1e-4
+                    )
+                    np.testing.assert_allclose(
+                        branches.loc[trafos].q_to_mvar, expected.q_lv_mvar, atol=1e-4
+                    )
+
+    def test_unsupplied_buses(self) -> None:
+        core_model = load_model("IEEE9_pf")
+        bus = Bus(core_model.get_valid_id(), "Isolated", lf_bus_type=LFBusType.PQ)
+        core_model.add_component(bus)
+
+        result = run_loadflow(core_model)
+        self.assertTrue(result.converged)
+        buses = result.bus_results()
+        self.assertTrue(np.isnan(buses.vm_pu[bus.uid]))
+        self.assertFalse(buses.drop(bus.uid).isna().any().any())
+
+    def test_no_slack(self) -> None:
+        core_model = load_model("IEEE9_pf")
+        for bus in core_model.type_list(Bus):
+            set_bus_type(core_model, bus, LFBusType.PQ)
+        with self.assertRaises(ValueError):
+            run_loadflow(core_model)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,105 @@
+import json
+import pathlib
+import re
+import unittest
+
+import numpy as np
+import pandapower
+import scipy.sparse as sp
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.shunt import Shunt
+from epowcore.gdf.tline import TLine
+from epowcore.generic.manipulation.flatten import flatten
+from epowcore.loadflow.admittance import build_admittance
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+
+PATH = pathlib.Path(__file__).parent.parent.resolve()
+MODELS = ("IEEE9_pf", "IEEE39", "IEEE399")
+
+
+def load_model(name: str) -> CoreModel:
+    with open(PATH / f"models/gdf/{name}_gdf.json", "r", encoding="utf-8") as file:
+        return CoreModel.import_dict(json.load(file))
+
+
+def load_flat_model(name: str) -> CoreModel:
+    core_model = load_model(name)
+    flatten(core_model)
+    return core_model
+
+
+class AdmittanceTest(unittest.TestCase):
+    def test_pandapower_ybus(self) -> None:
+        for name in MODELS:
+            with self.subTest(model=name):
+                core_model = load_model(name)
+                network = PandapowerConverter().from_gdf(core_model, name).network
+                pandapower.runpp(network, trafo_model="pi", numba=False)
+                expected = network._ppc["internal"]["Ybus"]
+
+                flatten(core_model)
+                admittance = build_admittance(core_model)
+
+                # map the buses to the pandapower internal buses,
+                # buses connected by closed switches are fused by pandapower
+                uids = admittance.bus_numbering.uids
+                lookup = network._pd2ppc_lookups["bus"][uids]
+                mapping = sp.csr_matrix(
+                    (np.ones(len(uids)), (np.arange(len(uids)), lookup)),
+                    shape=(len(uids), expected.shape[0]),
+                )
+                ybus = mapping.T @ admittance.ybus @ mapping
+                np.testing.assert_allclose(ybus.toarray(), expected.toarray(), atol=1e-9)
+
+    def test_branch_matrices(self) -> None:
+        admittance = build_admittance(load_flat_model("IEEE39"))
+        num_branches = len(admittance.branch_uids)
+        self.assertEqual(num_branches, 34 + 12)
+        self.assertEqual(admittance.yf.shape, (num_branches, 39))
+        self.assertEqual(admittance.yt.shape, (num_branches, 39))
+        np.testing.assert_array_equal(admittance.incidence.sum(axis=1), 0)
+        np.testing.assert_allclose(
+            (admittance.cf.T @ admittance.yf + admittance.ct.T @ admittance.yt).toarray(),
+            admittance.ybus.toarray(),
+        )
+
+    def test_shunt(self) -> None:
+        core_model = load_flat_model("IEEE9_pf")
+        bus = core_model.type_list(Bus)[0]
+        shunt = Shunt(core_model.get_valid_id(), "Shunt", p=10.0, q=-20.0)
+        core_model.add_component(shunt)
+        core_model.add_connection(bus, shunt)
+
+        without_shunt = build_admittance(load_flat_model("IEEE9_pf"))
+        admittance = build_admittance(core_model)
+        index = admittance.bus_numbering.index(bus.uid)
+        # capacitive shunt demanding -20 Mvar
+        self.assertAlmostEqual(
+            admittance.ybus[index, index] - without_shunt.ybus[index, index],
+            complex(10.0, 20.0) / core_model.base_mva_fb(),
+        )
+
+    def test_zero_impedance(self) -> None:
+        core_model = load_flat_model("IEEE39")
+        line = core_model.type_list(TLine)[0]
+        core_model.update_component(line, r1=0.0, x1=0.0)
+        with self.assertRaisesRegex(ValueError, re.escape(f"{line.name} ({line.uid})")):
+            build_admittance(core_model)
+
+    def test_matpower_internal(self) -> None:
+        for name in MODELS:
+            with self.subTest(model=name):
+                model = MatpowerConverter().from_gdf(load_model(name), name)
+                ybus = model.internal["Ybus"]
+                self.assertEqual(ybus.shape, (len(model.bus), len(model.bus)))
+                self.assertEqual(model.internal["Yf"].shape, (len(model.branch), len(model.bus)))
+                # Ybus is symmetric without phase shifting transformers
+                if all(b.ph_shift == 0 for b in model.branch):
+                    self.assertAlmostEqual(abs(ybus - ybus.T).max(), 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
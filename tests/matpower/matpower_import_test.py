@@ -0,0 +1,109 @@
+import json
+import pathlib
+import tempfile
+import unittest
+
+import numpy as np
+
+from epowcore.gdf.bus import Bus, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.load import Load
+from epowcore.gdf.shunt import Shunt
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.generic.bus_numbering import BusOrdering
+from epowcore.matpower.matpower_converter import MatpowerConverter
+
+PATH = pathlib.Path(__file__).parent.parent.resolve()
+
+
+class MatpowerImportTest(unittest.TestCase):
+    def test_case_file_import(self) -> None:
+        converter = MatpowerConverter()
+        core_model = converter.file_to_gdf(PATH / "models/matpower/case4_test.m")
+
+        self.assertTrue(core_model.sanity_check())
+        self.assertEqual(core_model.base_mva, 100.0)
+        self.assertEqual(len(core_model.type_list(Bus)), 4)
+        self.assertEqual(len(core_model.type_list(Load)), 2)
+        self.assertEqual(len(core_model.type_list(Shunt)), 2)
+        # out of service branch and generator are skipped
+        self.assertEqual(len(core_model.type_list(TLine)), 4)
+        self.assertEqual(len(core_model.type_list(TwoWindingTransformer)), 1)
+        self.assertEqual(len(core_model.type_list(SynchronousMachine)), 2)
+
+        buses = {b.name: b for b in core_model.type_list(Bus)}
+        self.assertEqual(buses["Bus 1"].lf_bus_type, LFBusType.SL)
+        self.assertEqual(buses["Bus 5"].lf_bus_type, LFBusType.PV)
+        # uids follow the bus numbers
+        self.assertEqual(
+            sorted(buses, key=lambda n: buses[n].uid), [f"Bus {n}" for n in (1, 2, 5, 7)]
+        )
+
+        trafo = core_model.type_list(TwoWindingTransformer)[0]
+        self.assertEqual(trafo.tap_ratio, 1.025)
+        self.assertEqual(core_model.get_neighbors(trafo, connector="HV"), [buses["Bus 5"]])
+        self.assertEqual(core_model.get_neighbors(trafo, connector="LV"), [buses["Bus 7"]])
+
+        line = next(l for l in core_model.type_list(TLine) if l.name == "Line 1 - 2")
+        z_base = 220.0**2 / 100.0
+        self.assertAlmostEqual(line.r1, 0.01 * z_base)
+        self.assertAlmostEqual(line.b1, 0.176 / z_base * 1e6)
+        self.assertEqual(len([l for l in core_model.type_list(TLine) if "2 - 5" in l.name]), 2)
+
+    def test_round_trip(self) -> None:
+        for model_name in ("IEEE9_pf", "IEEE39", "IEEE399"):
+            with self.subTest(model=model_name):
+                with open(
+                    PATH / f"models/gdf/{model_name}_gdf.json", "r", encoding="utf-8"
+                ) as file:
+                    core_model = CoreModel.import_dict(json.load(file))
+
+                converter = MatpowerConverter()
+                exported = converter.from_gdf(core_model, model_name).as_dict()["mpc"]
+
+                imported_model = converter.to_gdf(converter.from_gdf(core_model, model_name))
+                self.assertTrue(imported_model.sanity_check())
+                reexported = converter.from_gdf(imported_model, model_name).as_dict()["mpc"]
+
+                for key in ("bus", "branch", "gen"):
+                    np.testing.assert_allclose(reexported[key], exported[key], err_msg=key)
+
+    def test_bus_ordering(self) -> None:
+        with open(PATH / "models/gdf/IEEE39_gdf.json", "r", encoding="utf-8") as file:
+            core_model = CoreModel.import_dict(json.load(file))
+
+        def branch_uids(model) -> list[tuple[int, int]]:
+            numbering = model.bus_numbering
+            return sorted(
+                (numbering.uid(b.from_bus), numbering.uid(b.to_bus)) for b in model.branch
+            )
+
+        reference = MatpowerConverter().from_gdf(core_model, "IEEE39")
+        for ordering in (BusOrdering.RCM, BusOrdering.AMD):
+            with self.subTest(ordering=ordering):
+                model = MatpowerConverter(bus_ordering=ordering).from_gdf(core_model, "IEEE39")
+                self.assertEqual(
+                    sorted(b.bus_number for b in model.bus), list(range(1, len(model.bus) + 1))
+                )
+                self.assertNotEqual(model.bus_numbering.uids, reference.bus_numbering.uids)
+                self.assertEqual(branch_uids(model), branch_uids(reference))
+
+    def test_mat_file_round_trip(self) -> None:
+        converter = MatpowerConverter()
+        model = converter.read_from_file(PATH / "models/matpower/case4_test.m")
+
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = f"{directory}/case4_test.mat"
+            converter.write_to_matfile(model, file_path)
+            read_model = converter.read_from_file(file_path)
+
+        for key in ("bus", "branch", "gen"):
+            np.testing.assert_allclose(
+                read_model.as_dict()["mpc"][key], model.as_dict()["mpc"][key]
+            )
+
+
+if __name__ == "__main__":
+    unittest.main()
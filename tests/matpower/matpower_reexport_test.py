@@ -0,0 +1,98 @@
+import json
+import pathlib
+import unittest
+
+import numpy as np
+import scipy.sparse as sp
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.load import Load
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.matpower.matpower_converter import MatpowerConverter
+from epowcore.matpower.matpower_model import MatpowerModel
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+
+PATH = pathlib.Path(__file__).parent.parent.resolve()
+
+
+def load_model(name: str) -> CoreModel:
+    with open(PATH / "models/gdf" / name, "r", encoding="utf-8") as file:
+        return CoreModel.import_dict(json.load(file))
+
+
+def sorted_rows(model: MatpowerModel, table: str) -> np.ndarray:
+    rows = model.as_dict()["mpc"][table]
+    return rows[np.lexsort(rows.T[::-1])]
+
+
+class MatpowerReexportTest(unittest.TestCase):
+    """Test that patching a previous export gives the same case as a new export."""
+
+    def setUp(self) -> None:
+        self.core_model = load_model("IEEE39-flat_gdf.json")
+        self.core_model.track_changes()
+        self.converter = MatpowerConverter()
+        self.model = self.converter.from_gdf(self.core_model, "IEEE39")
+
+    def test_parameter_changes_are_patched(self) -> None:
+        for load in self.core_model.type_list(Load)[:5]:
+            self.core_model.update_component(load, reactive_power=load.reactive_power + 10.0)
+        line = self.core_model.type_list(TLine)[0]
+        self.core_model.update_component(line, x1=line.x1 * 1.5)
+        trafo = self.core_model.type_list(TwoWindingTransformer)[0]
+        assert trafo.tap_initial is not None
+        self.core_model.update_component(trafo, tap_initial=trafo.tap_initial + 2)
+        machine = self.core_model.type_list(SynchronousMachine)[1]
+        self.core_model.update_component(machine, voltage_set_point=1.03, active_power=500.0)
+
+        patched = self.converter.reexport(self.core_model, self.model, "IEEE39")
+        self.assertIs(patched, self.model)
+
+        expected = self.converter.from_gdf(self.core_model, "IEEE39")
+        for table in ("bus", "branch", "gen"):
+            np.testing.assert_allclose(
+                sorted_rows(patched, table), sorted_rows(expected, table), err_msg=table
+            )
+        # the branches are in a different order, the admittance matrix is not
+        ybus, expected_ybus = patched.internal["Ybus"], expected.internal["Ybus"]
+        assert isinstance(ybus, sp.csr_matrix) and isinstance(expected_ybus, sp.csr_matrix)
+        np.testing.assert_allclose(ybus.toarray(), expected_ybus.toarray())
+
+    def test_unsupported_changes_are_exported_again(self) -> None:
+        bus = self.core_model.type_list(Bus)[0]
+        bus = self.core_model.update_component(bus, nominal_voltage=bus.nominal_voltage * 2)
+        self.assertIsNot(self.converter.reexport(self.core_model, self.model, "IEEE39"), self.model)
+
+        self.core_model.add_connection(bus, Load(self.core_model.get_valid_id(), "New"))
+        self.assertIsNot(self.converter.reexport(self.core_model, self.model, "IEEE39"), self.model)
+
+    def test_reexport_to_two_targets(self) -> None:
+        pandapower_converter = PandapowerConverter()
+        network = pandapower_converter.from_gdf(self.core_model, "IEEE39")
+        load = self.core_model.type_list(Load)[0]
+        self.core_model.update_component(load, active_power=load.active_power + 100.0)
+
+        # re-exporting to one target does not hide the changes from the other one
+        patched = self.converter.reexport(self.core_model, self.model, "IEEE39")
+        self.assertIs(patched, self.model)
+        patched_network = pandapower_converter.reexport(self.core_model, network, "IEEE39")
+        self.assertIs(patched_network, network)
+
+        expected = sum(load.active_power for load in self.core_model.type_list(Load))
+        self.assertAlmostEqual(sum(bus.demand_p for bus in patched.bus), expected)
+        self.assertAlmostEqual(patched_network.network.load.p_mw.sum(), expected)
+
+        # a second change is patched once for each target
+        self.core_model.update_component(self.core_model.type_list(Load)[1], active_power=0.0)
+        self.converter.reexport(self.core_model, patched, "IEEE39")
+        pandapower_converter.reexport(self.core_model, patched_network, "IEEE39")
+        expected = sum(load.active_power for load in self.core_model.type_list(Load))
+        self.assertAlmostEqual(sum(bus.demand_p for bus in patched.bus), expected)
+        self.assertAlmostEqual(patched_network.network.load.p_mw.sum(), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
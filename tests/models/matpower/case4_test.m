@@ -0,0 +1,49 @@
+function mpc = case4_test
+%CASE4_TEST  Small 4 bus test case for the Matpower import.
+%   Bus 4 is on a lower voltage level and connected via a transformer.
+%   Bus numbers are not contiguous on purpose.
+
+%% MATPOWER Case Format : Version 2
+mpc.version = '2';
+
+%%-----  Power Flow Data  -----%%
+%% system MVA base
+mpc.baseMVA = 100;
+
+%% bus data
+%	bus_i	type	Pd	Qd	Gs	Bs	area	Vm	Va	baseKV	zone	Vmax	Vmin
+mpc.bus = [
+	1	3	0	0	0	0	1	1.02	0	220	1	1.1	0.9;
+	2	1	50	20	0	10	1	1	0	220	1	1.1	0.9;
+	5	2	0	0	0	0	1	1	0	220	1	1.1	0.9;
+	7	1	30	10	0.5	0	1	1	0	110	1	1.1	0.9;
+];
+
+%% generator data
+%	bus	Pg	Qg	Qmax	Qmin	Vg	mBase	status	Pmax	Pmin	Pc1	Pc2	Qc1min	Qc1max	Qc2min	Qc2max	ramp_agc	ramp_10	ramp_30	ramp_q	apf
+mpc.gen = [
+	1	0	0	300	-300	1.02	100	1	250	10	0	0	0	0	0	0	0	0	0	0	0;
+	5	60	0	300	-300	1.01	100	1	270	10	0	0	0	0	0	0	0	0	0	0	0;
+	5	20	0	100	-100	1.01	100	0	100	0	0	0	0	0	0	0	0	0	0	0	0;
+];
+
+%% branch data
+%	fbus	tbus	r	x	b	rateA	rateB	rateC	ratio	angle	status	angmin	angmax
+mpc.branch = [
+	1	2	0.01	0.085	0.176	250	250	250	0	0	1	-360	360;
+	1	5	0.017	0.092	0.158	250	260	270	0	0	1	-360	360;
+	2	5	0.039	0.17	0.358	150	150	150	0	0	1	-360	360;
+	2	5	0.039	0.17	0.358	150	150	150	0	0	1	-360	360;
+	5	7	0	0.0576	0	250	250	250	1.025	0	1	-360	360;
+	1	7	0.01	0.1	0	0	0	0	0	0	0	-360	360;
+];
+
+%%-----  OPF Data  -----%%
+%% generator cost data
+%	1	startup	shutdown	n	x1	y1	...	xn	yn
+%	2	startup	shutdown	n	c(n-1)	...	c0
+mpc.gencost = [
+	2	1500	0	3	0.11	5	150;
+	2	2000	0	3	0.085	1.2	600;
+	2	2000	0	3	0.085	1.2	600;
+];
@@ -0,0 +1,52 @@
+import json
+import pathlib
+import unittest
+
+import numpy as np
+import pandapower
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.generic.bus_numbering import BusOrdering
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+
+PATH = pathlib.Path(__file__).parent.parent.resolve()
+
+
+class PandapowerBusOrderingTest(unittest.TestCase):
+    """Test that renumbering the buses of the pandapower export does not change the loadflow."""
+
+    def _export(self, bus_ordering: BusOrdering | None):
+        with open(PATH / "models/gdf/IEEE39_gdf.json", "r", encoding="utf-8") as file:
+            core_model = CoreModel.import_dict(json.load(file))
+        converter = PandapowerConverter(bus_ordering=bus_ordering)
+        model = converter.from_gdf(core_model, "IEEE39")
+        pandapower.runpp(model.network)
+        return model
+
+    def test_loadflow_is_unchanged(self) -> None:
+        reference = self._export(None)
+        self.assertIsNone(reference.bus_numbering)
+
+        for ordering in (BusOrdering.RCM, BusOrdering.AMD):
+            with self.subTest(ordering=ordering):
+                model = self._export(ordering)
+                numbering = model.bus_numbering
+                assert numbering is not None
+                self.assertEqual(list(model.network.bus.index), list(range(len(numbering))))
+
+                # map the results back to the bus uids
+                res_bus = model.network.res_bus.copy()
+                res_bus.index = [numbering.uid(i) for i in res_bus.index]
+                res_bus = res_bus.loc[reference.network.res_bus.index]
+                np.testing.assert_allclose(
+                    res_bus.values, reference.network.res_bus.values, atol=1e-8
+                )
+                np.testing.assert_allclose(
+                    model.network.res_line.loc[reference.network.res_line.index].values,
+                    reference.network.res_line.values,
+                    atol=1e-8,
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,139 @@
+import json
+import pathlib
+import unittest
+
+import numpy as np
+import pandapower
+
+from epowcore.gdf.bus import Bus, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.generators.static_generator import StaticGenerator
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.load import Load
+from epowcore.gdf.switch import Switch
+from epowcore.gdf.tline import TLine
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+from epowcore.pandapower.pandapower_model import PandapowerModel
+
+PATH = pathlib.Path(__file__).parent.parent.resolve()
+TABLES = ("bus", "load", "sgen", "gen", "ext_grid", "line", "trafo", "switch")
+
+
+def load_model(name: str) -> CoreModel:
+    with open(PATH / "models/gdf" / name, "r", encoding="utf-8") as file:
+        return CoreModel.import_dict(json.load(file))
+
+
+def create_network() -> pandapower.pandapowerNet:
+    """A small network with all imported element types and some out of service elements."""
+    net = pandapower.create_empty_network(f_hz=60.0)
+    hv = pandapower.create_bus(net, vn_kv=110.0, name="HV")
+    mv = [pandapower.create_bus(net, vn_kv=20.0) for _ in range(4)]
+    unused = pandapower.create_bus(net, vn_kv=20.0, in_service=False)
+    pandapower.create_ext_grid(net, bus=hv, vm_pu=1.02)
+    pandapower.create_transformer_from_parameters(
+        net,
+        hv_bus=hv,
+        lv_bus=mv[0],
+        sn_mva=25.0,
+        vn_hv_kv=110.0,
+        vn_lv_kv=20.0,
+        vkr_percent=0.3,
+        vk_percent=12.0,
+        pfe_kw=14.0,
+        i0_percent=0.07,
+        shift_degree=150.0,
+    )
+    for from_bus, to_bus in [(mv[0], mv[1]), (mv[1], mv[2])]:
+        pandapower.create_line_from_parameters(
+            net,
+            from_bus=from_bus,
+            to_bus=to_bus,
+            length_km=2.0,
+            r_ohm_per_km=0.16,
+            x_ohm_per_km=0.12,
+            c_nf_per_km=260.0,
+            max_i_ka=0.3,
+        )
+    pandapower.create_switch(net, bus=mv[2], element=mv[3], et="b", closed=True)
+    pandapower.create_load(net, bus=mv[3], p_mw=2.0, q_mvar=0.5, scaling=0.5)
+    pandapower.create_load(net, bus=mv[2], p_mw=1.0, q_mvar=0.2, in_service=False)
+    pandapower.create_load(net, bus=unused, p_mw=1.0, q_mvar=0.2)
+    pandapower.create_sgen(net, bus=mv[2], p_mw=0.8, q_mvar=0.0)
+    pandapower.create_gen(net, bus=mv[1], p_mw=1.5, vm_pu=1.01)
+    pandapower.create_shunt(net, bus=mv[1], q_mvar=0.3)
+    return net
+
+
+class PandapowerImportTest(unittest.TestCase):
+    def test_round_trip(self) -> None:
+        """Exporting an imported export reproduces the pandapower tables."""
+        converter = PandapowerConverter()
+        for name in ("IEEE9_pf_gdf.json", "IEEE39_gdf.json", "IEEE399_gdf.json"):
+            with self.subTest(model=name):
+                network = converter.from_gdf(load_model(name), "export").network
+                core_model = converter.to_gdf(converter.from_gdf(load_model(name), "export"))
+                self.assertTrue(core_model.sanity_check())
+                round_trip = converter.from_gdf(core_model, "round trip").network
+
+                for table in TABLES:
+                    expected, actual = network[table], round_trip[table]
+                    self.assertTrue(expected.index.equals(actual.index), table)
+                    self.assertEqual(list(expected.columns), list(actual.columns), table)
+                    for column in expected.columns:
+                        if expected[column].dtype.kind in "biuf":
+                            np.testing.assert_allclose(
+                                actual[column].to_numpy(dtype=float),
+                                expected[column].to_numpy(dtype=float),
+                                rtol=1e-12,
+                                err_msg=f"{table}.{column}",
+                            )
+                        else:
+                            self.assertTrue(expected[column].equals(actual[column]), column)
+
+    def test_import_network(self) -> None:
+        net = create_network()
+        core_model = PandapowerConverter().to_gdf(PandapowerModel(network=net))
+
+        self.assertEqual(core_model.base_frequency, 60.0)
+        self.assertEqual(len(core_model.type_list(Bus)), 5)
+        self.assertEqual(len(core_model.type_list(TLine)), 2)
+        self.assertEqual(len(core_model.type_list(Switch)), 1)
+        (load,) = core_model.type_list(Load)
+        self.assertAlmostEqual(load.active_power, 1.0)
+        self.assertEqual(len(core_model.type_list(StaticGenerator)), 1)
+        (machine,) = core_model.type_list(SynchronousMachine)
+        self.assertEqual(machine.rated_voltage, 20.0)
+
+        uids = [component.uid for component in core_model.component_list()]
+        self.assertEqual(len(uids), len(set(uids)))
+        bus_types = {bus.uid: bus.lf_bus_type for bus in core_model.type_list(Bus)}
+        self.assertEqual(bus_types[0], LFBusType.SL)
+        self.assertEqual(bus_types[2], LFBusType.PV)
+        self.assertEqual(bus_types[3], LFBusType.PQ)
+
+    def test_load_flow_is_unchanged(self) -> None:
+        net = create_network()
+        converter = PandapowerConverter()
+        exported = converter.from_gdf(converter.to_gdf(PandapowerModel(network=net)), "net")
+
+        pandapower.runpp(net)
+        pandapower.runpp(exported.network)
+
+        buses = net.res_bus.dropna().index
+        np.testing.assert_allclose(
+            exported.network.res_bus.loc[buses].to_numpy(),
+            net.res_bus.loc[buses].to_numpy(),
+            atol=1e-8,
+        )
+
+    def test_unknown_bus(self) -> None:
+        net = create_network()
+        net.load.at[0, "bus"] = 42
+
+        with self.assertRaises(ValueError):
+            PandapowerConverter().to_gdf(PandapowerModel(network=net))
+
+
+if __name__ == "__main__":
+    unittest.main()
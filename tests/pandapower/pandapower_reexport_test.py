@@ -0,0 +1,90 @@
+import json
+import pathlib
+import unittest
+
+import pandas
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.load import Load
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.generic.bus_numbering import BusOrdering
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+from epowcore.pandapower.pandapower_model import PandapowerModel
+
+PATH = pathlib.Path(__file__).parent.parent.resolve()
+TABLES = ["bus", "load", "sgen", "gen", "line", "trafo", "switch", "shunt", "ext_grid"]
+
+
+def load_model(name: str) -> CoreModel:
+    with open(PATH / "models/gdf" / name, "r", encoding="utf-8") as file:
+        return CoreModel.import_dict(json.load(file))
+
+
+class PandapowerReexportTest(unittest.TestCase):
+    """Test that patching a previous export gives the same network as a new export."""
+
+    def assert_same_network(self, actual: PandapowerModel, expected: PandapowerModel) -> None:
+        for table in TABLES:
+            pandas.testing.assert_frame_equal(
+                actual.network[table].sort_index(),
+                expected.network[table].sort_index(),
+                check_dtype=False,
+                obj=table,
+            )
+
+    def test_parameter_changes_are_patched(self) -> None:
+        # the IEEE39 model contains subsystems
+        core_model = load_model("IEEE39_gdf.json")
+        core_model.track_changes()
+        for bus_ordering in (None, BusOrdering.RCM):
+            with self.subTest(bus_ordering=bus_ordering):
+                converter = PandapowerConverter(bus_ordering=bus_ordering)
+                model = converter.from_gdf(core_model, "IEEE39")
+
+                for load in core_model.type_list(Load)[:3]:
+                    core_model.update_component(load, active_power=load.active_power * 1.1)
+                trafo = core_model.type_list(TwoWindingTransformer)[0]
+                assert trafo.tap_initial is not None
+                core_model.update_component(trafo, tap_initial=trafo.tap_initial + 1)
+                machine = core_model.type_list(SynchronousMachine)[0]
+                core_model.update_component(machine, voltage_set_point=1.02)
+
+                patched = converter.reexport(core_model, model, "IEEE39")
+                self.assertIs(patched, model)
+                self.assertEqual(patched.journal_sequence, core_model.track_changes().sequence)
+                self.assert_same_network(patched, converter.from_gdf(core_model, "IEEE39"))
+
+    def test_structural_changes_are_patched(self) -> None:
+        core_model = load_model("IEEE39-flat_gdf.json")
+        core_model.track_changes()
+        converter = PandapowerConverter()
+        model = converter.from_gdf(core_model, "IEEE39")
+
+        bus = core_model.type_list(Bus)[3]
+        core_model.add_connection(bus, Load(core_model.get_valid_id(), "New", active_power=5.0))
+        core_model.remove_component(core_model.type_list(TLine)[2])
+        core_model.update_component(bus, nominal_voltage=bus.nominal_voltage * 1.01)
+
+        patched = converter.reexport(core_model, model, "IEEE39")
+        self.assertIs(patched, model)
+        self.assert_same_network(patched, converter.from_gdf(core_model, "IEEE39"))
+
+    def test_many_structural_changes_are_exported_again(self) -> None:
+        core_model = load_model("IEEE39-flat_gdf.json")
+        core_model.track_changes()
+        converter = PandapowerConverter()
+        model = converter.from_gdf(core_model, "IEEE39")
+
+        for line in core_model.type_list(TLine)[:10]:
+            core_model.remove_component(line)
+
+        reexported = converter.reexport(core_model, model, "IEEE39")
+        self.assertIsNot(reexported, model)
+        self.assertEqual(len(reexported.network.line), len(model.network.line) - 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
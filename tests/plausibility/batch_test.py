@@ -0,0 +1,105 @@
+import json
+import pathlib
+import shutil
+
+import pandapower
+
+from epowcore.plausibility.batch import BatchOptions, BatchPlausibilityChecker, main
+
+PATH = pathlib.Path(__file__).parent.parent.resolve()
+
+
+def create_models(directory: pathlib.Path) -> None:
+    directory.mkdir()
+    shutil.copy(PATH / "models/gdf/IEEE9_pf_gdf.json", directory / "ieee9.json")
+
+    net = pandapower.create_empty_network()
+    bus_1 = pandapower.create_bus(net, vn_kv=20.0)
+    bus_2 = pandapower.create_bus(net, vn_kv=20.0)
+    pandapower.create_ext_grid(net, bus=bus_1, vm_pu=1.0)
+    pandapower.create_line_from_parameters(
+        net,
+        from_bus=bus_1,
+        to_bus=bus_2,
+        length_km=1.0,
+        r_ohm_per_km=0.1,
+        x_ohm_per_km=0.1,
+        c_nf_per_km=0.0,
+        max_i_ka=1.0,
+    )
+    pandapower.create_load(net, bus=bus_2, p_mw=0.1, q_mvar=0.05)
+    pandapower.to_json(net, str(directory / "feeder.json"))
+
+    (directory / "broken.json").write_text("{", encoding="utf-8")
+
+
+def test_batch_run(tmp_path) -> None:
+    models = tmp_path / "models"
+    create_models(models)
+    report = tmp_path / "report.jsonl"
+    checker = BatchPlausibilityChecker(max_workers=1)
+
+    table = checker.run([str(models)], report).set_index("name")
+
+    assert table.loc["ieee9", "format"] == "gdf"
+    assert table.loc["ieee9", "converged"]
+    assert table.loc["feeder", "format"] == "pandapower"
+    assert table.loc["feeder", "successful"]
+    assert table.loc["broken", "status"] == "failed"
+    lines = report.read_text(encoding="utf-8").splitlines()
+    assert sorted(json.loads(line)["name"] for line in lines) == ["broken", "feeder", "ieee9"]
+
+    # only changed and failed models are checked again
+    (models / "feeder.json").write_text(
+        (models / "feeder.json").read_text(encoding="utf-8") + "\n", encoding="utf-8"
+    )
+    table = checker.run([str(models / "*.json")], report).set_index("name")
+
+    assert table.loc["ieee9", "status"] == "unchanged"
+    assert table.loc["ieee9", "converged"]
+    assert table.loc["feeder", "status"] == "checked"
+    assert table.loc["broken", "status"] == "failed"
+
+
+def test_parallel_dc_screening(tmp_path) -> None:
+    models = tmp_path / "models"
+    create_models(models)
+
+    checker = BatchPlausibilityChecker(BatchOptions(dc_screening=True), max_workers=2)
+    table = checker.run([str(models)], tmp_path / "report.jsonl", force=True).set_index("name")
+
+    assert table.loc["ieee9", "status"] == "checked"
+    assert table.loc["feeder", "successful"]
+    assert table.loc["broken", "status"] == "failed"
+
+
+def test_cli(tmp_path, capsys) -> None:
+    models = tmp_path / "models"
+    create_models(models)
+    report = tmp_path / "report.jsonl"
+
+    main([str(models), "--report", str(report), "--workers", "1"])
+    main([str(models), "--report", str(report), "--workers", "1"])
+
+    assert "2 unchanged, 1 failed" in capsys.readouterr().out.splitlines()[-1]
+
+
+def test_changed_options_and_output(tmp_path) -> None:
+    models = tmp_path / "models"
+    create_models(models)
+    report = tmp_path / "report.jsonl"
+    # the results of the checks are written next to the models
+    options = BatchOptions(output_path=str(models / "results"))
+
+    table = BatchPlausibilityChecker(options, max_workers=1).run([str(models)], report)
+    assert sorted(table["name"]) == ["broken", "feeder", "ieee9"]
+    assert any((models / "results").glob("*.json"))
+
+    # other options check the models again, the results are not read as models
+    options = BatchOptions(dc_screening=True, output_path=str(models / "results"))
+    table = BatchPlausibilityChecker(options, max_workers=1).run([str(models)], report)
+    assert sorted(table["name"]) == ["broken", "feeder", "ieee9"]
+    assert set(table["status"]) == {"checked", "failed"}
+
+    table = BatchPlausibilityChecker(options, max_workers=1).run([str(models)], report)
+    assert table.set_index("name").loc["ieee9", "status"] == "unchanged"
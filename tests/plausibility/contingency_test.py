@@ -0,0 +1,88 @@
+import pandapower
+
+from epowcore.plausibility.contingency import (
+    Contingency,
+    ContingencyRunner,
+    all_branch_outages,
+)
+
+
+def create_ring_with_spur() -> pandapower.pandapowerNet:
+    net = pandapower.create_empty_network()
+
+    buses = [pandapower.create_bus(net, vn_kv=20.0) for _ in range(5)]
+    pandapower.create_ext_grid(net, bus=buses[0], vm_pu=1.0)
+
+    ring = buses[:4]
+    for from_bus, to_bus in zip(ring, ring[1:] + ring[:1]):
+        pandapower.create_line_from_parameters(
+            net,
+            from_bus=from_bus,
+            to_bus=to_bus,
+            length_km=1.0,
+            r_ohm_per_km=0.1,
+            x_ohm_per_km=0.4,
+            c_nf_per_km=0.0,
+            max_i_ka=0.03,
+        )
+    pandapower.create_line_from_parameters(
+        net,
+        from_bus=buses[2],
+        to_bus=buses[4],
+        length_km=1.0,
+        r_ohm_per_km=0.1,
+        x_ohm_per_km=0.4,
+        c_nf_per_km=0.0,
+        max_i_ka=1.0,
+    )
+    pandapower.create_load(net, bus=buses[2], p_mw=1.0, q_mvar=0.2)
+    pandapower.create_load(net, bus=buses[4], p_mw=0.5, q_mvar=0.1)
+    return net
+
+
+def test_single_outages() -> None:
+    net = create_ring_with_spur()
+
+    report = ContingencyRunner(processes=1).run(net)
+
+    assert report.base_case.successful
+    assert set(report.results) == set(all_branch_outages(net))
+    table = report.summary_table().set_index(["element", "index"])
+    # each side of the ring carries the full load after the outage of the other side
+    for line in range(4):
+        assert table.loc[("line", line), "overloaded_lines"] > 0
+    # the outage of the spur isolates its bus
+    assert report.results[Contingency("line", 4)].isolated_areas == [[4]]
+    assert report.throughput > 0
+
+
+def test_network_is_restored() -> None:
+    net = create_ring_with_spur()
+    pandapower.runpp(net)
+    base_loading = net.res_line["loading_percent"].copy()
+
+    ContingencyRunner(processes=1).run(net)
+
+    assert net.line["in_service"].all()
+    assert (net.res_line["loading_percent"] - base_loading).abs().max() < 1e-6
+
+
+def test_out_of_service_branch_stays_out_of_service() -> None:
+    net = create_ring_with_spur()
+    net.line.at[1, "in_service"] = False
+
+    ContingencyRunner(processes=1).run(net, [Contingency("line", 0), Contingency("line", 1)])
+
+    assert net.line["in_service"].tolist() == [True, False, True, True, True]
+
+
+def test_process_pool_matches_serial_run() -> None:
+    contingencies = [Contingency("line", index) for index in range(5)]
+
+    serial = ContingencyRunner(processes=1).run(create_ring_with_spur(), contingencies)
+    parallel = ContingencyRunner(processes=2, chunk_size=2).run(
+        create_ring_with_spur(), contingencies
+    )
+
+    assert list(parallel.results) == contingencies
+    assert parallel.summary_table().equals(serial.summary_table())
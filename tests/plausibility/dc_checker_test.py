@@ -0,0 +1,134 @@
+import dataclasses
+import json
+import pathlib
+
+import numpy as np
+import pandapower
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.tline import TLine
+from epowcore.pandapower.pandapower_converter import PandapowerConverter
+from epowcore.plausibility.dc_checker import DcPlausibilityChecker
+from epowcore.plausibility.dc_screening import DcScreening
+
+PATH = pathlib.Path(__file__).parent.parent.resolve()
+
+
+def load_model(name: str) -> CoreModel:
+    with open(PATH / f"models/gdf/{name}_gdf.json", "r", encoding="utf-8") as file:
+        return CoreModel.import_dict(json.load(file))
+
+
+def create_ring() -> pandapower.pandapowerNet:
+    net = pandapower.create_empty_network()
+    buses = [pandapower.create_bus(net, vn_kv=20.0) for _ in range(4)]
+    pandapower.create_ext_grid(net, bus=buses[0], vm_pu=1.0)
+    for from_bus, to_bus in zip(buses, buses[1:] + buses[:1]):
+        pandapower.create_line_from_parameters(
+            net,
+            from_bus=from_bus,
+            to_bus=to_bus,
+            length_km=1.0,
+            r_ohm_per_km=0.1,
+            x_ohm_per_km=0.4,
+            c_nf_per_km=0.0,
+            max_i_ka=0.05,
+        )
+    pandapower.create_load(net, bus=buses[2], p_mw=2.0, q_mvar=0.5)
+    return net
+
+
+def test_flows_match_pandapower_dc() -> None:
+    for name in ("IEEE9_pf", "IEEE39", "IEEE399"):
+        net = PandapowerConverter().from_gdf(load_model(name), name).network
+        pandapower.rundcpp(net, numba=False)
+
+        for screening in (
+            DcScreening.from_core_model(load_model(name)),
+            DcScreening.from_pandapower(net),
+        ):
+            flows = screening.flows()
+            lines = ~screening.branch_is_transformer & (screening.branch_ids >= 0)
+            expected = net.res_line.p_from_mw.loc[screening.branch_ids[lines]]
+            np.testing.assert_allclose(flows[lines], expected, atol=1e-3)
+
+
+def test_ptdf_and_lodf() -> None:
+    screening = DcScreening.from_core_model(load_model("IEEE39"))
+    flows = screening.flows()
+
+    ptdf = screening.ptdf()
+    bus = 5
+    p_injection = screening.p_injection.copy()
+    p_injection[bus] += 0.1
+    np.testing.assert_allclose(
+        screening.flows(p_injection) - flows, ptdf[:, bus] * 0.1 * screening.base_mva, atol=1e-9
+    )
+    np.testing.assert_allclose(screening.ptdf([3, 7]), ptdf[[3, 7]])
+
+    outage = 2
+    lodf = screening.lodf([outage])
+    b = screening.b.copy()
+    b[outage] = 0.0
+    after_outage = dataclasses.replace(screening, b=b).flows()
+    np.testing.assert_allclose(after_outage, flows + lodf[:, 0] * flows[outage], atol=1e-9)
+
+
+def test_detects_overloaded_line() -> None:
+    net = create_ring()
+    result = DcPlausibilityChecker().check(net)
+    assert result.converged
+    assert not result.overloaded_lines
+
+    # each side of the ring carries 1 MW of the load, the other side 2 MW after an outage
+    result = DcPlausibilityChecker(contingencies=True).check(net)
+    assert {entry["contingency"] for entry in result.overloaded_lines} == {0, 1, 2, 3}
+    assert all(entry["loading_percent"] > 100.0 for entry in result.overloaded_lines)
+
+
+def test_detects_isolated_area() -> None:
+    net = create_ring()
+    isolated_bus_1 = pandapower.create_bus(net, vn_kv=20.0)
+    isolated_bus_2 = pandapower.create_bus(net, vn_kv=20.0)
+    pandapower.create_line_from_parameters(
+        net,
+        from_bus=isolated_bus_1,
+        to_bus=isolated_bus_2,
+        length_km=1.0,
+        r_ohm_per_km=0.1,
+        x_ohm_per_km=0.1,
+        c_nf_per_km=0.0,
+        max_i_ka=1.0,
+    )
+
+    result = DcPlausibilityChecker(contingencies=True).check(net)
+
+    assert result.isolated_areas == [[isolated_bus_1, isolated_bus_2]]
+    assert not np.isnan([entry["loading_percent"] for entry in result.overloaded_lines]).any()
+
+
+def test_missing_slack_is_reported() -> None:
+    net = create_ring()
+    net.ext_grid.drop(net.ext_grid.index, inplace=True)
+
+    result = DcPlausibilityChecker().check(net)
+
+    assert not result.successful
+    assert result.errors
+
+
+def test_unlimited_and_zero_reactance_branches() -> None:
+    core_model = load_model("IEEE39")
+    lines = core_model.type_list(TLine)
+    # a rating of 0 means unlimited in MATPOWER
+    unlimited = core_model.update_component(lines[0], rating=0.0)
+    core_model.update_component(lines[1], x1=0.0)
+
+    screening = DcScreening.from_core_model(core_model)
+    assert np.isnan(screening.rating_mva[list(screening.branch_ids).index(unlimited.uid)])
+    assert np.all(np.isfinite(screening.b))
+    assert np.all(np.isfinite(screening.flows()))
+
+    result = DcPlausibilityChecker(contingencies=True).check(core_model)
+    assert result.converged
+    assert all(entry["line_index"] != unlimited.uid for entry in result.overloaded_lines)
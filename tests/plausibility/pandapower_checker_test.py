@@ -1,5 +1,6 @@
 import pandapower
 
+from epowcore.plausibility.checker import PlausibilityThresholds
 from epowcore.plausibility.pandapower_checker import (
     PandapowerPlausibilityChecker,
 )
@@ -350,3 +351,65 @@ def test_plots_isolated_areas(tmp_path) -> None:
 
     assert output_file.exists()
     assert output_file.stat().st_size > 0
+
+
+def test_thresholds_are_configurable() -> None:
+    net = pandapower.create_empty_network()
+
+    bus_1 = pandapower.create_bus(net, vn_kv=20.0)
+    bus_2 = pandapower.create_bus(net, vn_kv=20.0)
+
+    pandapower.create_ext_grid(net, bus=bus_1, vm_pu=1.0)
+    pandapower.create_line_from_parameters(
+        net,
+        from_bus=bus_1,
+        to_bus=bus_2,
+        length_km=1.0,
+        r_ohm_per_km=0.1,
+        x_ohm_per_km=0.1,
+        c_nf_per_km=0.0,
+        max_i_ka=1.0,
+    )
+    pandapower.create_load(net, bus=bus_2, p_mw=0.1, q_mvar=0.05)
+
+    thresholds = PlausibilityThresholds(
+        soft_vm_min_pu=0.99999,
+        max_loading_percent=0.1,
+    )
+    result = PandapowerPlausibilityChecker(thresholds).check(net)
+
+    assert result.converged
+    assert [violation["bus_index"] for violation in result.soft_voltage_violations] == [bus_2]
+    assert not result.hard_voltage_violations
+    assert result.overloaded_lines[0]["line_index"] == 0
+
+
+def test_violation_tables_are_columnar() -> None:
+    net = pandapower.create_empty_network()
+
+    buses = pandapower.create_buses(net, 3, vn_kv=20.0)
+
+    pandapower.create_ext_grid(net, bus=buses[0], vm_pu=1.0)
+    for to_bus in buses[1:]:
+        pandapower.create_line_from_parameters(
+            net,
+            from_bus=buses[0],
+            to_bus=to_bus,
+            length_km=30.0,
+            r_ohm_per_km=1.0,
+            x_ohm_per_km=0.5,
+            c_nf_per_km=0.0,
+            max_i_ka=0.05,
+        )
+        pandapower.create_load(net, bus=to_bus, p_mw=2.5, q_mvar=1.5)
+
+    checker = PandapowerPlausibilityChecker()
+    result = checker.check(net)
+    tables = checker.violation_tables(net)
+
+    assert list(tables["hard_voltage_violations"].columns) == ["bus_index", "vm_pu"]
+    assert tables["hard_voltage_violations"]["bus_index"].tolist() == list(buses[1:])
+    assert tables["overloaded_lines"]["line_index"].tolist() == [0, 1]
+    assert result.hard_voltage_violations == (
+        tables["hard_voltage_violations"].to_dict("records")
+    )
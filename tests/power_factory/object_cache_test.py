@@ -0,0 +1,74 @@
+import unittest
+
+from epowcore.power_factory import stand_in
+
+stand_in.install()
+
+# pylint: disable=wrong-import-position
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.power_factory.object_cache import CachedObject, ObjectCache
+from epowcore.power_factory.to_gdf.power_factory_extractor import PowerFactoryExtractor
+
+
+class ObjectCacheTest(unittest.TestCase):
+    def test_attributes_are_read_once(self) -> None:
+        app = stand_in.synthetic_grid(20)
+        cache = ObjectCache(app)
+        lines = cache.of_class("ElmLne", ["loc_name", "typ_id.rline"])
+
+        calls = app.calls
+        # one call for the objects, one per line for each attribute and one per line type
+        self.assertEqual(calls, 1 + 2 * len(lines) + 4)
+        for line in lines:
+            self.assertEqual(line.typ_id.rline, 0.02)
+            self.assertTrue(line.loc_name.startswith("Line"))
+        self.assertEqual(app.calls, calls)
+
+    def test_objects_are_interned(self) -> None:
+        app = stand_in.synthetic_grid(20)
+        cache = ObjectCache(app)
+        buses = cache.of_class("ElmTerm")
+        line = cache.of_class("ElmLne")[0]
+
+        self.assertIsInstance(line.bus1.cterm, CachedObject)
+        self.assertIs(line.bus1.cterm, buses[0])
+        self.assertIs(cache.of_class("ElmTerm"), buses)
+        self.assertFalse(hasattr(line, "GPScoords"))
+
+
+class PowerFactoryExtractorTest(unittest.TestCase):
+    def test_extract_synthetic_grid(self) -> None:
+        app = stand_in.synthetic_grid(40)
+        extractor = PowerFactoryExtractor("Grid", "Base", 50.0, app=app)
+        core_model = extractor.get_core_model()
+
+        self.assertEqual(len(core_model.type_list(Bus)), 42)
+        self.assertEqual(len(core_model.type_list(TLine)), 80)
+        self.assertEqual(len(core_model.type_list(SynchronousMachine)), 8)
+        self.assertEqual(len(core_model.type_list(TwoWindingTransformer)), 2)
+        # lines and transformers connect two buses, loads and generators one
+        self.assertEqual(len(core_model.graph.edges), 2 * 80 + 40 + 8 + 2 * 2)
+
+        uid = core_model.type_list(TwoWindingTransformer)[0].uid
+        self.assertEqual(
+            sorted(x[2][uid][0] for x in core_model.graph.edges.data() if uid in x[2]),
+            ["HV", "LV"],
+        )
+
+    def test_hierarchy_groups_by_site(self) -> None:
+        app = stand_in.synthetic_grid(40)
+        extractor = PowerFactoryExtractor("Grid", "Base", 50.0, app=app)
+        extractor.get_core_model()
+
+        hierarchy = extractor.get_hierarchy()
+
+        self.assertEqual([str(site) for site in hierarchy], [f"Site {i}.ElmSite" for i in range(4)])
+        # lines are in the grid folder and belong to no site
+        self.assertEqual(len(hierarchy[next(iter(hierarchy))]), 10 + 10 + 2 + 1 + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
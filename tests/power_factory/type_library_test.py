@@ -0,0 +1,70 @@
+import unittest
+
+from helpers.gdf_component_creator import GdfTestComponentCreator
+
+from epowcore.power_factory import stand_in
+
+stand_in.install()
+
+# pylint: disable=wrong-import-position
+from epowcore.power_factory.from_gdf.power_factory_exporter import PowerFactoryExporter
+from epowcore.power_factory.from_gdf.type_library import TypeLibrary
+
+
+class TypeLibraryTest(unittest.TestCase):
+    def test_equal_parameters_share_a_type(self) -> None:
+        app = stand_in.StandInApplication()
+        types = TypeLibrary(app.folders["equip"])
+        types.create_folder("Line Types")
+
+        line_type = types.get("Line Types", "TypLne", "Line 1_type", {"rline": 0.1, "xline": 1})
+        same_type = types.get("Line Types", "TypLne", "Line 2_type", {"xline": 1, "rline": 0.1})
+        other_type = types.get("Line Types", "TypLne", "Line 3_type", {"rline": 0.2, "xline": 1})
+
+        self.assertIs(line_type, same_type)
+        self.assertIsNot(line_type, other_type)
+        self.assertEqual((types.created, types.reused), (2, 1))
+        self.assertEqual(str(line_type), "Line 1_type.TypLne")
+        self.assertEqual(line_type.rline, 0.1)
+
+    def test_missing_folder(self) -> None:
+        types = TypeLibrary(stand_in.StandInApplication().folders["equip"])
+        with self.assertRaises(ValueError):
+            types.get("Line Types", "TypLne", "Line_type", {})
+
+
+class PowerFactoryExporterTypesTest(unittest.TestCase):
+    def test_export_creates_distinct_types(self) -> None:
+        creator = GdfTestComponentCreator(base_frequency=50.0)
+        buses = [creator.create_bus() for _ in range(6)]
+        lines = []
+        for i, bus in enumerate(buses):
+            line = creator.create_tline()
+            if i % 2 == 1:
+                line = creator.core_model.update_component(line, x1=line.x1 * 2)
+            creator.core_model.add_connection(line, bus, "A")
+            creator.core_model.add_connection(line, buses[(i + 1) % len(buses)], "B")
+            lines.append(line)
+        for _ in range(3):
+            transformer = creator.create_2w_transformer()
+            creator.core_model.add_connection(transformer, buses[0], "HV")
+            creator.core_model.add_connection(transformer, buses[1], "LV")
+
+        app = stand_in.StandInApplication()
+        exporter = PowerFactoryExporter(creator.core_model, "Types", app)
+        exporter.convert_model()
+
+        pf_lines = app.GetCalcRelevantObjects("ElmLne")
+        self.assertEqual(len(pf_lines), 6)
+        self.assertEqual(len(app.GetCalcRelevantObjects("TypLne")), 2)
+        self.assertEqual(len(app.GetCalcRelevantObjects("TypTr2")), 1)
+        self.assertEqual(len(app.GetCalcRelevantObjects("ElmTr2")), 3)
+        self.assertIs(pf_lines[0].typ_id, pf_lines[2].typ_id)
+        self.assertIsNot(pf_lines[0].typ_id, pf_lines[1].typ_id)
+        self.assertEqual(pf_lines[1].typ_id.xline, lines[1].x1)
+        # the lines are connected to the created buses
+        self.assertIs(pf_lines[0].bus1.cterm, exporter.pf_components[buses[0].name])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,179 @@
+import json
+import pathlib
+
+import numpy as np
+import pypsa
+import pytest
+
+from epowcore.gdf.bus import Bus, LFBusType
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.generators.generator import GeneratorCategory
+from epowcore.gdf.generators.static_generator import StaticGenerator
+from epowcore.gdf.generators.synchronous_machine import SynchronousMachine
+from epowcore.gdf.load import Load
+from epowcore.gdf.shunt import Shunt
+from epowcore.gdf.tline import TLine
+from epowcore.gdf.transformers.two_winding_transformer import TwoWindingTransformer
+from epowcore.pypsa.pypsa_convert import PyPSAConverter
+
+PATH = pathlib.Path(__file__).parent.parent.resolve()
+COMPONENTS = ("buses", "lines", "transformers", "generators", "loads", "shunt_impedances")
+
+
+def load_model(name: str) -> CoreModel:
+    with open(PATH / "models/gdf" / name, "r", encoding="utf-8") as file:
+        return CoreModel.import_dict(json.load(file))
+
+
+def create_network() -> pypsa.Network:
+    """A small PyPSA-Eur like network with standard types and named components."""
+    n = pypsa.Network()
+    n.add("Bus", ["way/1", "way/2", "way/3", "way/4"], v_nom=380.0, x=[8.4, 8.5, 8.6, 8.7], y=49.0)
+    n.add("Bus", "way/5", v_nom=110.0, x=8.7, y=49.1)
+    n.add(
+        "Line",
+        ["relation/1", "relation/2"],
+        bus0=["way/1", "way/2"],
+        bus1=["way/2", "way/3"],
+        type="Al/St 240/40 4-bundle 380.0",
+        length=[50.0, 120.0],
+        num_parallel=[1.0, 2.0],
+    )
+    n.add("Line", "merged/3", bus0="way/3", bus1="way/4", x=8.0, r=0.8, b=2e-4, s_nom=1500.0)
+    n.add("Line", "inactive", bus0="way/1", bus1="way/4", x=1.0, r=0.1, active=False)
+    n.add(
+        "Transformer",
+        "trafo/1",
+        bus0="way/4",
+        bus1="way/5",
+        type="100 MVA 220/110 kV",
+        num_parallel=2.0,
+        tap_position=1,
+    )
+    n.add("Generator", "slack", bus="way/1", control="Slack", p_nom=2000.0, carrier="CCGT")
+    n.add("Generator", "pv", bus="way/3", control="PV", p_nom=500.0, p_set=300.0, carrier="nuclear")
+    n.add("Generator", "wind", bus="way/5", p_nom=80.0, p_set=60.0, q_set=5.0, carrier="onwind")
+    n.add("Load", ["load/1", "load/2"], bus=["way/2", "way/5"], p_set=[400.0, 150.0], q_set=40.0)
+    n.add("ShuntImpedance", "shunt", bus="way/4", b=2e-4, g=1e-6)
+    n.add("Link", "hvdc", bus0="way/1", bus1="way/4", p_nom=500.0)
+    n.c.buses.static.loc["way/3", "v_mag_pu_set"] = 1.02
+    return n
+
+
+# external grids are exported without a nominal power and cannot be restored
+@pytest.mark.parametrize("name", ["IEEE9_pf_gdf.json", "IEEE39_gdf.json"])
+def test_round_trip(name: str) -> None:
+    """Exporting an imported export reproduces the PyPSA tables."""
+    converter = PyPSAConverter()
+    network = converter.from_gdf(load_model(name), "export")
+    core_model = converter.to_gdf(network)
+    assert core_model.sanity_check()
+    round_trip = converter.from_gdf(core_model, "round trip")
+
+    for component in COMPONENTS:
+        expected = network.components[component].static
+        actual = round_trip.components[component].static
+        # generators are exported grouped by their GDF type
+        assert sorted(expected.index) == sorted(actual.index), component
+        actual = actual.loc[expected.index]
+        assert list(expected.columns) == list(actual.columns), component
+        for column in expected.columns:
+            if expected[column].dtype.kind in "biuf":
+                np.testing.assert_allclose(
+                    actual[column].to_numpy(dtype=float),
+                    expected[column].to_numpy(dtype=float),
+                    rtol=1e-12,
+                    err_msg=f"{component}.{column}",
+                )
+            else:
+                assert expected[column].equals(actual[column]), f"{component}.{column}"
+
+
+def test_import_network() -> None:
+    core_model = PyPSAConverter().to_gdf(create_network())
+
+    assert core_model.base_frequency == 50.0
+    uids = [component.uid for component in core_model.component_list()]
+    assert sorted(uids) == list(range(len(uids)))
+
+    buses = {bus.name: bus for bus in core_model.type_list(Bus)}
+    assert buses["way/1"].lf_bus_type == LFBusType.SL
+    assert buses["way/3"].lf_bus_type == LFBusType.PV
+    assert buses["way/5"].lf_bus_type == LFBusType.PQ
+    assert buses["way/5"].coords == (8.7, 49.1)
+
+    lines = {line.name: line for line in core_model.type_list(TLine)}
+    assert set(lines) == {"relation/1", "relation/2", "merged/3"}
+    assert lines["relation/2"].parallel_lines == 2
+    assert lines["relation/2"].r1 == pytest.approx(0.03)
+    assert lines["relation/2"].b1 == pytest.approx(2 * np.pi * 50 * 13.8 * 1e-3)
+    assert lines["relation/2"].rating == pytest.approx(np.sqrt(3) * 2.58 * 380)
+    assert lines["merged/3"].length is None
+    assert lines["merged/3"].b1 == pytest.approx(200.0)
+
+    (trafo,) = core_model.type_list(TwoWindingTransformer)
+    assert trafo.rating == pytest.approx(200.0)
+    assert trafo.voltage_lv == 110.0
+    assert trafo.tap_ratio == pytest.approx(1.015)
+
+    machine_slack, machine_pv = core_model.type_list(SynchronousMachine)
+    assert machine_slack.category == GeneratorCategory.GAS
+    assert machine_pv.voltage_set_point == 1.02
+    (wind,) = core_model.type_list(StaticGenerator)
+    assert wind.category == GeneratorCategory.WIND
+    assert wind.reactive_power == 5.0
+
+    assert sum(load.active_power for load in core_model.type_list(Load)) == 550.0
+    (shunt,) = core_model.type_list(Shunt)
+    assert shunt.q == pytest.approx(-2e-4 * 380**2)
+
+
+def test_transformer_is_turned_around() -> None:
+    network = create_network()
+    network.remove("Transformer", "trafo/1")
+    network.add(
+        "Transformer",
+        "reversed",
+        bus0="way/5",
+        bus1="way/4",
+        x=0.1,
+        r=0.01,
+        s_nom=100.0,
+        tap_ratio=1.05,
+        phase_shift=30.0,
+    )
+    core_model = PyPSAConverter().to_gdf(network)
+
+    (trafo,) = core_model.type_list(TwoWindingTransformer)
+    assert (trafo.voltage_hv, trafo.voltage_lv) == (380.0, 110.0)
+    assert trafo.tap_ratio == pytest.approx(1 / 1.05)
+    assert trafo.phase_shift_30 == -1
+    (hv_bus,) = core_model.get_neighbors(trafo, connector="HV")
+    assert hv_bus.name == "way/4"
+
+
+def test_load_flow_is_unchanged() -> None:
+    network = create_network()
+    network.remove("Link", "hvdc")
+    converter = PyPSAConverter()
+    exported = converter.from_gdf(converter.to_gdf(network), "net")
+
+    network.pf()
+    exported.pf()
+
+    buses = network.buses.index
+    names = {bus.name: str(bus.uid) for bus in converter.to_gdf(network).type_list(Bus)}
+    for quantity in ("v_mag_pu", "v_ang"):
+        np.testing.assert_allclose(
+            exported.buses_t[quantity][[names[bus] for bus in buses]].to_numpy(),
+            network.buses_t[quantity][buses].to_numpy(),
+            atol=1e-8,
+        )
+
+
+def test_unknown_bus() -> None:
+    network = create_network()
+    network.c.loads.static.loc["load/1", "bus"] = "way/42"
+
+    with pytest.raises(ValueError):
+        PyPSAConverter().to_gdf(network)
@@ -0,0 +1,74 @@
+import unittest
+from types import SimpleNamespace
+from typing import Any, cast
+
+import networkx as nx
+
+from epowcore.gdf.component import Component
+from epowcore.generic.component_graph import ComponentGraph
+from epowcore.rscad.graph_transformer_rscad import GraphTransformerRscad
+
+
+class DraftComponents:
+    """Looks up components by id like a draft."""
+
+    def __init__(self, components: list[SimpleNamespace]) -> None:
+        self.components = {component.uuid: component for component in components}
+
+    def get_by_id(self, uuid: str) -> SimpleNamespace | None:
+        return self.components.get(uuid)
+
+
+class GraphTransformerRscadTest(unittest.TestCase):
+    """Tests the graph operations used to pack components into hierarchy boxes."""
+
+    def test_replace_subgraph(self) -> None:
+        components = [
+            SimpleNamespace(uuid="bus", type="rtds_sharc_sld_BUSLABEL"),
+            SimpleNamespace(uuid="load", type="rtds_sharc_sld_DYLOAD"),
+            SimpleNamespace(uuid="line", type="_rtds_PI123.def"),
+            SimpleNamespace(uuid="other_bus", type="rtds_sharc_sld_BUSLABEL"),
+            SimpleNamespace(uuid="other_load", type="rtds_sharc_sld_DYLOAD"),
+        ]
+        draft = DraftComponents(components)
+        graph = nx.Graph(
+            [("bus", "load"), ("bus", "line"), ("load", "line"), ("line", "other_bus")]
+        )
+        graph.add_edge("other_bus", "other_load")
+        subgraph = graph.subgraph(["bus", "load"]).copy()
+        box = SimpleNamespace(uuid="box", type="HIERARCHY")
+
+        bus = components[0]
+        transformer = GraphTransformerRscad()
+        # the stand-ins only provide the attributes used by replace_subgraph
+        removed = transformer.replace_subgraph(
+            graph, subgraph, cast(Any, box), cast(Any, draft), cast(Any, bus)
+        )
+
+        self.assertEqual(removed, ["load"])
+        self.assertEqual(set(graph.nodes), {"bus", "box", "line", "other_bus", "other_load"})
+        self.assertEqual(set(graph.adj["box"]), {"bus", "line"})
+        self.assertEqual(set(graph.adj["line"]), {"bus", "box", "other_bus"})
+
+    def test_relabel_nodes(self) -> None:
+        bus = Component(1, "Bus", None)
+        load = Component(2, "Load", None)
+        line = Component(3, "Line", None)
+        graph = ComponentGraph()
+        graph.add_edges_from([(bus, load, {1: ["A"], 2: ["B"]}), (bus, line)])
+
+        relabeled = GraphTransformerRscad().relabel_nodes(
+            graph, {bus: "bus", load: "load", line: "line"}
+        )
+
+        self.assertEqual(set(relabeled.nodes), {"bus", "load", "line"})
+        self.assertEqual(relabeled.edges["bus", "load"]["bus"], ["A"])
+        self.assertEqual(relabeled.edges["bus", "load"]["load"], ["B"])
+        self.assertEqual(relabeled.edges["bus", "line"]["line"], [])
+        # the connector names of the core model are not shared with the relabeled graph
+        relabeled.edges["bus", "load"]["bus"].append("C")
+        self.assertEqual(graph.edges[bus, load], {1: ["A"], 2: ["B"]})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+import itertools
+import unittest
+
+import networkx as nx
+
+from epowcore.rscad.rack_partitioner import partition_racks
+
+TIMESTEP = 5e-5
+
+
+def create_graph(num_clusters: int, cluster_size: int, cost: int = 10) -> nx.Graph:
+    """Clusters of meshed hierarchies connected by long lines in a ring.
+    Inside the clusters, every second line is shorter than the time step."""
+    graph = nx.Graph()
+    for cluster in range(num_clusters):
+        nodes = [f"h{cluster}_{i}" for i in range(cluster_size)]
+        graph.add_nodes_from(nodes, LoadUnitCosts=cost)
+        for i, (node1, node2) in enumerate(itertools.combinations(nodes, 2)):
+            graph.add_edge(node1, node2, time=TIMESTEP / 2 if i % 2 else TIMESTEP * 4, lines=1)
+        graph.add_edge(nodes[0], f"h{(cluster + 1) % num_clusters}_1", time=TIMESTEP * 10)
+    return graph
+
+
+class RackPartitionerTest(unittest.TestCase):
+    def test_clusters_are_kept_together(self) -> None:
+        graph = create_graph(6, 5)
+        partition = partition_racks(graph, max_load=100, timestep=TIMESTEP)
+
+        self.assertEqual(len(partition.racks), 3)
+        self.assertEqual(partition.loads, [100, 100, 100])
+        self.assertEqual(set().union(*partition.racks), set(graph.nodes))
+        # only the ring between the clusters is cut
+        self.assertEqual(partition.cut_lines, 3)
+        for u, v, data in graph.edges(data=True):
+            if data["time"] < TIMESTEP:
+                self.assertTrue(any(u in rack and v in rack for rack in partition.racks))
+
+    def test_any_number_of_racks(self) -> None:
+        graph = create_graph(12, 4)
+        for num_racks in (1, 2, 3, 4, 6):
+            partition = partition_racks(graph, 1000, TIMESTEP, num_racks=num_racks)
+            self.assertEqual(len(partition.racks), num_racks)
+            self.assertEqual(set(partition.loads), {480 / num_racks})
+            self.assertEqual(partition.cut_lines, num_racks if num_racks > 1 else 0)
+
+    def test_coupled_hierarchies_exceeding_a_rack_raise(self) -> None:
+        graph = nx.Graph()
+        graph.add_nodes_from(["a", "b", "c"], LoadUnitCosts=40)
+        graph.add_edge("a", "b", time=TIMESTEP / 10)
+        with self.assertRaises(ValueError):
+            partition_racks(graph, max_load=60, timestep=TIMESTEP)
+        with self.assertRaises(ValueError):
+            partition_racks(graph, max_load=100, timestep=TIMESTEP, num_racks=1)
+        partition = partition_racks(graph, max_load=100, timestep=TIMESTEP)
+        self.assertEqual(sorted(map(sorted, partition.racks)), [["a", "b"], ["c"]])
+
+    def test_no_empty_racks(self) -> None:
+        graph = nx.Graph()
+        graph.add_nodes_from(["a", "b", "c"], LoadUnitCosts=40)
+        graph.add_node("d", LoadUnitCosts=0)
+        graph.add_edge("a", "b", time=TIMESTEP / 10)
+        graph.add_edge("b", "c", time=TIMESTEP * 10)
+        for num_racks in (2, 3, 10):
+            partition = partition_racks(graph, 100, TIMESTEP, num_racks=num_racks)
+            self.assertLessEqual(len(partition.racks), 3)
+            self.assertTrue(all(partition.racks))
+            self.assertEqual(len(partition.loads), len(partition.racks))
+            self.assertEqual(set().union(*partition.racks), set(graph.nodes))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,9 @@ from pyapi_rts.generated.rtds3P3WTRFdef import rtds3P3WTRFdef as RSCAD3WindingTr
 from pyapi_rts.generated.rtdssharcsldBUSLABEL import rtdssharcsldBUSLABEL as RSCADBuslabel
 
 from epowcore.gdf.subsystem import Subsystem
+from epowcore.generic.configuration import Configuration
 from epowcore.generic.singleton import Singleton
+from epowcore.rscad.rscad_component_creator import RscadComponentCreator
 from epowcore.rscad.rscad_converter import RscadConverter
 
 
@@ -84,6 +86,27 @@ class RSCADExportTest(unittest.TestCase):
         )
         draft.write_file("tests/out/test1.dfx")
 
+    def test_tli_files_are_shared(self) -> None:
+        """TLines with equal parameters share one TLI file."""
+        creator = GdfTestComponentCreator()
+        tlines = [creator.create_tline() for _ in range(3)]
+        tlines[2] = creator.core_model.update_component(tlines[2], length=50.0)
+        rscad_creator = RscadComponentCreator(creator.core_model.graph, 50.0)
+
+        tli_files = [rscad_creator.get_tli_file(tline) for tline in tlines]
+        self.assertEqual([created for _, created in tli_files], [True, False, True])
+        self.assertIs(tli_files[1][0], tli_files[0][0])
+        self.assertEqual(tli_files[0][0].name, tlines[0].name)
+        _, _, calc_box = rscad_creator.create_rscad_tline(tlines[1], tli_files[1][0].name)
+        self.assertEqual(calc_box.CONFIGURATION.Name.value, tlines[1].name)
+        self.assertEqual(calc_box.CONFIGURATION.Dnm1.value, tlines[0].name)
+
+        with Configuration().scoped(overrides={"RSCAD": {"TLine": {"share_tli_files": False}}}):
+            _, created = RscadComponentCreator(creator.core_model.graph, 50.0).get_tli_file(
+                tlines[1]
+            )
+        self.assertTrue(created)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,107 @@
+import contextlib
+import dataclasses
+import io
+import json
+import threading
+import time
+import unittest
+
+from epowcore.gdf.bus import Bus
+from epowcore.gdf.core_model import CoreModel
+from epowcore.gdf.load import Load
+from epowcore.gdf.subsystem import Subsystem
+from epowcore.generic.component_graph import ComponentGraph
+from epowcore.generic.configuration import Configuration
+from epowcore.generic.logger import Logger
+from epowcore.simscape.engine_pool import EnginePool
+from epowcore.simscape.script_engine import StandInEngine
+from epowcore.simscape.simscape_converter import SimscapeConverter
+
+
+def create_model(num_subsystems: int) -> CoreModel:
+    """IEEE39 with additional subsystems, each containing an island with a bus and a load."""
+    with open("tests/models/gdf/IEEE39_gdf.json", "r", encoding="utf-8") as file:
+        core_model = CoreModel.import_dict(json.load(file))
+    bus, load = core_model.type_list(Bus)[0], core_model.type_list(Load)[0]
+    for i in range(num_subsystems):
+        graph = ComponentGraph()
+        island_bus = dataclasses.replace(bus, uid=core_model.get_valid_id() + 2 * i)
+        island_load = dataclasses.replace(load, uid=core_model.get_valid_id() + 2 * i + 1)
+        graph.add_edge(island_bus, island_load)
+        core_model.graph.add_node(Subsystem(core_model.get_valid_id(), f"Island {i}", None, graph))
+    return core_model
+
+
+class EnginePoolTest(unittest.TestCase):
+    def test_engines_are_reused(self) -> None:
+        pool = EnginePool(3, StandInEngine)
+        running, max_running = 0, 0
+        lock = threading.Lock()
+
+        def work(engine: StandInEngine, item: int) -> tuple[int, StandInEngine]:
+            nonlocal running, max_running
+            with lock:
+                running += 1
+                max_running = max(max_running, running)
+            time.sleep(0.02)
+            with lock:
+                running -= 1
+            return item * 2, engine
+
+        for _ in range(2):
+            results = pool.map(work, range(12))
+            self.assertEqual([result for result, _ in results], list(range(0, 24, 2)))
+        self.assertEqual(pool.started, 3)
+        self.assertEqual(max_running, 3)
+        self.assertEqual(len({id(engine) for _, engine in results}), 3)
+
+        pool.close()
+        self.assertTrue(all(engine.closed for _, engine in results))
+        with self.assertRaises(ValueError):
+            pool.map(work, range(2))
+
+    def test_caller_context_is_used(self) -> None:
+        pool = EnginePool(3, StandInEngine)
+
+        def work(_: StandInEngine, item: int) -> tuple[int, bool]:
+            time.sleep(0.01)
+            return Configuration().get("Test.value"), Logger.log_to_selected(f"item {item}")
+
+        with Configuration().scoped(overrides={"Test": {"value": 1}}), Logger.scope():
+            logger = Logger.new("test", print_to_console=False)
+            results = pool.map(work, range(12), StandInEngine())
+        pool.close()
+        self.assertEqual(results, [(1, True)] * 12)
+        self.assertEqual(len(logger.entries), 12)
+
+    def test_engines_are_quit_after_errors(self) -> None:
+        pool = EnginePool(1, StandInEngine)
+        with self.assertRaises(RuntimeError):
+            with pool.lease() as engine:
+                raise RuntimeError()
+        self.assertTrue(engine.closed)
+        with pool.lease() as new_engine:
+            self.assertIsNot(new_engine, engine)
+        self.assertEqual(pool.started, 1)
+
+    def test_subsystems_are_built_on_the_pool(self) -> None:
+        core_model = create_model(6)
+        models: dict[str, bool] = {}
+        pool = EnginePool(2, lambda: StandInEngine(models))
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(2):
+                SimscapeConverter(pool=pool).from_gdf(core_model, "IEEE39")
+
+        # the parent model is built on one engine of the pool, which also builds subsystems
+        self.assertEqual(pool.started, 2)
+        commands = [command for engine in pool._idle for command in engine.commands]
+        self.assertEqual(sum(c.startswith("new_system('IEEE39')") for c in commands), 2)
+        copied = [c for c in commands if "copyContentsToSubSystem" in c and "Island" in c]
+        self.assertEqual(len(copied), 12)
+        # the subsystem models were saved before the parent model loaded them
+        self.assertEqual(len(models), 13)
+        self.assertTrue(all(models.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import json
+import unittest
+
+from epowcore.gdf.core_model import CoreModel
+from epowcore.simscape.script_engine import RecordingEngine, ScriptEngine, matlab_literal
+from epowcore.simscape.simscape_converter import SimscapeConverter
+
+
+class ScriptEngineTest(unittest.TestCase):
+    def test_literals(self) -> None:
+        self.assertEqual(matlab_literal("Bus 'A'"), "'Bus ''A'''")
+        self.assertEqual(matlab_literal("a\nb"), "['a' newline 'b']")
+        self.assertEqual(matlab_literal([1, 2.5, float("inf")]), "[1 2.5 Inf]")
+        self.assertEqual(matlab_literal(True), "true")
+
+    def test_port_handles_are_read_once(self) -> None:
+        eng = ScriptEngine()
+        eng.add_block("lib/Bus", "model/Bus 1", "Position", "[0 0 10 40]", nargout=0)
+        handles = eng.get_param("model/Bus 1", "PortHandles")
+        self.assertEqual(handles["LConn"], "ph1.LConn")
+        self.assertEqual(handles["LConn"][0:2], "ph1.LConn(1:2)")
+        eng.add_line("model", handles["LConn"][0], handles["LConn"][0], nargout=0)
+        self.assertEqual(eng.get_param("model/Bus 1", "PortHandles")["RConn"], "ph1.RConn")
+        # changing the block reads the handles again
+        eng.set_param("model/Bus 1", "Orientation", "left", nargout=0)
+        self.assertEqual(eng.get_param("model/Bus 1", "PortHandles")["RConn"], "ph2.RConn")
+        self.assertIn("add_line('model', ph1.LConn, ph1.LConn);", eng.commands)
+        self.assertEqual(eng.get_param("model/Bus 1", "Orientation"), "left")
+        with self.assertRaises(ValueError):
+            eng.get_param("model/Bus 1", "Name")
+
+    def test_set_position(self) -> None:
+        eng = ScriptEngine()
+        eng.add_block("lib/Load", "model/Load", "Position", "[0 0 20 30]", nargout=0)
+        eng.set_position("model/Load", 100, 200)
+        self.assertEqual(
+            eng.commands[-1], "set_param('model/Load', 'Position', [100 200 120 230]);"
+        )
+        self.assertEqual(eng.get_param("model/Load", "Position"), [[100.0, 200.0, 120.0, 230.0]])
+
+        eng.add_block("lib/Load", "model/Load 2", nargout=0)
+        eng.set_position("model/Load 2", 5, 6)
+        self.assertEqual(eng.commands[-2], "p = get_param('model/Load 2', 'Position');")
+        self.assertIn("(5 + p(3) - p(1))", eng.commands[-1])
+
+    def test_run(self) -> None:
+        eng = ScriptEngine()
+        for i in range(5):
+            eng.new_system(f"model{i}")
+        matlab = RecordingEngine()
+        self.assertEqual(eng.run(matlab), 1)
+        self.assertEqual(matlab.scripts, [eng.script()])
+        self.assertEqual(eng.run(matlab, batch_size=2), 3)
+        self.assertEqual([name for name, _ in matlab.calls], ["run", "eval", "eval", "eval"])
+
+    def test_export_ieee39(self) -> None:
+        with open("tests/models/gdf/IEEE39_gdf.json", "r", encoding="utf-8") as file:
+            core_model = CoreModel.import_dict(json.load(file))
+        matlab = RecordingEngine()
+        SimscapeConverter(matlab, batch=True).from_gdf(core_model, "IEEE39")
+
+        self.assertEqual([name for name, _ in matlab.calls], ["run"])
+        script = matlab.scripts[0].splitlines()
+        self.assertIn("new_system('IEEE39');", script)
+        self.assertEqual(script[-1], "save_system('IEEE39');")
+        self.assertTrue(any(line.startswith("add_line(") and "ph" in line for line in script))
+
+
+if __name__ == "__main__":
+    unittest.main()